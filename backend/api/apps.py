@@ -1,4 +1,7 @@
 import logging
+import os
+import sys
+import threading
 
 from django.apps import AppConfig
 
@@ -35,6 +38,74 @@ class ApiConfig(AppConfig):
                 )
             else:
                 logger.info("TTS model found — Kokoro-82M ready.")
+                self._maybe_start_tts_benchmark()
         except Exception:
             # Never prevent startup due to model check failures
             pass
+
+        self._maybe_start_task_store()
+
+    @staticmethod
+    def _is_serving_process() -> bool:
+        """True in the process that serves requests.
+
+        False for the runserver autoreload parent, tests and other
+        management commands.
+        """
+        if 'runserver' in sys.argv:
+            # The autoreloader parent process also calls ready()
+            return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in sys.argv
+        # migrate, test, shell, ... (WSGI/ASGI servers fall through)
+        return os.path.basename(sys.argv[0]) not in ('manage.py', 'django-admin')
+
+    @staticmethod
+    def _is_reloader_parent() -> bool:
+        """True in the runserver autoreloader parent, which serves nothing."""
+        return (
+            'runserver' in sys.argv
+            and os.environ.get('RUN_MAIN') != 'true'
+            and '--noreload' not in sys.argv
+        )
+
+    def _maybe_start_task_store(self):
+        """Persist the task registry and recover what a restart interrupted.
+
+        Only when ``TASK_STORE_ENABLED`` is set (opt-in, see settings);
+        see ``api/task_store.py``.
+        """
+        from django.conf import settings
+
+        if not getattr(settings, 'TASK_STORE_ENABLED', False):
+            return
+        if self._is_reloader_parent():
+            return
+        try:
+            from .task_store import start_task_store
+
+            start_task_store()
+        except Exception as exc:
+            logger.warning("Task store could not be started: %s", exc)
+
+    def _maybe_start_tts_benchmark(self):
+        """Log a TTS real-time-factor benchmark in a background thread.
+
+        Only runs when ``TTS_STARTUP_BENCHMARK`` is enabled, in the
+        serving process.
+        """
+        from django.conf import settings
+
+        if not getattr(settings, 'TTS_STARTUP_BENCHMARK', False):
+            return
+        if not self._is_serving_process():
+            return
+
+        def run():
+            from core_engine.tts_benchmark import format_benchmark_report, run_tts_benchmark
+
+            try:
+                results = run_tts_benchmark()
+                logger.info("TTS startup benchmark:\n%s", format_benchmark_report(results))
+            except Exception as exc:
+                logger.warning("TTS startup benchmark failed: %s", exc)
+
+        threading.Thread(target=run, name='tts-benchmark', daemon=True).start()
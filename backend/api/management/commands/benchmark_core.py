@@ -0,0 +1,91 @@
+"""
+``python manage.py benchmark_core`` — time the core_engine hot paths.
+
+Runs :mod:`core_engine.core_benchmark` on synthetic images and WAVs,
+writes the results to a JSON file and optionally compares them with the
+results of an earlier commit.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Benchmark image loading, Ken Burns, subtitles, audio, full renders and API endpoints."
+
+    def add_arguments(self, parser):
+        from core_engine.core_benchmark import BENCHMARKS, DEFAULT_REGRESSION_THRESHOLD
+
+        parser.add_argument(
+            "--only", action="append", choices=sorted(BENCHMARKS),
+            help="Benchmark group to run (repeatable; default: all).",
+        )
+        parser.add_argument(
+            "--quick", action="store_true",
+            help="Smoke run: 720p only, 1- and 3-segment renders, one repeat.",
+        )
+        parser.add_argument("--repeat", type=int, help="Timed calls per benchmark.")
+        parser.add_argument(
+            "--segments", type=int, nargs="+",
+            help="Segment counts of the rendered projects (default: 1 10 50).",
+        )
+        parser.add_argument(
+            "--quality", choices=["draft", "standard", "final"],
+            help="Render quality preset for the render benchmarks.",
+        )
+        parser.add_argument(
+            "--output", default=None,
+            help="JSON results file (default: core_benchmark_<commit>.json).",
+        )
+        parser.add_argument("--compare", help="Baseline JSON results file to compare against.")
+        parser.add_argument(
+            "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+            help="Relative slowdown of the median counted as a regression.",
+        )
+        parser.add_argument(
+            "--fail-on-regression", action="store_true",
+            help="Exit with an error if any benchmark regressed.",
+        )
+
+    def handle(self, *args, **options):
+        from core_engine.core_benchmark import (
+            compare_reports,
+            format_benchmark_report,
+            run_benchmarks,
+        )
+
+        baseline = None
+        if options["compare"]:
+            try:
+                with open(options["compare"], encoding="utf-8") as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Cannot read baseline: {exc}") from exc
+
+        report = run_benchmarks(
+            only=options["only"],
+            quick=options["quick"],
+            repeat=options["repeat"],
+            segment_counts=options["segments"],
+            render_quality=options["quality"],
+        )
+
+        output = options["output"] or (
+            f"core_benchmark_{report['environment']['commit'] or 'unknown'}.json"
+        )
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        comparison = None
+        if baseline is not None:
+            comparison = compare_reports(report, baseline, options["threshold"])
+            report["comparison"] = comparison
+
+        self.stdout.write(format_benchmark_report(report, comparison))
+        self.stdout.write(f"Results written to {output}")
+
+        if options["fail_on_regression"] and comparison and any(
+            row["status"] == "regression" for row in comparison
+        ):
+            raise CommandError("Benchmark regression detected.")
@@ -0,0 +1,56 @@
+"""
+``python manage.py benchmark_export <project_id>`` — compare export profiles.
+
+Encodes the reference project's video once per export profile and prints
+encode fps and output size, so the best ``GlobalSettings.export_profile``
+can be chosen for this machine.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Benchmark encode speed and output size of each video export profile."
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", help="UUID of the reference project.")
+        parser.add_argument(
+            "--profile", action="append", dest="profiles",
+            choices=["crf", "vbr", "two_pass"],
+            help="Profile to include (repeatable; default: all).",
+        )
+        parser.add_argument(
+            "--quality", choices=["draft", "standard", "final"],
+            help="Render quality preset (default: the configured one).",
+        )
+        parser.add_argument(
+            "--json", action="store_true",
+            help="Print raw results as JSON instead of a table.",
+        )
+
+    def handle(self, *args, **options):
+        from api.models import Project
+        from core_engine import render_utils
+        from core_engine.export_benchmark import (
+            format_export_benchmark_report,
+            run_export_benchmark,
+        )
+
+        if not render_utils.check_ffmpeg():
+            raise CommandError(render_utils.get_ffmpeg_error_message())
+
+        try:
+            results = run_export_benchmark(
+                options["project_id"],
+                profiles=options["profiles"],
+                render_quality=options["quality"],
+            )
+        except (Project.DoesNotExist, ValueError) as exc:
+            raise CommandError(f"Cannot run export benchmark: {exc}") from exc
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+        else:
+            self.stdout.write(format_export_benchmark_report(results))
@@ -0,0 +1,38 @@
+"""
+``python manage.py benchmark_tts`` — compare ONNX session configurations.
+
+Prints the real-time factor of Kokoro-82M for each configuration in
+``TTS_BENCHMARK_CONFIGS`` (or a default intra-op thread sweep) so the
+fastest one can be copied into ``TTS_ONNX_SESSION``.
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Benchmark Kokoro TTS real-time factor across ONNX Runtime session configurations."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeats", type=int, default=3,
+            help="Timed runs per configuration after one warm-up run (default: 3).",
+        )
+        parser.add_argument(
+            "--json", action="store_true",
+            help="Print raw results as JSON instead of a table.",
+        )
+
+    def handle(self, *args, **options):
+        from core_engine.tts_benchmark import format_benchmark_report, run_tts_benchmark
+
+        try:
+            results = run_tts_benchmark(repeats=options["repeats"])
+        except (FileNotFoundError, ImportError) as exc:
+            raise CommandError(f"Cannot run TTS benchmark: {exc}") from exc
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2, default=str))
+        else:
+            self.stdout.write(format_benchmark_report(results))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0004_logo_globalsettings_logo_enabled_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalsettings",
+            name="render_workers",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
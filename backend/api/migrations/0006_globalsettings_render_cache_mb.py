@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0005_globalsettings_render_workers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalsettings",
+            name="render_cache_mb",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
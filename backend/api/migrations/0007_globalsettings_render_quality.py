@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0006_globalsettings_render_cache_mb"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalsettings",
+            name="render_quality",
+            field=models.CharField(
+                choices=[
+                    ("draft", "Draft"),
+                    ("standard", "Standard"),
+                    ("final", "Final"),
+                ],
+                default="final",
+                max_length=10,
+            ),
+        ),
+    ]
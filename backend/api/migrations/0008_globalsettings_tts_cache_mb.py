@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0007_globalsettings_render_quality"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalsettings",
+            name="tts_cache_mb",
+            field=models.PositiveIntegerField(default=512),
+        ),
+    ]
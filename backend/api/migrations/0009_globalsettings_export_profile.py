@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0008_globalsettings_tts_cache_mb"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalsettings",
+            name="export_bitrate_kbps",
+            field=models.PositiveIntegerField(default=4000),
+        ),
+        migrations.AddField(
+            model_name="globalsettings",
+            name="export_profile",
+            field=models.CharField(
+                choices=[
+                    ("crf", "Constant quality (CRF)"),
+                    ("vbr", "Constrained VBR"),
+                    ("two_pass", "Two-pass target size"),
+                ],
+                default="crf",
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="globalsettings",
+            name="export_target_mb",
+            field=models.PositiveIntegerField(default=50),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0009_globalsettings_export_profile"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalsettings",
+            name="ken_burns_easing",
+            field=models.CharField(
+                choices=[
+                    ("linear", "Linear"),
+                    ("ease_in", "Ease in"),
+                    ("ease_out", "Ease out"),
+                    ("ease_in_out", "Ease in-out"),
+                    ("ease_in_out_sine", "Ease in-out (sine)"),
+                ],
+                default="linear",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0010_globalsettings_ken_burns_easing"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="globalsettings",
+            name="image_cache_mb",
+            field=models.PositiveIntegerField(default=256),
+        ),
+        migrations.AddField(
+            model_name="globalsettings",
+            name="image_spill_mb",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
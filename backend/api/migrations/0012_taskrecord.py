@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0011_globalsettings_image_cache"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskRecord",
+            fields=[
+                (
+                    "task_id",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("lane", models.CharField(max_length=20)),
+                ("status", models.CharField(max_length=20)),
+                ("progress", models.JSONField(default=dict)),
+                ("completed_segments", models.JSONField(default=list)),
+                ("errors", models.JSONField(default=list)),
+                ("params", models.JSONField(default=dict)),
+                ("cancel_requested", models.BooleanField(default=False)),
+                ("created_at", models.FloatField()),
+                ("started_at", models.FloatField(blank=True, null=True)),
+                ("completed_at", models.FloatField(blank=True, null=True)),
+                ("updated_at", models.FloatField()),
+            ],
+            options={
+                "ordering": ["created_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0012_taskrecord"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="segment",
+            name="audio_input_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
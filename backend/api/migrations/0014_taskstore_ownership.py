@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0013_segment_audio_input_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="taskrecord",
+            name="owner",
+            field=models.CharField(blank=True, default="", max_length=32),
+        ),
+        migrations.CreateModel(
+            name="TaskStoreLock",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=50, primary_key=True, serialize=False),
+                ),
+                ("holder", models.CharField(blank=True, default="", max_length=32)),
+                ("expires_at", models.FloatField(default=0.0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="TaskStoreProcess",
+            fields=[
+                (
+                    "boot_id",
+                    models.CharField(max_length=32, primary_key=True, serialize=False),
+                ),
+                ("pid", models.IntegerField()),
+                ("hostname", models.CharField(blank=True, default="", max_length=255)),
+                ("started_at", models.FloatField()),
+                ("heartbeat_at", models.FloatField()),
+            ],
+        ),
+    ]
@@ -52,11 +52,25 @@ class Segment(models.Model):
     image_file = models.ImageField(upload_to=segment_image_path, blank=True, null=True)
     audio_file = models.FileField(upload_to=segment_audio_path, blank=True, null=True)
     audio_duration = models.FloatField(null=True, blank=True)
+    # tts_input_hash() of the text, voice and speed the audio was made from
+    audio_input_hash = models.CharField(max_length=64, blank=True, default='')
     is_locked = models.BooleanField(default=False)
 
     def __str__(self):
         return f"Segment {self.sequence_index} of {self.project.title}"
 
+    def audio_is_stale(self, voice_id, speed):
+        """True if the audio was generated from other text, voice or speed.
+
+        Audio generated before input hashes were recorded is never
+        reported as stale.
+        """
+        if not self.audio_file or not self.audio_input_hash:
+            return False
+        from core_engine.tts_cache import tts_input_hash
+
+        return self.audio_input_hash != tts_input_hash(self.text_content, voice_id, speed)
+
     class Meta:
         ordering = ['sequence_index']
 
@@ -74,6 +88,26 @@ LOGO_POSITION_CHOICES = [
     ('bottom-right', 'Bottom Right'),
 ]
 
+RENDER_QUALITY_CHOICES = [
+    ('draft', 'Draft'),
+    ('standard', 'Standard'),
+    ('final', 'Final'),
+]
+
+EXPORT_PROFILE_CHOICES = [
+    ('crf', 'Constant quality (CRF)'),
+    ('vbr', 'Constrained VBR'),
+    ('two_pass', 'Two-pass target size'),
+]
+
+KEN_BURNS_EASING_CHOICES = [
+    ('linear', 'Linear'),
+    ('ease_in', 'Ease in'),
+    ('ease_out', 'Ease out'),
+    ('ease_in_out', 'Ease in-out'),
+    ('ease_in_out_sine', 'Ease in-out (sine)'),
+]
+
 
 def logo_upload_path(instance, filename):
     return f'logos/{filename}'
@@ -99,6 +133,8 @@ class GlobalSettings(models.Model):
     # ── TTS defaults ──
     default_voice_id = models.CharField(max_length=100, default='af_bella')
     tts_speed = models.FloatField(default=1.0)
+    # Shared content-addressed TTS audio cache budget in MB (0 = disabled)
+    tts_cache_mb = models.PositiveIntegerField(default=512)
 
     # ── Subtitle styling ──
     subtitle_font_family = models.CharField(max_length=200, default='Arial')
@@ -117,9 +153,39 @@ class GlobalSettings(models.Model):
     render_width = models.PositiveIntegerField(default=1920)
     render_height = models.PositiveIntegerField(default=1080)
     render_fps = models.PositiveIntegerField(default=30)
+    # Parallel segment encoders: 1 = single stream, 0 = one per CPU core
+    render_workers = models.PositiveIntegerField(default=1)
+    # Per-project encoded-segment cache budget in MB (0 = disabled)
+    render_cache_mb = models.PositiveIntegerField(default=0)
+    # Process-wide prepared-image cache: memory budget and optional
+    # on-disk .npy tier shared with parallel workers (0 = disabled)
+    image_cache_mb = models.PositiveIntegerField(default=256)
+    image_spill_mb = models.PositiveIntegerField(default=0)
+    # Speed/quality preset: resample filter, x264 preset/CRF, scale
+    render_quality = models.CharField(
+        max_length=10,
+        choices=RENDER_QUALITY_CHOICES,
+        default='final',
+    )
+    # x264 rate control of the final MP4 (all profiles use -tune stillimage)
+    export_profile = models.CharField(
+        max_length=10,
+        choices=EXPORT_PROFILE_CHOICES,
+        default='crf',
+    )
+    # Average bitrate of the constrained VBR profile
+    export_bitrate_kbps = models.PositiveIntegerField(default=4000)
+    # Output size targeted by the two-pass profile
+    export_target_mb = models.PositiveIntegerField(default=50)
 
     # ── Ken Burns & transitions ──
     ken_burns_zoom = models.FloatField(default=1.2)
+    # Camera easing curve of the Ken Burns pan
+    ken_burns_easing = models.CharField(
+        max_length=20,
+        choices=KEN_BURNS_EASING_CHOICES,
+        default='linear',
+    )
     transition_duration = models.FloatField(default=0.5)
     zoom_intensity = models.FloatField(default=1.3)  # legacy
 
@@ -170,3 +236,58 @@ class GlobalSettings(models.Model):
     class Meta:
         verbose_name = 'Global Settings'
         verbose_name_plural = 'Global Settings'
+
+
+class TaskRecord(models.Model):
+    """Persisted copy of a TaskManager registry entry (see api/task_store.py).
+
+    Timestamps are epoch seconds, exactly as kept in the in-memory
+    registry.  ``params`` holds what is needed to resume the task after
+    a restart (only TTS batches record any).  ``owner`` is the boot ID
+    of the process running the task (see :class:`TaskStoreProcess`).
+    """
+    task_id = models.CharField(max_length=255, primary_key=True)
+    owner = models.CharField(max_length=32, blank=True, default='')
+    lane = models.CharField(max_length=20)
+    status = models.CharField(max_length=20)
+    progress = models.JSONField(default=dict)
+    completed_segments = models.JSONField(default=list)
+    errors = models.JSONField(default=list)
+    params = models.JSONField(default=dict)
+    cancel_requested = models.BooleanField(default=False)
+    created_at = models.FloatField()
+    started_at = models.FloatField(null=True, blank=True)
+    completed_at = models.FloatField(null=True, blank=True)
+    updated_at = models.FloatField()
+
+    def __str__(self):
+        return f"{self.task_id} ({self.status})"
+
+    class Meta:
+        ordering = ['created_at']
+
+
+class TaskStoreProcess(models.Model):
+    """A process running a task store, kept alive by a periodic heartbeat.
+
+    Startup recovery only fails tasks owned by processes whose heartbeat
+    has stopped, so one server process never fails another's live work.
+    """
+    boot_id = models.CharField(max_length=32, primary_key=True)
+    pid = models.IntegerField()
+    hostname = models.CharField(max_length=255, blank=True, default='')
+    started_at = models.FloatField()
+    heartbeat_at = models.FloatField()
+
+    def __str__(self):
+        return f"{self.hostname}:{self.pid} ({self.boot_id})"
+
+
+class TaskStoreLock(models.Model):
+    """A named lease held by one process until ``expires_at`` (epoch seconds)."""
+    name = models.CharField(max_length=50, primary_key=True)
+    holder = models.CharField(max_length=32, blank=True, default='')
+    expires_at = models.FloatField(default=0.0)
+
+    def __str__(self):
+        return f"{self.name} ({self.holder or 'free'})"
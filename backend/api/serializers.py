@@ -48,18 +48,31 @@ class ProjectSerializer(serializers.ModelSerializer):
 
 
 class SegmentSerializer(serializers.ModelSerializer):
+    # True when the audio no longer matches the text or the default
+    # voice / speed (see Segment.audio_is_stale)
+    audio_stale = serializers.SerializerMethodField()
+
     class Meta:
         model = Segment
         fields = [
             'id', 'project', 'sequence_index', 'text_content',
             'image_prompt', 'image_file', 'audio_file',
-            'audio_duration', 'is_locked',
+            'audio_duration', 'audio_stale', 'is_locked',
         ]
         read_only_fields = [
             'id', 'project', 'sequence_index',
             'image_file', 'audio_file', 'audio_duration',
         ]
 
+    def get_audio_stale(self, obj):
+        # Read the TTS settings once per response, not once per segment
+        tts_inputs = self.context.get('_tts_inputs')
+        if tts_inputs is None:
+            settings_obj = GlobalSettings.load()
+            tts_inputs = (settings_obj.default_voice_id, settings_obj.tts_speed)
+            self.context['_tts_inputs'] = tts_inputs
+        return obj.audio_is_stale(*tts_inputs)
+
 
 class LogoSerializer(serializers.ModelSerializer):
     class Meta:
@@ -72,12 +85,16 @@ class GlobalSettingsSerializer(serializers.ModelSerializer):
     class Meta:
         model = GlobalSettings
         fields = [
-            'default_voice_id', 'tts_speed',
+            'default_voice_id', 'tts_speed', 'tts_cache_mb',
             'subtitle_font_family', 'subtitle_font_size',
             'subtitle_font_color', 'subtitle_position',
             'subtitle_font', 'subtitle_color',
             'render_width', 'render_height', 'render_fps',
-            'ken_burns_zoom', 'transition_duration', 'zoom_intensity',
+            'render_workers', 'render_cache_mb', 'image_cache_mb',
+            'image_spill_mb', 'render_quality',
+            'export_profile', 'export_bitrate_kbps', 'export_target_mb',
+            'ken_burns_zoom', 'ken_burns_easing', 'transition_duration',
+            'zoom_intensity',
             'inter_segment_silence', 'subtitles_enabled',
             'custom_font_file',
             'logo_enabled', 'active_logo', 'logo_scale',
@@ -140,6 +157,79 @@ class GlobalSettingsSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def validate_render_workers(self, value):
+        if value < 0 or value > 64:
+            raise serializers.ValidationError(
+                'Render workers must be between 0 (auto) and 64.'
+            )
+        return value
+
+    def validate_tts_cache_mb(self, value):
+        if value > 102400:
+            raise serializers.ValidationError(
+                'TTS cache size must be between 0 (disabled) and 102400 MB.'
+            )
+        return value
+
+    def validate_render_cache_mb(self, value):
+        if value > 102400:
+            raise serializers.ValidationError(
+                'Render cache size must be between 0 (disabled) and 102400 MB.'
+            )
+        return value
+
+    def validate_image_cache_mb(self, value):
+        if value > 102400:
+            raise serializers.ValidationError(
+                'Image cache size must be between 0 (disabled) and 102400 MB.'
+            )
+        return value
+
+    def validate_image_spill_mb(self, value):
+        if value > 102400:
+            raise serializers.ValidationError(
+                'Image spill store size must be between 0 (disabled) and 102400 MB.'
+            )
+        return value
+
+    def validate_render_quality(self, value):
+        allowed = {'draft', 'standard', 'final'}
+        if value not in allowed:
+            raise serializers.ValidationError(
+                f'Render quality must be one of: {", ".join(sorted(allowed))}.'
+            )
+        return value
+
+    def validate_export_profile(self, value):
+        allowed = {'crf', 'vbr', 'two_pass'}
+        if value not in allowed:
+            raise serializers.ValidationError(
+                f'Export profile must be one of: {", ".join(sorted(allowed))}.'
+            )
+        return value
+
+    def validate_export_bitrate_kbps(self, value):
+        if value < 100 or value > 100000:
+            raise serializers.ValidationError(
+                'Export bitrate must be between 100 and 100000 kbps.'
+            )
+        return value
+
+    def validate_export_target_mb(self, value):
+        if value < 1 or value > 102400:
+            raise serializers.ValidationError(
+                'Export target size must be between 1 and 102400 MB.'
+            )
+        return value
+
+    def validate_ken_burns_easing(self, value):
+        allowed = {'linear', 'ease_in', 'ease_out', 'ease_in_out', 'ease_in_out_sine'}
+        if value not in allowed:
+            raise serializers.ValidationError(
+                f'Ken Burns easing must be one of: {", ".join(sorted(allowed))}.'
+            )
+        return value
+
     def validate_inter_segment_silence(self, value):
         if value < 0.0 or value > 5.0:
             raise serializers.ValidationError(
@@ -0,0 +1,610 @@
+"""
+Persistent task store — a write-behind copy of the TaskManager registry.
+
+The registry in :mod:`api.tasks` lives in memory, so restarting the
+server used to lose every task: status polls returned 404 and projects
+that were rendering stayed in ``PROCESSING`` forever, which blocks a new
+render with 409.  When ``TASK_STORE_ENABLED`` is set, every registry
+change is mirrored to the :class:`~api.models.TaskRecord` table.
+
+Writes
+~~~~~~
+* **Write-behind** — the TaskManager only marks a task dirty (a set
+  insert, under its own lock).  A daemon thread writes the latest state
+  of every dirty task in one transaction (a single upsert), at most
+  every ``TASK_STORE_FLUSH_INTERVAL`` seconds.  Progress updates in
+  between are coalesced, so a render reporting many times a second
+  costs one row write per interval.
+* **Status changes first** — a task whose status differs from the one
+  last written wakes the writer at once, so a finished task is not left
+  recorded as running for a whole interval.
+* Tasks dropped by the registry's cleanup are deleted from the table.
+* Render profiles (``progress["profile"]``) are not persisted; the
+  report is written next to the MP4 anyway.
+* Database errors are logged and the batch is retried on the next
+  flush — persistence never fails a task.
+* On SQLite the database is switched to the WAL journal when the store
+  starts, so request threads keep reading while it writes.  The mode is
+  stored in the database file, which is why this only happens when the
+  store is enabled.
+
+Ownership
+~~~~~~~~~
+Several processes may share the database (server workers, a shell, a
+management command).  Each running store has a random boot ID, stamps
+it on every record it writes (``TaskRecord.owner``) and keeps a
+:class:`~api.models.TaskStoreProcess` row alive with a heartbeat every
+:data:`HEARTBEAT_INTERVAL` seconds.  A task counts as interrupted only
+when its owner's heartbeat is older than :data:`PROCESS_TIMEOUT` (or the
+row is gone — a store that stops cleanly deletes it).
+
+Recovery
+~~~~~~~~
+:func:`start_task_store` runs once per process, and only when
+``TASK_STORE_ENABLED`` is set (see :mod:`api.apps`).  Before its first
+flush, and every :data:`PROCESS_TIMEOUT` seconds after, the writer
+thread calls :func:`recover_tasks`.  Holding the ``recovery`` lock
+(:class:`~api.models.TaskStoreLock`, so one process recovers at a time)
+it:
+
+1. marks ``PENDING`` / ``PROCESSING`` tasks whose owner is dead as
+   ``FAILED``,
+2. moves ``PROCESSING`` projects back to ``FAILED`` — so they can be
+   rendered again — unless a live process owns their render or the
+   project changed within the last :data:`PROCESS_TIMEOUT` seconds (a
+   render just submitted may not be written yet),
+3. loads recent records, except those live elsewhere, back into the
+   registry, so the status endpoints keep answering for them, and
+4. with ``TASK_STORE_RESUME_TTS``, resubmits each interrupted
+   generate-all-audio batch (under its old task ID) for the segments it
+   had not finished or whose text changed since
+   (:func:`api.tasks.resume_tts_batch`).
+
+The table is also where :func:`find_tts_batch` looks for the checkpoint
+of a batch that has left the registry, for ``POST
+/api/projects/<id>/resume-audio/``.
+"""
+
+import atexit
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from django.db import DatabaseError, connection, models, transaction
+
+from .tasks import (
+    TASK_FAILED,
+    TASK_KIND_TTS_BATCH,
+    TASK_PENDING,
+    TASK_PROCESSING,
+    RENDER_TASK_PREFIX,
+    TTS_BATCH_TASK_PREFIX,
+    get_task_manager,
+    resume_tts_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between batched writes when the setting is absent
+DEFAULT_FLUSH_INTERVAL: float = 2.0
+
+# Progress keys kept out of the table
+UNPERSISTED_PROGRESS_KEYS = ("profile",)
+
+# Seconds between two heartbeats of a running store
+HEARTBEAT_INTERVAL: float = 10.0
+
+# A store whose heartbeat is older than this (seconds) is considered dead
+PROCESS_TIMEOUT: float = 60.0
+
+# Name and lease (seconds) of the lock held while recovering
+RECOVERY_LOCK = "recovery"
+RECOVERY_LOCK_TTL: float = 60.0
+
+# Description / error recorded on tasks interrupted by a restart
+INTERRUPTED_MESSAGE = "Interrupted by a server restart."
+
+_ACTIVE_STATUSES = (TASK_PENDING, TASK_PROCESSING)
+
+_RECORD_FIELDS = (
+    "owner", "lane", "status", "progress", "completed_segments", "errors", "params",
+    "cancel_requested", "created_at", "started_at", "completed_at",
+    "updated_at",
+)
+
+
+def task_record_fields(state: dict, now: Optional[float] = None) -> dict:
+    """Map a registry state dict to ``TaskRecord`` field values."""
+    progress = {
+        key: value
+        for key, value in (state.get("progress") or {}).items()
+        if key not in UNPERSISTED_PROGRESS_KEYS
+    }
+    return {
+        "lane": state.get("lane", ""),
+        "status": state["status"],
+        "progress": progress,
+        "completed_segments": list(state.get("completed_segments") or []),
+        "errors": list(state.get("errors") or []),
+        "params": dict(state.get("params") or {}),
+        "cancel_requested": bool(state.get("cancel_requested", False)),
+        "created_at": state.get("created_at") or time.time(),
+        "started_at": state.get("started_at"),
+        "completed_at": state.get("completed_at"),
+        "updated_at": now if now is not None else time.time(),
+    }
+
+
+def task_state_from_record(record) -> dict:
+    """Map a ``TaskRecord`` back to a registry state dict."""
+    return {
+        "status": record.status,
+        "lane": record.lane,
+        "progress": dict(record.progress or {}),
+        "completed_segments": list(record.completed_segments or []),
+        "errors": list(record.errors or []),
+        "params": dict(record.params or {}),
+        "cancel_requested": record.cancel_requested,
+        "created_at": record.created_at,
+        "started_at": record.started_at,
+        "completed_at": record.completed_at,
+    }
+
+
+def new_boot_id() -> str:
+    """Return a fresh boot ID for a task store."""
+    return uuid.uuid4().hex
+
+
+def use_wal_journal() -> bool:
+    """Switch a SQLite database to the WAL journal (persistent, idempotent).
+
+    Returns:
+        ``True`` if the database now uses WAL.
+    """
+    if connection.vendor != "sqlite":
+        return False
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode=WAL;")
+            mode = cursor.fetchone()[0]
+    except DatabaseError as exc:
+        logger.warning("Task store: could not enable the WAL journal: %s", exc)
+        return False
+    return str(mode).lower() == "wal"
+
+
+def acquire_lock(name: str, holder: str, ttl: float,
+                 now: Optional[float] = None) -> bool:
+    """Take the lease *name* for *holder* unless another holder has it.
+
+    The claim is a single conditional ``UPDATE``, so of several
+    processes racing for a free (or expired) lease exactly one wins.
+    """
+    from .models import TaskStoreLock  # noqa: E402 — deferred import
+
+    now = time.time() if now is None else now
+    TaskStoreLock.objects.get_or_create(name=name)
+    claimed = (
+        TaskStoreLock.objects.filter(name=name)
+        .filter(models.Q(holder=holder) | models.Q(expires_at__lt=now))
+        .update(holder=holder, expires_at=now + ttl)
+    )
+    return claimed == 1
+
+
+def release_lock(name: str, holder: str) -> None:
+    """Give the lease *name* up, if *holder* still has it."""
+    from .models import TaskStoreLock  # noqa: E402 — deferred import
+
+    TaskStoreLock.objects.filter(name=name, holder=holder).update(
+        holder="", expires_at=0.0,
+    )
+
+
+def live_owners(now: Optional[float] = None) -> set:
+    """Boot IDs of the stores whose heartbeat is recent enough."""
+    from .models import TaskStoreProcess  # noqa: E402 — deferred import
+
+    now = time.time() if now is None else now
+    return set(
+        TaskStoreProcess.objects.filter(heartbeat_at__gte=now - PROCESS_TIMEOUT)
+        .values_list("boot_id", flat=True)
+    )
+
+
+class TaskStore:
+    """Batches TaskManager changes into ``TaskRecord`` writes.
+
+    :meth:`mark` and :meth:`forget` are cheap and thread-safe;
+    :meth:`flush` does the database work and is called by the writer
+    thread (:meth:`start`) or directly.
+
+    Args:
+        manager: The TaskManager whose registry is persisted.
+        flush_interval: Minimum seconds between two flushes caused by
+            progress alone.
+        boot_id: Owner stamped on the records (default: a new one).
+    """
+
+    def __init__(self, manager, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 boot_id: Optional[str] = None):
+        self.manager = manager
+        self.flush_interval = max(float(flush_interval), 0.0)
+        self.boot_id = boot_id or new_boot_id()
+        self.started_at = time.time()
+        self._last_heartbeat = 0.0
+        self._lock = threading.Lock()
+        self._dirty: set = set()
+        self._removed: set = set()
+        self._written_status: dict = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+        self.rows_written = 0
+
+    # ------------------------------------------------------------------
+    # Change tracking (called with the TaskManager lock held)
+    # ------------------------------------------------------------------
+
+    def mark(self, task_id: str, status: str) -> None:
+        """Record that *task_id* changed; *status* is its current status."""
+        with self._lock:
+            self._dirty.add(task_id)
+            self._removed.discard(task_id)
+            urgent = self._written_status.get(task_id) != status
+        if urgent:
+            self._wake.set()
+
+    def forget(self, task_ids: Iterable[str]) -> None:
+        """Record that *task_ids* left the registry."""
+        with self._lock:
+            for task_id in task_ids:
+                self._dirty.discard(task_id)
+                self._removed.add(task_id)
+
+    @property
+    def pending(self) -> int:
+        """Number of changes not yet written."""
+        with self._lock:
+            return len(self._dirty) + len(self._removed)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def flush(self) -> int:
+        """Write every pending change in one transaction.
+
+        Returns:
+            Number of rows written or deleted (``0`` when the write
+            failed; the changes are then retried on the next flush).
+        """
+        from .models import TaskRecord  # noqa: E402 — deferred import
+
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            removed, self._removed = self._removed, set()
+        if not dirty and not removed:
+            return 0
+
+        states = self.manager.snapshot_tasks(dirty)
+        now = time.time()
+        records = [
+            TaskRecord(task_id=task_id, owner=self.boot_id,
+                       **task_record_fields(state, now))
+            for task_id, state in states.items()
+        ]
+        try:
+            with transaction.atomic():
+                if records:
+                    TaskRecord.objects.bulk_create(
+                        records,
+                        update_conflicts=True,
+                        unique_fields=["task_id"],
+                        update_fields=list(_RECORD_FIELDS),
+                    )
+                if removed:
+                    TaskRecord.objects.filter(task_id__in=removed).delete()
+        except DatabaseError as exc:
+            logger.warning("Task store: could not write %d task(s): %s",
+                           len(records) + len(removed), exc)
+            with self._lock:
+                self._dirty |= dirty - self._removed
+                self._removed |= removed - self._dirty
+            return 0
+
+        with self._lock:
+            for task_id, state in states.items():
+                self._written_status[task_id] = state["status"]
+            for task_id in removed:
+                self._written_status.pop(task_id, None)
+        self.flushes += 1
+        self.rows_written += len(records) + len(removed)
+        return len(records) + len(removed)
+
+    def heartbeat(self, now: Optional[float] = None) -> bool:
+        """Record that this store's process is alive.
+
+        Returns:
+            ``False`` if the write failed (it is retried next interval).
+        """
+        from .models import TaskStoreProcess  # noqa: E402 — deferred import
+
+        now = time.time() if now is None else now
+        try:
+            TaskStoreProcess.objects.update_or_create(
+                boot_id=self.boot_id,
+                defaults={"heartbeat_at": now},
+                create_defaults={
+                    "pid": os.getpid(),
+                    "hostname": socket.gethostname(),
+                    "started_at": self.started_at,
+                    "heartbeat_at": now,
+                },
+            )
+        except DatabaseError as exc:
+            logger.warning("Task store: heartbeat failed: %s", exc)
+            return False
+        self._last_heartbeat = now
+        return True
+
+    def retire(self) -> None:
+        """Remove this store's process row, so its leftovers are recovered at once."""
+        from .models import TaskStoreProcess  # noqa: E402 — deferred import
+
+        try:
+            TaskStoreProcess.objects.filter(boot_id=self.boot_id).delete()
+        except DatabaseError as exc:
+            logger.warning("Task store: could not retire %s: %s", self.boot_id, exc)
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def start(self, recover: bool = True, resume_tts: bool = False) -> "TaskStore":
+        """Start the writer thread (idempotent).
+
+        Args:
+            recover: Run :func:`recover_tasks` before the first flush
+                and every :data:`PROCESS_TIMEOUT` seconds after.
+            resume_tts: Passed on to :func:`recover_tasks`.
+        """
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(recover, resume_tts),
+            name="task-store", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the writer thread after a final flush."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        thread.join(timeout)
+        self._thread = None
+
+    def _run(self, recover: bool, resume_tts: bool) -> None:
+        try:
+            use_wal_journal()
+            self.heartbeat()
+            last_recovery = None
+            while not self._stop.is_set():
+                now = time.time()
+                if recover and (last_recovery is None
+                                or now - last_recovery >= PROCESS_TIMEOUT):
+                    last_recovery = now
+                    try:
+                        recover_tasks(self.manager, resume_tts=resume_tts,
+                                      boot_id=self.boot_id)
+                    except Exception as exc:
+                        logger.warning("Task store: recovery failed: %s", exc)
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                self.flush()
+                if time.time() - self._last_heartbeat >= HEARTBEAT_INTERVAL:
+                    self.heartbeat()
+                # Coalesce the changes that follow a status change too
+                self._stop.wait(min(self.flush_interval, 0.1))
+            self.flush()
+            self.retire()
+        finally:
+            connection.close()
+
+
+# --------------------------------------------------------------------------
+# Startup recovery
+# --------------------------------------------------------------------------
+
+
+def recover_tasks(manager=None, resume_tts: bool = False,
+                  now: Optional[float] = None, boot_id: str = "") -> dict:
+    """Recover the state a restart left behind (see the module docstring).
+
+    Args:
+        manager: TaskManager to restore into (default: the singleton).
+        resume_tts: Resubmit interrupted TTS batches for their remaining
+            segments.
+        now: Current epoch time (for tests).
+        boot_id: The calling store's boot ID; its own records are live.
+
+    Returns:
+        ``{"interrupted", "restored", "projects_failed", "resumed",
+        "skipped"}`` — counts, with ``resumed`` the list of resubmitted
+        task IDs and ``skipped`` true if another process held the lock.
+    """
+    manager = manager or get_task_manager()
+    now = time.time() if now is None else now
+    holder = boot_id or new_boot_id()
+
+    if not acquire_lock(RECOVERY_LOCK, holder, RECOVERY_LOCK_TTL, now):
+        logger.info("Task store: another process is recovering; skipped.")
+        return {
+            "interrupted": 0, "restored": 0, "projects_failed": 0,
+            "resumed": [], "skipped": True,
+        }
+    try:
+        return dict(_recover(manager, resume_tts, now, boot_id), skipped=False)
+    finally:
+        release_lock(RECOVERY_LOCK, holder)
+
+
+def _recover(manager, resume_tts: bool, now: float, boot_id: str) -> dict:
+    """The body of :func:`recover_tasks` (the caller holds the lock)."""
+    from .models import (  # noqa: E402 — deferred import
+        Project, TaskRecord, TaskStoreProcess, STATUS_FAILED, STATUS_PROCESSING,
+    )
+
+    from django.conf import settings  # noqa: E402 — deferred import
+
+    live = live_owners(now)
+    if boot_id:
+        live.add(boot_id)
+
+    # 1. Tasks whose process is gone
+    interrupted = list(
+        TaskRecord.objects.filter(status__in=_ACTIVE_STATUSES).exclude(owner__in=live)
+    )
+    for record in interrupted:
+        record.status = TASK_FAILED
+        record.completed_at = now
+        record.updated_at = now
+        record.progress = dict(record.progress or {}, description=INTERRUPTED_MESSAGE)
+        record.errors = list(record.errors or []) + [
+            {"segment_id": None, "error": INTERRUPTED_MESSAGE},
+        ]
+    if interrupted:
+        TaskRecord.objects.bulk_update(
+            interrupted,
+            ["status", "completed_at", "updated_at", "progress", "errors"],
+        )
+
+    TaskStoreProcess.objects.filter(
+        heartbeat_at__lt=now - PROCESS_TIMEOUT,
+    ).exclude(boot_id=boot_id).delete()
+
+    # 2. Projects left rendering by a dead process
+    render_ids = set(manager.find_tasks(RENDER_TASK_PREFIX))
+    render_ids.update(
+        TaskRecord.objects.filter(
+            task_id__startswith=RENDER_TASK_PREFIX,
+            status__in=_ACTIVE_STATUSES,
+            owner__in=live,
+        ).values_list("task_id", flat=True)
+    )
+    live_renders = [task_id[len(RENDER_TASK_PREFIX):] for task_id in render_ids]
+    settled = datetime.fromtimestamp(now - PROCESS_TIMEOUT, tz=timezone.utc)
+    projects_failed = (
+        Project.objects.filter(status=STATUS_PROCESSING, updated_at__lt=settled)
+        .exclude(id__in=live_renders)
+        .update(status=STATUS_FAILED)
+    )
+
+    # 3. Recent records back into the registry; expired ones are dropped
+    cutoff = now - getattr(settings, "TASK_CLEANUP_THRESHOLD", 3600)
+    TaskRecord.objects.filter(completed_at__lt=cutoff).delete()
+    restored = manager.restore_tasks({
+        record.task_id: task_state_from_record(record)
+        for record in TaskRecord.objects.exclude(
+            status__in=_ACTIVE_STATUSES, owner__in=live,
+        )
+    })
+
+    # 4. Interrupted TTS batches, continued from their checkpoints
+    resumed = []
+    if resume_tts:
+        for record in interrupted:
+            if (record.params or {}).get("kind") != TASK_KIND_TTS_BATCH:
+                continue
+            plan = resume_tts_batch(
+                record.task_id, task_state_from_record(record), task_id=record.task_id,
+            )
+            if plan["task_id"] is not None:
+                resumed.append(plan["task_id"])
+
+    if interrupted or projects_failed or resumed:
+        logger.warning(
+            "Task store: %d task(s) interrupted by a restart, %d project(s) "
+            "reset from PROCESSING, %d TTS batch(es) resumed.",
+            len(interrupted), projects_failed, len(resumed),
+        )
+    return {
+        "interrupted": len(interrupted),
+        "restored": restored,
+        "projects_failed": projects_failed,
+        "resumed": resumed,
+    }
+
+
+def find_tts_batch(project_id: str, batch_id: Optional[str] = None,
+                   manager=None) -> tuple:
+    """Find a project's TTS batch in the registry or, failing that, the table.
+
+    Args:
+        project_id: UUID string of the project.
+        batch_id: A specific batch; default is the project's most
+            recently created one.
+        manager: TaskManager to search (default: the singleton).
+
+    Returns:
+        ``(batch_id, state)``, or ``(None, None)`` if there is none.
+    """
+    from .models import TaskRecord  # noqa: E402 — deferred import
+
+    manager = manager or get_task_manager()
+    prefix = f"{TTS_BATCH_TASK_PREFIX}{project_id}_"
+    if batch_id is not None and not batch_id.startswith(prefix):
+        return None, None
+
+    candidates = {
+        record.task_id: task_state_from_record(record)
+        for record in TaskRecord.objects.filter(task_id__startswith=prefix)
+    }
+    candidates.update(manager.find_tasks(prefix))
+    if batch_id is not None:
+        state = candidates.get(batch_id)
+        return (batch_id, state) if state is not None else (None, None)
+    if not candidates:
+        return None, None
+    latest = max(candidates, key=lambda tid: candidates[tid].get("created_at") or 0)
+    return latest, candidates[latest]
+
+
+def start_task_store(manager=None) -> Optional[TaskStore]:
+    """Attach and start a :class:`TaskStore` if ``TASK_STORE_ENABLED``.
+
+    Called once from ``ApiConfig.ready``; the database work (WAL,
+    recovery, then flushes) happens on the writer thread, which is
+    stopped — with a final flush — when the interpreter exits.
+
+    Returns:
+        The running store, or ``None`` when persistence is disabled.
+    """
+    from django.conf import settings  # noqa: E402 — deferred import
+
+    if not getattr(settings, "TASK_STORE_ENABLED", False):
+        return None
+    manager = manager or get_task_manager()
+    store = TaskStore(
+        manager,
+        flush_interval=getattr(settings, "TASK_STORE_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL),
+    )
+    manager.attach_store(store)
+    store.start(
+        recover=True,
+        resume_tts=getattr(settings, "TASK_STORE_RESUME_TTS", False),
+    )
+    atexit.register(store.stop, 5.0)
+    return store
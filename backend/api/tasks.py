@@ -1,17 +1,52 @@
 """
 TaskManager — Singleton for background task management.
 
-Provides a single-threaded executor and a thread-safe task registry
-for tracking asynchronous audio generation work. All status reads
-and writes are guarded by a lock so API threads and background
-threads never race on the same dict.
+Provides one executor per named *lane* and a thread-safe task registry
+for tracking asynchronous audio generation, render and preview work.
+All status reads and writes are guarded by a lock so API threads and
+background threads never race on the same dict.
 
 Threading model
 ~~~~~~~~~~~~~~~
-``max_workers=1`` is deliberate: TTS inference is CPU/GPU-intensive.
-Tasks submitted while the worker is busy are queued automatically by
-``ThreadPoolExecutor``. Each queued task remains in ``PENDING`` state
-until the executor picks it up and transitions it to ``PROCESSING``.
+Work is split into independent lanes, each backed by its own
+``ThreadPoolExecutor``:
+
+* ``tts``     — Kokoro inference (single and bulk audio generation).
+* ``render``  — full project renders (which fan out to their own
+  process pool, see ``GlobalSettings.render_workers``).
+* ``preview`` — low-resolution single-segment previews.
+* ``batch``   — render-batch coordinators, which queue the projects of
+  a batch onto the ``render`` lane one after another (see
+  :func:`render_batch_task_function`) and otherwise just wait.
+
+A 20-minute render therefore never blocks a "Generate audio" click.
+Each lane defaults to ``max_workers=1`` — TTS inference is
+CPU/GPU-intensive and should not run twice at once — and can be tuned
+with the ``TASK_LANE_WORKERS`` Django setting, e.g.
+``{"tts": 1, "render": 2, "preview": 1}``.
+
+Tasks submitted while a lane's workers are busy are queued
+automatically by its executor. Each queued task remains in ``PENDING``
+state until a worker picks it up and transitions it to ``PROCESSING``.
+Per-lane queue depth and wait times are available from
+:meth:`TaskManager.get_lane_metrics`.
+
+Change notifications
+~~~~~~~~~~~~~~~~~~~~
+Every state change (submission, status transitions, progress updates,
+completed segments, errors, cancellation) stamps the task with a
+process-wide, increasing ``event_seq`` and wakes the threads blocked in
+:meth:`TaskManager.wait_for_changes`.  The server-sent events endpoint
+(``/api/tasks/events/``) uses this to push progress as it happens
+instead of being polled.
+
+Persistence
+~~~~~~~~~~~
+The registry itself lives in memory.  When a ``TaskStore`` is attached
+(:meth:`TaskManager.attach_store`, done at server startup when
+``TASK_STORE_ENABLED`` is set) every change is also written, batched
+and throttled, to the ``TaskRecord`` table — see :mod:`api.task_store`,
+which also recovers the tasks a restart interrupted.
 
 Database connections
 ~~~~~~~~~~~~~~~~~~~~
@@ -24,7 +59,9 @@ import logging
 import threading
 import time
 import uuid
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from django.db import connection
 
@@ -40,6 +77,31 @@ TASK_COMPLETED = "COMPLETED"
 TASK_FAILED = "FAILED"
 TASK_CANCELLED = "CANCELLED"
 
+# Render tasks are registered as ``render_<project_id>``, render
+# batches as ``batch_<uuid>``, bulk audio generation as
+# ``tts_batch_<project_id>_<hex8>``
+RENDER_TASK_PREFIX = "render_"
+BATCH_TASK_PREFIX = "batch_"
+TTS_BATCH_TASK_PREFIX = "tts_batch_"
+
+# ``params["kind"]`` of tasks that can be resumed after a restart
+TASK_KIND_TTS_BATCH = "tts_batch"
+
+# --------------------------------------------------------------------------
+# Executor lanes
+# --------------------------------------------------------------------------
+
+LANE_TTS = "tts"
+LANE_RENDER = "render"
+LANE_PREVIEW = "preview"
+LANE_BATCH = "batch"
+
+LANES = (LANE_TTS, LANE_RENDER, LANE_PREVIEW, LANE_BATCH)
+DEFAULT_LANE_WORKERS = {LANE_TTS: 1, LANE_RENDER: 1, LANE_PREVIEW: 1, LANE_BATCH: 1}
+
+# Number of recent queue-wait samples kept per lane for the metrics.
+LANE_WAIT_SAMPLES = 50
+
 
 # --------------------------------------------------------------------------
 # TaskManager singleton
@@ -52,9 +114,10 @@ class TaskManager:
     task registry.
 
     Uses double-checked locking in ``__new__`` to guarantee exactly one
-    instance across all threads. The single ``ThreadPoolExecutor`` with
-    ``max_workers=1`` ensures TTS jobs run sequentially (to avoid
-    OOM / GPU contention).
+    instance across all threads. Each lane owns a ``ThreadPoolExecutor``
+    sized from ``TASK_LANE_WORKERS``; the TTS lane keeps a single worker
+    by default so TTS jobs run sequentially (to avoid OOM / GPU
+    contention) while renders and previews proceed on their own lanes.
     """
 
     _instance = None
@@ -80,36 +143,73 @@ class TaskManager:
     # ------------------------------------------------------------------
 
     def _init(self):
-        """Initialise the executor, registry, and lock."""
+        """Initialise the lane executors, registry, and lock."""
         from django.conf import settings
 
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        lane_workers = dict(DEFAULT_LANE_WORKERS)
+        lane_workers.update(getattr(settings, 'TASK_LANE_WORKERS', {}) or {})
+
+        self._lanes: dict = {}
+        for lane in LANES:
+            workers = max(int(lane_workers.get(lane, 1)), 1)
+            self._lanes[lane] = {
+                "workers": workers,
+                "executor": ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix=f"task-{lane}",
+                ),
+                "queued": 0,
+                "running": 0,
+                "completed": 0,
+                "wait_times": deque(maxlen=LANE_WAIT_SAMPLES),
+            }
+
         self._tasks: dict = {}
         self._tasks_lock = threading.Lock()
+        # Signalled (under _tasks_lock) on every task state change
+        self._tasks_changed = threading.Condition(self._tasks_lock)
+        self._event_seq = 0
         self._cleanup_threshold = getattr(settings, 'TASK_CLEANUP_THRESHOLD', 3600)
         self._is_shutdown = False
-        logger.info("TaskManager initialised (max_workers=1)")
+        # Optional write-behind persistence (see attach_store)
+        self._store = None
+        logger.info(
+            "TaskManager initialised (lanes: %s)",
+            ", ".join(f"{name}={lane['workers']}" for name, lane in self._lanes.items()),
+        )
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def submit_task(self, task_fn, task_id=None) -> str:
+    def submit_task(self, task_fn, task_id=None, lane=LANE_TTS, progress=None) -> str:
         """
         Register *task_fn* for background execution.
 
         The task starts in ``PENDING`` and transitions to ``PROCESSING``
         only when the executor's worker thread picks it up (not at
-        submission time). If the executor has been shut down, it is
-        automatically re-created.
+        submission time). If the lane's executor has been shut down, it
+        is automatically re-created.
 
         Args:
             task_fn: A callable that performs the actual work.
             task_id: Optional task identifier. Generated via UUID if omitted.
+            lane: One of :data:`LANES` — ``LANE_TTS`` (default),
+                ``LANE_RENDER``, ``LANE_PREVIEW`` or ``LANE_BATCH``.
+            progress: Optional initial progress dict, visible while the
+                task is still ``PENDING``.
 
         Returns:
             The task ID string.
+
+        Raises:
+            ValueError: If *lane* is not a known lane.
         """
+        if lane not in self._lanes:
+            raise ValueError(
+                f"Unknown task lane '{lane}'. Expected one of: {', '.join(LANES)}."
+            )
+
         if task_id is None:
             task_id = str(uuid.uuid4())
 
@@ -117,13 +217,18 @@ class TaskManager:
         with self._tasks_lock:
             self._tasks[task_id] = {
                 "status": TASK_PENDING,
-                "progress": {},
+                "lane": lane,
+                "progress": dict(progress or {}),
                 "completed_segments": [],
                 "errors": [],
+                "params": {},
                 "cancel_requested": False,
                 "created_at": time.time(),
+                "started_at": None,
                 "completed_at": None,
             }
+            self._lanes[lane]["queued"] += 1
+            self._notify(task_id)
 
         def wrapper():
             """
@@ -132,40 +237,59 @@ class TaskManager:
             Always closes the Django DB connection in the ``finally``
             block to prevent SQLite "database is locked" errors.
             """
+            lane_state = self._lanes[lane]
             try:
                 # Transition to PROCESSING when the worker picks up this task
                 with self._tasks_lock:
+                    lane_state["queued"] -= 1
+                    lane_state["running"] += 1
                     if task_id in self._tasks:
+                        started_at = time.time()
                         self._tasks[task_id]["status"] = TASK_PROCESSING
+                        self._tasks[task_id]["started_at"] = started_at
+                        lane_state["wait_times"].append(
+                            started_at - self._tasks[task_id]["created_at"]
+                        )
+                        self._notify(task_id)
 
                 task_fn()
 
                 with self._tasks_lock:
-                    if task_id in self._tasks:
+                    # A task that honoured a cancellation keeps CANCELLED
+                    if task_id in self._tasks and self._tasks[task_id]["status"] != TASK_CANCELLED:
                         self._tasks[task_id]["status"] = TASK_COMPLETED
                         self._tasks[task_id]["completed_at"] = time.time()
+                        self._notify(task_id)
             except Exception as exc:
                 logger.exception("Task %s failed: %s", task_id, exc)
                 with self._tasks_lock:
                     if task_id in self._tasks:
                         self._tasks[task_id]["status"] = TASK_FAILED
                         self._tasks[task_id]["completed_at"] = time.time()
+                        self._notify(task_id)
             finally:
+                with self._tasks_lock:
+                    lane_state["running"] -= 1
+                    lane_state["completed"] += 1
                 # Critical: close the DB connection held by this worker thread
                 connection.close()
 
-        # Handle submission after shutdown — re-create the executor
+        # Handle submission after shutdown — re-create the lane executor
+        lane_state = self._lanes[lane]
         try:
-            self._executor.submit(wrapper)
+            lane_state["executor"].submit(wrapper)
         except RuntimeError:
-            logger.warning("Executor was shut down — re-creating")
-            self._executor = ThreadPoolExecutor(max_workers=1)
+            logger.warning("Executor for lane '%s' was shut down — re-creating", lane)
+            lane_state["executor"] = ThreadPoolExecutor(
+                max_workers=lane_state["workers"],
+                thread_name_prefix=f"task-{lane}",
+            )
             self._is_shutdown = False
-            self._executor.submit(wrapper)
+            lane_state["executor"].submit(wrapper)
 
         self._cleanup_old_tasks()
 
-        logger.info("Task %s submitted", task_id)
+        logger.info("Task %s submitted to lane '%s'", task_id, lane)
         return task_id
 
     def get_task_status(self, task_id: str):
@@ -181,6 +305,128 @@ class TaskManager:
                 return None
             return task.copy()
 
+    def find_tasks(self, prefix: str) -> dict:
+        """Return ``{task_id: state copy}`` for every task ID starting with *prefix*."""
+        with self._tasks_lock:
+            return {
+                tid: task.copy()
+                for tid, task in self._tasks.items()
+                if tid.startswith(prefix)
+            }
+
+    def get_lane_metrics(self) -> dict:
+        """
+        Return a snapshot of queue depth and wait times for every lane.
+
+        ``queue_depth`` counts tasks waiting for a worker; wait times are
+        measured from submission to the moment a worker picked the task
+        up, over the last :data:`LANE_WAIT_SAMPLES` tasks of the lane.
+
+        Returns:
+            ``{lane: {"workers", "queue_depth", "running", "completed",
+            "avg_wait_seconds", "max_wait_seconds",
+            "oldest_pending_seconds"}}``
+        """
+        now = time.time()
+        with self._tasks_lock:
+            oldest_pending: dict = {}
+            for task in self._tasks.values():
+                if task["status"] != TASK_PENDING:
+                    continue
+                lane = task.get("lane", LANE_TTS)
+                age = now - task["created_at"]
+                oldest_pending[lane] = max(oldest_pending.get(lane, 0.0), age)
+
+            metrics = {}
+            for name, lane in self._lanes.items():
+                waits = list(lane["wait_times"])
+                metrics[name] = {
+                    "workers": lane["workers"],
+                    "queue_depth": lane["queued"],
+                    "running": lane["running"],
+                    "completed": lane["completed"],
+                    "avg_wait_seconds": (
+                        round(sum(waits) / len(waits), 3) if waits else 0.0
+                    ),
+                    "max_wait_seconds": round(max(waits), 3) if waits else 0.0,
+                    "oldest_pending_seconds": round(oldest_pending.get(name, 0.0), 3),
+                }
+            return metrics
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def attach_store(self, store):
+        """Mirror every task change to *store* (an ``api.task_store.TaskStore``).
+
+        Tasks already in the registry are marked dirty so the store
+        catches up with them on its next flush.
+        """
+        with self._tasks_lock:
+            self._store = store
+            for task_id, task in self._tasks.items():
+                store.mark(task_id, task["status"])
+
+    def detach_store(self):
+        """Stop mirroring task changes; returns the detached store."""
+        with self._tasks_lock:
+            store, self._store = self._store, None
+            return store
+
+    def set_task_params(self, task_id: str, params: dict):
+        """Record what is needed to resume *task_id* after a restart.
+
+        Only persisted (and used on startup by
+        ``api.task_store.recover_tasks``); running tasks never read it.
+        """
+        with self._tasks_lock:
+            if task_id not in self._tasks:
+                return
+            self._tasks[task_id]["params"] = dict(params)
+            self._notify(task_id)
+
+    def snapshot_tasks(self, task_ids) -> dict:
+        """Return ``{task_id: state copy}`` for the registered *task_ids*.
+
+        Unlike :meth:`get_task_status`, the segment and error lists are
+        copied too, so the result can be serialised outside the lock.
+        """
+        with self._tasks_lock:
+            snapshot = {}
+            for task_id in task_ids:
+                task = self._tasks.get(task_id)
+                if task is None:
+                    continue
+                state = task.copy()
+                state["progress"] = dict(task["progress"])
+                state["completed_segments"] = list(task["completed_segments"])
+                state["errors"] = list(task["errors"])
+                snapshot[task_id] = state
+            return snapshot
+
+    def restore_tasks(self, states: dict) -> int:
+        """Register finished tasks loaded from the persistent store.
+
+        Tasks already in the registry (e.g. resubmitted since startup)
+        are left alone, and restored tasks are not marked dirty — the
+        store already holds them.
+
+        Returns:
+            Number of tasks restored.
+        """
+        restored = 0
+        with self._tasks_lock:
+            for task_id, state in states.items():
+                if task_id in self._tasks:
+                    continue
+                self._event_seq += 1
+                self._tasks[task_id] = dict(state, event_seq=self._event_seq)
+                restored += 1
+            if restored:
+                self._tasks_changed.notify_all()
+        return restored
+
     # ------------------------------------------------------------------
     # Lifecycle management
     # ------------------------------------------------------------------
@@ -193,9 +439,10 @@ class TaskManager:
             wait: If True, block until all queued tasks finish.
                   If False, return immediately (tasks may still run).
         """
-        self._executor.shutdown(wait=wait)
+        for lane in self._lanes.values():
+            lane["executor"].shutdown(wait=wait)
         self._is_shutdown = True
-        logger.info("TaskManager executor shut down (wait=%s)", wait)
+        logger.info("TaskManager executors shut down (wait=%s)", wait)
 
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -214,8 +461,25 @@ class TaskManager:
             if task is None:
                 return False
             task["cancel_requested"] = True
+            self._notify(task_id)
             return True
 
+    def mark_cancelled(self, task_id: str, description: str = "Cancelled by user"):
+        """
+        Record that *task_id* stopped after a cancellation request.
+
+        Called by task functions once they have honoured
+        :meth:`cancel_task`; the wrapper then leaves the status alone.
+        """
+        with self._tasks_lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return
+            task["status"] = TASK_CANCELLED
+            task["completed_at"] = time.time()
+            task["progress"]["description"] = description
+            self._notify(task_id)
+
     def is_cancelled(self, task_id: str) -> bool:
         """
         Check whether cancellation has been requested for *task_id*.
@@ -260,6 +524,7 @@ class TaskManager:
                 "percentage": percentage,
                 **kwargs,
             }
+            self._notify(task_id)
 
     def add_completed_segment(self, task_id: str, segment_id, result: dict):
         """
@@ -268,18 +533,26 @@ class TaskManager:
         Args:
             task_id: The task identifier.
             segment_id: Segment primary key.
-            result: Dict with at least ``audio_url`` and ``duration``.
+            result: Dict with at least ``audio_url`` and ``duration``;
+                ``cached`` marks audio served from the TTS audio cache,
+                ``text_hash`` (TTS batches) checkpoints the input the
+                audio was generated from.
         """
         with self._tasks_lock:
             task = self._tasks.get(task_id)
             if task is None:
                 return
 
-            task["completed_segments"].append({
+            entry = {
                 "segment_id": segment_id,
                 "audio_url": result.get("audio_url", ""),
                 "duration": result.get("duration", 0),
-            })
+                "cached": result.get("cached", False),
+            }
+            if result.get("text_hash"):
+                entry["text_hash"] = result["text_hash"]
+            task["completed_segments"].append(entry)
+            self._notify(task_id)
 
     def add_error(self, task_id: str, segment_id, error_message: str):
         """
@@ -299,6 +572,52 @@ class TaskManager:
                 "segment_id": segment_id,
                 "error": error_message,
             })
+            self._notify(task_id)
+
+    # ------------------------------------------------------------------
+    # Change notifications
+    # ------------------------------------------------------------------
+
+    def wait_for_changes(self, since: int, timeout: float, task_ids=None):
+        """
+        Block until a task changes after event *since*, or *timeout*.
+
+        Args:
+            since: Last ``event_seq`` the caller has seen (``0`` = none,
+                so every current task is returned at once).
+            timeout: Maximum seconds to wait.
+            task_ids: Optional collection restricting which tasks are
+                returned (others still wake the caller).
+
+        Returns:
+            ``(seq, changed)`` — the newest ``event_seq`` and a dict of
+            ``{task_id: state copy}`` for the matching tasks changed
+            after *since*.  Several updates of one task in between are
+            coalesced into its latest state.
+        """
+        with self._tasks_changed:
+            self._tasks_changed.wait_for(
+                lambda: self._event_seq > since, timeout=max(timeout, 0.0),
+            )
+            changed = {
+                tid: task.copy()
+                for tid, task in self._tasks.items()
+                if task.get("event_seq", 0) > since
+                and (task_ids is None or tid in task_ids)
+            }
+            return self._event_seq, changed
+
+    def _notify(self, task_id: str):
+        """Stamp *task_id* as changed and wake waiters (lock must be held).
+
+        Also marks the task dirty in the persistent store, if attached.
+        """
+        task = self._tasks[task_id]
+        self._event_seq += 1
+        task["event_seq"] = self._event_seq
+        self._tasks_changed.notify_all()
+        if self._store is not None:
+            self._store.mark(task_id, task["status"])
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -316,7 +635,10 @@ class TaskManager:
             ]
             for tid in stale_ids:
                 del self._tasks[tid]
+            store = self._store
 
+        if stale_ids and store is not None:
+            store.forget(stale_ids)
         if stale_ids:
             logger.info("Cleaned up %d stale task(s)", len(stale_ids))
 
@@ -336,7 +658,11 @@ def get_task_manager() -> TaskManager:
 # --------------------------------------------------------------------------
 
 
-def render_task_function(project_id: str, task_id: str) -> None:
+def render_task_function(
+    project_id: str,
+    task_id: str,
+    render_quality: Optional[str] = None,
+) -> None:
     """Background task that renders a project's video.
 
     Bridges the TaskManager infrastructure (Phase 03) with the video
@@ -349,9 +675,18 @@ def render_task_function(project_id: str, task_id: str) -> None:
     ``is_cancelled()`` between segments and raises ``RenderCancelled``
     to abort cleanly.
 
+    The render is profiled by a ``RenderProfiler``; every progress
+    update carries its fixed-size ``summary()`` as
+    ``progress["profile"]`` (current phase, totals, export frame rate),
+    so updates stay cheap however many segments there are.  Only the
+    final update carries the full report, plus the path of the
+    ``render_report.json`` written next to the MP4.
+
     Args:
         project_id: UUID string of the project to render.
         task_id:    TaskManager-assigned identifier (``render_{project_id}``).
+        render_quality: Optional preset name (``draft`` / ``standard`` /
+            ``final``) overriding ``GlobalSettings.render_quality``.
 
     Note:
         Imports are deferred to avoid circular dependencies.
@@ -359,10 +694,15 @@ def render_task_function(project_id: str, task_id: str) -> None:
         model instance must never be shared across threads.
     """
     # Step 2 — deferred imports
+    from core_engine.render_profiler import RenderProfiler  # noqa: E402
     from core_engine.video_renderer import render_project  # noqa: E402
     from api.models import Project, STATUS_COMPLETED, STATUS_FAILED  # noqa: E402
 
     tm = get_task_manager()
+    profiler = RenderProfiler()
+    # Segment count, kept through the export phase (whose total is 100)
+    # so progress events can be shown without a database read.
+    segment_total = {"value": 0}
 
     class RenderCancelled(Exception):
         """Raised when cooperative cancellation is detected."""
@@ -398,9 +738,12 @@ def render_task_function(project_id: str, task_id: str) -> None:
                 description=phase,
                 is_export_phase=True,
                 percentage_override=pct,
+                total_segments=segment_total["value"],
+                profile=profiler.summary(),
             )
         else:
             # Scale segment progress into the 0–80 % range
+            segment_total["value"] = total
             seg_pct = int((current / total) * 80) if total > 0 else 0
             tm.update_task_progress(
                 task_id,
@@ -408,11 +751,18 @@ def render_task_function(project_id: str, task_id: str) -> None:
                 total=total,
                 description=phase,
                 percentage_override=seg_pct,
+                total_segments=total,
+                profile=profiler.summary(),
             )
 
     try:
         # Step 4 — blocking render call
-        result = render_project(project_id, on_progress=on_progress)
+        result = render_project(
+            project_id,
+            on_progress=on_progress,
+            render_quality=render_quality,
+            profiler=profiler,
+        )
 
         # Step 5 — success: update Project model
         project = Project.objects.get(id=project_id)
@@ -426,9 +776,12 @@ def render_task_function(project_id: str, task_id: str) -> None:
             current=result.get("total_segments", 0),
             total=result.get("total_segments", 0),
             description="Export complete",
+            total_segments=segment_total["value"],
             output_path=result.get("output_path", ""),
             duration=result.get("duration", 0),
             file_size=result.get("file_size", 0),
+            profile=result.get("profile"),
+            render_report=result.get("render_report"),
         )
 
     except RenderCancelled:
@@ -441,12 +794,7 @@ def render_task_function(project_id: str, task_id: str) -> None:
         except Exception:
             pass
         # Mark the task as CANCELLED in TaskManager
-        with tm._tasks_lock:
-            task = tm._tasks.get(task_id)
-            if task:
-                task["status"] = TASK_CANCELLED
-                task["completed_at"] = __import__("time").time()
-                task["progress"]["description"] = "Cancelled by user"
+        tm.mark_cancelled(task_id)
 
     except Exception as exc:
         # Step 6 — failure: log error, set FAILED status
@@ -463,3 +811,523 @@ def render_task_function(project_id: str, task_id: str) -> None:
 
         # Re-raise so the TaskManager wrapper marks the task as FAILED
         raise
+
+
+# --------------------------------------------------------------------------
+# Bulk audio generation
+# --------------------------------------------------------------------------
+
+
+def tts_batch_params(project_id: str, segment_ids: list, voice_id: str,
+                     speed: float, checkpoint: Optional[list] = None,
+                     resumed_from: Optional[str] = None) -> dict:
+    """Resume parameters of a TTS batch (see ``TaskManager.set_task_params``).
+
+    Args:
+        segment_ids: Every segment of the batch, in narration order.
+        checkpoint: ``[{"segment_id", "text_hash"}]`` of segments a
+            previous run of the batch already finished (resumed
+            batches only).
+        resumed_from: Task ID of that previous run.
+    """
+    params = {
+        "kind": TASK_KIND_TTS_BATCH,
+        "project_id": project_id,
+        "segment_ids": list(segment_ids),
+        "voice_id": voice_id,
+        "speed": speed,
+    }
+    if checkpoint:
+        params["checkpoint"] = list(checkpoint)
+    if resumed_from:
+        params["resumed_from"] = resumed_from
+    return params
+
+
+def plan_tts_batch_resume(state: dict, texts: dict) -> dict:
+    """Work out what is left of a checkpointed TTS batch.
+
+    A segment counts as done when a run of the batch completed it (its
+    ``completed_segments`` entry, or the ``checkpoint`` carried over
+    from earlier runs) **and** the hash recorded then still matches its
+    current text.  Completed segments whose text changed since are
+    *stale*; completions without a hash cannot be checked and count as
+    stale too.
+
+    Args:
+        state: Registry (or ``TaskRecord``) state of the batch.
+        texts: ``{segment_id: text_content}`` of the batch's segments
+            as they are now; segments missing from it were deleted.
+
+    Returns:
+        ``{"done": [{"segment_id", "text_hash"}], "remaining": [...],
+        "stale": [...], "missing": [...]}`` — segment IDs in narration
+        order.
+    """
+    from core_engine.tts_cache import tts_input_hash  # noqa: E402 — deferred import
+
+    params = state.get("params") or {}
+    voice_id, speed = params.get("voice_id"), params.get("speed", 1.0)
+
+    recorded = {}
+    for entry in list(params.get("checkpoint") or []) + list(state.get("completed_segments") or []):
+        recorded[str(entry.get("segment_id"))] = entry.get("text_hash")
+
+    plan = {"done": [], "remaining": [], "stale": [], "missing": []}
+    for seg_id in params.get("segment_ids") or []:
+        if seg_id not in texts:
+            plan["missing"].append(seg_id)
+        elif seg_id not in recorded:
+            plan["remaining"].append(seg_id)
+        elif recorded[seg_id] and recorded[seg_id] == tts_input_hash(texts[seg_id], voice_id, speed):
+            plan["done"].append({"segment_id": seg_id, "text_hash": recorded[seg_id]})
+        else:
+            plan["stale"].append(seg_id)
+    return plan
+
+
+def new_tts_batch_task_id(project_id: str) -> str:
+    """Return a fresh ``tts_batch_<project_id>_<hex8>`` task ID."""
+    return f"{TTS_BATCH_TASK_PREFIX}{project_id}_{uuid.uuid4().hex[:8]}"
+
+
+def resume_tts_batch(batch_id: str, state: dict,
+                     task_id: Optional[str] = None) -> dict:
+    """Submit the unfinished part of a checkpointed TTS batch.
+
+    Only the remaining and stale segments (see
+    :func:`plan_tts_batch_resume`) are synthesised, with the batch's own
+    voice and speed; the new task carries the checkpoint forward so it
+    can be resumed in turn.
+
+    Args:
+        batch_id: Task ID of the batch to resume.
+        state: Its registry (or ``TaskRecord``) state; it must not be
+            running.
+        task_id: ID of the new task (default: a fresh one; recovery
+            reuses *batch_id*).
+
+    Returns:
+        The plan, plus ``"task_id"`` — ``None`` when nothing was left.
+    """
+    from api.models import Segment  # noqa: E402 — deferred import
+
+    params = state.get("params") or {}
+    project_id = params.get("project_id")
+    segment_ids = list(params.get("segment_ids") or [])
+    voice_id, speed = params.get("voice_id"), params.get("speed", 1.0)
+
+    texts = {
+        str(pk): text
+        for pk, text in Segment.objects.filter(
+            project_id=project_id, pk__in=segment_ids,
+        ).values_list("id", "text_content")
+    }
+    plan = plan_tts_batch_resume(state, texts)
+    todo = set(plan["remaining"]) | set(plan["stale"])
+    plan["task_id"] = None
+    if not todo:
+        return plan
+
+    to_process = [seg_id for seg_id in segment_ids if seg_id in todo]
+    task_id = task_id or new_tts_batch_task_id(project_id)
+    resumed_from = batch_id if task_id != batch_id else params.get("resumed_from")
+
+    def resumed_batch_fn():
+        tts_batch_task_function(project_id, task_id, to_process, voice_id, speed)
+
+    tm = get_task_manager()
+    tm.submit_task(resumed_batch_fn, task_id=task_id)
+    tm.set_task_params(task_id, tts_batch_params(
+        project_id, segment_ids, voice_id, speed,
+        checkpoint=plan["done"], resumed_from=resumed_from,
+    ))
+    plan["task_id"] = task_id
+    return plan
+
+
+def tts_batch_task_function(
+    project_id: str,
+    task_id: str,
+    segment_ids: list,
+    voice_id: str,
+    speed: float,
+) -> None:
+    """Background task that generates audio for several segments.
+
+    Runs every segment through the batched TTS pipeline
+    (``generate_audio_batch``), reporting per-segment progress, completed
+    segments and errors to the TaskManager.  Text already in the TTS
+    audio cache is linked instead of re-synthesised.  Each completed
+    segment records the hash of its text, voice and speed — the
+    checkpoint :func:`resume_tts_batch` continues from.
+
+    Args:
+        project_id: UUID string of the project.
+        task_id: TaskManager-assigned identifier
+            (``tts_batch_<project_id>_<hex8>``).
+        segment_ids: Segment UUID strings, in narration order.
+        voice_id: Kokoro voice.
+        speed: Speech speed multiplier.
+    """
+    from core_engine.tts_wrapper import (  # noqa: E402 — deferred import
+        generate_audio_batch,
+        construct_audio_path,
+        construct_audio_url,
+    )
+    from core_engine.tts_cache import TTSAudioCache, tts_input_hash  # noqa: E402
+    from api.models import Segment  # noqa: E402
+
+    tm = get_task_manager()
+
+    # Read every pending segment's text up front so the batched TTS
+    # pipeline can phonemize ahead of inference.
+    texts = {
+        str(pk): text
+        for pk, text in Segment.objects.filter(
+            pk__in=segment_ids,
+        ).values_list("id", "text_content")
+    }
+    items = []
+    hashes = {}
+    for seg_id in segment_ids:
+        text = texts.get(seg_id)
+        if text is None:
+            tm.add_error(task_id, seg_id, "Segment no longer exists.")
+            continue
+        hashes[seg_id] = tts_input_hash(text, voice_id, speed)
+        items.append({
+            "key": seg_id,
+            "text": text,
+            "output_path": str(construct_audio_path(project_id, seg_id)),
+        })
+
+    position = {"index": 0, "total": len(items)}
+
+    def on_start(index, total, seg_id):
+        # Update progress BEFORE processing
+        position.update(index=index, total=total)
+        tm.update_task_progress(
+            task_id,
+            current=index + 1,
+            total=total,
+            current_segment_id=seg_id,
+        )
+
+    def on_chunk(seg_id, done, chunks):
+        # Sub-segment progress for long, streamed narration
+        index, total = position["index"], position["total"]
+        tm.update_task_progress(
+            task_id,
+            current=index + 1,
+            total=total,
+            current_segment_id=seg_id,
+            segment_chunk=done,
+            segment_chunks=chunks,
+            percentage_override=int((index + done / chunks) / total * 100),
+        )
+
+    def on_result(seg_id, result):
+        try:
+            if result["success"]:
+                audio_url = construct_audio_url(project_id, seg_id)
+                seg = Segment.objects.get(pk=seg_id)
+                seg.audio_file.name = f"projects/{project_id}/audio/{seg_id}.wav"
+                seg.audio_duration = result["duration"]
+                seg.audio_input_hash = hashes[seg_id]
+                seg.save(update_fields=["audio_file", "audio_duration", "audio_input_hash"])
+                tm.add_completed_segment(task_id, seg_id, {
+                    "audio_url": audio_url,
+                    "duration": result["duration"],
+                    "cached": result.get("cached", False),
+                    "text_hash": hashes[seg_id],
+                })
+            else:
+                tm.add_error(task_id, seg_id, result["error"])
+        except Exception as exc:
+            tm.add_error(task_id, seg_id, str(exc))
+
+    generate_audio_batch(
+        items,
+        voice_id=voice_id,
+        speed=speed,
+        on_start=on_start,
+        on_result=on_result,
+        should_cancel=lambda: tm.is_cancelled(task_id),
+        cache=TTSAudioCache.from_settings(),
+        on_chunk=on_chunk,
+    )
+
+
+# --------------------------------------------------------------------------
+# Render batches
+# --------------------------------------------------------------------------
+
+# Batch item states
+BATCH_ITEM_QUEUED = "queued"
+BATCH_ITEM_RENDERING = "rendering"
+BATCH_ITEM_COMPLETED = "completed"
+BATCH_ITEM_FAILED = "failed"
+BATCH_ITEM_CANCELLED = "cancelled"
+
+BATCH_ITEM_STATES = (
+    BATCH_ITEM_QUEUED,
+    BATCH_ITEM_RENDERING,
+    BATCH_ITEM_COMPLETED,
+    BATCH_ITEM_FAILED,
+    BATCH_ITEM_CANCELLED,
+)
+
+# Longest wait for render progress before the coordinator re-checks its
+# own cancellation flag (seconds)
+BATCH_WAIT_SECONDS = 1.0
+
+
+def make_batch_item(project_id: str, title: str, segments: int,
+                    priority: int = 0, position: int = 0) -> dict:
+    """Return the initial state of one project in a render batch."""
+    return {
+        "project_id": project_id,
+        "title": title,
+        "priority": priority,
+        "position": position,
+        "segments": segments,
+        "status": BATCH_ITEM_QUEUED,
+        "task_id": None,
+        "percentage": 0,
+        "current_segment": 0,
+        "current_phase": "Waiting",
+        "started_at": None,
+        "finished_at": None,
+        "duration": 0.0,
+        "output_url": None,
+        "error": None,
+    }
+
+
+def order_batch_items(items: list) -> list:
+    """Render order of a batch: highest priority first, then as submitted."""
+    return sorted(items, key=lambda item: (-item["priority"], item["position"]))
+
+
+def summarise_batch(items: list, started_at: Optional[float],
+                    now: Optional[float] = None) -> dict:
+    """
+    Aggregate counts, throughput and ETA of a render batch.
+
+    Throughput is measured over the batch's wall time, so it includes
+    the time renders spent waiting for the render lane.  The ETA assumes
+    the remaining segments render at the rate observed so far; it is
+    ``None`` until some progress has been made.
+
+    Args:
+        items: Batch items (see :func:`make_batch_item`).
+        started_at: When the coordinator started (``None`` = not yet).
+        now: Current time (defaults to ``time.time()``).
+
+    Returns:
+        JSON-serialisable dict with per-state counts, ``elapsed_seconds``,
+        ``throughput``, ``eta_seconds`` and a copy of ``items``.
+    """
+    now = time.time() if now is None else now
+    counts = {state: 0 for state in BATCH_ITEM_STATES}
+    done_segments = 0.0
+    remaining_segments = 0.0
+    video_seconds = 0.0
+    for item in items:
+        counts[item["status"]] += 1
+        if item["status"] == BATCH_ITEM_COMPLETED:
+            done_segments += item["segments"]
+            video_seconds += item["duration"] or 0.0
+        elif item["status"] in (BATCH_ITEM_QUEUED, BATCH_ITEM_RENDERING):
+            fraction = item["percentage"] / 100.0
+            done_segments += item["segments"] * fraction
+            remaining_segments += item["segments"] * (1.0 - fraction)
+
+    elapsed = max(now - started_at, 0.0) if started_at else 0.0
+    rate = done_segments / elapsed if elapsed > 0 else 0.0
+    if not remaining_segments:
+        eta = 0
+    elif rate > 0:
+        eta = round(remaining_segments / rate)
+    else:
+        eta = None
+
+    return {
+        "total": len(items),
+        **counts,
+        "elapsed_seconds": round(elapsed, 1),
+        "throughput": {
+            "projects_per_hour": (
+                round(counts[BATCH_ITEM_COMPLETED] * 3600 / elapsed, 2)
+                if elapsed > 0 else 0.0
+            ),
+            "segments_per_minute": round(rate * 60, 2),
+            "video_seconds_per_minute": (
+                round(video_seconds * 60 / elapsed, 2) if elapsed > 0 else 0.0
+            ),
+        },
+        "eta_seconds": eta,
+        "items": [dict(item) for item in items],
+    }
+
+
+def _apply_render_state(item: dict, state: dict):
+    """Copy a render task's state onto its batch item."""
+    progress = state.get("progress") or {}
+    task_status = state["status"]
+    if task_status == TASK_COMPLETED:
+        item.update(
+            status=BATCH_ITEM_COMPLETED,
+            percentage=100,
+            current_segment=item["segments"],
+            current_phase="Done",
+            finished_at=state.get("completed_at"),
+            duration=progress.get("duration", 0.0),
+            output_url=(
+                f"/media/{progress['output_path']}"
+                if progress.get("output_path") else None
+            ),
+        )
+    elif task_status == TASK_FAILED:
+        item.update(
+            status=BATCH_ITEM_FAILED,
+            current_phase="Failed",
+            finished_at=state.get("completed_at"),
+            error="Render failed on the server",
+        )
+    elif task_status == TASK_CANCELLED:
+        item.update(
+            status=BATCH_ITEM_CANCELLED,
+            current_phase="Cancelled",
+            finished_at=state.get("completed_at"),
+        )
+    elif progress:
+        item.update(
+            percentage=int(progress.get("percentage", 0)),
+            current_segment=(
+                item["segments"] if progress.get("is_export_phase")
+                else progress.get("current", 0)
+            ),
+            current_phase=progress.get("description", "Rendering…"),
+        )
+
+
+def render_batch_task_function(batch_id: str, items: list,
+                               render_quality: Optional[str] = None):
+    """
+    Coordinate a render batch (runs on the ``batch`` lane).
+
+    Projects are queued onto the ``render`` lane in priority order,
+    keeping as many renders in flight as the lane has workers, so the
+    batch never starves renders started by hand for longer than one
+    project.  Each project renders as the usual ``render_<project_id>``
+    task — status endpoints, the event stream and cancel-render work
+    unchanged — in this process, so the process-wide caches (prepared
+    images and logo, subtitle sprites, the piece worker pool and its
+    caches) stay warm from one project to the next.
+
+    The batch state (see :func:`summarise_batch`) is published as the
+    task's ``progress["batch"]`` on every change.  Cancelling the batch
+    task cancels the renders in flight and drops the queued ones.
+
+    Args:
+        batch_id: TaskManager ID of the batch (``batch_<uuid>``).
+        items: Batch items from :func:`make_batch_item`.
+        render_quality: Optional preset applied to every render.
+    """
+    # Deferred imports
+    from api.models import Project, STATUS_PROCESSING  # noqa: E402
+    from api.validators import validate_project_for_render  # noqa: E402
+
+    tm = get_task_manager()
+    started_at = time.time()
+    ordered = order_batch_items(items)
+    pending = deque(ordered)
+    in_flight: dict = {}
+    concurrency = tm.get_lane_metrics()[LANE_RENDER]["workers"]
+
+    def publish(description):
+        summary = summarise_batch(ordered, started_at)
+        summary["render_quality"] = render_quality
+        finished = summary["completed"] + summary["failed"] + summary["cancelled"]
+        tm.update_task_progress(
+            batch_id, finished, summary["total"],
+            description=description, batch=summary,
+        )
+
+    def fail(item, error):
+        item.update(
+            status=BATCH_ITEM_FAILED, current_phase="Failed",
+            finished_at=time.time(), error=error,
+        )
+
+    def start(item):
+        project_id = item["project_id"]
+        try:
+            project = Project.objects.get(id=project_id)
+        except Project.DoesNotExist:
+            fail(item, "Project no longer exists.")
+            return
+        if project.status == STATUS_PROCESSING:
+            fail(item, "Project is already being rendered.")
+            return
+        validation_error = validate_project_for_render(project)
+        if validation_error is not None:
+            fail(item, validation_error["message"])
+            return
+
+        project.status = STATUS_PROCESSING
+        project.save(update_fields=["status"])
+
+        task_id = f"{RENDER_TASK_PREFIX}{project_id}"
+        render_kwargs = {}
+        if render_quality is not None:
+            render_kwargs["render_quality"] = render_quality
+
+        def task_wrapper():
+            render_task_function(project_id, task_id, **render_kwargs)
+
+        tm.submit_task(task_wrapper, task_id=task_id, lane=LANE_RENDER)
+        item.update(
+            status=BATCH_ITEM_RENDERING, task_id=task_id,
+            started_at=time.time(), current_phase="Queued for render",
+        )
+        in_flight[task_id] = item
+
+    cancelled = False
+    seq = 0
+    publish("Starting batch")
+    while pending or in_flight:
+        if not cancelled and tm.is_cancelled(batch_id):
+            cancelled = True
+            for task_id in in_flight:
+                tm.cancel_task(task_id)
+            while pending:
+                pending.popleft().update(
+                    status=BATCH_ITEM_CANCELLED, current_phase="Cancelled",
+                )
+            publish("Cancelling batch")
+
+        if pending and len(in_flight) < concurrency:
+            while pending and len(in_flight) < concurrency:
+                start(pending.popleft())
+            publish(f"Rendering {len(in_flight)} project(s)")
+            continue
+
+        seq, changed = tm.wait_for_changes(
+            seq, BATCH_WAIT_SECONDS, task_ids=set(in_flight),
+        )
+        for task_id, state in changed.items():
+            item = in_flight[task_id]
+            _apply_render_state(item, state)
+            if item["status"] != BATCH_ITEM_RENDERING:
+                del in_flight[task_id]
+        if changed:
+            publish(f"Rendering {len(in_flight)} project(s)")
+
+    if cancelled:
+        publish("Batch cancelled")
+        tm.mark_cancelled(batch_id, "Batch cancelled")
+    else:
+        publish("Batch complete")
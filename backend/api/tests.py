@@ -8,6 +8,7 @@ import io
 import os
 import shutil
 import tempfile
+import unittest
 
 from PIL import Image as PILImage
 
@@ -983,6 +984,153 @@ class TestGenerateAllAudioEndpoint(APITestCase):
         s = self.tm.get_task_status(captured['tid'])
         self.assertEqual(s['progress']['current'], s['progress']['total'])
 
+    # ── Stale audio ──
+
+    def _give_audio(self, segment, text=None):
+        """Attach audio generated from *text* (default: the current text)."""
+        from core_engine.tts_cache import tts_input_hash
+
+        segment.audio_file.name = f'projects/{self.project.id}/audio/{segment.id}.wav'
+        segment.audio_input_hash = tts_input_hash(
+            text if text is not None else segment.text_content, 'af_bella', 1.0,
+        )
+        segment.save()
+
+    def test_project_detail_flags_stale_audio(self):
+        self._give_audio(self.seg1)
+        self._give_audio(self.seg2, text='Segment two, before the edit.')
+
+        response = self.client.get(f'/api/projects/{self.project.id}/')
+
+        stale = {s['id']: s['audio_stale'] for s in response.data['segments']}
+        self.assertEqual(stale, {
+            str(self.seg1.id): False, str(self.seg2.id): True, str(self.seg3.id): False,
+        })
+
+        # A different default voice makes every generated segment stale
+        GlobalSettings.objects.update(default_voice_id='am_adam')
+        response = self.client.get(f'/api/segments/{self.seg1.id}/')
+        self.assertTrue(response.data['audio_stale'])
+
+    @patch('core_engine.model_loader.KokoroModelLoader.is_model_available', return_value=True)
+    def test_stale_only_regenerates_changed_segments(self, mock_avail):
+        self._give_audio(self.seg1)
+        self._give_audio(self.seg2, text='Segment two, before the edit.')
+
+        with patch('api.views.tts_batch_task_function') as batch_fn:
+            response = self.client.post(
+                f'/api/projects/{self.project.id}/generate-all-audio/',
+                {'stale_only': True, 'force_regenerate': True}, format='json',
+            )
+            self.tm.shutdown(wait=True)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['segments_to_process'], 2)
+        self.assertEqual(response.data['stale_segments'], 1)
+        self.assertEqual(response.data['skipped_existing'], 1)
+        self.assertEqual(batch_fn.call_args[0][2], [str(self.seg2.id), str(self.seg3.id)])
+
+    # ── Resume ──
+
+    def _finished_batch(self, completed):
+        """Register a finished batch over all three segments."""
+        import time as time_mod
+        from api.tasks import tts_batch_params
+
+        task_id = f'tts_batch_{self.project.id}_0000beef'
+        segment_ids = [str(s.id) for s in (self.seg1, self.seg2, self.seg3)]
+        self.tm.submit_task(lambda: None, task_id=task_id)
+        self.tm.set_task_params(
+            task_id, tts_batch_params(str(self.project.id), segment_ids, 'af_bella', 1.0),
+        )
+        for segment, text_hash in completed:
+            self.tm.add_completed_segment(task_id, str(segment.id), {'text_hash': text_hash})
+        for _ in range(50):
+            if self.tm.get_task_status(task_id)['status'] == TASK_COMPLETED:
+                break
+            time_mod.sleep(0.05)
+        return task_id
+
+    def test_plan_splits_done_stale_and_remaining(self):
+        from api.tasks import plan_tts_batch_resume, tts_batch_params
+        from core_engine.tts_cache import tts_input_hash
+
+        state = {
+            'params': tts_batch_params(
+                'p', ['a', 'b', 'c', 'd'], 'af_bella', 1.0,
+                checkpoint=[{'segment_id': 'a', 'text_hash': tts_input_hash('A', 'af_bella', 1.0)}],
+            ),
+            'completed_segments': [
+                {'segment_id': 'b', 'text_hash': tts_input_hash('old B', 'af_bella', 1.0)},
+            ],
+        }
+        plan = plan_tts_batch_resume(state, {'a': 'A', 'b': 'B', 'c': 'C'})
+
+        self.assertEqual([e['segment_id'] for e in plan['done']], ['a'])
+        self.assertEqual(plan['stale'], ['b'])
+        self.assertEqual(plan['remaining'], ['c'])
+        self.assertEqual(plan['missing'], ['d'])
+
+    @patch('core_engine.model_loader.KokoroModelLoader.is_model_available', return_value=True)
+    def test_resume_processes_only_remaining_and_stale(self, mock_avail):
+        from core_engine.tts_cache import tts_input_hash
+
+        batch_id = self._finished_batch([
+            (self.seg1, tts_input_hash('Segment one.', 'af_bella', 1.0)),
+            (self.seg2, tts_input_hash('Segment two, before the edit.', 'af_bella', 1.0)),
+        ])
+
+        with patch('api.tasks.tts_batch_task_function') as batch_fn:
+            response = self.client.post(
+                f'/api/projects/{self.project.id}/resume-audio/', {'force_regenerate': True},
+                format='json',
+            )
+            self.tm.shutdown(wait=True)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['resumed_from'], batch_id)
+        self.assertEqual(response.data['segments_to_process'], 2)
+        self.assertEqual(response.data['skipped_completed'], 1)
+        self.assertEqual(response.data['stale_segments'], 1)
+        new_id = response.data['task_id']
+        batch_fn.assert_called_once_with(
+            str(self.project.id), new_id,
+            [str(self.seg2.id), str(self.seg3.id)], 'af_bella', 1.0,
+        )
+        params = self.tm.get_task_status(new_id)['params']
+        self.assertEqual(params['resumed_from'], batch_id)
+        self.assertEqual([e['segment_id'] for e in params['checkpoint']], [str(self.seg1.id)])
+
+    @patch('core_engine.model_loader.KokoroModelLoader.is_model_available', return_value=True)
+    def test_resume_without_batch_or_work(self, mock_avail):
+        from core_engine.tts_cache import tts_input_hash
+
+        url = f'/api/projects/{self.project.id}/resume-audio/'
+        self.assertEqual(self.client.post(url).status_code, status.HTTP_404_NOT_FOUND)
+
+        self._finished_batch([
+            (seg, tts_input_hash(seg.text_content, 'af_bella', 1.0))
+            for seg in (self.seg1, self.seg2, self.seg3)
+        ])
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['skipped_completed'], 3)
+
+    def test_resume_running_batch_conflicts(self):
+        import threading
+
+        release = threading.Event()
+        task_id = f'tts_batch_{self.project.id}_0000cafe'
+        self.tm.submit_task(release.wait, task_id=task_id)
+        try:
+            response = self.client.post(
+                f'/api/projects/{self.project.id}/resume-audio/', {'task_id': task_id},
+                format='json',
+            )
+        finally:
+            release.set()
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
 
 # --------------------------------------------------------------------------
 # Task Status endpoint tests
@@ -1010,6 +1158,43 @@ class TestTaskStatusEndpoint(APITestCase):
         self.assertIn('completed_segments', response.data)
         self.assertIn('errors', response.data)
 
+    def test_lane_metrics_in_response(self):
+        """Response reports the task's lane and per-lane queue metrics."""
+        import time as time_mod
+        from api.tasks import LANES, LANE_RENDER
+
+        self.tm.submit_task(lambda: time_mod.sleep(2), task_id='render-1', lane=LANE_RENDER)
+        self.tm.submit_task(lambda: None, task_id='render-2', lane=LANE_RENDER)
+
+        response = self.client.get('/api/tasks/render-2/status/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['lane'], LANE_RENDER)
+        self.assertGreaterEqual(response.data['wait_seconds'], 0)
+        self.assertEqual(set(response.data['lanes']), set(LANES))
+
+        render_metrics = response.data['lanes'][LANE_RENDER]
+        self.assertEqual(render_metrics['queue_depth'], 1)
+        self.assertEqual(render_metrics['running'], 1)
+        self.assertIn('avg_wait_seconds', render_metrics)
+        self.assertIn('max_wait_seconds', render_metrics)
+
+    def test_render_profile_in_response(self):
+        """A profile stored with the progress is returned top-level."""
+        import time as time_mod
+
+        def task():
+            self.tm.update_task_progress(
+                'render-prof', 1, 2, description='Rendering',
+                profile={'phases': [{'name': 'setup', 'wall_seconds': 0.1}]},
+            )
+
+        self.tm.submit_task(task, task_id='render-prof')
+        time_mod.sleep(0.5)
+
+        response = self.client.get('/api/tasks/render-prof/status/')
+        self.assertEqual(response.data['profile']['phases'][0]['name'], 'setup')
+        self.assertNotIn('profile', response.data['progress'])
+
     def test_unknown_task_returns_404(self):
         response = self.client.get('/api/tasks/nonexistent-task-id/status/')
         self.assertEqual(response.status_code, 404)
@@ -1055,6 +1240,50 @@ class TestTaskStatusEndpoint(APITestCase):
         self.assertEqual(s['errors'][0]['segment_id'], 'seg-1')
         self.assertEqual(s['errors'][0]['error'], 'Something went wrong')
 
+    def _read_events(self, url, **headers):
+        """Consume a short-lived event stream and return its frames."""
+        with patch('api.views.TASK_EVENTS_MAX_SECONDS', 0.5), \
+                patch('api.views.TASK_EVENTS_COALESCE_SECONDS', 0.0):
+            response = self.client.get(url, **headers)
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            self.assertEqual(response['Cache-Control'], 'no-cache')
+            body = b''.join(response.streaming_content).decode()
+        return [frame for frame in body.split('\n\n') if frame]
+
+    def test_event_stream_sends_current_tasks(self):
+        """The stream opens with the latest state of every matching task."""
+        import json
+        import threading
+
+        release = threading.Event()
+        self.tm.submit_task(release.wait, task_id='render_p1')
+        self.tm.submit_task(lambda: None, task_id='other')
+        for n in (1, 2, 3):
+            self.tm.update_task_progress('render_p1', n, 4, description='Rendering')
+
+        frames = self._read_events('/api/tasks/events/?task_ids=render_p1')
+        release.set()
+
+        self.assertEqual(frames[0], 'retry: 1000')
+        events = [f for f in frames if 'event: task' in f]
+        self.assertEqual(len(events), 1)
+        data = json.loads(events[0].split('data: ', 1)[1])
+        self.assertEqual(data['task_id'], 'render_p1')
+        self.assertEqual(data['progress']['current'], 3)
+        self.assertEqual(data['render']['project_id'], 'p1')
+        self.assertEqual(data['render']['status'], 'PROCESSING')
+        self.assertEqual(data['render']['progress']['percentage'], 75)
+
+    def test_event_stream_resumes_after_last_event_id(self):
+        """Events already seen (by Last-Event-ID) are not sent again."""
+        self.tm.submit_task(lambda: None, task_id='seen')
+        seq, _ = self.tm.wait_for_changes(0, 0)
+
+        frames = self._read_events(
+            '/api/tasks/events/?task_ids=seen', HTTP_LAST_EVENT_ID=str(seq + 10),
+        )
+        self.assertFalse([f for f in frames if 'event: task' in f])
+
 
 # --------------------------------------------------------------------------
 # Segment Delete Audio Cleanup tests
@@ -1101,6 +1330,104 @@ class TestSegmentDeleteAudioCleanup(APITestCase):
 # TaskManager unit tests
 # --------------------------------------------------------------------------
 
+# --------------------------------------------------------------------------
+# Segment preview endpoint tests
+# --------------------------------------------------------------------------
+
+@override_settings(MEDIA_ROOT=TEMP_MEDIA_AUDIO)
+class TestSegmentPreviewEndpoint(APITestCase):
+    """Tests for POST /api/segments/{id}/preview/."""
+
+    def setUp(self):
+        import struct
+        from django.core.files.base import File as DjangoFile
+
+        self.tm = _reset_task_manager()
+        self.project = Project.objects.create(title='Preview Test')
+        self.segment = Segment.objects.create(
+            project=self.project, sequence_index=1,
+            text_content='Hello world.', audio_duration=0.5,
+        )
+        GlobalSettings.objects.all().delete()
+        GlobalSettings.objects.create(render_width=320, render_height=180)
+
+        self.temp_dir = tempfile.mkdtemp()
+        img_path = os.path.join(self.temp_dir, 'seg.png')
+        PILImage.effect_noise((200, 150), 64).convert('RGB').save(img_path)
+        audio_path = os.path.join(self.temp_dir, 'seg.wav')
+        num_samples = 12000  # 0.5 s at 24 kHz
+        with open(audio_path, 'wb') as af:
+            af.write(b'RIFF')
+            af.write(struct.pack('<I', 36 + num_samples * 2))
+            af.write(b'WAVEfmt ')
+            af.write(struct.pack('<IHHIIHH', 16, 1, 1, 24000, 48000, 2, 16))
+            af.write(b'data')
+            af.write(struct.pack('<I', num_samples * 2))
+            af.write(b'\x00' * num_samples * 2)
+
+        with open(img_path, 'rb') as f:
+            self.segment.image_file.save('seg.png', DjangoFile(f), save=False)
+        with open(audio_path, 'rb') as f:
+            self.segment.audio_file.save('seg.wav', DjangoFile(f), save=False)
+        self.segment.save()
+        self.url = f'/api/segments/{self.segment.id}/preview/'
+
+    def tearDown(self):
+        self.tm.shutdown(wait=True)
+        _reset_task_manager()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if os.path.isdir(TEMP_MEDIA_AUDIO):
+            shutil.rmtree(TEMP_MEDIA_AUDIO, ignore_errors=True)
+            os.makedirs(TEMP_MEDIA_AUDIO, exist_ok=True)
+
+    def _post_and_run(self, body):
+        """POST, capture the submitted task and run it synchronously."""
+        from api.tasks import LANE_PREVIEW
+
+        captured = {}
+        original_submit = self.tm.submit_task
+
+        def capture_submit(task_fn, task_id=None, lane=None):
+            captured['lane'] = lane
+            captured['fn'] = task_fn
+            return original_submit(lambda: None, task_id=task_id, lane=lane)
+
+        with patch.object(self.tm, 'submit_task', side_effect=capture_submit):
+            response = self.client.post(self.url, body, format='json')
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(captured['lane'], LANE_PREVIEW)
+        captured['fn']()
+        return response
+
+    def test_invalid_format_returns_400(self):
+        response = self.client.post(self.url, {'format': 'gif'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_missing_audio_returns_400(self):
+        self.segment.audio_file = None
+        self.segment.save()
+        response = self.client.post(self.url, {}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_missing_image_returns_400(self):
+        self.segment.image_file = None
+        self.segment.save()
+        response = self.client.post(self.url, {}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_preview_renders_then_serves_cached(self):
+        response = self._post_and_run({'format': 'webp'})
+        task_state = self.tm.get_task_status(response.data['task_id'])
+        preview_url = task_state['progress']['preview_url']
+        self.assertTrue(preview_url.endswith('.webp'))
+
+        cached = self.client.post(self.url, {'format': 'webp'}, format='json')
+        self.assertEqual(cached.status_code, 200)
+        self.assertTrue(cached.data['cached'])
+        self.assertEqual(cached.data['preview_url'], preview_url)
+
+
 class TestTaskManagerUnit(TestCase):
     """Unit tests for TaskManager singleton and lifecycle."""
 
@@ -1130,6 +1457,54 @@ class TestTaskManagerUnit(TestCase):
         s = self.tm.get_task_status(tid)
         self.assertEqual(s['status'], TASK_PENDING)
 
+    def test_render_lane_not_blocked_by_tts_lane(self):
+        import time as time_mod
+        from api.tasks import LANE_RENDER, LANE_TTS
+
+        self.tm.submit_task(lambda: time_mod.sleep(5), task_id='tts-blocker', lane=LANE_TTS)
+        tid = self.tm.submit_task(lambda: None, task_id='render', lane=LANE_RENDER)
+
+        for _ in range(20):
+            time_mod.sleep(0.1)
+            s = self.tm.get_task_status(tid)
+            if s['status'] == TASK_COMPLETED:
+                break
+
+        self.assertEqual(s['status'], TASK_COMPLETED)
+        metrics = self.tm.get_lane_metrics()
+        self.assertEqual(metrics[LANE_RENDER]['completed'], 1)
+        self.assertEqual(metrics[LANE_TTS]['running'], 1)
+
+    def test_unknown_lane_raises(self):
+        with self.assertRaises(ValueError):
+            self.tm.submit_task(lambda: None, lane='gpu')
+
+    @override_settings(TASK_LANE_WORKERS={'render': 3})
+    def test_lane_workers_from_settings(self):
+        from api.tasks import LANE_RENDER, LANE_TTS
+
+        tm = _reset_task_manager()
+        metrics = tm.get_lane_metrics()
+        self.assertEqual(metrics[LANE_RENDER]['workers'], 3)
+        self.assertEqual(metrics[LANE_TTS]['workers'], 1)
+        tm.shutdown(wait=True)
+
+    def test_preview_lane_not_blocked_by_tts_lane(self):
+        import time as time_mod
+        from api.tasks import LANE_PREVIEW
+
+        self.tm.submit_task(lambda: time_mod.sleep(5), task_id='blocker')
+        tid = self.tm.submit_task(lambda: None, task_id='preview', lane=LANE_PREVIEW)
+
+        for _ in range(20):
+            time_mod.sleep(0.1)
+            s = self.tm.get_task_status(tid)
+            if s['status'] == TASK_COMPLETED:
+                break
+
+        self.assertEqual(s['status'], TASK_COMPLETED)
+        self.assertEqual(self.tm.get_task_status('blocker')['status'], TASK_PROCESSING)
+
     def test_lifecycle_pending_to_completed(self):
         import time as time_mod
 
@@ -1210,6 +1585,52 @@ class TestTaskManagerUnit(TestCase):
         self.tm.update_task_progress('fake-id', 1, 10)
         # Should not raise
 
+    def test_wait_for_changes_coalesces_updates(self):
+        """Several updates of one task are returned as its latest state."""
+        import threading
+
+        release = threading.Event()
+        tid = self.tm.submit_task(release.wait, task_id='watched')
+        seq, changed = self.tm.wait_for_changes(0, 0)
+        self.assertIn(tid, changed)
+
+        self.tm.update_task_progress(tid, 1, 3)
+        self.tm.update_task_progress(tid, 2, 3)
+        new_seq, changed = self.tm.wait_for_changes(seq, 1)
+        release.set()
+
+        self.assertGreater(new_seq, seq)
+        self.assertEqual(list(changed), [tid])
+        self.assertEqual(changed[tid]['progress']['current'], 2)
+        self.assertEqual(changed[tid]['event_seq'], new_seq)
+
+    def test_wait_for_changes_filters_and_times_out(self):
+        import time as time_mod
+
+        self.tm.submit_task(lambda: None, task_id='a')
+        seq, changed = self.tm.wait_for_changes(0, 0, task_ids={'b'})
+        self.assertEqual(changed, {})
+
+        started = time_mod.monotonic()
+        self.assertEqual(self.tm.wait_for_changes(seq + 100, 0.2), (seq, {}))
+        self.assertGreaterEqual(time_mod.monotonic() - started, 0.2)
+
+    def test_mark_cancelled_is_not_overwritten(self):
+        """A task that marks itself cancelled stays CANCELLED."""
+        import time as time_mod
+        from api.tasks import TASK_CANCELLED
+
+        tid = self.tm.submit_task(
+            lambda: self.tm.mark_cancelled('cancel-me'), task_id='cancel-me',
+        )
+        for _ in range(20):
+            time_mod.sleep(0.1)
+            s = self.tm.get_task_status(tid)
+            if s['completed_at']:
+                break
+
+        self.assertEqual(s['status'], TASK_CANCELLED)
+
 
 # ==========================================================================
 # Phase 04 — Video Renderer Tests
@@ -2074,6 +2495,124 @@ class KenBurnsIntegrationTests(TestCase):
         self.assertGreater(result["file_size"], 0)
 
 
+# ===================================================================
+# Ken Burns Frame Engine Tests
+# ===================================================================
+
+class KenBurnsFrameEngineTests(TestCase):
+    """Tests for the pre-resampled KenBurnsFrameEngine.
+
+    Compares the engine against the reference crop-then-LANCZOS-resize
+    frame generator on a smooth synthetic image, checks the reusable
+    output buffer path, and verifies the per-frame speed-up.
+    """
+
+    RESOLUTION = (640, 360)
+    ZOOM = 1.3
+    DURATION = 2.0
+
+    def setUp(self):
+        from core_engine.ken_burns import (
+            KenBurnsFrameEngine,
+            calculate_crop_dimensions,
+            get_start_end_coords,
+        )
+
+        # Smooth "photo-like" image: upscaled random noise.
+        rng = np.random.RandomState(7)
+        small = rng.randint(0, 255, (30, 50, 3), dtype=np.uint8)
+        self.source = np.asarray(
+            PILImage.fromarray(small).resize(
+                (int(640 * self.ZOOM), int(360 * self.ZOOM)),
+                PILImage.Resampling.BICUBIC,
+            )
+        )
+        src_h, src_w = self.source.shape[:2]
+        self.crop = calculate_crop_dimensions(640, 360, self.ZOOM)
+        self.start, self.end = get_start_end_coords(
+            "top_left", "bottom_right", src_w, src_h, *self.crop,
+        )
+        self.engine = KenBurnsFrameEngine(
+            self.source, self.RESOLUTION, self.crop,
+            self.start, self.end, self.DURATION,
+        )
+
+    def _reference_frame(self, t):
+        """Crop-then-resize frame (the original make_frame algorithm)."""
+        from core_engine.ken_burns import interpolate_position
+
+        src_h, src_w = self.source.shape[:2]
+        crop_w, crop_h = self.crop
+        x, y = interpolate_position(self.start, self.end, t, self.DURATION)
+        x = max(0, min(int(round(x)), src_w - crop_w))
+        y = max(0, min(int(round(y)), src_h - crop_h))
+        crop = self.source[y:y + crop_h, x:x + crop_w]
+        return np.array(
+            PILImage.fromarray(crop).resize(
+                self.RESOLUTION, PILImage.Resampling.LANCZOS,
+            )
+        )
+
+    def test_frame_shape_and_dtype(self):
+        frame = self.engine.frame_at(0.5)
+        self.assertEqual(frame.shape, (360, 640, 3))
+        self.assertEqual(frame.dtype, np.uint8)
+        self.assertTrue(frame.flags["C_CONTIGUOUS"])
+
+    def test_matches_reference_within_tolerance(self):
+        for t in (0.0, 0.4, 1.0, 1.7, self.DURATION):
+            diff = np.abs(
+                self.engine.frame_at(t).astype(np.int16)
+                - self._reference_frame(t).astype(np.int16)
+            )
+            self.assertLess(diff.mean(), 3.0, f"mean diff too large at t={t}")
+
+    def test_out_buffer_is_reused(self):
+        buffer = np.empty((360, 640, 3), dtype=np.uint8)
+        first = self.engine.frame_at(0.0, out=buffer)
+        second = self.engine.frame_at(1.0, out=buffer)
+        self.assertIs(first, buffer)
+        self.assertIs(second, buffer)
+        np.testing.assert_array_equal(buffer, self.engine.frame_at(1.0))
+
+    def test_returned_frames_are_independent(self):
+        a = self.engine.frame_at(0.0)
+        b = self.engine.frame_at(self.DURATION)
+        self.assertFalse(np.shares_memory(a, b))
+        self.assertFalse(np.array_equal(a, b))
+
+    def test_offsets_stay_in_bounds(self):
+        for t in (-1.0, 0.0, self.DURATION, self.DURATION + 5.0):
+            x, y = self.engine.offset_at(t)
+            self.assertGreaterEqual(x, 0)
+            self.assertGreaterEqual(y, 0)
+            self.assertLessEqual(x, self.engine.max_x)
+            self.assertLessEqual(y, self.engine.max_y)
+
+    @unittest.skipUnless(
+        os.environ.get('STORYFLOW_TIMING_TESTS'),
+        'wall-clock comparison; set STORYFLOW_TIMING_TESTS=1 (see also '
+        'the ken_burns benchmarks in core_engine/core_benchmark.py)',
+    )
+    def test_per_frame_latency_at_least_3x_lower(self):
+        import time
+
+        buffer = np.empty((360, 640, 3), dtype=np.uint8)
+        times = [i / 30 for i in range(30)]
+
+        started = time.perf_counter()
+        for t in times:
+            self._reference_frame(t)
+        reference = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for t in times:
+            self.engine.frame_at(t, out=buffer)
+        engine = time.perf_counter() - started
+
+        self.assertLess(engine * 3, reference)
+
+
 # ── Render Pipeline Tests (Task 04.03.14) ──────────────────────────────────
 
 @override_settings(MEDIA_ROOT=tempfile.mkdtemp())
@@ -2227,6 +2766,40 @@ class RenderPipelineTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
 
+    def test_render_trigger_invalid_quality(self):
+        """POST with an unknown render_quality returns 400 and stays DRAFT."""
+        from api.models import STATUS_DRAFT
+
+        response = self.client.post(
+            self.render_url, {'render_quality': 'ultra'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('error', response.data)
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.status, STATUS_DRAFT)
+
+    def test_render_trigger_forwards_quality(self):
+        """POST with render_quality passes the preset to the render task."""
+        from unittest.mock import MagicMock, patch
+
+        task_manager = MagicMock()
+        with patch('api.views.render_utils.check_ffmpeg', return_value=True), \
+             patch('api.views.get_task_manager', return_value=task_manager):
+            response = self.client.post(
+                self.render_url, {'render_quality': 'draft'}, format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['render_quality'], 'draft')
+
+        task_wrapper = task_manager.submit_task.call_args[0][0]
+        with patch('api.views.render_task_function') as mock_render:
+            task_wrapper()
+        mock_render.assert_called_once_with(
+            self.project_id, response.data['task_id'], render_quality='draft'
+        )
+
     # ── Status Endpoint Tests ──
 
     def test_status_draft_project(self):
@@ -2288,7 +2861,7 @@ class RenderPipelineTests(APITestCase):
 
         # Mock submit_task to run the task synchronously in the same
         # thread, avoiding SQLite locking with in-memory test DB.
-        def run_synchronously(task_fn, task_id=None):
+        def run_synchronously(task_fn, task_id=None, lane=None):
             task_fn()
 
         with patch('api.views.render_utils.check_ffmpeg', return_value=True), \
@@ -2323,7 +2896,7 @@ class RenderPipelineTests(APITestCase):
         # Mock submit_task to run synchronously, avoiding SQLite locking.
         # Catch exceptions since render_task_function re-raises after
         # setting FAILED status — mimics TaskManager wrapper behavior.
-        def run_synchronously(task_fn, task_id=None):
+        def run_synchronously(task_fn, task_id=None, lane=None):
             try:
                 task_fn()
             except Exception:
@@ -2431,3 +3004,396 @@ class RenderPipelineTests(APITestCase):
 
         # warnings is a list (possibly empty if ImageMagick is available)
         self.assertIsInstance(result["warnings"], list)
+
+
+# ── Render Batch Tests ─────────────────────────────────────────────────────
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class RenderBatchTests(APITestCase):
+    """Tests for the server-side render batch queue."""
+
+    url = '/api/render-batches/'
+
+    def setUp(self):
+        self.tm = _reset_task_manager()
+        self.ready = [self._make_project(f"Batch {i}", segments=i + 1) for i in range(3)]
+        self.empty = Project.objects.create(title="No segments")
+
+    def tearDown(self):
+        from django.conf import settings
+        self.tm.shutdown(wait=True)
+        _reset_task_manager()
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+
+    def _make_project(self, title, segments):
+        from django.core.files.base import ContentFile
+
+        project = Project.objects.create(title=title)
+        for i in range(segments):
+            segment = Segment.objects.create(
+                project=project, sequence_index=i, text_content=f"Segment {i}",
+            )
+            buffer = io.BytesIO()
+            PILImage.new("RGB", (16, 16)).save(buffer, format="PNG")
+            segment.image_file.save(f"img_{i}.png", ContentFile(buffer.getvalue()), save=False)
+            segment.audio_file.save(f"aud_{i}.wav", ContentFile(b"RIFF"), save=False)
+            segment.save()
+        return project
+
+    def _wait_for(self, task_id, statuses=(TASK_COMPLETED, TASK_FAILED)):
+        import time as time_mod
+        for _ in range(50):
+            state = self.tm.get_task_status(task_id)
+            if state and state['status'] in statuses:
+                return state
+            time_mod.sleep(0.1)
+        self.fail(f"Task {task_id} did not finish")
+
+    # ── Aggregates ──
+
+    def test_summary_throughput_and_eta(self):
+        from api.tasks import make_batch_item, summarise_batch
+
+        items = [make_batch_item(f"p{i}", f"P{i}", segments=10) for i in range(3)]
+        items[0].update(status='completed', percentage=100, duration=30.0)
+        items[1].update(status='rendering', percentage=50)
+
+        summary = summarise_batch(items, started_at=1000.0, now=1060.0)
+
+        self.assertEqual(summary['completed'], 1)
+        self.assertEqual(summary['rendering'], 1)
+        self.assertEqual(summary['queued'], 1)
+        # 15 segments in 60 s → 15 segments/min; 15 left → 60 s
+        self.assertEqual(summary['throughput']['segments_per_minute'], 15.0)
+        self.assertEqual(summary['throughput']['projects_per_hour'], 60.0)
+        self.assertEqual(summary['throughput']['video_seconds_per_minute'], 30.0)
+        self.assertEqual(summary['eta_seconds'], 60)
+        self.assertIsNone(summarise_batch(items[2:], None)['eta_seconds'])
+
+    # ── Endpoint ──
+
+    def test_create_batch_orders_by_priority(self):
+        with patch('api.views.render_utils.check_ffmpeg', return_value=True), \
+                patch('api.views.render_batch_task_function') as coordinator:
+            response = self.client.post(self.url, {
+                'projects': [
+                    str(self.ready[0].id),
+                    {'project_id': str(self.ready[1].id), 'priority': 5},
+                    {'project_id': str(self.ready[2].id), 'priority': 1},
+                ],
+                'render_quality': 'draft',
+            }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        batch_id = response.data['batch_id']
+        self.assertTrue(batch_id.startswith('batch_'))
+        self.assertEqual(response.data['render_quality'], 'draft')
+        self.assertEqual(
+            [item['project_id'] for item in response.data['items']],
+            [str(self.ready[i].id) for i in (1, 2, 0)],
+        )
+        self.assertEqual(response.data['items'][0]['segments'], 2)
+
+        self._wait_for(batch_id)
+        coordinator.assert_called_once()
+        detail = self.client.get(f'{self.url}{batch_id}/')
+        self.assertEqual(detail.data['total'], 3)
+        self.assertEqual(
+            [b['batch_id'] for b in self.client.get(self.url).data], [batch_id],
+        )
+        cancel = self.client.post(f'{self.url}{batch_id}/cancel/')
+        self.assertEqual(cancel.status_code, status.HTTP_409_CONFLICT)
+
+    def test_create_batch_rejects_unready_projects(self):
+        response = self.client.post(self.url, {
+            'projects': [str(self.ready[0].id), str(self.empty.id), 'nope'],
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data['projects']), {str(self.empty.id), 'nope'})
+
+        for body in ({'projects': []}, {'projects': [str(self.ready[0].id)] * 2},
+                     {'projects': [{'project_id': str(self.ready[0].id), 'priority': 'x'}]}):
+            response = self.client.post(self.url, body, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unknown_batch_returns_404(self):
+        self.assertEqual(self.client.get(f'{self.url}batch_missing/').status_code, 404)
+        self.assertEqual(
+            self.client.post(f'{self.url}batch_missing/cancel/').status_code, 404,
+        )
+
+    # ── Coordinator ──
+
+    def _run_coordinator(self, renders, cancel_after=None):
+        """Run a batch of the ready projects with a fake render function."""
+        import threading
+        from api.models import STATUS_PROCESSING
+        from api.tasks import LANE_BATCH, make_batch_item, render_batch_task_function
+
+        def fake_render(project_id, task_id, **kwargs):
+            renders.append(project_id)
+            if cancel_after is not None and len(renders) > cancel_after:
+                self.tm.cancel_task('batch_test')
+            self.tm.update_task_progress(
+                task_id, 1, 1, description='Export complete',
+                output_path=f'projects/{project_id}/output/final.mp4', duration=2.0,
+            )
+
+        items = [
+            make_batch_item(str(p.id), p.title, segments=1, priority=-i, position=i)
+            for i, p in enumerate(self.ready)
+        ]
+        release = threading.Event()
+        self.tm.submit_task(release.wait, task_id='batch_test', lane=LANE_BATCH)
+        try:
+            with patch('api.tasks.render_task_function', side_effect=fake_render):
+                render_batch_task_function('batch_test', items)
+            state = self.tm.get_task_status('batch_test')
+        finally:
+            release.set()
+
+        self.assertEqual(
+            Project.objects.filter(status=STATUS_PROCESSING).count(), len(renders),
+        )
+        return state
+
+    def test_coordinator_renders_in_priority_order(self):
+        renders = []
+        state = self._run_coordinator(renders)
+
+        self.assertEqual(renders, [str(p.id) for p in self.ready])
+        batch = state['progress']['batch']
+        self.assertEqual(batch['completed'], 3)
+        self.assertEqual(batch['eta_seconds'], 0)
+        self.assertEqual(
+            batch['items'][0]['output_url'],
+            f'/media/projects/{self.ready[0].id}/output/final.mp4',
+        )
+        self.assertEqual(state['progress']['description'], 'Batch complete')
+
+    def test_cancel_drops_queued_projects(self):
+        from api.tasks import TASK_CANCELLED
+
+        renders = []
+        state = self._run_coordinator(renders, cancel_after=0)
+
+        self.assertEqual(len(renders), 1)
+        self.assertEqual(state['status'], TASK_CANCELLED)
+        self.assertEqual(
+            [item['status'] for item in state['progress']['batch']['items']],
+            ['completed', 'cancelled', 'cancelled'],
+        )
+
+
+# --------------------------------------------------------------------------
+# Persistent task store
+# --------------------------------------------------------------------------
+
+from datetime import timedelta
+from django.utils import timezone
+
+
+class TaskStoreTests(TestCase):
+    """Tests for the write-behind task store and startup recovery."""
+
+    def setUp(self):
+        from api.task_store import TaskStore
+
+        self.tm = _reset_task_manager()
+        self.store = TaskStore(self.tm)
+        self.tm.attach_store(self.store)
+
+    def tearDown(self):
+        self.tm.shutdown(wait=True)
+        _reset_task_manager()
+
+    def _wait_for(self, task_id, statuses=(TASK_COMPLETED, TASK_FAILED)):
+        import time as time_mod
+        for _ in range(50):
+            state = self.tm.get_task_status(task_id)
+            if state and state['status'] in statuses:
+                return state
+            time_mod.sleep(0.1)
+        self.fail(f"Task {task_id} did not finish")
+
+    def test_progress_updates_coalesce_into_one_row(self):
+        import threading
+        from api.models import TaskRecord
+
+        release = threading.Event()
+        self.tm.submit_task(release.wait, task_id='t1')
+        try:
+            for i in range(1, 21):
+                self.tm.update_task_progress('t1', i, 20, profile={'phases': []})
+            self.tm.add_completed_segment('t1', 's1', {'audio_url': '/a.wav', 'duration': 1.0})
+
+            self.assertEqual(self.store.flush(), 1)
+            self.assertEqual(self.store.flush(), 0)
+            record = TaskRecord.objects.get(pk='t1')
+            self.assertEqual(record.progress['current'], 20)
+            self.assertNotIn('profile', record.progress)
+            self.assertEqual(record.completed_segments[0]['segment_id'], 's1')
+        finally:
+            release.set()
+
+        self._wait_for('t1')
+        self.store.flush()
+        self.assertEqual(TaskRecord.objects.get(pk='t1').status, TASK_COMPLETED)
+
+        self.store.forget(['t1'])
+        self.store.flush()
+        self.assertFalse(TaskRecord.objects.filter(pk='t1').exists())
+
+    def test_recovery_fails_interrupted_tasks_and_projects(self):
+        import time as time_mod
+        from api.models import STATUS_FAILED, STATUS_PROCESSING, TaskRecord
+        from api.task_store import INTERRUPTED_MESSAGE, recover_tasks
+
+        now = time_mod.time()
+        project = Project.objects.create(title='Stuck', status=STATUS_PROCESSING)
+        Project.objects.filter(pk=project.pk).update(
+            updated_at=timezone.now() - timedelta(minutes=5),
+        )
+        render_id = f'render_{project.id}'
+        TaskRecord.objects.create(
+            task_id=render_id, lane='render', status=TASK_PROCESSING,
+            created_at=now - 60, started_at=now - 59, updated_at=now - 1,
+        )
+        TaskRecord.objects.create(
+            task_id='done', lane='tts', status=TASK_COMPLETED,
+            created_at=now - 60, completed_at=now - 30, updated_at=now - 30,
+        )
+        TaskRecord.objects.create(
+            task_id='expired', lane='tts', status=TASK_COMPLETED,
+            created_at=now - 9000, completed_at=now - 8000, updated_at=now - 8000,
+        )
+
+        result = recover_tasks(self.tm, now=now)
+
+        self.assertEqual(result['interrupted'], 1)
+        self.assertEqual(result['projects_failed'], 1)
+        project.refresh_from_db()
+        self.assertEqual(project.status, STATUS_FAILED)
+        self.assertEqual(TaskRecord.objects.get(pk=render_id).status, TASK_FAILED)
+        self.assertFalse(TaskRecord.objects.filter(pk='expired').exists())
+
+        state = self.tm.get_task_status(render_id)
+        self.assertEqual(state['status'], TASK_FAILED)
+        self.assertEqual(state['errors'][-1]['error'], INTERRUPTED_MESSAGE)
+        self.assertEqual(self.tm.get_task_status('done')['status'], TASK_COMPLETED)
+        self.assertEqual(self.store.pending, 0)
+
+    def test_flush_stamps_records_with_the_store_boot_id(self):
+        import threading
+        from api.models import TaskRecord
+
+        release = threading.Event()
+        self.tm.submit_task(release.wait, task_id='t1')
+        try:
+            self.store.flush()
+            self.assertEqual(TaskRecord.objects.get(pk='t1').owner, self.store.boot_id)
+        finally:
+            release.set()
+        self._wait_for('t1')
+
+    def test_recovery_leaves_live_processes_alone(self):
+        import time as time_mod
+        from api.models import STATUS_PROCESSING, TaskRecord, TaskStoreProcess
+        from api.task_store import PROCESS_TIMEOUT, recover_tasks
+
+        now = time_mod.time()
+        TaskStoreProcess.objects.create(
+            boot_id='other', pid=1, started_at=now - 600, heartbeat_at=now - 5,
+        )
+        TaskStoreProcess.objects.create(
+            boot_id='dead', pid=2, started_at=now - 600,
+            heartbeat_at=now - PROCESS_TIMEOUT - 5,
+        )
+        busy = Project.objects.create(title='Rendering', status=STATUS_PROCESSING)
+        just_started = Project.objects.create(title='Queued', status=STATUS_PROCESSING)
+        Project.objects.filter(pk=busy.pk).update(
+            updated_at=timezone.now() - timedelta(minutes=5),
+        )
+        TaskRecord.objects.create(
+            task_id=f'render_{busy.id}', owner='other', lane='render',
+            status=TASK_PROCESSING, created_at=now - 300, updated_at=now - 1,
+        )
+        TaskRecord.objects.create(
+            task_id='orphan', owner='dead', lane='tts', status=TASK_PENDING,
+            created_at=now - 300, updated_at=now - 300,
+        )
+
+        result = recover_tasks(self.tm, now=now, boot_id=self.store.boot_id)
+
+        self.assertEqual(result['interrupted'], 1)
+        self.assertEqual(result['projects_failed'], 0)
+        self.assertEqual(TaskRecord.objects.get(pk=f'render_{busy.id}').status, TASK_PROCESSING)
+        self.assertEqual(TaskRecord.objects.get(pk='orphan').status, TASK_FAILED)
+        for project in (busy, just_started):
+            project.refresh_from_db()
+            self.assertEqual(project.status, STATUS_PROCESSING)
+        self.assertIsNone(self.tm.get_task_status(f'render_{busy.id}'))
+        self.assertFalse(TaskStoreProcess.objects.filter(pk='dead').exists())
+
+    def test_recovery_skipped_while_another_process_holds_the_lock(self):
+        import time as time_mod
+        from api.models import TaskRecord
+        from api.task_store import (
+            RECOVERY_LOCK, RECOVERY_LOCK_TTL, acquire_lock, recover_tasks, release_lock,
+        )
+
+        now = time_mod.time()
+        TaskRecord.objects.create(
+            task_id='orphan', lane='tts', status=TASK_PROCESSING,
+            created_at=now - 60, updated_at=now - 60,
+        )
+        self.assertTrue(acquire_lock(RECOVERY_LOCK, 'other', RECOVERY_LOCK_TTL, now))
+        self.assertFalse(acquire_lock(RECOVERY_LOCK, 'mine', RECOVERY_LOCK_TTL, now))
+
+        result = recover_tasks(self.tm, now=now, boot_id='mine')
+        self.assertTrue(result['skipped'])
+        self.assertEqual(TaskRecord.objects.get(pk='orphan').status, TASK_PROCESSING)
+
+        release_lock(RECOVERY_LOCK, 'other')
+        result = recover_tasks(self.tm, now=now, boot_id='mine')
+        self.assertFalse(result['skipped'])
+        self.assertEqual(TaskRecord.objects.get(pk='orphan').status, TASK_FAILED)
+        # A lease left by a crashed recoverer expires
+        self.assertTrue(acquire_lock(RECOVERY_LOCK, 'crashed', RECOVERY_LOCK_TTL, now))
+        self.assertTrue(acquire_lock(RECOVERY_LOCK, 'mine', RECOVERY_LOCK_TTL,
+                                     now + RECOVERY_LOCK_TTL + 1))
+
+    def test_recovery_resumes_tts_batch_from_first_incomplete_segment(self):
+        import time as time_mod
+        from api.models import TaskRecord
+        from api.task_store import recover_tasks
+        from api.tasks import tts_batch_params
+        from core_engine.tts_cache import tts_input_hash
+
+        project = Project.objects.create(title='Narration')
+        segments = [
+            str(Segment.objects.create(project=project, sequence_index=i, text_content=f'Line {i}').id)
+            for i in range(3)
+        ]
+        task_id = f'tts_batch_{project.id}_abcd1234'
+        TaskRecord.objects.create(
+            task_id=task_id, lane='tts', status=TASK_PROCESSING,
+            params=tts_batch_params(str(project.id), segments, 'af_bella', 1.0),
+            completed_segments=[{
+                'segment_id': segments[0], 'audio_url': '', 'duration': 1.0,
+                'text_hash': tts_input_hash('Line 0', 'af_bella', 1.0),
+            }],
+            created_at=time_mod.time(), updated_at=time_mod.time(),
+        )
+
+        with patch('api.tasks.tts_batch_task_function') as batch_fn:
+            result = recover_tasks(self.tm, resume_tts=True)
+            state = self._wait_for(task_id)
+
+        self.assertEqual(result['resumed'], [task_id])
+        batch_fn.assert_called_once_with(
+            str(project.id), task_id, segments[1:], 'af_bella', 1.0,
+        )
+        self.assertEqual(state['params']['segment_ids'], segments)
+        self.assertEqual(state['params']['checkpoint'][0]['segment_id'], segments[0])
@@ -10,6 +10,10 @@ urlpatterns = [
     path('projects/import/', views.import_project, name='project-import'),
     path('projects/<str:project_id>/import-segments/', views.import_segments, name='project-import-segments'),
     path('segments/reorder/', views.reorder_segments, name='segment-reorder'),
+    path('render-batches/', views.render_batches_view, name='render-batches'),
+    path('render-batches/<str:batch_id>/', views.render_batch_detail_view, name='render-batch-detail'),
+    path('render-batches/<str:batch_id>/cancel/', views.render_batch_cancel_view, name='render-batch-cancel'),
+    path('tasks/events/', views.task_events_view, name='task-events'),
     path('tasks/<str:task_id>/status/', views.task_status_view, name='task-status'),
     path('settings/', views.global_settings_view, name='global-settings'),
     path('settings/voices/', views.available_voices_view, name='available-voices'),
@@ -1,12 +1,15 @@
+import json
 import logging
 import os
 import shutil
+import time
 import uuid as uuid_mod
 
 from django.conf import settings
 from django.core.files.storage import default_storage
 from django.db import models, transaction
 from django.http import FileResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 from rest_framework import viewsets, status
 from rest_framework.decorators import api_view, action
 from rest_framework.exceptions import ValidationError
@@ -15,11 +18,34 @@ from rest_framework.response import Response
 from .models import Project, Segment, GlobalSettings, Logo, STATUS_PROCESSING, STATUS_COMPLETED, STATUS_FAILED, RENDERABLE_STATUSES
 from .serializers import ProjectSerializer, ProjectDetailSerializer, ProjectImportSerializer, SegmentSerializer, GlobalSettingsSerializer, LogoSerializer
 from .parsers import ParseError
-from .tasks import get_task_manager, render_task_function
+from .tasks import (
+    BATCH_TASK_PREFIX,
+    LANE_BATCH,
+    LANE_PREVIEW,
+    LANE_RENDER,
+    RENDER_TASK_PREFIX,
+    TASK_CANCELLED,
+    TASK_COMPLETED,
+    TASK_FAILED,
+    TASK_PENDING,
+    TASK_PROCESSING,
+    get_task_manager,
+    make_batch_item,
+    new_tts_batch_task_id,
+    order_batch_items,
+    render_batch_task_function,
+    render_task_function,
+    resume_tts_batch,
+    summarise_batch,
+    tts_batch_params,
+    tts_batch_task_function,
+)
+from .task_store import find_tts_batch
 from .validators import validate_image_upload, validate_project_for_render, validate_font_upload
 from core_engine.model_loader import KokoroModelLoader
 from core_engine.tts_wrapper import construct_audio_path, VALID_VOICE_IDS
-from core_engine import render_utils
+from core_engine import preview_renderer, render_utils
+from core_engine.render_quality import RENDER_QUALITY_PRESETS
 
 logger = logging.getLogger(__name__)
 
@@ -55,17 +81,31 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def generate_all_audio(self, request, pk=None):
         """Generate TTS audio for all eligible segments in a project.
 
-        Spawns a single background task that processes segments
-        sequentially. Locked, empty-text, and already-generated
-        segments can be skipped based on request options.
+        Spawns a single background task that runs every pending segment
+        through the batched TTS pipeline (``generate_audio_batch``),
+        reporting per-segment progress and errors. Text already in the
+        TTS audio cache is linked instead of re-synthesised. Locked, empty-text,
+        and already-generated segments can be skipped based on request
+        options.
+
+        With ``stale_only`` (which takes precedence over
+        ``force_regenerate``) segments that already have audio are
+        regenerated only if their text, or the default voice or speed,
+        changed since (see ``Segment.audio_is_stale``).
         """
         project = self.get_object()
 
         # 1. Parse request options
         skip_locked = request.data.get('skip_locked', True)
         force_regenerate = request.data.get('force_regenerate', False)
+        stale_only = request.data.get('stale_only', False)
 
-        # 2. Fetch and filter segments
+        # 2. Read global TTS settings (capture as plain values for thread safety)
+        settings_obj = GlobalSettings.load()
+        voice_id = settings_obj.default_voice_id
+        speed = settings_obj.tts_speed
+
+        # 3. Fetch and filter segments
         all_segments = Segment.objects.filter(project=project).order_by('sequence_index')
         total_segments = all_segments.count()
 
@@ -73,6 +113,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         skipped_locked = 0
         skipped_existing = 0
         skipped_empty = 0
+        stale_segments = 0
 
         for seg in all_segments:
             if not seg.text_content or not seg.text_content.strip():
@@ -81,12 +122,18 @@ class ProjectViewSet(viewsets.ModelViewSet):
             if seg.is_locked and skip_locked:
                 skipped_locked += 1
                 continue
-            if seg.audio_file and not force_regenerate:
-                skipped_existing += 1
-                continue
+            if seg.audio_file:
+                if stale_only:
+                    if not seg.audio_is_stale(voice_id, speed):
+                        skipped_existing += 1
+                        continue
+                    stale_segments += 1
+                elif not force_regenerate:
+                    skipped_existing += 1
+                    continue
             segments_to_process.append(str(seg.id))
 
-        # 3. Handle empty processing list
+        # 4. Handle empty processing list
         if not segments_to_process:
             return Response(
                 {
@@ -96,83 +143,36 @@ class ProjectViewSet(viewsets.ModelViewSet):
                     'skipped_locked': skipped_locked,
                     'skipped_existing': skipped_existing,
                     'skipped_empty': skipped_empty,
+                    'stale_segments': 0,
                 },
                 status=status.HTTP_200_OK,
             )
 
-        # 4. TTS model check
+        # 5. TTS model check
         if not KokoroModelLoader.is_model_available():
             return Response(
                 {'error': 'TTS model not available. Please install the Kokoro ONNX model file.'},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
 
-        # 5. Read global TTS settings (capture as plain values for thread safety)
-        settings_obj = GlobalSettings.load()
-        voice_id = settings_obj.default_voice_id
-        speed = settings_obj.tts_speed
-
         # Capture project ID as string (not ORM object)
         project_id = str(project.id)
         segment_ids = list(segments_to_process)  # plain list of string IDs
 
         # 6. Generate task ID
-        hex8 = uuid_mod.uuid4().hex[:8]
-        task_id = f"tts_batch_{project_id}_{hex8}"
+        task_id = new_tts_batch_task_id(project_id)
 
         task_manager = get_task_manager()
 
         # 7. Define batch task function
         def batch_task_fn():
-            from core_engine.tts_wrapper import (
-                generate_audio as tts_generate,
-                construct_audio_path,
-                construct_audio_url,
-            )
-            from api.models import Segment as SegmentModel
-
-            for idx, seg_id in enumerate(segment_ids):
-                # Check cancellation before each segment
-                if task_manager.is_cancelled(task_id):
-                    break
+            tts_batch_task_function(project_id, task_id, segment_ids, voice_id, speed)
 
-                # Update progress BEFORE processing
-                task_manager.update_task_progress(
-                    task_id,
-                    current=idx + 1,
-                    total=len(segment_ids),
-                    current_segment_id=seg_id,
-                )
-
-                try:
-                    seg = SegmentModel.objects.get(pk=seg_id)
-
-                    output_path = str(construct_audio_path(project_id, seg_id))
-                    result = tts_generate(
-                        text=seg.text_content,
-                        voice_id=voice_id,
-                        speed=speed,
-                        output_path=output_path,
-                    )
-
-                    if result["success"]:
-                        audio_url = construct_audio_url(project_id, seg_id)
-                        seg.audio_file.name = f"projects/{project_id}/audio/{seg_id}.wav"
-                        seg.audio_duration = result["duration"]
-                        seg.save(update_fields=["audio_file", "audio_duration"])
-
-                        task_manager.add_completed_segment(task_id, seg_id, {
-                            "audio_url": audio_url,
-                            "duration": result["duration"],
-                        })
-                    else:
-                        task_manager.add_error(task_id, seg_id, result["error"])
-
-                except Exception as exc:
-                    task_manager.add_error(task_id, seg_id, str(exc))
-
-        # 8. Submit and return 202
+        # 8. Submit (recording how to resume it after a restart) and return 202
         task_manager.submit_task(batch_task_fn, task_id=task_id)
+        task_manager.set_task_params(
+            task_id, tts_batch_params(project_id, segment_ids, voice_id, speed),
+        )
 
         return Response(
             {
@@ -184,6 +184,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 'skipped_locked': skipped_locked,
                 'skipped_existing': skipped_existing,
                 'skipped_empty': skipped_empty,
+                'stale_segments': stale_segments,
                 'message': (
                     f'Audio generation started for {len(segment_ids)} segments. '
                     f'Skipped: {skipped_locked} locked, {skipped_existing} existing, '
@@ -193,13 +194,82 @@ class ProjectViewSet(viewsets.ModelViewSet):
             status=status.HTTP_202_ACCEPTED,
         )
 
+    @action(detail=True, methods=['post'], url_path='resume-audio')
+    def resume_audio(self, request, pk=None):
+        """Continue an interrupted "generate all audio" batch.
+
+        Every batch checkpoints its completed segments together with a
+        hash of the text, voice and speed they were generated from.
+        Resuming synthesises only the segments the batch never finished
+        and those whose text changed since (stale) — completed segments
+        are never paid for twice, whatever ``force_regenerate`` the
+        batch was started with.  The batch's own voice and speed are
+        used.
+
+        Body (optional): ``{"task_id": "tts_batch_<project>_<hex8>"}`` —
+        defaults to the project's most recent batch.
+
+        Returns 202 with the new task, 200 if nothing is left to do,
+        404 if there is no batch, 409 while it is still running.
+        """
+        project = self.get_object()
+        project_id = str(project.id)
+
+        batch_id, batch = find_tts_batch(project_id, request.data.get('task_id'))
+        if batch is None:
+            return Response(
+                {'error': 'No audio generation batch to resume for this project.'},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if batch['status'] in (TASK_PENDING, TASK_PROCESSING):
+            return Response(
+                {'error': 'This audio generation batch is still running.', 'task_id': batch_id},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if not KokoroModelLoader.is_model_available():
+            return Response(
+                {'error': 'TTS model not available. Please install the Kokoro ONNX model file.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        plan = resume_tts_batch(batch_id, batch)
+        to_process = len(plan['remaining']) + len(plan['stale'])
+        counts = {
+            'resumed_from': batch_id,
+            'segments_to_process': to_process,
+            'skipped_completed': len(plan['done']),
+            'stale_segments': len(plan['stale']),
+            'missing_segments': len(plan['missing']),
+        }
+        if plan['task_id'] is None:
+            return Response(
+                {'message': 'Nothing left to resume.', 'project_id': project_id, **counts},
+                status=status.HTTP_200_OK,
+            )
+
+        return Response(
+            {
+                'task_id': plan['task_id'],
+                'project_id': project_id,
+                'status': 'PENDING',
+                **counts,
+                'message': (
+                    f'Audio generation resumed for {to_process} segments '
+                    f'({len(plan["stale"])} changed since). '
+                    f'Skipped: {len(plan["done"])} already completed.'
+                ),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
     @action(detail=True, methods=['get'], url_path='status')
     def render_status(self, request, pk=None):
         """Return the current render status for a project.
 
-        Designed for frequent polling (every ~3 s). All data comes from
-        the in-memory TaskManager registry or a single DB read — no
-        expensive queries.
+        Cheap enough for polling: all data comes from the in-memory
+        TaskManager registry or a single DB read.  Clients that can
+        should listen to ``/api/tasks/events/`` instead, which pushes
+        the same shape (``render``) as the render progresses.
 
         Returns:
             200 OK — JSON with project_id, status, progress, and output_url.
@@ -282,15 +352,33 @@ class ProjectViewSet(viewsets.ModelViewSet):
         PROCESSING, spawns a background render task, and returns 202
         Accepted with the task ID.
 
+        Accepts an optional JSON body ``{"render_quality": "draft" |
+        "standard" | "final"}`` that overrides
+        ``GlobalSettings.render_quality`` for this render only.
+
         Returns:
             202 Accepted — rendering started successfully.
-            400 Bad Request — segments missing image or audio files.
+            400 Bad Request — segments missing image or audio files, or
+                an unknown ``render_quality``.
             409 Conflict — project is already being rendered.
             500 Internal Server Error — FFmpeg not available.
         """
         # Step 2: Retrieve the project (404 handled by DRF)
         project = self.get_object()
 
+        # Step 2b: Optional per-render quality preset
+        render_quality = request.data.get('render_quality')
+        if render_quality is not None and render_quality not in RENDER_QUALITY_PRESETS:
+            return Response(
+                {
+                    'error': (
+                        'render_quality must be one of: '
+                        f'{", ".join(RENDER_QUALITY_PRESETS)}.'
+                    ),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         # Step 3: Pre-render validation
         validation_error = validate_project_for_render(project)
         if validation_error is not None:
@@ -332,10 +420,14 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
         # Use the standalone render_task_function from tasks.py
         # (wraps render_project with progress callback and status updates)
+        render_kwargs = {}
+        if render_quality is not None:
+            render_kwargs['render_quality'] = render_quality
+
         def task_wrapper():
-            render_task_function(project_id, task_id)
+            render_task_function(project_id, task_id, **render_kwargs)
 
-        task_manager.submit_task(task_wrapper, task_id=task_id)
+        task_manager.submit_task(task_wrapper, task_id=task_id, lane=LANE_RENDER)
 
         # Step 8: Return 202 Accepted
         total_segments = Segment.objects.filter(project=project).count()
@@ -346,6 +438,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 'project_id': project_id,
                 'status': STATUS_PROCESSING,
                 'total_segments': total_segments,
+                'render_quality': render_quality,
                 'message': 'Video rendering started.',
             },
             status=status.HTTP_202_ACCEPTED,
@@ -570,7 +663,8 @@ class SegmentViewSet(viewsets.ModelViewSet):
         # 4. Clear model fields
         segment.audio_file = None
         segment.audio_duration = None
-        segment.save(update_fields=['audio_file', 'audio_duration'])
+        segment.audio_input_hash = ''
+        segment.save(update_fields=['audio_file', 'audio_duration', 'audio_input_hash'])
 
         return Response({
             'id': str(segment.id),
@@ -625,6 +719,7 @@ class SegmentViewSet(viewsets.ModelViewSet):
                 construct_audio_path,
                 construct_audio_url,
             )
+            from core_engine.tts_cache import TTSAudioCache, tts_input_hash
 
             output_path = str(construct_audio_path(project_id, segment_id))
             result = tts_generate(
@@ -632,13 +727,23 @@ class SegmentViewSet(viewsets.ModelViewSet):
                 voice_id=voice_id,
                 speed=speed,
                 output_path=output_path,
+                cache=TTSAudioCache.from_settings(),
+                on_chunk=lambda done, chunks: get_task_manager().update_task_progress(
+                    task_id,
+                    current=done,
+                    total=chunks,
+                    current_segment_id=segment_id,
+                    segment_chunk=done,
+                    segment_chunks=chunks,
+                ),
             )
 
             if result["success"]:
                 seg = Segment.objects.get(pk=segment_id)
                 seg.audio_file.name = f"projects/{project_id}/audio/{segment_id}.wav"
                 seg.audio_duration = result["duration"]
-                seg.save(update_fields=["audio_file", "audio_duration"])
+                seg.audio_input_hash = tts_input_hash(segment.text_content, voice_id, speed)
+                seg.save(update_fields=["audio_file", "audio_duration", "audio_input_hash"])
             else:
                 raise Exception(result["error"])
 
@@ -657,6 +762,102 @@ class SegmentViewSet(viewsets.ModelViewSet):
             status=status.HTTP_202_ACCEPTED,
         )
 
+    @action(detail=True, methods=['post'], url_path='preview')
+    def preview(self, request, pk=None):
+        """Render a fast low-resolution preview of one segment (async).
+
+        Runs the segment through the same Ken Burns, subtitle and logo
+        assembly as a full render, at draft quality clamped to
+        ``PREVIEW_MAX_WIDTH`` / ``PREVIEW_FPS``. Accepts an optional
+        ``{"format": "mp4" | "webp"}`` body.
+
+        Returns:
+            200 OK — an up-to-date preview is already cached; the body
+                contains ``preview_url``.
+            202 Accepted — preview rendering started on the preview
+                lane; poll ``/api/tasks/<task_id>/status/`` and read
+                ``progress.preview_url`` once COMPLETED.
+            400 Bad Request — unknown format, or missing image/audio.
+        """
+        segment = self.get_object()
+        segment_id = str(segment.id)
+
+        # 1. Format check
+        preview_format = request.data.get(
+            'format', preview_renderer.DEFAULT_PREVIEW_FORMAT,
+        )
+        if preview_format not in preview_renderer.PREVIEW_FORMATS:
+            return Response(
+                {
+                    'error': (
+                        'format must be one of: '
+                        f'{", ".join(preview_renderer.PREVIEW_FORMATS)}.'
+                    ),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 2. Media checks — the preview is timed from the narration
+        if not segment.image_file or not os.path.isfile(segment.image_file.path):
+            return Response(
+                {'error': 'Segment has no image. Upload an image before previewing.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not segment.audio_file or not os.path.isfile(segment.audio_file.path):
+            return Response(
+                {'error': 'Segment has no audio. Generate audio before previewing.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 3. Serve an up-to-date cached preview directly
+        try:
+            cached_path = preview_renderer.get_cached_preview(segment, preview_format)
+        except ValueError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if cached_path is not None:
+            return Response(
+                {
+                    'segment_id': segment_id,
+                    'status': 'COMPLETED',
+                    'format': preview_format,
+                    'cached': True,
+                    'preview_url': preview_renderer.preview_url(
+                        str(segment.project_id), cached_path,
+                    ),
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        # 4. Render on the preview lane
+        hex8 = uuid_mod.uuid4().hex[:8]
+        task_id = f"preview_{segment_id}_{hex8}"
+        task_manager = get_task_manager()
+
+        def task_fn():
+            result = preview_renderer.render_segment_preview(
+                segment_id, preview_format,
+            )
+            task_manager.update_task_progress(
+                task_id, 1, 1,
+                preview_url=result['url'],
+                format=preview_format,
+                warnings=result['warnings'],
+            )
+
+        task_manager.submit_task(task_fn, task_id=task_id, lane=LANE_PREVIEW)
+
+        return Response(
+            {
+                'task_id': task_id,
+                'segment_id': segment_id,
+                'status': 'PENDING',
+                'format': preview_format,
+                'message': 'Preview rendering started.',
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
     def perform_destroy(self, instance):
         """Delete segment with media file cleanup.
 
@@ -871,13 +1072,24 @@ def reorder_segments(request):
 
 @api_view(['GET'])
 def task_status_view(request, task_id):
-    """Return real-time progress of a background TTS task.
+    """Return real-time progress of a background task.
 
     Lightweight endpoint — no database queries, just a dict lookup
     in the TaskManager registry. Returns a snapshot of the task
     state that may be slightly stale (acceptable for polling).
+
+    Besides the task's own progress the response carries its ``lane``,
+    how long it waited (or has been waiting) for a worker in
+    ``wait_seconds``, and ``lanes`` — queue depth and wait-time metrics
+    for every TaskManager lane.
+
+    Render tasks also return ``profile`` — the render profiler's
+    report (wall / CPU time and peak memory per phase and per segment,
+    export frames per second), live while the render runs and final
+    once it completes.
     """
-    task_state = get_task_manager().get_task_status(task_id)
+    task_manager = get_task_manager()
+    task_state = task_manager.get_task_status(task_id)
 
     if task_state is None:
         return Response(
@@ -885,13 +1097,427 @@ def task_status_view(request, task_id):
             status=status.HTTP_404_NOT_FOUND,
         )
 
+    data = _task_payload(task_id, task_state)
+    data['wait_seconds'] = round(
+        (task_state.get('started_at') or time.time()) - task_state['created_at'],
+        3,
+    )
+    data['lanes'] = task_manager.get_lane_metrics()
+    return Response(data, status=status.HTTP_200_OK)
+
+
+def _task_payload(task_id, task_state):
+    """Serialise a TaskManager state copy for the status / event endpoints.
+
+    Render tasks additionally carry ``render`` — the same shape as
+    ``GET /api/projects/<id>/status/`` — and render batches ``batch``
+    (as ``GET /api/render-batches/<id>/``), both built from the task
+    state alone, so pushing them needs no database query.
+    """
+    progress = dict(task_state.get('progress') or {})
+    profile = progress.pop('profile', None)
+    progress.pop('batch', None)
+    payload = {
+        'task_id': task_id,
+        'status': task_state['status'],
+        'progress': progress,
+        'profile': profile,
+        'completed_segments': task_state.get('completed_segments', []),
+        'errors': task_state.get('errors', []),
+        'lane': task_state.get('lane'),
+    }
+    if task_id.startswith(RENDER_TASK_PREFIX):
+        payload['render'] = _render_status_from_task(
+            task_id[len(RENDER_TASK_PREFIX):], task_state, progress,
+        )
+    elif task_id.startswith(BATCH_TASK_PREFIX):
+        payload['batch'] = _batch_payload(task_id, task_state)
+    return payload
+
+
+def _render_status_from_task(project_id, task_state, progress):
+    """Map a render task's state onto the render-status response shape."""
+    task_status = task_state['status']
+    total = progress.get('total_segments') or 0
+    data = {
+        'project_id': project_id,
+        'status': STATUS_PROCESSING,
+        'progress': None,
+        'output_url': None,
+    }
+
+    if task_state.get('cancel_requested') or task_status in (TASK_CANCELLED, TASK_FAILED):
+        data['status'] = STATUS_FAILED
+        cancelled = task_status != TASK_FAILED
+        data['progress'] = {
+            'current_segment': progress.get('current', 0),
+            'total_segments': total or progress.get('total', 0),
+            'percentage': int(progress.get('percentage', 0)),
+            'current_phase': (
+                'Cancelled by user' if cancelled
+                else progress.get('description', 'Failed')
+            ),
+        }
+    elif task_status == TASK_COMPLETED:
+        data['status'] = STATUS_COMPLETED
+        if progress.get('output_path'):
+            data['output_url'] = f"/media/{progress['output_path']}"
+        data['progress'] = {
+            'current_segment': total,
+            'total_segments': total,
+            'percentage': 100,
+            'current_phase': 'Export complete',
+        }
+    elif progress:
+        is_export = progress.get('is_export_phase', False)
+        data['progress'] = {
+            'current_segment': total if is_export else progress.get('current', 0),
+            'total_segments': total,
+            'percentage': int(progress.get('percentage', 0)),
+            'current_phase': progress.get('description', 'Rendering…'),
+        }
+    return data
+
+
+# ===================================================================
+# Task Event Stream (server-sent events)
+# ===================================================================
+
+# Minimum spacing between two pushes; updates in between are coalesced
+# into the latest state of each task.
+TASK_EVENTS_COALESCE_SECONDS = 0.25
+# Idle time after which a comment line is sent, so proxies and browsers
+# keep the connection open and dead clients are noticed.
+TASK_EVENTS_HEARTBEAT_SECONDS = 15.0
+# Lifetime of one connection.  EventSource reconnects by itself and
+# resumes from the Last-Event-ID header, so no worker thread is held
+# forever by a forgotten tab.
+TASK_EVENTS_MAX_SECONDS = 300.0
+# Reconnect delay suggested to the browser (milliseconds)
+TASK_EVENTS_RETRY_MS = 1000
+
+
+def _task_event_stream(task_ids, since):
+    """Yield SSE frames for task changes after event *since*."""
+    task_manager = get_task_manager()
+    deadline = time.monotonic() + TASK_EVENTS_MAX_SECONDS
+    last_write = time.monotonic()
+    yield f"retry: {TASK_EVENTS_RETRY_MS}\n\n"
+
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            return
+        timeout = min(
+            TASK_EVENTS_HEARTBEAT_SECONDS - (now - last_write),
+            deadline - now,
+        )
+        since, changed = task_manager.wait_for_changes(since, timeout, task_ids)
+
+        if changed:
+            frames = []
+            for task_id, state in sorted(
+                changed.items(), key=lambda item: item[1].get('event_seq', 0),
+            ):
+                data = json.dumps(_task_payload(task_id, state), default=str)
+                frames.append(
+                    f"id: {state.get('event_seq', since)}\n"
+                    f"event: task\n"
+                    f"data: {data}\n\n"
+                )
+            yield ''.join(frames)
+            last_write = time.monotonic()
+            # Let further updates pile up; the next batch carries only
+            # the latest state of each task.
+            time.sleep(TASK_EVENTS_COALESCE_SECONDS)
+        elif time.monotonic() - last_write >= TASK_EVENTS_HEARTBEAT_SECONDS:
+            yield ": heartbeat\n\n"
+            last_write = time.monotonic()
+
+
+@require_GET
+def task_events_view(request):
+    """Push task progress to the browser as server-sent events.
+
+    GET /api/tasks/events/?task_ids=<id>,<id>
+
+    One long-lived ``text/event-stream`` connection replaces polling
+    ``/api/tasks/<id>/status/`` and ``/api/projects/<id>/status/``.
+    Each change is sent as an ``event: task`` frame whose ``data`` is
+    the task-status payload (render tasks include ``render``, shaped
+    like the render-status response); ``id`` is the TaskManager event
+    sequence number.  All current tasks are sent when the stream opens,
+    further changes as they happen (coalesced to at most one frame per
+    task every :data:`TASK_EVENTS_COALESCE_SECONDS`), and a heartbeat
+    comment after :data:`TASK_EVENTS_HEARTBEAT_SECONDS` of silence.
+
+    ``task_ids`` optionally restricts the stream to some tasks.  A
+    reconnecting ``EventSource`` sends ``Last-Event-ID`` and only
+    receives what changed since.
+
+    A plain Django view rather than a DRF one: DRF content negotiation
+    would reject the ``Accept: text/event-stream`` header.
+    """
+    task_ids = {
+        tid.strip() for tid in request.GET.get('task_ids', '').split(',')
+        if tid.strip()
+    } or None
+    try:
+        since = max(int(request.headers.get('Last-Event-ID') or 0), 0)
+    except ValueError:
+        since = 0
+
+    response = StreamingHttpResponse(
+        _task_event_stream(task_ids, since),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+# ===================================================================
+# Render Batch Endpoints
+# ===================================================================
+
+def _batch_payload(batch_id, task_state):
+    """Serialise a render batch from its coordinator task's state."""
+    progress = task_state.get('progress') or {}
+    return {
+        'batch_id': batch_id,
+        'status': task_state['status'],
+        'cancel_requested': task_state.get('cancel_requested', False),
+        'created_at': task_state['created_at'],
+        'started_at': task_state.get('started_at'),
+        'completed_at': task_state.get('completed_at'),
+        **(progress.get('batch') or {}),
+    }
+
+
+def _is_uuid(value):
+    try:
+        uuid_mod.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_batch_projects(entries):
+    """Normalise the ``projects`` list of a batch request.
+
+    Each entry is a project ID or ``{"project_id": ..., "priority": n}``.
+
+    Returns:
+        ``(projects, error)`` — a list of ``(project_id, priority)``
+        tuples, or an error message.
+    """
+    if not isinstance(entries, list) or not entries:
+        return None, 'projects must be a non-empty list.'
+
+    projects = []
+    seen = set()
+    for entry in entries:
+        if isinstance(entry, dict):
+            project_id = entry.get('project_id')
+            priority = entry.get('priority', 0)
+        else:
+            project_id, priority = entry, 0
+        if not isinstance(project_id, str) or not project_id:
+            return None, 'Each project needs a project_id.'
+        if _is_uuid(project_id):
+            project_id = str(uuid_mod.UUID(project_id))
+        if isinstance(priority, bool) or not isinstance(priority, int):
+            return None, f'priority of project {project_id} must be an integer.'
+        if project_id in seen:
+            return None, f'Project {project_id} is listed more than once.'
+        seen.add(project_id)
+        projects.append((project_id, priority))
+    return projects, None
+
+
+@api_view(['GET', 'POST'])
+def render_batches_view(request):
+    """List render batches (GET) or queue a new one (POST).
+
+    GET  /api/render-batches/
+    POST /api/render-batches/
+        {"projects": [{"project_id": "<uuid>", "priority": 2}, "<uuid>", …],
+         "render_quality": "draft" | "standard" | "final"}   (optional)
+
+    A batch is rendered by the server, independently of the browser:
+    projects go to the render lane highest ``priority`` first (ties in
+    list order) and share the render process's caches.  Progress,
+    throughput and ETA are available from
+    ``GET /api/render-batches/<batch_id>/`` and are pushed on
+    ``/api/tasks/events/`` as the ``batch`` of task ``<batch_id>``.
+
+    Returns:
+        200 OK — (GET) batches still in the task registry, newest first.
+        202 Accepted — (POST) the queued batch.
+        400 Bad Request — malformed list, unknown ``render_quality``, or
+            projects that are missing or not ready (``projects`` maps
+            each offending ID to the reason).
+        500 Internal Server Error — FFmpeg not available.
+    """
+    task_manager = get_task_manager()
+
+    if request.method == 'GET':
+        batches = [
+            _batch_payload(batch_id, state)
+            for batch_id, state in task_manager.find_tasks(BATCH_TASK_PREFIX).items()
+        ]
+        batches.sort(key=lambda batch: batch['created_at'], reverse=True)
+        return Response(batches)
+
+    # POST — validate the request
+    projects, error = _parse_batch_projects(request.data.get('projects'))
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+    render_quality = request.data.get('render_quality')
+    if render_quality is not None and render_quality not in RENDER_QUALITY_PRESETS:
+        return Response(
+            {
+                'error': (
+                    'render_quality must be one of: '
+                    f'{", ".join(RENDER_QUALITY_PRESETS)}.'
+                ),
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # Every project must exist and be ready now; the coordinator checks
+    # again right before each render.
+    found = {
+        str(project.id): project
+        for project in Project.objects.filter(
+            id__in=[project_id for project_id, _ in projects
+                    if _is_uuid(project_id)],
+        ).annotate(segment_count=models.Count('segments'))
+    }
+    problems = {}
+    for project_id, _ in projects:
+        project = found.get(project_id)
+        if project is None:
+            problems[project_id] = 'Project not found.'
+        elif project.status == STATUS_PROCESSING:
+            problems[project_id] = 'Project is already being rendered.'
+        else:
+            validation_error = validate_project_for_render(project)
+            if validation_error is not None:
+                problems[project_id] = validation_error['message']
+    if problems:
+        return Response(
+            {'error': 'Some projects cannot be rendered.', 'projects': problems},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if not render_utils.check_ffmpeg():
+        return Response(
+            {
+                'error': (
+                    'FFmpeg is required for video rendering but was '
+                    'not found on the system PATH. Please install '
+                    'FFmpeg and try again.'
+                ),
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    # Queue the coordinator
+    items = [
+        make_batch_item(
+            project_id,
+            found[project_id].title,
+            found[project_id].segment_count,
+            priority=priority,
+            position=position,
+        )
+        for position, (project_id, priority) in enumerate(projects)
+    ]
+    ordered = order_batch_items(items)
+    summary = summarise_batch(ordered, None)
+    summary['render_quality'] = render_quality
+
+    batch_id = f"{BATCH_TASK_PREFIX}{uuid_mod.uuid4()}"
+
+    def task_wrapper():
+        render_batch_task_function(batch_id, ordered, render_quality=render_quality)
+
+    task_manager.submit_task(
+        task_wrapper,
+        task_id=batch_id,
+        lane=LANE_BATCH,
+        progress={'description': 'Queued', 'batch': summary},
+    )
+
+    return Response(
+        _batch_payload(batch_id, task_manager.get_task_status(batch_id)),
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
+@api_view(['GET'])
+def render_batch_detail_view(request, batch_id):
+    """Return the progress, throughput and ETA of a render batch.
+
+    GET /api/render-batches/<batch_id>/
+
+    Returns:
+        200 OK — batch status, per-state counts, ``throughput``,
+            ``eta_seconds`` and ``items`` in render order.
+        404 Not Found — unknown batch (or cleaned up after an hour).
+    """
+    if not batch_id.startswith(BATCH_TASK_PREFIX):
+        batch_id = f"{BATCH_TASK_PREFIX}{batch_id}"
+    task_state = get_task_manager().get_task_status(batch_id)
+    if task_state is None:
+        return Response(
+            {'error': 'Render batch not found.'},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    return Response(_batch_payload(batch_id, task_state))
+
+
+@api_view(['POST'])
+def render_batch_cancel_view(request, batch_id):
+    """Cancel a render batch.
+
+    POST /api/render-batches/<batch_id>/cancel/
+
+    Renders in flight are cancelled like ``cancel-render`` does; queued
+    projects are not rendered.
+
+    Returns:
+        200 OK — cancellation requested.
+        404 Not Found — unknown batch.
+        409 Conflict — the batch has already finished.
+    """
+    if not batch_id.startswith(BATCH_TASK_PREFIX):
+        batch_id = f"{BATCH_TASK_PREFIX}{batch_id}"
+    task_manager = get_task_manager()
+    task_state = task_manager.get_task_status(batch_id)
+    if task_state is None:
+        return Response(
+            {'error': 'Render batch not found.'},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    if task_state['status'] in (TASK_COMPLETED, TASK_FAILED, TASK_CANCELLED):
+        return Response(
+            {
+                'error': 'Render batch has already finished.',
+                'batch_id': batch_id,
+                'status': task_state['status'],
+            },
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    task_manager.cancel_task(batch_id)
     return Response(
         {
-            'task_id': task_id,
-            'status': task_state['status'],
-            'progress': task_state.get('progress', {}),
-            'completed_segments': task_state.get('completed_segments', []),
-            'errors': task_state.get('errors', []),
+            'batch_id': batch_id,
+            'status': 'CANCELLING',
+            'message': 'Render batch cancellation requested.',
         },
         status=status.HTTP_200_OK,
     )
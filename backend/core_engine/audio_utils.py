@@ -2,7 +2,8 @@
 Audio utility functions for StoryFlow TTS pipeline.
 
 Pure utility functions for peak normalization, WAV file saving,
-duration calculation, and audio file validation. No Django imports,
+duration calculation, audio file validation, and mixing the render
+soundtrack. No Django imports,
 no model access — testable in isolation with synthetic numpy arrays.
 """
 
@@ -129,3 +130,89 @@ def save_audio_wav(
     logger.info("Saved audio file: %s", output_path)
 
     return output_path
+
+
+def _resample_linear(audio: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """Linearly resample a ``(frames, channels)`` array to *target_rate*."""
+    if source_rate == target_rate or len(audio) == 0:
+        return audio
+    target_len = max(int(round(len(audio) * target_rate / source_rate)), 1)
+    source_x = np.arange(len(audio), dtype=np.float64)
+    target_x = np.linspace(0, len(audio) - 1, target_len)
+    return np.stack(
+        [np.interp(target_x, source_x, audio[:, ch]) for ch in range(audio.shape[1])],
+        axis=1,
+    ).astype(np.float32)
+
+
+def mix_soundtrack(
+    audio_paths: list[str],
+    start_times: list[float],
+    total_duration: float,
+    output_path: str,
+    sample_rate: int | None = None,
+) -> str:
+    """
+    Mix every segment's narration into one WAV in a single NumPy pass.
+
+    Each file is read with soundfile and added into one float32
+    ``(samples, channels)`` buffer at ``start_times[i]``.  The caller's
+    start times carry the timeline arithmetic: a segment starts where
+    the previous one's visual duration (narration + inter-segment
+    silence) ends, minus the crossfade overlap.  The silence gaps are
+    therefore simply samples nothing is added to, and where two
+    narrations overlap they are summed.  The result is clipped to
+    ``[-1, 1]`` and padded or truncated to exactly *total_duration*.
+
+    Files at a different sample rate than the mix are resampled
+    linearly; mono files are spread over every channel of a stereo mix.
+
+    Args:
+        audio_paths: Segment WAV files, in timeline order.
+        start_times: Start of each file on the timeline, in seconds.
+        total_duration: Length of the mixed track in seconds.
+        output_path: Destination WAV path.
+        sample_rate: Mix rate in Hz.  Defaults to the first file's rate.
+
+    Returns:
+        The output_path for chaining convenience.
+
+    Raises:
+        ValueError: If the lists differ in length or are empty.
+    """
+    if not audio_paths or len(audio_paths) != len(start_times):
+        raise ValueError(
+            "mix_soundtrack needs one start time per audio file "
+            f"(got {len(audio_paths)} file(s), {len(start_times)} start(s))."
+        )
+
+    tracks = []
+    for path in audio_paths:
+        data, rate = sf.read(path, dtype="float32", always_2d=True)
+        tracks.append((data, rate))
+
+    rate = int(sample_rate or tracks[0][1])
+    channels = max(data.shape[1] for data, _ in tracks)
+    total_samples = max(int(round(total_duration * rate)), 1)
+    mix = np.zeros((total_samples, channels), dtype=np.float32)
+
+    for (data, source_rate), start in zip(tracks, start_times):
+        data = _resample_linear(data, source_rate, rate)
+        offset = max(int(round(start * rate)), 0)
+        length = min(len(data), total_samples - offset)
+        if length <= 0:
+            continue
+        # (n, 1) broadcasts over every channel of a multichannel mix
+        mix[offset:offset + length] += data[:length]
+
+    np.clip(mix, -1.0, 1.0, out=mix)
+
+    parent_dir = os.path.dirname(output_path)
+    if parent_dir:
+        os.makedirs(parent_dir, exist_ok=True)
+    sf.write(output_path, mix, rate, subtype="PCM_16")
+    logger.info(
+        "Mixed %d track(s) into %s (%.2fs @ %d Hz)",
+        len(tracks), output_path, total_samples / rate, rate,
+    )
+    return output_path
@@ -0,0 +1,510 @@
+"""
+StoryFlow core_engine Benchmark Suite.
+
+Times the hot paths of the render engine on synthetic inputs generated
+offline (gradient-and-noise images, sine-tone WAVs), so the numbers do
+not depend on any project data or on the TTS model:
+
+* ``image.load`` — :func:`core_engine.ken_burns.load_and_prepare_image`
+  (decode and resize, bypassing the prepared-image cache)
+* ``image.load_cached`` — the same call served by
+  :mod:`core_engine.image_cache`
+* ``ken_burns.build`` — the one-off plane resample of
+  :func:`core_engine.ken_burns.build_ken_burns_engine`
+* ``ken_burns.frame`` — one frame from the prepared engine (the
+  per-frame cost of the renderer)
+* ``ken_burns.make_frame`` — one frame of the MoviePy clip returned by
+  :func:`core_engine.ken_burns.apply_ken_burns`
+* ``subtitles.clips`` / ``subtitles.sprites`` —
+  :func:`~core_engine.subtitle_engine.generate_subtitle_clips` and the
+  Pillow sprites the renderer actually composites
+* ``audio.normalize`` — :func:`core_engine.audio_utils.normalize_audio`
+* ``render.project`` — a full :func:`core_engine.video_renderer.render_project`
+  for 1, 10 and 50-segment projects
+* ``api.project_status`` / ``api.gallery`` — the render status poll
+  and the gallery list endpoints
+
+Image and frame benchmarks run at 720p, 1080p and 4K.  The render and
+endpoint benchmarks create throw-away projects inside a database
+transaction that is rolled back, with ``MEDIA_ROOT`` pointed at a
+temporary directory, so nothing is left behind.
+
+:func:`run_benchmarks` returns a JSON-serialisable report (environment,
+git commit, one entry per benchmark with min / median / mean seconds);
+:func:`compare_reports` diffs two reports so regressions can be spotted
+across commits.
+
+Used by ``python manage.py benchmark_core``.
+"""
+
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_RESOLUTIONS: dict[str, tuple[int, int]] = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+RENDER_SEGMENT_COUNTS: tuple[int, ...] = (1, 10, 50)
+
+# Smaller sweep for ``--quick`` (CI smoke runs)
+QUICK_RESOLUTIONS: tuple[str, ...] = ("720p",)
+QUICK_SEGMENT_COUNTS: tuple[int, ...] = (1, 3)
+
+BENCHMARK_TEXT = (
+    "The old lighthouse keeper climbed the spiral stairs one last time, "
+    "counting each step as the storm gathered over the grey northern sea."
+)
+
+# Synthetic narration length per segment (seconds) and sample rate
+SEGMENT_SECONDS: float = 2.0
+SAMPLE_RATE: int = 24000
+
+# Source images are this much larger than the output, like real photos
+IMAGE_OVERSCAN: float = 1.6
+
+# Relative change in median time reported as a regression / improvement
+DEFAULT_REGRESSION_THRESHOLD: float = 0.10
+
+REPORT_VERSION = 1
+
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------
+
+def make_synthetic_image(path: str, size: tuple[int, int], seed: int = 0) -> str:
+    """Write a JPEG of *size* with a colour gradient plus noise.
+
+    Noise keeps the JPEG from compressing to nothing, so decode and
+    resample costs resemble a real photograph.
+    """
+    from PIL import Image
+
+    width, height = size
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    image = np.empty((height, width, 3), dtype=np.float32)
+    image[..., 0] = x
+    image[..., 1] = y
+    image[..., 2] = (x + y) / 2
+    image += rng.normal(0, 12, image.shape).astype(np.float32)
+    Image.fromarray(np.clip(image, 0, 255).astype(np.uint8)).save(path, quality=90)
+    return path
+
+
+def make_synthetic_wav(path: str, seconds: float = SEGMENT_SECONDS,
+                       sample_rate: int = SAMPLE_RATE, seed: int = 0) -> str:
+    """Write a mono 16-bit WAV of a quiet, slightly noisy sine tone."""
+    import soundfile as sf
+
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / sample_rate
+    audio = 0.3 * np.sin(2 * np.pi * 220 * t) + rng.normal(0, 0.01, t.shape)
+    sf.write(path, audio.astype(np.float32), sample_rate, subtype="PCM_16")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def time_call(fn: Callable[[], object], repeat: int, warmup: int = 1) -> dict:
+    """Call *fn* ``warmup + repeat`` times and summarise the timed calls."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(max(int(repeat), 1)):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return {
+        "repeat": len(samples),
+        "min_seconds": round(min(samples), 6),
+        "median_seconds": round(statistics.median(samples), 6),
+        "mean_seconds": round(statistics.fmean(samples), 6),
+    }
+
+
+def result_id(name: str, params: dict) -> str:
+    """Stable key of a benchmark result, e.g. ``ken_burns.frame[resolution=4k]``."""
+    if not params:
+        return name
+    inner = ",".join(f"{k}={params[k]}" for k in sorted(params))
+    return f"{name}[{inner}]"
+
+
+def _result(name: str, params: dict, timing: dict, **extra) -> dict:
+    return {"id": result_id(name, params), "name": name, "params": params,
+            **timing, **extra}
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def bench_image_load(workdir: str, resolutions, repeat: int) -> list[dict]:
+    """``load_and_prepare_image`` at each resolution, cold and cached."""
+    from core_engine.ken_burns import load_and_prepare_image
+
+    results = []
+    for name in resolutions:
+        size = BENCHMARK_RESOLUTIONS[name]
+        source = (int(size[0] * IMAGE_OVERSCAN), int(size[1] * IMAGE_OVERSCAN))
+        path = make_synthetic_image(os.path.join(workdir, f"load_{name}.jpg"), source)
+        timing = time_call(
+            lambda: load_and_prepare_image(path, size, 1.3, use_cache=False), repeat,
+        )
+        results.append(_result("image.load", {"resolution": name}, timing))
+
+        load_and_prepare_image(path, size, 1.3)
+        timing = time_call(lambda: load_and_prepare_image(path, size, 1.3), repeat)
+        results.append(_result("image.load_cached", {"resolution": name}, timing))
+    return results
+
+
+def bench_ken_burns(workdir: str, resolutions, repeat: int) -> list[dict]:
+    """Ken Burns plane build, prepared-engine frames and MoviePy ``make_frame``."""
+    from core_engine.ken_burns import apply_ken_burns, build_ken_burns_engine
+
+    results = []
+    for name in resolutions:
+        size = BENCHMARK_RESOLUTIONS[name]
+        source = (int(size[0] * IMAGE_OVERSCAN), int(size[1] * IMAGE_OVERSCAN))
+        path = make_synthetic_image(os.path.join(workdir, f"kb_{name}.jpg"), source)
+        params = {"resolution": name}
+
+        timing = time_call(
+            lambda: build_ken_burns_engine(path, SEGMENT_SECONDS, size), repeat,
+        )
+        results.append(_result("ken_burns.build", params, timing))
+
+        engine = build_ken_burns_engine(path, SEGMENT_SECONDS, size)
+        out = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        frame_times = iter(np.linspace(0, SEGMENT_SECONDS, 10_000))
+        timing = time_call(
+            lambda: engine.frame_at(next(frame_times), out), repeat * 10,
+        )
+        results.append(_result(
+            "ken_burns.frame", params, timing,
+            fps=round(1 / timing["median_seconds"], 1) if timing["median_seconds"] else None,
+        ))
+
+        clip = apply_ken_burns(path, SEGMENT_SECONDS, size)
+        try:
+            clip_times = iter(np.linspace(0, SEGMENT_SECONDS * 0.99, 10_000))
+            timing = time_call(lambda: clip.get_frame(next(clip_times)), repeat * 10)
+        finally:
+            clip.close()
+        results.append(_result("ken_burns.make_frame", params, timing))
+    return results
+
+
+def bench_subtitles(workdir: str, resolutions, repeat: int) -> list[dict]:
+    """Subtitle ``TextClip`` generation and Pillow sprite rasterisation."""
+    from core_engine.subtitle_engine import (
+        calculate_subtitle_timing,
+        chunk_text,
+        generate_subtitle_clips,
+        generate_subtitle_sprites,
+    )
+    from core_engine.render_utils import get_font_path
+
+    font = get_font_path(None)
+    chunks = chunk_text(BENCHMARK_TEXT)
+    timings = calculate_subtitle_timing(chunks, SEGMENT_SECONDS * 3)
+
+    results = []
+    for name in resolutions:
+        size = BENCHMARK_RESOLUTIONS[name]
+        params = {"resolution": name, "chunks": len(chunks)}
+        timing = time_call(
+            lambda: generate_subtitle_clips(chunks, timings, size, font, "#FFFFFF"),
+            repeat,
+        )
+        results.append(_result("subtitles.clips", params, timing))
+        timing = time_call(
+            lambda: generate_subtitle_sprites(chunks, timings, size, font, "#FFFFFF"),
+            repeat,
+        )
+        results.append(_result("subtitles.sprites", params, timing))
+    return results
+
+
+def bench_normalize_audio(workdir: str, resolutions, repeat: int) -> list[dict]:
+    """Peak normalisation of 10 s and 60 s narration buffers."""
+    from core_engine.audio_utils import normalize_audio
+
+    rng = np.random.default_rng(0)
+    results = []
+    for seconds in (10, 60):
+        audio = (rng.standard_normal(seconds * SAMPLE_RATE) * 0.1).astype(np.float32)
+        timing = time_call(lambda: normalize_audio(audio), repeat * 5)
+        results.append(_result("audio.normalize", {"seconds": seconds}, timing))
+    return results
+
+
+def _create_project(title: str, segments: int, media: str, seed: int = 0):
+    """Create a project whose segments have synthetic images and WAVs."""
+    from django.core.files import File
+
+    from api.models import Project, Segment  # noqa: E402 — deferred import
+
+    project = Project.objects.create(title=title)
+    for index in range(segments):
+        image = make_synthetic_image(
+            os.path.join(media, f"src_{seed}_{index}.jpg"), (1280, 720), seed + index,
+        )
+        audio = make_synthetic_wav(
+            os.path.join(media, f"src_{seed}_{index}.wav"), seed=seed + index,
+        )
+        segment = Segment.objects.create(
+            project=project,
+            sequence_index=index,
+            text_content=BENCHMARK_TEXT,
+            audio_duration=SEGMENT_SECONDS,
+        )
+        with open(image, "rb") as f:
+            segment.image_file.save(os.path.basename(image), File(f), save=False)
+        with open(audio, "rb") as f:
+            segment.audio_file.save(os.path.basename(audio), File(f), save=False)
+        segment.save()
+    return project
+
+
+def bench_render_and_endpoints(workdir: str, segment_counts, repeat: int,
+                               render_quality: Optional[str] = None) -> list[dict]:
+    """Full renders of synthetic projects, then the status and gallery endpoints.
+
+    Everything happens in a rolled-back transaction with ``MEDIA_ROOT``
+    in *workdir*.
+    """
+    from django.conf import settings
+    from django.db import transaction
+    from django.test import Client
+    from django.test.utils import override_settings
+
+    from api.models import STATUS_COMPLETED  # noqa: E402 — deferred import
+    from core_engine.video_renderer import render_project
+
+    class _Rollback(Exception):
+        pass
+
+    media = os.path.join(workdir, "media")
+    os.makedirs(media, exist_ok=True)
+    results: list[dict] = []
+    hosts = list(settings.ALLOWED_HOSTS) + ["testserver"]
+
+    with override_settings(MEDIA_ROOT=media, ALLOWED_HOSTS=hosts):
+        try:
+            with transaction.atomic():
+                project = None
+                for count in segment_counts:
+                    project = _create_project(f"Benchmark {count}", count, media, seed=count)
+                    rendered: dict = {}
+
+                    def render():
+                        rendered.update(render_project(str(project.id), render_quality=render_quality))
+
+                    timing = time_call(render, repeat, warmup=0)
+                    profile = rendered.get("profile", {})
+                    results.append(_result(
+                        "render.project", {"segments": count}, timing,
+                        render_mode=rendered.get("render_mode"),
+                        render_quality=rendered.get("render_quality"),
+                        video_seconds=round(rendered.get("duration", 0.0), 3),
+                        export_fps=profile.get("export", {}).get("fps"),
+                        peak_rss_mb=rendered.get("peak_rss_mb"),
+                    ))
+                    project.status = STATUS_COMPLETED
+                    project.output_path = rendered.get("output_path", "")
+                    project.save(update_fields=["status", "output_path"])
+
+                client = Client()
+                status_url = f"/api/projects/{project.id}/status/"
+                timing = time_call(lambda: client.get(status_url), repeat * 20)
+                results.append(_result("api.project_status", {}, timing))
+                timing = time_call(lambda: client.get("/api/gallery/"), repeat * 20)
+                results.append(_result(
+                    "api.gallery", {"projects": len(segment_counts)}, timing,
+                ))
+                raise _Rollback
+        except _Rollback:
+            pass
+    return results
+
+
+# name → (function, needs the database)
+BENCHMARKS: dict[str, tuple[Callable, bool]] = {
+    "image": (bench_image_load, False),
+    "ken_burns": (bench_ken_burns, False),
+    "subtitles": (bench_subtitles, False),
+    "audio": (bench_normalize_audio, False),
+    "render": (bench_render_and_endpoints, True),
+}
+
+
+# ---------------------------------------------------------------------------
+# Suite runner and reports
+# ---------------------------------------------------------------------------
+
+def environment_info() -> dict:
+    """Machine, library versions and git commit the numbers belong to."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=10,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    import PIL
+
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_benchmarks(only=None, quick: bool = False, repeat: Optional[int] = None,
+                   segment_counts=None, render_quality: Optional[str] = None) -> dict:
+    """
+    Run the benchmark suite.
+
+    Args:
+        only: Benchmark group names from :data:`BENCHMARKS` (default: all).
+        quick: Use :data:`QUICK_RESOLUTIONS` / :data:`QUICK_SEGMENT_COUNTS`
+            and a single repeat — a smoke run, not a measurement.
+        repeat: Timed calls per benchmark (default 5, or 1 when *quick*;
+            frame and endpoint benchmarks scale it up).
+        segment_counts: Project sizes for ``render`` (default
+            :data:`RENDER_SEGMENT_COUNTS`).
+        render_quality: Optional preset for the ``render`` group.
+
+    Returns:
+        dict: ``version``, ``environment``, ``settings`` and ``results``
+        (one dict per benchmark with ``id``, ``name``, ``params``,
+        ``repeat`` and ``min`` / ``median`` / ``mean_seconds``; failed
+        benchmark groups are reported with ``error``).
+
+    Raises:
+        ValueError: For an unknown benchmark group.
+    """
+    groups = list(only or BENCHMARKS)
+    unknown = [g for g in groups if g not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark group(s): {', '.join(unknown)}")
+
+    repeat = repeat or (1 if quick else 5)
+    resolutions = QUICK_RESOLUTIONS if quick else tuple(BENCHMARK_RESOLUTIONS)
+    counts = tuple(segment_counts or (QUICK_SEGMENT_COUNTS if quick else RENDER_SEGMENT_COUNTS))
+
+    results: list[dict] = []
+    workdir = tempfile.mkdtemp(prefix="core_benchmark_")
+    try:
+        for group in groups:
+            fn, _needs_db = BENCHMARKS[group]
+            logger.info("Benchmark group '%s'...", group)
+            try:
+                if group == "render":
+                    results.extend(fn(workdir, counts, repeat, render_quality))
+                else:
+                    results.extend(fn(workdir, resolutions, repeat))
+            except Exception as exc:
+                logger.warning("Benchmark group %s failed: %s", group, exc, exc_info=True)
+                results.append({"id": group, "name": group, "params": {},
+                                "error": f"{type(exc).__name__}: {exc}"})
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "version": REPORT_VERSION,
+        "environment": environment_info(),
+        "settings": {
+            "quick": quick,
+            "repeat": repeat,
+            "resolutions": list(resolutions),
+            "segment_counts": list(counts),
+            "render_quality": render_quality,
+        },
+        "results": results,
+    }
+
+
+def compare_reports(current: dict, baseline: dict,
+                    threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> list[dict]:
+    """Compare the median times of two reports, benchmark by benchmark.
+
+    Returns:
+        list[dict]: ``id``, ``baseline_seconds``, ``current_seconds``,
+        ``ratio`` (current / baseline) and ``status`` —
+        ``"regression"``, ``"improvement"`` or ``"same"`` — for every
+        benchmark present in both reports.
+    """
+    previous = {
+        r["id"]: r for r in baseline.get("results", []) if "median_seconds" in r
+    }
+    rows = []
+    for result in current.get("results", []):
+        before = previous.get(result["id"])
+        if before is None or "median_seconds" not in result:
+            continue
+        base, now = before["median_seconds"], result["median_seconds"]
+        ratio = now / base if base else float("inf")
+        if ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "same"
+        rows.append({
+            "id": result["id"],
+            "baseline_seconds": base,
+            "current_seconds": now,
+            "ratio": round(ratio, 3),
+            "status": verdict,
+        })
+    return rows
+
+
+def format_benchmark_report(report: dict, comparison: Optional[list[dict]] = None) -> str:
+    """Render a report (and optional comparison) as a fixed-width table."""
+    env = report["environment"]
+    lines = [
+        f"commit {env.get('commit') or '?'} · python {env['python']} · "
+        f"{env['cpu_count']} CPU(s)",
+        f"{'benchmark':<44} {'median ms':>10} {'min ms':>10} {'n':>4}",
+        "-" * 71,
+    ]
+    for r in report["results"]:
+        if "error" in r:
+            lines.append(f"{r['id']:<44} failed: {r['error']}")
+            continue
+        lines.append(
+            f"{r['id']:<44} {r['median_seconds'] * 1000:>10.2f} "
+            f"{r['min_seconds'] * 1000:>10.2f} {r['repeat']:>4}"
+        )
+    if comparison:
+        lines += ["", f"{'vs baseline':<44} {'ratio':>10} {'status':>15}", "-" * 71]
+        for row in comparison:
+            lines.append(f"{row['id']:<44} {row['ratio']:>10.3f} {row['status']:>15}")
+    return "\n".join(lines)
@@ -0,0 +1,164 @@
+"""
+StoryFlow Export Profile Benchmark.
+
+Encodes the video timeline of a reference project once per export
+profile (see :mod:`core_engine.export_profiles`) and records the encode
+speed and the size of the result, so ``GlobalSettings.export_profile``
+can be chosen with real numbers for the machine and the footage.
+
+The frames are drawn exactly as in a render (Ken Burns, subtitles,
+logo, crossfades) and piped through
+:func:`core_engine.frame_pipe.encode_timeline`; the soundtrack is left
+out so only the video encoder is compared.
+
+Used by ``python manage.py benchmark_export``.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def build_benchmark_timeline(project, render_settings):
+    """Build the :class:`CrossfadeTimeline` of *project* for benchmarking.
+
+    Segments without an image, without audio or with unreadable audio
+    are skipped.
+
+    Raises:
+        ValueError: If no segment can be drawn.
+    """
+    from api.models import Segment  # noqa: E402 — deferred import
+
+    from core_engine.audio_utils import get_audio_duration
+    from core_engine.frame_compositor import CrossfadeTimeline
+    from core_engine.video_renderer import (
+        TRANSITION_DURATION,
+        build_logo_overlay,
+        build_segment_source,
+        describe_segment,
+    )
+
+    logo = None
+    if render_settings["logo"] is not None:
+        try:
+            logo = build_logo_overlay(render_settings["logo"], render_settings["resolution"])
+        except Exception as logo_err:
+            logger.warning("Benchmark without logo: %s", logo_err)
+
+    segments = [
+        seg for seg in Segment.objects.filter(project=project).order_by("sequence_index")
+        if seg.image_file and seg.audio_file
+    ]
+    sources = []
+    for idx, segment in enumerate(segments, start=1):
+        spec = describe_segment(segment, idx, len(segments))
+        try:
+            audio_duration = get_audio_duration(spec["audio_path"])
+        except Exception as exc:
+            logger.warning("Benchmark skips %s: %s", spec["label"], exc)
+            continue
+        if audio_duration <= 0 or not os.path.exists(spec["image_path"]):
+            continue
+        spec["audio_duration"] = audio_duration
+        spec["visual_duration"] = audio_duration + max(render_settings["inter_segment_silence"], 0.0)
+        source, _warnings = build_segment_source(spec, render_settings, logo)
+        sources.append(source)
+
+    if not sources:
+        raise ValueError(
+            f"Project '{project.title}' has no segments with both an image "
+            "and readable audio to benchmark."
+        )
+    return CrossfadeTimeline(sources, TRANSITION_DURATION)
+
+
+def run_export_benchmark(project_id, profiles=None, render_quality=None):
+    """
+    Encode a project's timeline with each export profile.
+
+    Args:
+        project_id: UUID of the reference project.
+        profiles: Profile names to compare (default: every profile).
+        render_quality: Optional quality preset (default: the configured one).
+
+    Returns:
+        list[dict]: ``profile``, ``frames``, ``encode_seconds``,
+        ``encode_fps``, ``output_bytes``, ``bitrate_kbps`` and
+        ``encoder_args`` — or ``profile`` and ``error`` for a profile that
+        failed.
+
+    Raises:
+        Project.DoesNotExist: If *project_id* is unknown.
+        ValueError: If the project has nothing to draw.
+    """
+    from api.models import Project  # noqa: E402 — deferred import
+
+    from core_engine.export_profiles import EXPORT_PROFILES, encoder_args, encoder_threads
+    from core_engine.frame_pipe import encode_timeline
+    from core_engine.parallel_renderer import piece_encoder
+    from core_engine.video_renderer import load_render_settings
+
+    project = Project.objects.get(id=project_id)
+    render_settings = load_render_settings(project, render_quality)
+    timeline = build_benchmark_timeline(project, render_settings)
+    fps = render_settings["fps"]
+
+    results = []
+    temp_dir = tempfile.mkdtemp(prefix="export_benchmark_")
+    try:
+        for profile in profiles or EXPORT_PROFILES:
+            settings = dict(render_settings, export_profile=profile)
+            encoder = dict(
+                piece_encoder(settings, timeline.duration),
+                threads=encoder_threads(1),
+            )
+            output_path = os.path.join(temp_dir, f"{profile}.mp4")
+            try:
+                start = time.perf_counter()
+                frames = encode_timeline(timeline, fps, output_path, encoder)
+                seconds = time.perf_counter() - start
+            except Exception as exc:
+                logger.warning("Export benchmark profile %s failed: %s", profile, exc)
+                results.append({"profile": profile, "error": str(exc)})
+                continue
+
+            output_bytes = os.path.getsize(output_path)
+            results.append({
+                "profile": profile,
+                "frames": frames,
+                "encode_seconds": round(seconds, 3),
+                "encode_fps": round(frames / seconds, 2) if seconds else None,
+                "output_bytes": output_bytes,
+                "bitrate_kbps": round(output_bytes * 8 / 1000 / timeline.duration, 1),
+                "encoder_args": encoder_args(encoder),
+            })
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return results
+
+
+def format_export_benchmark_report(results):
+    """Render benchmark results as a fixed-width text table (smallest file first)."""
+    ok = sorted((r for r in results if "error" not in r), key=lambda r: r["output_bytes"])
+    failed = [r for r in results if "error" in r]
+
+    lines = [
+        f"{'profile':<10} {'fps':>8} {'encode s':>9} {'size MB':>9} {'kbps':>9}",
+        "-" * 49,
+    ]
+    for r in ok:
+        lines.append(
+            f"{r['profile']:<10} {r['encode_fps']:>8.2f} {r['encode_seconds']:>9.3f} "
+            f"{r['output_bytes'] / (1024 * 1024):>9.2f} {r['bitrate_kbps']:>9.1f}"
+        )
+    for r in failed:
+        lines.append(f"{r['profile']:<10} failed: {r['error']}")
+    if ok:
+        fastest = max(ok, key=lambda r: r["encode_fps"] or 0)
+        lines.append(f"Smallest: {ok[0]['profile']}  Fastest: {fastest['profile']}")
+    return "\n".join(lines)
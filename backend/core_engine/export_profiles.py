@@ -0,0 +1,129 @@
+"""
+StoryFlow Export Profiles.
+
+An export profile selects libx264's rate control for the final MP4,
+independently of the render quality preset (which still picks the x264
+speed preset and the CRF used by the ``crf`` profile):
+
+* **crf** — constant quality (``-crf``).  Smallest files for a given
+  visual quality; size depends on the content.
+* **vbr** — constrained variable bitrate: an average ``-b:v`` with a
+  ``-maxrate`` / ``-bufsize`` ceiling, for players or platforms that
+  cap the bitrate.
+* **two_pass** — two-pass encode to a target file size.  The first pass
+  only analyses the frames; the second spends exactly the bitrate that
+  fits ``export_target_mb`` for the video's duration.
+
+Every profile adds ``-tune stillimage`` (the footage is pans and zooms
+over still photographs) and an explicit encoder thread count, so
+parallel piece encoders never oversubscribe the CPU.
+
+The profile is resolved once per render by
+:func:`core_engine.video_renderer.load_render_settings` and turned into
+FFmpeg arguments by :func:`encoder_args`.
+"""
+
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+EXPORT_PROFILE_CRF = "crf"
+EXPORT_PROFILE_VBR = "vbr"
+EXPORT_PROFILE_TWO_PASS = "two_pass"
+
+EXPORT_PROFILES: tuple[str, ...] = (
+    EXPORT_PROFILE_CRF,
+    EXPORT_PROFILE_VBR,
+    EXPORT_PROFILE_TWO_PASS,
+)
+DEFAULT_EXPORT_PROFILE: str = EXPORT_PROFILE_CRF
+
+# Defaults mirrored by GlobalSettings.export_bitrate_kbps / export_target_mb
+DEFAULT_EXPORT_BITRATE_KBPS: int = 4000
+DEFAULT_EXPORT_TARGET_MB: int = 50
+
+# x264 tune for slideshow-style footage
+X264_TUNE: str = "stillimage"
+
+# Constrained VBR ceiling relative to the average bitrate
+VBR_MAXRATE_FACTOR: float = 1.5
+VBR_BUFSIZE_FACTOR: float = 2.0
+
+# Bitrate reserved for the AAC track when sizing a two-pass encode
+AUDIO_BITRATE_KBPS: int = 128
+
+# Floor so a tiny target on a long video still yields a watchable stream
+MIN_VIDEO_BITRATE_KBPS: int = 100
+
+
+def resolve_export_profile(name: Optional[str]) -> str:
+    """Return *name* as a known profile, falling back to the default.
+
+    Unknown names are logged, never raised, so a bad stored value never
+    blocks a render.
+    """
+    key = (name or "").strip().lower()
+    if key not in EXPORT_PROFILES:
+        if key:
+            logger.warning(
+                "Unknown export_profile '%s'. Falling back to '%s'.",
+                name, DEFAULT_EXPORT_PROFILE,
+            )
+        key = DEFAULT_EXPORT_PROFILE
+    return key
+
+
+def encoder_threads(workers: int = 1) -> int:
+    """Encoder threads for each of *workers* concurrent encoders."""
+    return max((os.cpu_count() or 1) // max(int(workers), 1), 1)
+
+
+def two_pass_bitrate_kbps(target_mb: float, duration: float) -> int:
+    """Video bitrate that makes a *duration*-second MP4 about *target_mb*.
+
+    The AAC track's share (:data:`AUDIO_BITRATE_KBPS`) is subtracted
+    from the total budget first.
+    """
+    if duration <= 0:
+        return MIN_VIDEO_BITRATE_KBPS
+    total_kbps = target_mb * 8 * 1024 / duration
+    return max(int(total_kbps - AUDIO_BITRATE_KBPS), MIN_VIDEO_BITRATE_KBPS)
+
+
+def encoder_args(encoder: dict, pass_number: Optional[int] = None,
+                 passlog: Optional[str] = None) -> list[str]:
+    """Return the libx264 output arguments for an encoder dict.
+
+    Args:
+        encoder: ``codec``, ``preset``, ``pixel_format``, ``profile``,
+            ``crf``, ``bitrate_kbps`` and ``threads`` (see
+            :func:`core_engine.parallel_renderer.piece_encoder`).
+        pass_number: ``1`` or ``2`` for a two-pass encode.
+        passlog: Statistics file prefix shared by both passes.
+    """
+    args = [
+        "-c:v", encoder["codec"],
+        "-preset", encoder["preset"],
+        "-tune", encoder.get("tune", X264_TUNE),
+        "-pix_fmt", encoder["pixel_format"],
+    ]
+    profile = encoder.get("profile", EXPORT_PROFILE_CRF)
+    if profile == EXPORT_PROFILE_CRF:
+        args += ["-crf", str(encoder["crf"])]
+    else:
+        kbps = int(encoder["bitrate_kbps"])
+        args += ["-b:v", f"{kbps}k"]
+        if profile == EXPORT_PROFILE_VBR:
+            args += [
+                "-maxrate", f"{int(kbps * VBR_MAXRATE_FACTOR)}k",
+                "-bufsize", f"{int(kbps * VBR_BUFSIZE_FACTOR)}k",
+            ]
+        elif pass_number is not None:
+            args += ["-pass", str(pass_number)]
+            if passlog:
+                args += ["-passlogfile", passlog]
+    if encoder.get("threads"):
+        args += ["-threads", str(encoder["threads"])]
+    return args
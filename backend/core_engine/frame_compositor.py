@@ -0,0 +1,459 @@
+"""
+StoryFlow Single-Pass Frame Compositor.
+
+Produces every output frame in one pass over a reused buffer instead of
+stacking MoviePy ``CompositeVideoClip`` layers (one for the subtitles,
+one for the logo, and a third for the ``method="compose"``
+concatenation):
+
+1. **Crop + resample** — :meth:`KenBurnsFrameEngine.frame_at` copies the
+   frame's window out of the pre-resampled plane straight into the
+   buffer.
+2. **Subtitle** — the sprite active at *t* is alpha-blended over its
+   own rectangle (:class:`core_engine.subtitle_engine.SubtitleOverlay`).
+3. **Logo** — the premultiplied logo is alpha-blended over its
+   rectangle (:class:`LogoOverlay`).
+
+A crossfade is a weighted blend of two such buffers: at overlap
+progress *w* the frame is ``outgoing * (1 - w) + incoming * w`` — the
+same linear ramp the parallel renderer's transition pieces use.
+
+Classes
+-------
+* :class:`LogoOverlay` — premultiplied, positioned logo watermark.
+* :class:`SegmentFrameSource` — Ken Burns engine + subtitles + logo
+  for one segment.
+* :class:`LazySegmentFrameSource` — builds its ``SegmentFrameSource``
+  when the segment's window begins and drops it when the window ends,
+  so long projects hold only one or two Ken Burns planes at a time.
+* :class:`FrameCompositor` — owns the reused frame / blend buffers.
+* :class:`CrossfadeTimeline` — maps timeline time to one segment frame
+  or a crossfade of two, for the single-stream renderer.
+"""
+
+import bisect
+import logging
+import os
+import threading
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from core_engine.image_cache import get_image_cache, image_key
+
+logger = logging.getLogger(__name__)
+
+# Seconds after a segment's window ends before the streaming timeline
+# releases it — must exceed how far concurrent producers run ahead of
+# the oldest frame still being drawn.
+RELEASE_LAG: float = 1.0
+
+
+# ---------------------------------------------------------------------------
+# Logo watermark
+# ---------------------------------------------------------------------------
+
+class LogoOverlay:
+    """A positioned logo watermark, premultiplied for one-pass blending.
+
+    Args:
+        rgb: ``(h, w, 3)`` uint8 logo colours.
+        alpha: ``(h, w)`` float alpha in ``[0, 1]`` (opacity applied).
+        position: Top-left ``(x, y)`` in the frame.
+    """
+
+    def __init__(self, rgb: np.ndarray, alpha: np.ndarray, position: tuple[int, int]):
+        alpha = alpha.astype(np.float32)[:, :, None]
+        self.premultiplied = rgb.astype(np.float32) * alpha
+        self.inverse_alpha = 1.0 - alpha
+        self.position = (int(position[0]), int(position[1]))
+
+    @classmethod
+    def from_settings(cls, logo: dict, resolution: tuple[int, int]) -> "LogoOverlay":
+        """Load and place the logo described by ``load_render_settings()["logo"]``.
+
+        The logo is scaled to ``logo["scale"]`` of the frame width
+        (aspect preserved), anchored to one of the four corners with
+        ``logo["margin"]`` pixels of padding, and its alpha channel is
+        multiplied by ``logo["opacity"]``.
+        """
+        from PIL import Image as PILImage
+
+        res_width, res_height = resolution
+        logo_position_str = logo["position"]
+        logo_margin_px = logo["margin"]
+        logo_opacity = logo["opacity"]
+
+        # Compute logo size based on resolution and scale
+        logo_target_w = int(res_width * logo["scale"])
+
+        def prepare() -> np.ndarray:
+            pil_logo = PILImage.open(logo["path"]).convert("RGBA")
+            logo_aspect = pil_logo.width / pil_logo.height
+            pil_logo = pil_logo.resize(
+                (logo_target_w, int(logo_target_w / logo_aspect)),
+                PILImage.LANCZOS,
+            )
+            return np.array(pil_logo)
+
+        # The resized logo is shared by every render and preview at
+        # this width (see core_engine.image_cache).
+        logo_arr = get_image_cache().get_or_prepare(
+            image_key(logo["path"], "logo", logo_target_w), prepare,
+        )
+        logo_target_h = logo_arr.shape[0]
+
+        # Compute position
+        if logo_position_str == "top-left":
+            logo_pos = (logo_margin_px, logo_margin_px)
+        elif logo_position_str == "top-right":
+            logo_pos = (res_width - logo_target_w - logo_margin_px, logo_margin_px)
+        elif logo_position_str == "bottom-left":
+            logo_pos = (logo_margin_px, res_height - logo_target_h - logo_margin_px)
+        else:  # bottom-right
+            logo_pos = (res_width - logo_target_w - logo_margin_px, res_height - logo_target_h - logo_margin_px)
+
+        logo_alpha = logo_arr[:, :, 3].astype(np.float32) / 255.0
+        if logo_opacity < 1.0:
+            logo_alpha = logo_alpha * logo_opacity
+
+        logger.info(
+            "Logo watermark enabled: %s, size: %dx%d, "
+            "position: %s (%s), opacity: %.2f",
+            os.path.basename(logo["path"]),
+            logo_target_w, logo_target_h,
+            logo_position_str, logo_pos, logo_opacity,
+        )
+        return cls(logo_arr[:, :, :3], logo_alpha, logo_pos)
+
+    def blend_into(self, frame: np.ndarray) -> np.ndarray:
+        """Alpha-blend the logo into *frame* (uint8 RGB) in place."""
+        frame_h, frame_w = frame.shape[:2]
+        logo_h, logo_w = self.premultiplied.shape[:2]
+        x, y = self.position
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + logo_w, frame_w), min(y + logo_h, frame_h)
+        if x0 >= x1 or y0 >= y1:
+            return frame
+
+        lx, ly = x0 - x, y0 - y
+        region = frame[y0:y1, x0:x1]
+        blended = region * self.inverse_alpha[ly:ly + y1 - y0, lx:lx + x1 - x0]
+        blended += self.premultiplied[ly:ly + y1 - y0, lx:lx + x1 - x0]
+        np.copyto(region, blended, casting="unsafe")
+        return frame
+
+
+# ---------------------------------------------------------------------------
+# Per-segment frame source
+# ---------------------------------------------------------------------------
+
+class SegmentFrameSource:
+    """Everything needed to draw one segment's frames in a single pass.
+
+    Args:
+        engine: The segment's :class:`KenBurnsFrameEngine`.
+        duration: On-screen duration in seconds.
+        subtitles: Optional :class:`SubtitleOverlay`.
+        logo: Optional :class:`LogoOverlay`.
+    """
+
+    def __init__(self, engine, duration: float, subtitles=None, logo: Optional[LogoOverlay] = None):
+        self.engine = engine
+        self.duration = duration
+        self.subtitles = subtitles if subtitles is not None and len(subtitles) else None
+        self.logo = logo
+        self.size = (engine.output_width, engine.output_height)
+
+    def render(self, t: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Draw the frame at *t* into *out* (allocated when ``None``)."""
+        frame = self.engine.frame_at(t, out)
+        if self.subtitles is not None:
+            self.subtitles.apply(frame, t)
+        if self.logo is not None:
+            self.logo.blend_into(frame)
+        return frame
+
+
+class LazySegmentFrameSource:
+    """A :class:`SegmentFrameSource` built on first use and releasable.
+
+    The Ken Burns plane (up to ~1.5× the zoomed output resolution) is
+    the bulk of a segment's memory.  This wrapper defers building it to
+    the first :meth:`render` (or a background :meth:`prefetch`) and
+    frees it on :meth:`release`; a released source is rebuilt if it is
+    needed again.  Thread-safe: concurrent producers share one build.
+
+    Args:
+        loader: Zero-argument callable returning ``(source, warnings)``
+            (see :func:`core_engine.video_renderer.build_segment_source`).
+        duration: On-screen duration in seconds.
+        size: Output ``(width, height)``.
+        warnings: List to which the loader's warnings are appended.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], tuple],
+        duration: float,
+        size: tuple[int, int],
+        warnings: Optional[list] = None,
+    ):
+        self._loader = loader
+        self.duration = duration
+        self.size = size
+        self._warnings = warnings
+        self._source: Optional[SegmentFrameSource] = None
+        self._lock = threading.Lock()
+        # Guards _prefetching; separate so prefetch() never waits on a build
+        self._prefetch_lock = threading.Lock()
+        self._prefetching = False
+        # Bumped by release(); a prefetch requested before it is dropped
+        self._generation = 0
+        self.loads = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._source is not None
+
+    def _get(self, generation: Optional[int] = None) -> Optional[SegmentFrameSource]:
+        """Return the source, building it if needed.
+
+        With *generation* (a prefetch), nothing is built if the source
+        was released since — ``None`` is returned instead.
+        """
+        source = self._source
+        if source is not None:
+            return source
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return None
+            if self._source is None:
+                self._source, warnings = self._loader()
+                self.loads += 1
+                # Warnings are reported once, however often the source
+                # is rebuilt.
+                if self._warnings is not None and self.loads == 1:
+                    self._warnings.extend(warnings)
+            return self._source
+
+    def prefetch(self) -> None:
+        """Start building the source on a background thread (idempotent).
+
+        A prefetch still waiting for the build lock when :meth:`release`
+        is called builds nothing.
+        """
+        if self._source is not None:
+            return
+        with self._prefetch_lock:
+            if self._prefetching:
+                return
+            self._prefetching = True
+            generation = self._generation
+
+        def load():
+            try:
+                self._get(generation)
+            except Exception as exc:
+                # The error resurfaces on the first render() call.
+                logger.debug("Prefetch failed: %s", exc)
+            finally:
+                with self._prefetch_lock:
+                    self._prefetching = False
+
+        threading.Thread(target=load, name="segment-prefetch", daemon=True).start()
+
+    def release(self) -> None:
+        """Drop the built source; frames already being drawn keep theirs."""
+        with self._lock:
+            self._generation += 1
+            self._source = None
+
+    def render(self, t: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Draw the frame at *t*, building the source first if needed."""
+        return self._get().render(t, out)
+
+
+# ---------------------------------------------------------------------------
+# Buffer-owning compositor
+# ---------------------------------------------------------------------------
+
+class FrameCompositor:
+    """Renders frames into buffers that are reused for every frame.
+
+    The array returned by :meth:`compose` and :meth:`crossfade` is the
+    same object on every call; consume it (e.g. write it to FFmpeg)
+    before requesting the next frame.  Pass *out* to draw into a
+    caller-owned buffer instead (the blend scratch buffers are still
+    the compositor's, so one compositor serves one thread at a time).
+
+    Args:
+        resolution: Output ``(width, height)``.
+    """
+
+    def __init__(self, resolution: tuple[int, int]):
+        width, height = resolution
+        self.frame = np.empty((height, width, 3), dtype=np.uint8)
+        self._incoming = np.empty_like(self.frame)
+        self._accum = np.empty(self.frame.shape, dtype=np.float32)
+        self._scratch = np.empty(self.frame.shape, dtype=np.float32)
+
+    def compose(
+        self,
+        source: SegmentFrameSource,
+        t: float,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Return the frame of *source* at local time *t*."""
+        return source.render(t, self.frame if out is None else out)
+
+    def crossfade(
+        self,
+        outgoing: SegmentFrameSource,
+        t_out: float,
+        incoming: SegmentFrameSource,
+        t_in: float,
+        weight: float,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Return ``outgoing * (1 - weight) + incoming * weight``.
+
+        Both frames are composed in full (subtitles and logo included)
+        before blending, so the whole picture fades as one unit.
+        """
+        frame = self.frame if out is None else out
+        outgoing.render(t_out, frame)
+        if weight <= 0.0:
+            return frame
+        incoming.render(t_in, self._incoming)
+        if weight >= 1.0:
+            np.copyto(frame, self._incoming)
+            return frame
+
+        np.multiply(frame, 1.0 - weight, out=self._accum)
+        np.multiply(self._incoming, weight, out=self._scratch)
+        self._accum += self._scratch
+        self._accum += 0.5  # round to nearest on the cast below
+        np.copyto(frame, self._accum, casting="unsafe")
+        return frame
+
+
+# ---------------------------------------------------------------------------
+# Single-stream timeline
+# ---------------------------------------------------------------------------
+
+class CrossfadeTimeline:
+    """Frames of consecutive segments overlapped by a crossfade.
+
+    Segment *i* starts at ``sum(d_j - T for j < i)`` and consecutive
+    segments overlap by ``T`` seconds; during an overlap the incoming
+    segment's weight rises linearly from 0 to 1.
+
+    With :class:`LazySegmentFrameSource` segments the timeline streams:
+    entering segment *i* prefetches segment *i + 1*, and segments whose
+    window ended more than :data:`RELEASE_LAG` seconds before the
+    requested time are released.  Seeking back to an earlier segment
+    rebuilds it on demand.  The lag covers concurrent producers
+    drawing slightly out of order (see :mod:`core_engine.frame_pipe`).
+
+    Args:
+        sources: Ordered :class:`SegmentFrameSource` objects.
+        transition_duration: Crossfade length ``T`` in seconds.
+        compositor: Buffer owner; one is created when ``None``.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[SegmentFrameSource],
+        transition_duration: float,
+        compositor: Optional[FrameCompositor] = None,
+    ):
+        if not sources:
+            raise ValueError("CrossfadeTimeline needs at least one segment.")
+        self.sources = list(sources)
+        self.transition = transition_duration if len(self.sources) > 1 else 0.0
+        self.compositor = compositor or FrameCompositor(self.sources[0].size)
+
+        self.starts: list[float] = []
+        cursor = 0.0
+        for source in self.sources:
+            self.starts.append(cursor)
+            cursor += source.duration - self.transition
+        self.duration = self.starts[-1] + self.sources[-1].duration
+        self.ends = [
+            start + source.duration
+            for start, source in zip(self.starts, self.sources)
+        ]
+
+        self._streaming = any(
+            isinstance(source, LazySegmentFrameSource) for source in self.sources
+        )
+        self._release_lock = threading.Lock()
+        self._next_release = 0
+
+    def _stream(self, index: int, t: float) -> None:
+        """Prefetch the next segment and release finished ones."""
+        if index + 1 < len(self.sources):
+            following = self.sources[index + 1]
+            if isinstance(following, LazySegmentFrameSource):
+                following.prefetch()
+
+        # A rewind (the second pass of a two-pass export) starts
+        # releasing again from the requested segment.
+        released = self._next_release
+        if released and t < self.starts[released - 1]:
+            with self._release_lock:
+                self._next_release = min(self._next_release, index)
+
+        cutoff = t - RELEASE_LAG
+        if self._next_release >= len(self.sources) or self.ends[self._next_release] >= cutoff:
+            return
+        with self._release_lock:
+            while (
+                self._next_release < len(self.sources)
+                and self.ends[self._next_release] < cutoff
+            ):
+                source = self.sources[self._next_release]
+                if isinstance(source, LazySegmentFrameSource):
+                    source.release()
+                self._next_release += 1
+
+    def release_all(self) -> None:
+        """Free every lazily built segment (after the export)."""
+        with self._release_lock:
+            self._next_release = 0
+        for source in self.sources:
+            if isinstance(source, LazySegmentFrameSource):
+                source.release()
+
+    def frame_at(
+        self,
+        t: float,
+        out: Optional[np.ndarray] = None,
+        compositor: Optional[FrameCompositor] = None,
+    ) -> np.ndarray:
+        """Return the timeline frame at *t*.
+
+        By default the frame is drawn into the timeline compositor's
+        buffer.  Concurrent producers pass their own *compositor* and a
+        destination *out* buffer (see :mod:`core_engine.frame_pipe`).
+        """
+        compositor = compositor or self.compositor
+        index = max(bisect.bisect_right(self.starts, t) - 1, 0)
+        source = self.sources[index]
+        local = t - self.starts[index]
+        if self._streaming:
+            self._stream(index, t)
+
+        # Inside the previous segment's tail → crossfade from it.
+        if index > 0 and self.transition > 0 and local < self.transition:
+            previous = self.sources[index - 1]
+            return compositor.crossfade(
+                previous,
+                t - self.starts[index - 1],
+                source,
+                local,
+                local / self.transition,
+                out,
+            )
+        return compositor.compose(source, local, out)
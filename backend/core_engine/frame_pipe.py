@@ -0,0 +1,385 @@
+"""
+StoryFlow Raw-Frame FFmpeg Pipe.
+
+Export backend for the single-stream renderer.  Instead of letting
+MoviePy's ``write_videofile`` pull one frame, wait for FFmpeg to accept
+it and only then draw the next, frame production and encoding overlap:
+
+1. **Producers** — a small thread pool draws frames with
+   :meth:`CrossfadeTimeline.frame_at`.  Each thread owns a
+   :class:`FrameCompositor` for its blend scratch buffers; NumPy and
+   Pillow release the GIL for the heavy copies and blends.
+2. **Ring** — frames are drawn straight into a fixed ring of
+   preallocated ``(height, width, 3)`` uint8 buffers.  At most
+   ``ring_size`` frames are in flight, so memory stays bounded no
+   matter how long the video is.
+3. **Consumer** — the calling thread writes the buffers, in frame
+   order, as raw RGB to the stdin of ``ffmpeg -f rawvideo``.  As soon
+   as a buffer is written its slot is handed back to the producers for
+   frame ``i + ring_size``.
+
+The soundtrack is a pre-mixed WAV muxed in by the same FFmpeg process,
+so no second audio pass over the clip tree is needed.
+
+Pass a *stats* dict to :func:`encode_frames` to get the pipe's time
+breakdown (see :mod:`core_engine.render_profiler`): ``draw_seconds``
+(producer time spent drawing, summed over threads), ``wait_seconds``
+(the writer waiting for producers), ``write_seconds`` (the writer
+blocked on FFmpeg's stdin, i.e. x264 is the bottleneck) and
+``flush_seconds`` (FFmpeg finishing after the last frame).
+
+Functions
+---------
+* :func:`count_frames` — number of frames for a duration.
+* :func:`build_rawvideo_command` — FFmpeg argument list.
+* :func:`encode_frames` — run the pipe for any frame drawer (one or
+  two passes, see :mod:`core_engine.export_profiles`).
+* :func:`encode_timeline` — run the pipe for a whole timeline.
+"""
+
+import logging
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import numpy as np
+
+from core_engine.export_profiles import EXPORT_PROFILE_TWO_PASS, encoder_args
+from core_engine.frame_compositor import CrossfadeTimeline, FrameCompositor
+
+logger = logging.getLogger(__name__)
+
+# Number of preallocated frame buffers shared by producers and the
+# FFmpeg writer.  Eight 1080p frames are ~50 MB.
+DEFAULT_RING_SIZE: int = 8
+
+# Upper bound on producer threads — beyond this the consumer (FFmpeg's
+# stdin) is the bottleneck and extra threads only add memory traffic.
+MAX_PRODUCER_THREADS: int = 4
+
+
+# Type alias for the frame progress callback ``(frames_done, total_frames)``
+FrameProgressCallback = Optional[Callable[[int, int], None]]
+
+# Type alias for a frame drawer ``(index, out, compositor) -> frame``
+FrameDrawer = Callable[[int, np.ndarray, FrameCompositor], np.ndarray]
+
+
+def count_frames(duration: float, fps: int) -> int:
+    """Return the number of frames covering *duration* at *fps*.
+
+    Frames are sampled at ``i / fps`` for ``0 <= i < n`` — the same
+    sampling as MoviePy's ``iter_frames`` — so the last frame starts
+    before *duration*.
+    """
+    return max(math.ceil(duration * fps - 1e-6), 1)
+
+
+def producer_thread_count(threads: int) -> int:
+    """Return how many producer threads a *threads* request runs."""
+    return min(max(int(threads), 1), MAX_PRODUCER_THREADS)
+
+
+def build_rawvideo_command(
+    output_path: str,
+    resolution: tuple[int, int],
+    fps: int,
+    audio_path: Optional[str],
+    encoder: dict,
+    pass_number: Optional[int] = None,
+    passlog: Optional[str] = None,
+) -> list[str]:
+    """Return the FFmpeg command that encodes raw RGB frames from stdin.
+
+    Args:
+        output_path: Destination MP4.
+        resolution: Frame ``(width, height)``.
+        fps: Frame rate of the piped frames.
+        audio_path: Pre-mixed WAV to mux in, or ``None`` for video only.
+        encoder: Encoder dict (see
+            :func:`core_engine.parallel_renderer.piece_encoder` and
+            :func:`core_engine.export_profiles.encoder_args`).
+        pass_number: ``1`` or ``2`` for a two-pass encode.  The first
+            pass only writes x264 statistics, so it has no audio and no
+            output file.
+        passlog: Statistics file prefix shared by both passes.
+    """
+    from moviepy.config import FFMPEG_BINARY
+
+    width, height = resolution
+    cmd = [
+        FFMPEG_BINARY, "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-vcodec", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-s", f"{width}x{height}",
+        "-r", str(fps),
+        "-i", "-",
+    ]
+    if pass_number == 1:
+        audio_path = None
+    if audio_path:
+        cmd += ["-i", audio_path, "-map", "0:v", "-map", "1:a"]
+    cmd += encoder_args(encoder, pass_number, passlog)
+    if pass_number == 1:
+        return cmd + ["-an", "-f", "null", os.devnull]
+    if audio_path:
+        cmd += ["-c:a", "aac"]
+    cmd += ["-movflags", "+faststart", output_path]
+    return cmd
+
+
+def encode_timeline(
+    timeline: CrossfadeTimeline,
+    fps: int,
+    output_path: str,
+    encoder: dict,
+    audio_path: Optional[str] = None,
+    threads: int = 2,
+    ring_size: int = DEFAULT_RING_SIZE,
+    on_frame: FrameProgressCallback = None,
+    stats: Optional[dict] = None,
+) -> int:
+    """Encode every frame of *timeline* to *output_path* through a pipe.
+
+    Thin wrapper around :func:`encode_frames`; frame *i* is the
+    timeline at ``i / fps``.
+
+    Returns:
+        Number of frames written.
+    """
+    def draw(index, out, compositor):
+        return timeline.frame_at(index / fps, out=out, compositor=compositor)
+
+    width, height = timeline.compositor.frame.shape[1::-1]
+    return encode_frames(
+        draw,
+        count_frames(timeline.duration, fps),
+        (width, height),
+        fps,
+        output_path,
+        encoder,
+        audio_path=audio_path,
+        threads=threads,
+        ring_size=ring_size,
+        on_frame=on_frame,
+        stats=stats,
+    )
+
+
+def encode_frames(
+    draw: FrameDrawer,
+    total_frames: int,
+    resolution: tuple[int, int],
+    fps: int,
+    output_path: str,
+    encoder: dict,
+    audio_path: Optional[str] = None,
+    threads: int = 2,
+    ring_size: int = DEFAULT_RING_SIZE,
+    on_frame: FrameProgressCallback = None,
+    stats: Optional[dict] = None,
+) -> int:
+    """Encode *total_frames* frames drawn by *draw* through an FFmpeg pipe.
+
+    A ``two_pass`` encoder profile runs the whole pipe twice — the
+    frames are drawn again for the second pass rather than kept — and
+    *on_frame* counts the frames of both passes.
+
+    Args:
+        draw: ``draw(index, out, compositor)`` renders frame *index*
+            into the ring buffer *out* using the calling thread's
+            :class:`FrameCompositor` for scratch space, and returns it.
+        total_frames: Number of frames to encode.
+        resolution: Frame ``(width, height)``.
+        fps: Output frame rate.
+        output_path: Destination MP4.
+        encoder: Encoder parameters (see :func:`build_rawvideo_command`).
+        audio_path: Optional pre-mixed WAV muxed into the output.
+        threads: Producer threads (clamped to
+            ``1 … MAX_PRODUCER_THREADS``).
+        ring_size: Frame buffers in flight (at least ``threads``).
+        on_frame: Optional ``(frames_done, total_frames)`` callback,
+            invoked from the calling thread after each written frame.
+            An exception raised by it (e.g. cooperative cancellation)
+            stops the producers and FFmpeg and is re-raised.
+        stats: Optional dict that receives the pipe's time breakdown
+            (see the module docs); both passes of a two-pass encode
+            are added up.
+
+    Returns:
+        Number of frames written to the output file.
+
+    Raises:
+        RuntimeError: If FFmpeg exits early or with a non-zero status.
+    """
+    threads = producer_thread_count(threads)
+    ring_size = max(int(ring_size), threads)
+
+    if encoder.get("profile") != EXPORT_PROFILE_TWO_PASS:
+        cmd = build_rawvideo_command(
+            output_path, resolution, fps, audio_path, encoder,
+        )
+        written = _run_pipe(
+            cmd, draw, total_frames, resolution, threads, ring_size,
+            on_frame, output_path, stats,
+        )
+    else:
+        passlog_dir = tempfile.mkdtemp(prefix="x264pass_")
+        passlog = os.path.join(passlog_dir, "x264")
+
+        def pass_progress(offset):
+            if on_frame is None:
+                return None
+            return lambda done, _total: on_frame(offset + done, 2 * total_frames)
+
+        try:
+            first = build_rawvideo_command(
+                output_path, resolution, fps, None, encoder, 1, passlog,
+            )
+            _run_pipe(
+                first, draw, total_frames, resolution, threads, ring_size,
+                pass_progress(0), None, stats,
+            )
+            second = build_rawvideo_command(
+                output_path, resolution, fps, audio_path, encoder, 2, passlog,
+            )
+            written = _run_pipe(
+                second, draw, total_frames, resolution, threads, ring_size,
+                pass_progress(total_frames), output_path, stats,
+            )
+        finally:
+            shutil.rmtree(passlog_dir, ignore_errors=True)
+
+    logger.info(
+        "Piped %d frame(s) to FFmpeg (%s, %d producer thread(s), ring of %d).",
+        written, encoder.get("profile", "crf"), threads, ring_size,
+    )
+    return written
+
+
+def _run_pipe(
+    cmd: list[str],
+    draw: FrameDrawer,
+    total_frames: int,
+    resolution: tuple[int, int],
+    threads: int,
+    ring_size: int,
+    on_frame: FrameProgressCallback,
+    output_path: Optional[str],
+    stats: Optional[dict] = None,
+) -> int:
+    """Run one FFmpeg process fed by the producer ring (see module docs)."""
+    width, height = resolution
+    ring = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(ring_size)]
+    local = threading.local()
+    timings = {"draw": 0.0, "wait": 0.0, "write": 0.0, "flush": 0.0}
+    timings_lock = threading.Lock()
+
+    def produce(index: int) -> np.ndarray:
+        compositor = getattr(local, "compositor", None)
+        if compositor is None:
+            compositor = local.compositor = FrameCompositor((width, height))
+        started = time.perf_counter()
+        frame = draw(index, ring[index % ring_size], compositor)
+        elapsed = time.perf_counter() - started
+        with timings_lock:
+            timings["draw"] += elapsed
+        return frame
+
+    logger.debug("FFmpeg pipe: %s", " ".join(cmd))
+
+    # stderr goes to a file: a full pipe would block FFmpeg while we
+    # block writing its stdin.
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+            stderr=stderr_file,
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="frame-producer",
+        )
+        pending = {}
+        written = 0
+        try:
+            for index in range(min(ring_size, total_frames)):
+                pending[index] = executor.submit(produce, index)
+
+            for index in range(total_frames):
+                started = time.perf_counter()
+                frame = pending.pop(index).result()
+                drawn = time.perf_counter()
+                try:
+                    proc.stdin.write(frame.data)
+                except (BrokenPipeError, OSError) as pipe_err:
+                    raise RuntimeError(
+                        "FFmpeg stopped accepting frames: "
+                        + _read_stderr(stderr_file, proc)
+                    ) from pipe_err
+                timings["wait"] += drawn - started
+                timings["write"] += time.perf_counter() - drawn
+                written += 1
+
+                # The slot has been written — reuse it further ahead.
+                following = index + ring_size
+                if following < total_frames:
+                    pending[following] = executor.submit(produce, following)
+
+                if on_frame is not None:
+                    on_frame(written, total_frames)
+
+            started = time.perf_counter()
+            proc.stdin.close()
+            returncode = proc.wait()
+            timings["flush"] += time.perf_counter() - started
+            if returncode != 0:
+                raise RuntimeError(
+                    f"FFmpeg exited with status {returncode}: "
+                    + _read_stderr(stderr_file, proc)
+                )
+        except BaseException:
+            for future in pending.values():
+                future.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            if output_path:
+                _remove_partial(output_path)
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if proc.stdin and not proc.stdin.closed:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+    if stats is not None:
+        for key, seconds in timings.items():
+            stats[f"{key}_seconds"] = stats.get(f"{key}_seconds", 0.0) + seconds
+    return written
+
+
+def _read_stderr(stderr_file, proc: subprocess.Popen) -> str:
+    """Return the tail of FFmpeg's stderr once the process has exited."""
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    stderr_file.seek(0)
+    message = stderr_file.read().decode("utf-8", errors="replace").strip()
+    return message[-500:] or "(no error output)"
+
+
+def _remove_partial(output_path: str) -> None:
+    try:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+    except OSError:
+        pass
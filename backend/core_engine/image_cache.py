@@ -0,0 +1,340 @@
+"""
+StoryFlow Prepared-Image Cache.
+
+Process-wide cache of decoded and resized images.  Preparing a cover
+image (open, decode, convert to RGB, LANCZOS-upscale for zoom headroom,
+cover-crop) costs far more than anything done with the result, yet the
+same image is prepared again by every render, every segment preview and
+every parallel piece that shows it.  The cache keeps the prepared
+arrays keyed on:
+
+* the source file's resolved path, modification time (ns) and size — an
+  edited or replaced image never hits a stale entry,
+* what was done to it (``"ken_burns"``, ``"cover"``, ``"logo"``) and the
+  parameters (resolution, zoom intensity, logo width, …).
+
+Two tiers:
+
+* **Memory** — a least-recently-used map bounded by the total bytes of
+  the arrays it holds.  Entries are read-only NumPy arrays shared by
+  every caller in the process.
+* **Disk** (optional) — ``<key>.npy`` files under
+  ``MEDIA_ROOT/image_cache/``, written when an image is first prepared
+  and opened as read-only memory maps on a miss in memory.  Parallel
+  render workers are separate processes, so this tier is what lets them
+  share one preparation.  It is bounded by total size; the least
+  recently used files (by modification time, refreshed on every hit) are
+  evicted first.
+
+Budgets come from ``GlobalSettings.image_cache_mb`` and
+``image_spill_mb`` via :func:`core_engine.video_renderer.load_render_settings`
+(see :func:`configure_from_settings`); until configured, the shared
+cache uses :data:`DEFAULT_IMAGE_CACHE_MB` in memory and no disk tier.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every spilled entry after a change to how images
+# are prepared.
+IMAGE_CACHE_VERSION: int = 1
+
+# Memory budget of the shared cache before it is configured
+DEFAULT_IMAGE_CACHE_MB: int = 256
+
+_MB = 1024 * 1024
+
+
+def get_image_cache_dir() -> str:
+    """Return (and create) ``<MEDIA_ROOT>/image_cache/``.
+
+    Raises:
+        ValueError: If ``MEDIA_ROOT`` is not configured.
+    """
+    from django.conf import settings  # noqa: E402 — deferred import
+
+    media_root = getattr(settings, "MEDIA_ROOT", None)
+    if not media_root:
+        raise ValueError(
+            "MEDIA_ROOT is not configured in Django settings. "
+            "This setting is required for the image cache spill store."
+        )
+    path = Path(media_root) / "image_cache"
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
+def image_key(path: str, kind: str, *params) -> Optional[tuple]:
+    """Return the cache key for preparing *path* as *kind* with *params*.
+
+    Returns:
+        A hashable tuple, or ``None`` if the file cannot be stat'ed (the
+        caller then prepares the image uncached and reports the error).
+    """
+    try:
+        real = os.path.realpath(path)
+        stat = os.stat(real)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (real, stat.st_mtime_ns, stat.st_size, kind) + tuple(params)
+
+
+class PreparedImageCache:
+    """Byte-bounded LRU cache of prepared images with an optional disk tier.
+
+    All methods are thread-safe.  Preparation itself runs outside the
+    lock, so two threads missing on the same key at once may both
+    prepare it; the second result simply replaces the first.
+
+    Args:
+        max_bytes: Memory budget.  ``0`` disables the memory tier.
+        spill_dir: Directory of the ``.npy`` tier (``None`` = no disk
+            tier).
+        spill_max_bytes: Disk budget.  ``0`` disables the disk tier.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_IMAGE_CACHE_MB * _MB,
+        spill_dir: Optional[str] = None,
+        spill_max_bytes: int = 0,
+    ):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self.bytes = 0
+        self.max_bytes = 0
+        self.spill_dir: Optional[str] = None
+        self.spill_max_bytes = 0
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.configure(max_bytes, spill_dir, spill_max_bytes)
+
+    def configure(
+        self,
+        max_bytes: int,
+        spill_dir: Optional[str] = None,
+        spill_max_bytes: int = 0,
+    ) -> "PreparedImageCache":
+        """Change the budgets (evicting down to the new memory bound)."""
+        with self._lock:
+            self.max_bytes = max(int(max_bytes), 0)
+            self.spill_max_bytes = max(int(spill_max_bytes), 0)
+            self.spill_dir = spill_dir if spill_dir and self.spill_max_bytes else None
+            self._shrink()
+        return self
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 or self.spill_dir is not None
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get_or_prepare(
+        self, key: Optional[tuple], prepare: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """Return the cached array for *key*, preparing it on a miss.
+
+        Args:
+            key: From :func:`image_key`; ``None`` bypasses the cache.
+            prepare: Builds the array; exceptions propagate and nothing
+                is cached.
+
+        Returns:
+            A read-only array (shared with other callers when cached).
+        """
+        if key is None or not self.enabled:
+            return prepare()
+
+        with self._lock:
+            array = self._entries.get(key)
+            if array is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return array
+
+        array = self._load_spilled(key)
+        if array is not None:
+            with self._lock:
+                self.spill_hits += 1
+        else:
+            with self._lock:
+                self.misses += 1
+            array = np.ascontiguousarray(prepare())
+            array.setflags(write=False)
+            self._spill(key, array)
+
+        self._remember(key, array)
+        return array
+
+    def _remember(self, key: tuple, array: np.ndarray) -> None:
+        if array.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous.nbytes
+            self._entries[key] = array
+            self.bytes += array.nbytes
+            self._shrink()
+
+    def _shrink(self) -> None:
+        """Evict least recently used entries (caller holds the lock)."""
+        while self._entries and self.bytes > self.max_bytes:
+            _key, array = self._entries.popitem(last=False)
+            self.bytes -= array.nbytes
+            self.evicted += 1
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _spill_path(self, key: tuple) -> Optional[str]:
+        spill_dir = self.spill_dir
+        if spill_dir is None:
+            return None
+        blob = json.dumps([IMAGE_CACHE_VERSION, list(key)], default=str)
+        name = hashlib.sha256(blob.encode("utf-8")).hexdigest()
+        return os.path.join(spill_dir, f"{name}.npy")
+
+    def _load_spilled(self, key: tuple) -> Optional[np.ndarray]:
+        path = self._spill_path(key)
+        if path is None or not os.path.isfile(path):
+            return None
+        try:
+            array = np.load(path, mmap_mode="r")
+            os.utime(path, None)
+        except (OSError, ValueError) as exc:
+            logger.warning("Image cache entry %s unusable: %s", path, exc)
+            return None
+        return array
+
+    def _spill(self, key: tuple, array: np.ndarray) -> None:
+        path = self._spill_path(key)
+        if path is None or array.nbytes > self.spill_max_bytes:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                suffix=".tmp", dir=os.path.dirname(path),
+            )
+            with os.fdopen(fd, "wb") as fh:
+                np.save(fh, array, allow_pickle=False)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not spill image to %s: %s", path, exc)
+            # evict_spilled() only sees .npy files, so nothing else
+            # would ever remove a partial write (e.g. on ENOSPC)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            return
+        self.evict_spilled(keep={path})
+
+    def evict_spilled(self, keep: Optional[set[str]] = None) -> int:
+        """Delete least recently used ``.npy`` files until under budget.
+
+        Returns:
+            Number of files removed.
+        """
+        spill_dir = self.spill_dir
+        if spill_dir is None or not os.path.isdir(spill_dir):
+            return 0
+
+        keep = keep or set()
+        entries = []
+        total = 0
+        for name in os.listdir(spill_dir):
+            if not name.endswith(".npy"):
+                continue
+            path = os.path.join(spill_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total += stat.st_size
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        removed = 0
+        for _mtime, size, path in sorted(entries):
+            if total <= self.spill_max_bytes:
+                break
+            if path in keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError as exc:
+                logger.warning("Could not evict image cache file %s: %s", path, exc)
+
+        if removed:
+            logger.info(
+                "Image cache: evicted %d spilled file(s), %.1f MB kept.",
+                removed, total / _MB,
+            )
+        return removed
+
+    def report(self) -> dict:
+        """Summarise cache activity for logs and render results."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "memory_mb": round(self.bytes / _MB, 1),
+                "hits": self.hits,
+                "spill_hits": self.spill_hits,
+                "misses": self.misses,
+                "evicted": self.evicted,
+                "spill": self.spill_dir is not None,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Shared instance
+# ---------------------------------------------------------------------------
+
+_shared_cache = PreparedImageCache()
+
+
+def get_image_cache() -> PreparedImageCache:
+    """Return the process-wide cache used by every image loader."""
+    return _shared_cache
+
+
+def configure_from_settings(render_settings: dict) -> PreparedImageCache:
+    """Size the shared cache from ``render_settings["image_cache"]``.
+
+    The entry (built by ``load_render_settings``) holds plain values —
+    ``max_mb``, ``spill_mb`` and ``spill_dir`` — so worker processes
+    can apply it without Django.
+    """
+    config = render_settings.get("image_cache") or {}
+    return _shared_cache.configure(
+        int(config.get("max_mb", DEFAULT_IMAGE_CACHE_MB)) * _MB,
+        config.get("spill_dir"),
+        int(config.get("spill_mb", 0)) * _MB,
+    )
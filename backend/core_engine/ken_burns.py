@@ -3,8 +3,10 @@ StoryFlow Ken Burns Effect Module.
 
 Provides zoom-and-pan animation for still images used in narrative video
 segments.  The module converts static cover images into MoviePy VideoClip
-objects with per-frame camera motion computed through linear interpolation
-of crop-box positions.
+objects with per-frame camera motion.  Crop-box positions follow an
+easing curve (see :data:`KEN_BURNS_EASINGS`) and are precomputed once per
+clip as a trajectory table, so producing a frame is an array lookup plus
+a slice of a pre-resampled source plane.
 
 The primary public interface is :func:`apply_ken_burns`, which the video
 renderer calls once per segment.  All other functions in this module are
@@ -22,12 +24,16 @@ Design principles
   support both MoviePy 1.x (``moviepy.editor``) and 2.x (``moviepy``).
 """
 
+import functools
 import logging
-from typing import Tuple
+import threading
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 from PIL import Image
 
+from core_engine.image_cache import get_image_cache, image_key
+
 # ---------------------------------------------------------------------------
 # MoviePy version-safe imports
 # ---------------------------------------------------------------------------
@@ -64,6 +70,58 @@ DIRECTIONS: Tuple[
     ("center", "bottom_right"),        # drift downward-right
 )
 
+# ---------------------------------------------------------------------------
+# Easing curves
+# ---------------------------------------------------------------------------
+# Map linear progress in [0, 1] to eased progress in [0, 1] (vectorised
+# over NumPy arrays).  Every curve starts at 0 and ends at 1, so the
+# camera still travels exactly from the start to the end position.
+EASING_LINEAR = "linear"
+EASING_EASE_IN = "ease_in"
+EASING_EASE_OUT = "ease_out"
+EASING_EASE_IN_OUT = "ease_in_out"
+EASING_EASE_IN_OUT_SINE = "ease_in_out_sine"
+
+DEFAULT_EASING: str = EASING_LINEAR
+
+
+def _ease_linear(p: np.ndarray) -> np.ndarray:
+    return p
+
+
+def _ease_in(p: np.ndarray) -> np.ndarray:
+    return p * p
+
+
+def _ease_out(p: np.ndarray) -> np.ndarray:
+    return 1.0 - (1.0 - p) ** 2
+
+
+def _ease_in_out(p: np.ndarray) -> np.ndarray:
+    # Smoothstep: zero velocity at both ends
+    return p * p * (3.0 - 2.0 * p)
+
+
+def _ease_in_out_sine(p: np.ndarray) -> np.ndarray:
+    return (1.0 - np.cos(np.pi * p)) / 2.0
+
+
+KEN_BURNS_EASINGS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    EASING_LINEAR: _ease_linear,
+    EASING_EASE_IN: _ease_in,
+    EASING_EASE_OUT: _ease_out,
+    EASING_EASE_IN_OUT: _ease_in_out,
+    EASING_EASE_IN_OUT_SINE: _ease_in_out_sine,
+}
+
+# Sub-pixel precision of the frame engine: offsets are quantised to
+# 1 / SUBPIXEL_STEPS of an output pixel and blended bilinearly.
+SUBPIXEL_BITS: int = 4
+SUBPIXEL_STEPS: int = 1 << SUBPIXEL_BITS
+
+# Trajectory table rate used when the caller does not pass the clip's fps
+DEFAULT_TRAJECTORY_FPS: int = 30
+
 
 # ===================================================================
 # Helper function stubs (Tasks 04.02.02 — 04.02.07)
@@ -75,6 +133,7 @@ def load_and_prepare_image(
     image_path: str,
     resolution: Tuple[int, int],
     zoom_intensity: float,
+    use_cache: bool = True,
 ) -> np.ndarray:
     """Load a source image and prepare it for Ken Burns animation.
 
@@ -88,18 +147,35 @@ def load_and_prepare_image(
     than the minimum (> 1.5× in both dimensions), it is center-cropped
     to limit memory usage during frame generation.
 
+    The result is kept in the process-wide prepared-image cache
+    (:mod:`core_engine.image_cache`), keyed on the file's path, mtime
+    and size plus *resolution* and *zoom_intensity*, so later renders
+    and previews of the same image skip all of the above.
+
     Args:
         image_path: Absolute path to the source cover image.
         resolution: Target output ``(width, height)``.
         zoom_intensity: Zoom factor (≥ 1.0).
+        use_cache: Look up / store the result in the shared cache.
 
     Returns:
-        NumPy array of shape ``(H, W, 3)`` with dtype ``uint8``
-        representing the prepared RGB image.
+        Read-only NumPy array of shape ``(H, W, 3)`` with dtype
+        ``uint8`` representing the prepared RGB image.
 
     Raises:
         ValueError: If the image file cannot be opened or is corrupted.
     """
+    if use_cache:
+        return get_image_cache().get_or_prepare(
+            image_key(
+                image_path, "ken_burns",
+                tuple(int(v) for v in resolution), float(zoom_intensity),
+            ),
+            lambda: load_and_prepare_image(
+                image_path, resolution, zoom_intensity, use_cache=False,
+            ),
+        )
+
     output_width, output_height = resolution
 
     # ------------------------------------------------------------------
@@ -478,73 +554,365 @@ def interpolate_position(
     return (x, y)
 
 
+# ===================================================================
+# Trajectory table
+# ===================================================================
+
+def resolve_easing(name: Optional[str]) -> str:
+    """Return the easing called *name*, or :data:`DEFAULT_EASING`.
+
+    Unknown names fall back with a warning, so a bad stored value never
+    blocks a render.
+    """
+    key = (name or "").strip().lower()
+    if key not in KEN_BURNS_EASINGS:
+        if key:
+            logger.warning(
+                "Unknown Ken Burns easing '%s'. Falling back to '%s'.",
+                name, DEFAULT_EASING,
+            )
+        key = DEFAULT_EASING
+    return key
+
+
+@functools.lru_cache(maxsize=64)
+def trajectory_progress(duration: float, fps: float, easing: str) -> np.ndarray:
+    """Eased progress at every frame time ``i / fps`` of a clip.
+
+    The table depends only on the clip's timing and easing — not on the
+    image, resolution or direction — so it is computed once and shared
+    by every engine with the same timing (preview and final renders of
+    a segment, the pieces of a parallel render, re-renders).
+
+    Returns:
+        Read-only float64 array of ``count_frames + 1`` entries; the
+        last entry lies at or beyond *duration* and is always ``1.0``.
+    """
+    easing = resolve_easing(easing)
+    if duration <= 0 or fps <= 0:
+        progress = np.zeros(2)
+    else:
+        frames = max(int(np.ceil(duration * fps - 1e-9)), 1)
+        times = np.arange(frames + 1, dtype=np.float64) / fps
+        progress = KEN_BURNS_EASINGS[easing](np.clip(times / duration, 0.0, 1.0))
+    progress.setflags(write=False)
+    return progress
+
+
+class KenBurnsTrajectory:
+    """Crop-box positions for every frame of a clip, computed up front.
+
+    Positions are kept as floats in the caller's pixel space (the frame
+    engine passes its resampled plane coordinates), so no precision is
+    lost to rounding before the frame is drawn.
+
+    Args:
+        start: Position at ``t = 0``.
+        end: Position at ``t = duration``.
+        duration: Clip duration in seconds.
+        fps: Table rate; times between two entries are interpolated.
+        scale: ``(x, y)`` factor applied to *start* / *end*.
+        limits: Optional ``(max_x, max_y)`` the positions are clamped to.
+        easing: Name from :data:`KEN_BURNS_EASINGS`.
+    """
+
+    def __init__(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        duration: float,
+        fps: float = DEFAULT_TRAJECTORY_FPS,
+        scale: Tuple[float, float] = (1.0, 1.0),
+        limits: Optional[Tuple[float, float]] = None,
+        easing: str = DEFAULT_EASING,
+    ):
+        self.fps = float(fps) if fps and fps > 0 else float(DEFAULT_TRAJECTORY_FPS)
+        self.easing = resolve_easing(easing)
+        self.static = tuple(start) == tuple(end)
+        progress = trajectory_progress(float(duration), self.fps, self.easing)
+
+        positions = np.empty((len(progress), 2), dtype=np.float64)
+        for axis in (0, 1):
+            positions[:, axis] = (
+                start[axis] + (end[axis] - start[axis]) * progress
+            ) * scale[axis]
+            if limits is not None:
+                np.clip(positions[:, axis], 0.0, limits[axis], out=positions[:, axis])
+        positions.setflags(write=False)
+        self.positions = positions
+
+    def __len__(self) -> int:
+        """Number of frames covered (the table has one extra end entry)."""
+        return len(self.positions) - 1
+
+    def position_at(self, t: float) -> Tuple[float, float]:
+        """Return the ``(x, y)`` position at time *t* (clamped to the clip)."""
+        index = t * self.fps
+        last = len(self.positions) - 1
+        if index <= 0:
+            x, y = self.positions[0]
+        elif index >= last:
+            x, y = self.positions[last]
+        else:
+            i = int(index)
+            frac = index - i
+            x, y = self.positions[i]
+            if frac:
+                nx, ny = self.positions[i + 1]
+                x += (nx - x) * frac
+                y += (ny - y) * frac
+        return (float(x), float(y))
+
+
+# ===================================================================
+# Frame engine
+# ===================================================================
+
+class KenBurnsFrameEngine:
+    """Generates Ken Burns frames by slicing a pre-resampled source plane.
+
+    The crop box has a fixed size for the whole clip, so the scale from
+    crop pixels to output pixels never changes.  Instead of resampling a
+    fresh crop on every frame, the engine resamples the **entire**
+    prepared source image once, by exactly that scale
+    (``output / crop`` on each axis).  The crop trajectory is likewise
+    computed once, as a :class:`KenBurnsTrajectory` table with one entry
+    per frame, so drawing a frame is a table lookup plus a NumPy slice
+    of that plane — no Pillow round-trip and no per-frame allocation
+    when an ``out`` buffer is supplied.
+
+    Offsets are tracked in *output* pixels.  With *subpixel* enabled the
+    fractional part (quantised to ``1 / SUBPIXEL_STEPS``) is folded into
+    a fixed-point bilinear blend of the neighbouring pixels, so slow pans
+    glide instead of stepping one whole pixel at a time; without it the
+    offset is rounded and each frame is a plain slice copy.  Frames match
+    the crop-then-resize output within a small tolerance (differences
+    are confined to resampling at crop edges and the finer offsets).
+
+    Args:
+        source_image: Prepared ``(H, W, 3)`` uint8 image from
+            :func:`load_and_prepare_image`.
+        resolution: Output ``(width, height)``.
+        crop_size: Crop-box ``(width, height)`` in source pixels.
+        start: Crop-box top-left at ``t = 0`` (source pixels).
+        end: Crop-box top-left at ``t = duration`` (source pixels).
+        duration: Clip duration in seconds.
+        resample: Pillow resampling filter used for the one-off plane
+            resize.  Defaults to LANCZOS.
+        fps: Frame rate of the trajectory table (the clip's fps).
+        easing: Name from :data:`KEN_BURNS_EASINGS`.
+        subpixel: Blend fractional offsets instead of rounding them.
+    """
+
+    def __init__(
+        self,
+        source_image: np.ndarray,
+        resolution: Tuple[int, int],
+        crop_size: Tuple[int, int],
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        duration: float,
+        resample: int = Image.Resampling.LANCZOS,
+        fps: float = DEFAULT_TRAJECTORY_FPS,
+        easing: str = DEFAULT_EASING,
+        subpixel: bool = True,
+    ):
+        self.output_width, self.output_height = resolution
+        crop_width, crop_height = crop_size
+        source_height, source_width = source_image.shape[:2]
+
+        self.start = start
+        self.end = end
+        self.duration = duration
+
+        # Exact crop → output scale on each axis.
+        self.scale_x = self.output_width / crop_width
+        self.scale_y = self.output_height / crop_height
+
+        # Resample the whole source by that scale.  The box argument
+        # pins the scale exactly even though the plane size is rounded
+        # to whole pixels; the plane is never smaller than one frame.
+        plane_width = max(int(source_width * self.scale_x), self.output_width)
+        plane_height = max(int(source_height * self.scale_y), self.output_height)
+        plane = Image.fromarray(source_image).resize(
+            (plane_width, plane_height),
+            resample,
+            box=(
+                0.0,
+                0.0,
+                min(plane_width / self.scale_x, float(source_width)),
+                min(plane_height / self.scale_y, float(source_height)),
+            ),
+        )
+        self.plane = np.asarray(plane)
+        self.max_x = plane_width - self.output_width
+        self.max_y = plane_height - self.output_height
+
+        # Crop trajectory in plane pixels, one entry per frame.
+        self.trajectory = KenBurnsTrajectory(
+            start, end, duration, fps,
+            scale=(self.scale_x, self.scale_y),
+            limits=(self.max_x, self.max_y),
+            easing=easing,
+        )
+        # A zoom-only clip never moves, so there is nothing to glide.
+        self.subpixel = bool(subpixel) and not self.trajectory.static
+        self._scratch = threading.local()
+
+        logger.debug(
+            "KenBurnsFrameEngine: source %dx%d → plane %dx%d "
+            "(scale %.4f × %.4f), pan range %dx%d, %d-frame %s trajectory%s",
+            source_width, source_height, plane_width, plane_height,
+            self.scale_x, self.scale_y, self.max_x, self.max_y,
+            len(self.trajectory), self.trajectory.easing,
+            ", sub-pixel" if self.subpixel else "",
+        )
+
+    def _split(self, value: float, limit: int) -> Tuple[int, int]:
+        """Split a plane offset into whole pixels and a sub-pixel step."""
+        if not self.subpixel:
+            return max(0, min(int(round(value)), limit)), 0
+        whole, frac = divmod(int(round(value * SUBPIXEL_STEPS)), SUBPIXEL_STEPS)
+        if whole >= limit:
+            return max(limit, 0), 0
+        return max(whole, 0), frac
+
+    def offset_at(self, t: float) -> Tuple[int, int]:
+        """Return the frame's top-left offset in the resampled plane."""
+        x, y = self.trajectory.position_at(t)
+        return (
+            max(0, min(int(round(x)), self.max_x)),
+            max(0, min(int(round(y)), self.max_y)),
+        )
+
+    def _buffers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-thread uint16 scratch planes for the sub-pixel blend."""
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            shape = (self.output_height + 1, self.output_width, 3)
+            buffers = (np.empty(shape, np.uint16), np.empty(shape, np.uint16))
+            self._scratch.buffers = buffers
+        return buffers
+
+    def _blend(self, x: int, y: int, fx: int, fy: int, out: np.ndarray) -> None:
+        """Write the window at ``(x + fx/S, y + fy/S)`` into *out*.
+
+        Fixed-point bilinear interpolation: each axis weighs two
+        neighbouring pixels by ``S - f`` and ``f`` (``S`` =
+        :data:`SUBPIXEL_STEPS`), which stays within uint16 for both
+        passes, and the result is rounded back to uint8.
+        """
+        height, width = self.output_height, self.output_width
+        rows = height + 1 if fy else height
+        acc, tmp = self._buffers()
+        acc, tmp = acc[:rows], tmp[:rows]
+        shift = 0
+
+        if fx:
+            np.multiply(self.plane[y : y + rows, x : x + width],
+                        np.uint16(SUBPIXEL_STEPS - fx), out=acc)
+            np.multiply(self.plane[y : y + rows, x + 1 : x + width + 1],
+                        np.uint16(fx), out=tmp)
+            acc += tmp
+            shift += SUBPIXEL_BITS
+        else:
+            np.copyto(acc, self.plane[y : y + rows, x : x + width])
+
+        if fy:
+            result = tmp[:height]
+            np.multiply(acc[:height], np.uint16(SUBPIXEL_STEPS - fy), out=result)
+            below = acc[1:]
+            below *= np.uint16(fy)
+            result += below
+            shift += SUBPIXEL_BITS
+        else:
+            result = acc
+
+        result += np.uint16(1 << (shift - 1))
+        result >>= shift
+        np.copyto(out, result, casting="unsafe")
+
+    def frame_at(self, t: float, out: np.ndarray = None) -> np.ndarray:
+        """Return the frame at time *t*.
+
+        Args:
+            t: Time in seconds within the clip.
+            out: Optional preallocated ``(height, width, 3)`` uint8
+                buffer.  When given, the frame is written into it and
+                *out* is returned — no allocation takes place.
+
+        Returns:
+            Contiguous ``(height, width, 3)`` uint8 array.
+        """
+        pos_x, pos_y = self.trajectory.position_at(t)
+        x, fx = self._split(pos_x, self.max_x)
+        y, fy = self._split(pos_y, self.max_y)
+        if out is None:
+            out = np.empty((self.output_height, self.output_width, 3), np.uint8)
+        if fx or fy:
+            self._blend(x, y, fx, fy, out)
+        else:
+            np.copyto(out, self.plane[
+                y : y + self.output_height, x : x + self.output_width
+            ])
+        return out
+
+
 # ===================================================================
 # Main public interface
 # ===================================================================
 
-def apply_ken_burns(
+def build_ken_burns_engine(
     image_path: str,
     duration: float,
     resolution: Tuple[int, int],
     zoom_intensity: float = 1.3,
-    fps: int = 30,
     segment_index: int = 0,
-) -> VideoClip:
-    """Apply the Ken Burns (zoom-and-pan) effect to a still image.
-
-    Converts a static cover image into a MoviePy :class:`VideoClip` with
-    animated camera motion.  The camera position is linearly interpolated
-    between a start and end point, and a crop box of the appropriate size
-    is extracted from the source image on every frame.
-
-    Algorithm overview
-    ------------------
-    1. Load and prepare the source image (upscale for zoom headroom).
-    2. Calculate crop-box dimensions from output resolution and zoom.
-    3. Select a deterministic pan direction based on ``segment_index``.
-    4. Map direction names to start/end pixel coordinates.
-    5. Build a ``make_frame(t)`` closure that interpolates the crop
-       position and extracts the region for each time instant.
-    6. Construct and return a :class:`VideoClip`.
+    resample: int = Image.Resampling.LANCZOS,
+    profiler=None,
+    profile_segment: Optional[int] = None,
+    fps: float = DEFAULT_TRAJECTORY_FPS,
+    easing: str = DEFAULT_EASING,
+    subpixel: bool = True,
+) -> KenBurnsFrameEngine:
+    """Prepare the :class:`KenBurnsFrameEngine` for one segment image.
+
+    Performs steps 1–5 of :func:`apply_ken_burns` (load, crop size,
+    direction, start/end coordinates, one-off plane resample and
+    trajectory table) without
+    wrapping the result in a MoviePy clip.  Used directly by the
+    single-pass frame compositor, which renders into its own buffers.
 
     Args:
-        image_path: Absolute file-system path to the source cover image.
-        duration: Length in seconds the clip should play (matches audio).
-        resolution: Output video dimensions as ``(width, height)``,
-            e.g. ``(1920, 1080)``.
-        zoom_intensity: Zoom factor read from GlobalSettings.  ``1.0``
-            means no zoom; values > 1.0 create a zoom-in effect.
-            Defaults to ``1.3``.
-        fps: Frames per second for the output VideoClip.  Should match
-            the project framerate setting.  Defaults to ``30``.
-        segment_index: Zero-based index of this segment within the
-            project, used to deterministically select the pan direction.
-            Defaults to ``0``.
+        image_path: Absolute path to the source cover image.
+        duration: Clip duration in seconds.
+        resolution: Output ``(width, height)``.
+        zoom_intensity: Zoom factor (``1.0`` = no zoom).
+        segment_index: Selects the pan direction (``% 7``).
+        resample: Pillow filter for the plane resize.
+        profiler: Optional :class:`~core_engine.render_profiler.RenderProfiler`
+            timing the image load and the plane resample separately.
+        profile_segment: Segment key under which *profiler* records.
+        fps: Frame rate of the precomputed trajectory table.
+        easing: Camera easing curve (see :data:`KEN_BURNS_EASINGS`).
+        subpixel: Blend fractional offsets instead of rounding them.
 
     Returns:
-        A MoviePy :class:`VideoClip` with the specified duration and FPS,
-        whose ``make_frame`` callback generates each frame by
-        interpolating the camera position and extracting the appropriate
-        crop from the source image.
+        A ready :class:`KenBurnsFrameEngine`.
     """
-    output_width, output_height = resolution
-
-    logger.info(
-        "apply_ken_burns called: image=%s, duration=%.2fs, "
-        "resolution=%dx%d, zoom=%.2f, fps=%d, segment_index=%d",
-        image_path,
-        duration,
-        output_width,
-        output_height,
-        zoom_intensity,
-        fps,
-        segment_index,
+    from core_engine.render_profiler import (
+        PHASE_IMAGE_LOAD,
+        PHASE_KEN_BURNS,
+        profile_phase,
     )
 
+    output_width, output_height = resolution
+
     # ------------------------------------------------------------------
     # 1. Load and prepare the source image
     # ------------------------------------------------------------------
-    source_image = load_and_prepare_image(image_path, resolution, zoom_intensity)
+    with profile_phase(profiler, PHASE_IMAGE_LOAD, profile_segment):
+        source_image = load_and_prepare_image(image_path, resolution, zoom_intensity)
     source_height, source_width = source_image.shape[:2]
     logger.debug(
         "  Source image prepared: %dx%d", source_width, source_height
@@ -585,57 +953,126 @@ def apply_ken_burns(
     )
 
     # ------------------------------------------------------------------
-    # 5. Define the make_frame closure (Task 04.02.06)
+    # 5. Build the frame engine
     # ------------------------------------------------------------------
-    # Capture coordinates as tuples for interpolate_position
-    start_coords = (start_x, start_y)
-    end_coords = (end_x, end_y)
+    # All resampling and trajectory maths happen once here; each frame
+    # is a table lookup and a slice copy (or blend).
+    with profile_phase(profiler, PHASE_KEN_BURNS, profile_segment):
+        return KenBurnsFrameEngine(
+            source_image,
+            (output_width, output_height),
+            (crop_width, crop_height),
+            (start_x, start_y),
+            (end_x, end_y),
+            duration,
+            resample=resample,
+            fps=fps,
+            easing=easing,
+            subpixel=subpixel,
+        )
+
+
+def apply_ken_burns(
+    image_path: str,
+    duration: float,
+    resolution: Tuple[int, int],
+    zoom_intensity: float = 1.3,
+    fps: int = 30,
+    segment_index: int = 0,
+    resample: int = Image.Resampling.LANCZOS,
+    easing: str = DEFAULT_EASING,
+    subpixel: bool = True,
+) -> VideoClip:
+    """Apply the Ken Burns (zoom-and-pan) effect to a still image.
+
+    Converts a static cover image into a MoviePy :class:`VideoClip` with
+    animated camera motion.  The camera moves from a start to an end
+    point along an easing curve, and a crop box of the appropriate size
+    is extracted from the source image on every frame.
+
+    Algorithm overview
+    ------------------
+    1. Load and prepare the source image (upscale for zoom headroom).
+    2. Calculate crop-box dimensions from output resolution and zoom.
+    3. Select a deterministic pan direction based on ``segment_index``.
+    4. Map direction names to start/end pixel coordinates.
+    5. Build a :class:`KenBurnsFrameEngine` (one resample of the whole
+       source plus the trajectory table for all ``duration × fps``
+       frames) and a ``make_frame(t)`` closure that slices each frame
+       out of it.
+    6. Construct and return a :class:`VideoClip`.
+
+    Args:
+        image_path: Absolute file-system path to the source cover image.
+        duration: Length in seconds the clip should play (matches audio).
+        resolution: Output video dimensions as ``(width, height)``,
+            e.g. ``(1920, 1080)``.
+        zoom_intensity: Zoom factor read from GlobalSettings.  ``1.0``
+            means no zoom; values > 1.0 create a zoom-in effect.
+            Defaults to ``1.3``.
+        fps: Frames per second for the output VideoClip.  Should match
+            the project framerate setting.  Defaults to ``30``.
+        segment_index: Zero-based index of this segment within the
+            project, used to deterministically select the pan direction.
+            Defaults to ``0``.
+        resample: Pillow resampling filter for the source plane,
+            selected by the render quality preset.  Defaults to LANCZOS.
+        easing: Camera easing curve (see :data:`KEN_BURNS_EASINGS`).
+            Defaults to ``"linear"``.
+        subpixel: Blend fractional crop offsets instead of rounding
+            them to whole output pixels.  Defaults to ``True``.
+
+    Returns:
+        A MoviePy :class:`VideoClip` with the specified duration and FPS,
+        whose ``make_frame`` callback generates each frame by looking up
+        the camera position in the trajectory table and slicing the
+        matching window out of the pre-resampled source.
+    """
+    output_width, output_height = resolution
+
+    logger.info(
+        "apply_ken_burns called: image=%s, duration=%.2fs, "
+        "resolution=%dx%d, zoom=%.2f, fps=%d, segment_index=%d, "
+        "resample=%s, easing=%s, subpixel=%s",
+        image_path,
+        duration,
+        output_width,
+        output_height,
+        zoom_intensity,
+        fps,
+        segment_index,
+        resample,
+        easing,
+        subpixel,
+    )
+
+    # ------------------------------------------------------------------
+    # 1–5. Prepare the frame engine and the make_frame closure
+    # ------------------------------------------------------------------
+    engine = build_ken_burns_engine(
+        image_path,
+        duration,
+        resolution,
+        zoom_intensity=zoom_intensity,
+        segment_index=segment_index,
+        resample=resample,
+        fps=fps,
+        easing=easing,
+        subpixel=subpixel,
+    )
 
     def make_frame(t: float) -> np.ndarray:
-        """Generate a single frame at time *t* by interpolating the crop.
-
-        Called by MoviePy once per frame during rendering.  The closure
-        captures the source image, start/end coordinates, crop
-        dimensions, output resolution, and duration from the enclosing
-        :func:`apply_ken_burns` scope.
-
-        Algorithm per frame:
-
-        1. Call :func:`interpolate_position` to get the float crop-box
-           position at time *t* (with clamped progress).
-        2. Round to integer pixel coordinates.
-        3. Clamp to valid image bounds.
-        4. Extract the crop via NumPy slicing ``[y:y+h, x:x+w]``
-           (O(1) view, no data copy).
-        5. Resize the crop to the output resolution via Pillow LANCZOS.
-        6. Return a contiguous ``uint8`` NumPy array.
-
-        Performance notes (Task 04.02.10):
-
-        * **No multithreading** — MoviePy calls ``make_frame``
-          sequentially; parallel frame generation is not supported.
-        * **No frame caching** — At 1080p/30fps for a 5-second clip
-          (150 frames), caching all frames would require ~935 MB of
-          RAM (150 × 1920 × 1080 × 3 bytes).  Not feasible for a
-          local desktop application.
-        * **Per-frame object creation** is limited to the unavoidable
-          minimum given the Pillow+NumPy constraint:
-          1. ``Image.fromarray(crop)`` — convert NumPy slice to PIL
-          2. ``pil_crop.resize(…)`` — the core resize operation
-          3. ``np.array(pil_crop)`` — convert back to NumPy for MoviePy
-          Alternative libraries (OpenCV ``cv2.resize``,
-          ``scipy.ndimage.zoom``) could eliminate the NumPy ↔ Pillow
-          conversion overhead, but are intentionally excluded from the
-          dependency list to keep the application footprint small.
-        * **Resampling filter tradeoffs**:
-          - ``Image.Resampling.LANCZOS`` — highest quality, ~10 ms/frame
-            at 1080p.  Used for all renders (current default).
-          - ``Image.Resampling.BILINEAR`` — good quality, ~2× faster.
-            Suitable for previews or draft renders.
-          - ``Image.Resampling.NEAREST`` — lowest quality (pixelated),
-            ~5× faster.  Only for debugging or performance testing.
-          A future "render quality" setting could select the filter,
-          but this is out of scope for Phase 04.
+        """Generate a single frame at time *t*.
+
+        Called by MoviePy once per frame during rendering.  Delegates to
+        :meth:`KenBurnsFrameEngine.frame_at`, which looks up the crop
+        position in the trajectory table (clamped to the clip) and
+        copies the matching window out of the pre-resampled plane.
+
+        A fresh array is returned on every call because MoviePy may
+        keep a reference to earlier frames (e.g. while compositing).
+        Callers that own their frame buffer should use
+        ``engine.frame_at(t, out=buffer)`` directly.
 
         Args:
             t: Current time in seconds within the clip.
@@ -644,61 +1081,22 @@ def apply_ken_burns(
             NumPy array of shape ``(output_height, output_width, 3)``
             with dtype ``uint8``.
         """
-        # Step 1: Interpolate the crop-box position (progress clamped
-        # to [0, 1] inside interpolate_position)
-        interp_x, interp_y = interpolate_position(
-            start_coords, end_coords, t, duration
-        )
-
-        # Step 2: Convert float coordinates to integer pixels
-        x = int(round(interp_x))
-        y = int(round(interp_y))
-
-        # Step 3: Clamp to valid image boundaries
-        x = max(0, min(x, source_width - crop_width))
-        y = max(0, min(y, source_height - crop_height))
-
-        # Step 4: Extract crop region via NumPy array slicing (rows=y, cols=x).
-        # NumPy slicing returns a *view* into the existing array — an O(1)
-        # operation regardless of crop size.  Actual data transfer happens
-        # during the subsequent Pillow resize step.
-        crop = source_image[y : y + crop_height, x : x + crop_width]
-
-        # Step 5: Resize crop to output resolution using LANCZOS
-        pil_crop = Image.fromarray(crop)
-        pil_crop = pil_crop.resize(
-            (output_width, output_height), Image.Resampling.LANCZOS
-        )
-        frame = np.array(pil_crop)
-
-        # Step 6: Ensure contiguous memory layout for MoviePy
-        frame = np.ascontiguousarray(frame)
-
-        return frame
+        return engine.frame_at(t)
 
     # ------------------------------------------------------------------
     # 6. Construct and return the VideoClip
     # ------------------------------------------------------------------
-    # Performance expectations (Task 04.02.10):
-    #
-    # The dominant per-frame cost is the Pillow LANCZOS resize.  For a
-    # crop of ~1477×831 → 1920×1080, each resize takes ~5–15 ms on a
-    # modern CPU (Intel i5/i7, AMD Ryzen 5/7).  This yields a frame
-    # generation rate of ~67–200 FPS — well above the 5 FPS minimum.
-    #
-    # For a typical 12-segment project (5 s per segment, 30 FPS):
-    #   total_frames  = 12 × 5 × 30 = 1800
-    #   frame_gen     ≈ 1800 × 10 ms ≈ 18 seconds
-    #   MP4 encoding  ≈ 2–5 × frame_gen ≈ 36–90 seconds total
+    # Performance expectations:
     #
-    # All per-segment computations (image loading, crop dimensions,
-    # direction selection, start/end coordinates) are executed once and
-    # captured by the make_frame closure.  No per-frame re-computation
-    # of these values occurs.
+    # The only resampling is the one-off plane resize in
+    # KenBurnsFrameEngine (roughly the cost of a handful of per-frame
+    # crop resizes).  Each frame afterwards is a ~6 MB memory copy at
+    # 1080p (a few uint16 passes with sub-pixel motion), so frame
+    # generation is dominated by compositing and encoding rather than
+    # by the Ken Burns effect itself.
     #
-    # No multithreading is used — MoviePy calls make_frame sequentially.
-    # No frame caching is implemented — memory cost would be ~935 MB
-    # for a single 5 s clip at 1080p/30fps.
+    # The plane costs (zoom × source) pixels of RAM for the lifetime of
+    # the clip — about 40 MB for a 1080p render at zoom 1.3.
     total_frames = int(duration * fps)
     logger.debug(
         "  Expected frame count for this clip: %d "
@@ -4,8 +4,19 @@ KokoroModelLoader — Thread-safe singleton for Kokoro-82M ONNX model.
 Lazily loads the ONNX model exactly once and reuses the InferenceSession
 for all subsequent inference calls. Uses double-checked locking for
 thread safety without hot-path lock contention.
+
+Session options
+~~~~~~~~~~~~~~~
+Every Kokoro session (this loader's and the one used by
+``tts_wrapper``) is built by :func:`create_inference_session`, which
+applies the ``TTS_ONNX_SESSION`` Django setting on top of
+:data:`DEFAULT_SESSION_CONFIG`: intra/inter-op thread counts, optional
+intra-op thread affinities, execution mode, graph optimization level,
+a saved optimized-model path and the CPU memory-arena switches. Use
+``python manage.py benchmark_tts`` to compare configurations.
 """
 
+import json
 import logging
 import os
 import threading
@@ -14,6 +25,230 @@ logger = logging.getLogger(__name__)
 
 MODEL_FILENAME = "kokoro-v0_19.onnx"
 
+# --------------------------------------------------------------------------
+# ONNX Runtime session configuration
+# --------------------------------------------------------------------------
+
+DEFAULT_SESSION_CONFIG: dict = {
+    # 0 lets ONNX Runtime choose (one thread per physical core).
+    "intra_op_threads": 0,
+    "inter_op_threads": 0,
+    # e.g. "1;2;3" pins intra-op threads 2..4 to logical CPUs 1, 2, 3.
+    "intra_op_thread_affinities": None,
+    # Busy-wait between ops; disable on shared servers to free the CPU.
+    "allow_spinning": True,
+    "execution_mode": "sequential",          # "sequential" | "parallel"
+    "graph_optimization_level": "all",       # "disable" | "basic" | "extended" | "all"
+    # When set, the optimized graph is saved here on first load and
+    # loaded directly (without re-optimizing) afterwards — until the
+    # source model or the optimization level changes.
+    "optimized_model_path": None,
+    "enable_cpu_mem_arena": True,
+    "enable_mem_pattern": True,
+    "enable_mem_reuse": True,
+}
+
+_EXECUTION_MODES = ("sequential", "parallel")
+_OPTIMIZATION_LEVELS = ("disable", "basic", "extended", "all")
+
+
+def load_session_config(overrides=None):
+    """
+    Return the effective ONNX session configuration.
+
+    Merges :data:`DEFAULT_SESSION_CONFIG`, the ``TTS_ONNX_SESSION``
+    Django setting and *overrides* (in that order). Unknown keys are
+    ignored with a warning; invalid enum values fall back to defaults.
+
+    Args:
+        overrides: Optional dict of keys taking precedence over settings.
+
+    Returns:
+        dict: A complete configuration dict.
+    """
+    from django.conf import settings
+
+    config = dict(DEFAULT_SESSION_CONFIG)
+    for source in (getattr(settings, "TTS_ONNX_SESSION", None) or {}, overrides or {}):
+        for key, value in source.items():
+            if key not in DEFAULT_SESSION_CONFIG:
+                logger.warning("Ignoring unknown TTS_ONNX_SESSION key: %s", key)
+                continue
+            config[key] = value
+
+    if config["execution_mode"] not in _EXECUTION_MODES:
+        logger.warning(
+            "Invalid execution_mode '%s'. Using 'sequential'.",
+            config["execution_mode"],
+        )
+        config["execution_mode"] = "sequential"
+    if config["graph_optimization_level"] not in _OPTIMIZATION_LEVELS:
+        logger.warning(
+            "Invalid graph_optimization_level '%s'. Using 'all'.",
+            config["graph_optimization_level"],
+        )
+        config["graph_optimization_level"] = "all"
+
+    return config
+
+
+def _source_record_path(optimized_path):
+    """Sidecar file recording which model *optimized_path* was built from."""
+    return f"{optimized_path}.source.json"
+
+
+def model_fingerprint(model_path, optimization_level):
+    """
+    Identify the source model an optimized graph is built from.
+
+    Returns:
+        dict: Resolved path, size and modification time of *model_path*
+        plus the optimization level, or ``None`` if it cannot be stat'ed.
+    """
+    try:
+        stat = os.stat(model_path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return {
+        "source": os.path.realpath(model_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "graph_optimization_level": optimization_level,
+    }
+
+
+def optimized_model_is_current(optimized_path, model_path, optimization_level):
+    """True if *optimized_path* exists and was built from this exact model."""
+    if not os.path.exists(optimized_path):
+        return False
+    fingerprint = model_fingerprint(model_path, optimization_level)
+    if fingerprint is None:
+        return False
+    try:
+        with open(_source_record_path(optimized_path), encoding="utf-8") as f:
+            return json.load(f) == fingerprint
+    except (OSError, ValueError):
+        return False
+
+
+def record_optimized_model(optimized_path, model_path, optimization_level):
+    """Write the sidecar that ties *optimized_path* to its source model."""
+    fingerprint = model_fingerprint(model_path, optimization_level)
+    if fingerprint is None or not os.path.exists(optimized_path):
+        return
+    try:
+        with open(_source_record_path(optimized_path), "w", encoding="utf-8") as f:
+            json.dump(fingerprint, f)
+    except OSError as e:
+        logger.warning("Could not record the source of %s: %s", optimized_path, e)
+
+
+def build_session_options(config, model_path):
+    """
+    Translate a configuration dict into ``ort.SessionOptions``.
+
+    Args:
+        config: Dict as returned by :func:`load_session_config`.
+        model_path: Path of the original (unoptimized) model.
+
+    Returns:
+        tuple: ``(session_options, path_to_load)`` — the path is the
+        saved optimized model when one built from *model_path* (same
+        size, modification time and optimization level) exists,
+        otherwise *model_path* (and a stale optimized model is
+        regenerated).
+    """
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = max(int(config["intra_op_threads"]), 0)
+    options.inter_op_num_threads = max(int(config["inter_op_threads"]), 0)
+    options.execution_mode = (
+        ort.ExecutionMode.ORT_PARALLEL
+        if config["execution_mode"] == "parallel"
+        else ort.ExecutionMode.ORT_SEQUENTIAL
+    )
+    options.enable_cpu_mem_arena = bool(config["enable_cpu_mem_arena"])
+    options.enable_mem_pattern = bool(config["enable_mem_pattern"])
+    options.enable_mem_reuse = bool(config["enable_mem_reuse"])
+
+    options.add_session_config_entry(
+        "session.intra_op.allow_spinning",
+        "1" if config["allow_spinning"] else "0",
+    )
+    if config["intra_op_thread_affinities"]:
+        options.add_session_config_entry(
+            "session.intra_op_thread_affinities",
+            str(config["intra_op_thread_affinities"]),
+        )
+
+    levels = {
+        "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+    }
+    options.graph_optimization_level = levels[config["graph_optimization_level"]]
+
+    path_to_load = str(model_path)
+    optimized_path = config["optimized_model_path"]
+    if optimized_path:
+        optimized_path = str(optimized_path)
+        level = config["graph_optimization_level"]
+        if optimized_model_is_current(optimized_path, model_path, level):
+            # Already optimized offline — skip re-optimizing at load time.
+            path_to_load = optimized_path
+            options.graph_optimization_level = levels["disable"]
+        else:
+            if os.path.exists(optimized_path):
+                logger.info(
+                    "Optimized model %s is out of date; regenerating it.",
+                    optimized_path,
+                )
+            os.makedirs(os.path.dirname(optimized_path) or ".", exist_ok=True)
+            options.optimized_model_filepath = optimized_path
+
+    return options, path_to_load
+
+
+def create_inference_session(model_path, config=None):
+    """
+    Create a CPU ``InferenceSession`` for *model_path* with tuned options.
+
+    Args:
+        model_path: Path to the Kokoro ONNX model.
+        config: Optional configuration dict; defaults to
+            :func:`load_session_config`.
+
+    Returns:
+        onnxruntime.InferenceSession
+    """
+    import onnxruntime as ort
+
+    if config is None:
+        config = load_session_config()
+    options, path_to_load = build_session_options(config, model_path)
+    session = ort.InferenceSession(
+        path_to_load,
+        sess_options=options,
+        providers=["CPUExecutionProvider"],
+    )
+    if options.optimized_model_filepath:
+        # Saved by the session just created
+        record_optimized_model(
+            options.optimized_model_filepath, model_path,
+            config["graph_optimization_level"],
+        )
+    logger.info(
+        "ONNX session created: %s (intra=%s, inter=%s, mode=%s, opt=%s)",
+        os.path.basename(path_to_load),
+        config["intra_op_threads"] or "auto",
+        config["inter_op_threads"] or "auto",
+        config["execution_mode"],
+        config["graph_optimization_level"],
+    )
+    return session
+
 
 class KokoroModelLoader:
     """
@@ -63,14 +298,14 @@ class KokoroModelLoader:
         Load the Kokoro ONNX model into an InferenceSession.
 
         Resolves the model path, verifies the file exists, and creates
-        the ONNX Runtime session. Stores the session in cls._session.
+        the ONNX Runtime session with the configured ``SessionOptions``
+        (see :func:`create_inference_session`). Stores the session in
+        cls._session.
 
         Raises:
             FileNotFoundError: If the model file is not found.
             RuntimeError: If ONNX Runtime fails to load the model.
         """
-        import onnxruntime as ort
-
         model_path = cls._resolve_model_path()
 
         if not os.path.exists(model_path):
@@ -84,7 +319,7 @@ class KokoroModelLoader:
             )
 
         try:
-            cls._session = ort.InferenceSession(str(model_path))
+            cls._session = create_inference_session(str(model_path))
             logger.info("Kokoro ONNX model loaded successfully from: %s", model_path)
         except Exception as e:
             raise RuntimeError(
@@ -0,0 +1,733 @@
+"""
+StoryFlow Parallel Segment Renderer.
+
+Splits a multi-segment render into independent *pieces* that can be
+encoded concurrently by a ``ProcessPoolExecutor``:
+
+* **Body pieces** — the part of a segment that is shown on its own
+  (Ken Burns + subtitles + logo), excluding the frames that overlap a
+  neighbouring segment during a crossfade.
+* **Transition pieces** — the short overlap between two consecutive
+  segments, produced by blending the tail of the outgoing segment with
+  the head of the incoming one.
+
+Every piece is written as a video-only H.264 file with identical
+encoder parameters, so the final MP4 is produced by FFmpeg's concat
+demuxer with ``-c:v copy`` — full segments are never re-encoded during
+assembly.  The narration soundtrack is mixed once in the parent process
+and muxed in during the same stitch.
+
+Pieces are looked up in the per-project render cache
+(:mod:`core_engine.render_cache`) first, so a re-render only encodes
+the pieces whose inputs changed.  With a single worker, the remaining
+pieces are encoded inline in the calling process.
+
+The worker pool outlives a render (see :func:`get_piece_pool`):
+consecutive renders — e.g. the projects of a render batch — reuse warm
+worker processes, which keep their imports and prepared-image caches.
+
+The timeline is *frame aligned*: each segment occupies a whole number
+of frames and each crossfade a whole number of frames, so a piece only
+depends on its own segment(s) and never on where the rest of the video
+starts.  :func:`plan_segment_timeline` is a pure function and holds all
+of the timing arithmetic.
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from core_engine import render_utils
+from core_engine.audio_utils import get_audio_duration, mix_soundtrack
+from core_engine.export_profiles import (
+    EXPORT_PROFILE_CRF,
+    EXPORT_PROFILE_VBR,
+    X264_TUNE,
+    encoder_threads,
+    two_pass_bitrate_kbps,
+)
+from core_engine.image_cache import configure_from_settings
+from core_engine.render_cache import SegmentRenderCache
+from core_engine.render_profiler import (
+    PHASE_AUDIO_MIX,
+    PHASE_AUDIO_PROBE,
+    PHASE_PIECES,
+    PHASE_STITCH,
+    RenderProfiler,
+)
+from core_engine.video_renderer import (
+    TRANSITION_DURATION,
+    ProgressCallback,
+    build_logo_overlay,
+    build_segment_source,
+)
+
+logger = logging.getLogger(__name__)
+
+# Encoder parameters shared by every piece.  They must be identical
+# across pieces for the concat demuxer to copy the streams verbatim.
+PIECE_CODEC: str = "libx264"
+PIECE_PIXEL_FORMAT: str = "yuv420p"
+
+# Frame buffers in flight per piece encoder
+PIECE_RING_SIZE: int = 3
+
+
+# ---------------------------------------------------------------------------
+# Shared worker pool
+# ---------------------------------------------------------------------------
+
+_pool_lock = threading.Lock()
+_piece_pool: Optional[ProcessPoolExecutor] = None
+_piece_pool_workers = 0
+
+
+def get_piece_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process pool for *workers* piece workers.
+
+    The pool is created on first use and kept for later renders; asking
+    for a different size replaces it.  Workers are started with "spawn",
+    which avoids forking a process that holds Django DB connections and
+    MoviePy reader threads.
+    """
+    global _piece_pool, _piece_pool_workers
+    with _pool_lock:
+        if _piece_pool is not None and _piece_pool_workers == workers:
+            return _piece_pool
+        if _piece_pool is not None:
+            _piece_pool.shutdown(wait=False)
+        ctx = multiprocessing.get_context("spawn")
+        _piece_pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+        _piece_pool_workers = workers
+        return _piece_pool
+
+
+def discard_piece_pool(executor: Optional[ProcessPoolExecutor] = None) -> None:
+    """Shut the shared pool down (only if it is still *executor*, if given)."""
+    global _piece_pool, _piece_pool_workers
+    with _pool_lock:
+        if _piece_pool is None or (executor is not None and _piece_pool is not executor):
+            return
+        pool, _piece_pool, _piece_pool_workers = _piece_pool, None, 0
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+def piece_encoder(render_settings: dict, duration: Optional[float] = None) -> dict:
+    """Return the encoder parameters for every piece of a render.
+
+    The x264 preset and CRF come from the render quality preset, the
+    rate control from the export profile (see
+    :mod:`core_engine.export_profiles`).  A two-pass profile needs the
+    video's total *duration* to turn the target size into a bitrate.
+    The dict is also part of every render-cache key, so a piece encoded
+    with different parameters is never reused.  Thread counts are added
+    by the caller and are not part of the key.
+    """
+    profile = render_settings.get("export_profile", EXPORT_PROFILE_CRF)
+    encoder = {
+        "codec": PIECE_CODEC,
+        "preset": render_settings["x264_preset"],
+        "tune": X264_TUNE,
+        "pixel_format": PIECE_PIXEL_FORMAT,
+        "profile": profile,
+    }
+    if profile == EXPORT_PROFILE_CRF:
+        encoder["crf"] = render_settings["crf"]
+    elif profile == EXPORT_PROFILE_VBR:
+        encoder["bitrate_kbps"] = render_settings["export_bitrate_kbps"]
+    else:
+        encoder["bitrate_kbps"] = two_pass_bitrate_kbps(
+            render_settings["export_target_mb"], duration or 0.0,
+        )
+    return encoder
+
+
+# ---------------------------------------------------------------------------
+# Timeline planning
+# ---------------------------------------------------------------------------
+
+def plan_segment_timeline(
+    visual_durations: list[float],
+    fps: int,
+    transition_duration: float = TRANSITION_DURATION,
+) -> Optional[dict]:
+    """Compute a frame-aligned timeline and piece list for a render.
+
+    Segment *i* lasts ``n_i = round(visual_durations[i] * fps)`` frames
+    and consecutive segments overlap by ``T = round(transition_duration
+    * fps)`` frames.  The pieces are, in playback order::
+
+        body 0, transition 0→1, body 1, transition 1→2, ..., body N-1
+
+    where body *i* covers the segment's local frames ``[head, n_i -
+    tail)`` (``head``/``tail`` are ``T`` next to a neighbour, otherwise
+    0) and transition *i* covers the last ``T`` frames of segment *i*
+    blended with the first ``T`` frames of segment *i+1*.
+
+    This is a **pure function** — no I/O.
+
+    Args:
+        visual_durations: Ordered on-screen duration of each segment
+            (audio + inter-segment silence), in seconds.
+        fps: Output frame rate.
+        transition_duration: Crossfade length in seconds.
+
+    Returns:
+        ``None`` if any segment is too short to hold its transitions
+        (the caller should fall back to the single-stream renderer),
+        otherwise a dict with:
+
+        * ``segment_frames`` — frame count per segment.
+        * ``start_frames`` — global start frame of each segment.
+        * ``transition_frames`` — frames per crossfade.
+        * ``total_frames`` — frame count of the finished video.
+        * ``pieces`` — ordered list of piece dicts with ``kind``
+          (``"body"`` / ``"transition"``), ``segments`` (indices),
+          ``start`` / ``end`` (local frame range of the first segment)
+          and ``frames``.
+    """
+    if fps <= 0:
+        raise ValueError(f"fps must be positive, got {fps}")
+    if not visual_durations:
+        return {
+            "segment_frames": [],
+            "start_frames": [],
+            "transition_frames": 0,
+            "total_frames": 0,
+            "pieces": [],
+        }
+
+    count = len(visual_durations)
+    segment_frames = [max(int(round(d * fps)), 1) for d in visual_durations]
+    transition_frames = (
+        max(int(round(transition_duration * fps)), 0) if count > 1 else 0
+    )
+
+    start_frames: list[int] = []
+    cursor = 0
+    for n in segment_frames:
+        start_frames.append(cursor)
+        cursor += n - transition_frames
+
+    total_frames = start_frames[-1] + segment_frames[-1]
+
+    pieces: list[dict] = []
+    for i, n in enumerate(segment_frames):
+        head = transition_frames if i > 0 else 0
+        tail = transition_frames if i < count - 1 else 0
+        if n < head + tail:
+            logger.warning(
+                "Segment %d is %d frame(s) long — too short for %d "
+                "transition frame(s) on each side.",
+                i, n, transition_frames,
+            )
+            return None
+
+        if n - head - tail > 0:
+            pieces.append({
+                "kind": "body",
+                "segments": [i],
+                "start": head,
+                "end": n - tail,
+                "frames": n - head - tail,
+            })
+        if tail and transition_frames:
+            pieces.append({
+                "kind": "transition",
+                "segments": [i, i + 1],
+                "start": n - transition_frames,
+                "end": n,
+                "frames": transition_frames,
+            })
+
+    return {
+        "segment_frames": segment_frames,
+        "start_frames": start_frames,
+        "transition_frames": transition_frames,
+        "total_frames": total_frames,
+        "pieces": pieces,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Worker-side piece encoder
+# ---------------------------------------------------------------------------
+
+def render_piece(job: dict) -> dict:
+    """Encode one timeline piece to a video-only MP4 file.
+
+    Runs inside a worker process, so *job* contains only plain values
+    (see :func:`render_segments_parallel`).  Each involved segment's
+    frame source is rebuilt locally with
+    :func:`core_engine.video_renderer.build_segment_source`, and every
+    frame is drawn by a :class:`FrameCompositor` into a small buffer
+    ring that is piped straight to FFmpeg by
+    :func:`core_engine.frame_pipe.encode_frames` (twice for a two-pass
+    export profile).
+
+    Crossfade pieces are a linear blend: at transition frame *k* the
+    incoming segment has weight ``k / T`` — the same ramp as the
+    single-stream renderer's ``CrossfadeTimeline``.
+
+    Args:
+        job: Piece description plus ``segments`` (segment dicts),
+            ``render_settings``, ``encoder`` (from :func:`piece_encoder`),
+            ``threads`` and ``output_path``.
+
+    Returns:
+        dict with ``index``, ``output_path``, ``frames``, ``warnings``,
+        ``seconds`` / ``cpu_seconds`` (time spent in the worker) and
+        ``peak_rss_bytes`` (the worker process's high-water mark).
+    """
+    from core_engine.frame_pipe import encode_frames
+
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+
+    render_settings = job["render_settings"]
+    fps = render_settings["fps"]
+    width, height = render_settings["resolution"]
+    # Workers are fresh processes: size their cache like the parent's
+    # so prepared images are shared through the disk tier.
+    configure_from_settings(render_settings)
+
+    logo_overlay = None
+    if render_settings.get("logo"):
+        try:
+            logo_overlay = build_logo_overlay(render_settings["logo"], (width, height))
+        except Exception as logo_err:
+            logger.warning("Worker could not load logo: %s", logo_err)
+
+    sources = []
+    warnings: list[str] = []
+    for seg in job["segments"]:
+        source, seg_warnings = build_segment_source(seg, render_settings, logo_overlay)
+        sources.append(source)
+        warnings.extend(seg_warnings)
+
+    start, end = job["start"], job["end"]
+    frames = end - start
+    if job["kind"] == "body":
+        source = sources[0]
+
+        def draw(k, out, compositor):
+            return compositor.compose(source, (start + k) / fps, out)
+    else:
+        outgoing, incoming = sources
+
+        def draw(k, out, compositor):
+            return compositor.crossfade(
+                outgoing, (start + k) / fps,
+                incoming, k / fps,
+                k / frames,
+                out,
+            )
+
+    # Pieces already run one per worker process, so one producer
+    # thread each; the ring still overlaps drawing with encoding.
+    encoder = dict(job["encoder"], threads=job.get("threads"))
+    encode_frames(
+        draw, frames, (width, height), fps, job["output_path"], encoder,
+        threads=1, ring_size=PIECE_RING_SIZE,
+    )
+
+    return {
+        "index": job["index"],
+        "output_path": job["output_path"],
+        "frames": job["end"] - job["start"],
+        "warnings": warnings,
+        "seconds": time.perf_counter() - started,
+        "cpu_seconds": time.process_time() - cpu_started,
+        "peak_rss_bytes": render_utils.peak_rss_bytes(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Soundtrack and final stitch
+# ---------------------------------------------------------------------------
+
+def build_soundtrack(
+    segment_specs: list[dict],
+    start_frames: list[int],
+    fps: int,
+    total_frames: int,
+    output_path: str,
+) -> str:
+    """Mix every segment's narration into one WAV at its timeline offset.
+
+    Segment audio starts at ``start_frames[i] / fps``; the trailing
+    inter-segment silence is implicit (nothing plays there).  Overlaps
+    during crossfades are summed, exactly as in the single-stream
+    export — both use :func:`core_engine.audio_utils.mix_soundtrack`.
+
+    Returns:
+        *output_path*.
+    """
+    return mix_soundtrack(
+        [spec["audio_path"] for spec in segment_specs],
+        [start / fps for start in start_frames],
+        total_frames / fps,
+        output_path,
+    )
+
+
+def stitch_pieces(
+    piece_paths: list[str],
+    audio_path: str,
+    output_path: str,
+    list_path: str,
+) -> None:
+    """Concatenate encoded pieces and mux the soundtrack without re-encoding video.
+
+    Raises:
+        RuntimeError: If FFmpeg exits with a non-zero status.
+    """
+    from moviepy.config import FFMPEG_BINARY
+
+    with open(list_path, "w", encoding="utf-8") as fh:
+        for path in piece_paths:
+            escaped = path.replace("'", "'\\''")
+            fh.write(f"file '{escaped}'\n")
+
+    cmd = [
+        FFMPEG_BINARY, "-y", "-loglevel", "error",
+        "-f", "concat", "-safe", "0", "-i", list_path,
+        "-i", audio_path,
+        "-map", "0:v", "-map", "1:a",
+        "-c:v", "copy",
+        "-c:a", "aac",
+        "-movflags", "+faststart",
+        output_path,
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"FFmpeg concat failed (exit {proc.returncode}): "
+            f"{proc.stderr.strip()[-500:]}"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+def render_segments_parallel(
+    project_id: str,
+    segment_specs: list[dict],
+    render_settings: dict,
+    output_path: str,
+    workers: int,
+    on_progress: ProgressCallback = None,
+    warnings: Optional[list[str]] = None,
+    profiler: Optional[RenderProfiler] = None,
+) -> Optional[dict]:
+    """Render a project by encoding its pieces on a process pool.
+
+    Measures every segment's audio, plans the frame-aligned timeline,
+    reuses cached pieces, encodes the rest concurrently, mixes the
+    soundtrack and stitches the result into *output_path*.
+
+    Progress is reported as ``(completed_pieces, total_pieces, ...)``
+    scaled to the segment count while encoding (0–80 %), followed by
+    ``"Exporting …"`` messages for the stitch (80–99 %).  Any exception
+    raised by *on_progress* (e.g. cooperative cancellation) cancels the
+    outstanding pieces and propagates.
+
+    Args:
+        project_id: UUID string of the project (for temp paths).
+        segment_specs: Segment dicts from
+            :func:`core_engine.video_renderer.describe_segment`.
+        render_settings: Dict from
+            :func:`core_engine.video_renderer.load_render_settings`.
+        output_path: Destination MP4 path.
+        workers: Number of worker processes (``1`` encodes inline).
+        on_progress: Optional progress callback.
+        warnings: List to which non-fatal warnings are appended.
+        profiler: Optional :class:`RenderProfiler`.  Piece encodes are
+            recorded with the time, CPU and peak memory measured inside
+            their worker process; the export frame rate counts the
+            frames actually encoded (cached pieces excluded).
+
+    Returns:
+        The render result dict, or ``None`` when the timeline cannot be
+        split (segments shorter than their transitions) and the caller
+        should use the single-stream renderer instead.
+    """
+    if warnings is None:
+        warnings = []
+    own_profiler = profiler is None
+    if own_profiler:
+        profiler = RenderProfiler()
+
+    fps = render_settings["fps"]
+    silence = render_settings["inter_segment_silence"]
+    total_segments = len(segment_specs)
+
+    # ------------------------------------------------------------------
+    # 1. Measure audio and drop zero-length segments
+    # ------------------------------------------------------------------
+    specs: list[dict] = []
+    for spec in segment_specs:
+        for key in ("audio_path", "image_path"):
+            if not os.path.exists(spec[key]):
+                kind = "Audio" if key == "audio_path" else "Image"
+                raise FileNotFoundError(
+                    f"{kind} file missing for {spec['label']} "
+                    f"(segment ID {spec['id']}): {spec[key]}"
+                )
+        try:
+            with profiler.phase(PHASE_AUDIO_PROBE, spec.get("position")):
+                audio_duration = get_audio_duration(spec["audio_path"])
+        except Exception as exc:
+            raise RuntimeError(
+                f"Corrupt or unreadable audio file for {spec['label']} "
+                f"(segment ID {spec['id']}): {spec['audio_path']}"
+            ) from exc
+
+        if audio_duration is None or audio_duration <= 0:
+            logger.warning(
+                "Skipping %s (ID %s): audio duration is zero or negative.",
+                spec["label"], spec["id"],
+            )
+            continue
+
+        spec = dict(spec)
+        spec["audio_duration"] = audio_duration
+        spec["visual_duration"] = audio_duration + max(silence, 0.0)
+        specs.append(spec)
+        if spec.get("position") is not None:
+            profiler.label_segment(
+                spec["position"], spec["label"],
+                audio_duration=round(audio_duration, 3),
+                visual_duration=round(spec["visual_duration"], 3),
+            )
+
+    if not specs:
+        raise ValueError(
+            "No clips available for rendering. All segments may have "
+            "been skipped due to zero-duration audio or missing files."
+        )
+
+    # ------------------------------------------------------------------
+    # 2. Plan the frame-aligned timeline
+    # ------------------------------------------------------------------
+    plan = plan_segment_timeline(
+        [s["visual_duration"] for s in specs], fps, TRANSITION_DURATION,
+    )
+    if plan is None:
+        warnings.append(
+            "Parallel render unavailable (a segment is shorter than its "
+            "crossfades); rendered in a single stream instead."
+        )
+        return None
+
+    pieces = plan["pieces"]
+    total_pieces = len(pieces)
+    # The shared pool keeps the configured size (resizing it would
+    # respawn warm workers); only the per-piece threads and reporting
+    # use the workers this render can actually keep busy.
+    pool_workers = max(workers, 1)
+    workers = max(min(pool_workers, total_pieces), 1)
+    temp_dir = os.path.join(render_utils.get_temp_dir(project_id), "pieces")
+    os.makedirs(temp_dir, exist_ok=True)
+
+    logger.info(
+        "Piece render: %d segment(s) → %d piece(s) on %d worker(s), "
+        "%d frames total.",
+        len(specs), total_pieces, workers, plan["total_frames"],
+    )
+
+    # Split FFmpeg threads between workers so they don't oversubscribe.
+    threads_per_piece = encoder_threads(workers)
+    encoder = piece_encoder(render_settings, plan["total_frames"] / fps)
+
+    # ------------------------------------------------------------------
+    # 3. Resolve pieces against the render cache
+    # ------------------------------------------------------------------
+    cache = SegmentRenderCache(
+        project_id, render_settings.get("render_cache_mb", 0) * 1024 * 1024,
+    )
+    jobs = []
+    for index, piece in enumerate(pieces):
+        piece_segments = [specs[i] for i in piece["segments"]]
+        job = {
+            "index": index,
+            "kind": piece["kind"],
+            "start": piece["start"],
+            "end": piece["end"],
+            "segments": piece_segments,
+            "render_settings": render_settings,
+            "encoder": encoder,
+            "threads": threads_per_piece,
+            "output_path": os.path.join(temp_dir, f"piece_{index:04d}.mp4"),
+            "cache_key": None,
+            "cached": False,
+        }
+        if cache.enabled:
+            job["cache_key"] = cache.piece_key(
+                piece, piece_segments, render_settings, encoder,
+            )
+            cached_path = cache.lookup(job["cache_key"])
+            if cached_path is not None:
+                job["output_path"] = cached_path
+                job["cached"] = True
+        jobs.append(job)
+
+    to_render = [job for job in jobs if not job["cached"]]
+    if cache.enabled:
+        logger.info(
+            "Render cache: %d/%d piece(s) reused, %d to encode.",
+            cache.hits, total_pieces, len(to_render),
+        )
+
+    completed = total_pieces - len(to_render)
+    worker_peak_bytes = 0
+
+    def _piece_done(piece_result: dict) -> None:
+        nonlocal completed, worker_peak_bytes
+        worker_peak_bytes = max(
+            worker_peak_bytes, piece_result.get("peak_rss_bytes", 0),
+        )
+        job = jobs[piece_result["index"]]
+        profiler.add(
+            PHASE_PIECES,
+            piece_result.get("seconds", 0.0),
+            piece_result.get("cpu_seconds"),
+            piece_result.get("peak_rss_bytes", 0),
+            segment=job["segments"][0].get("position"),
+        )
+        if job["cache_key"] is not None:
+            job["output_path"] = cache.store(
+                job["cache_key"], piece_result["output_path"],
+            )
+        warnings.extend(
+            w for w in piece_result["warnings"] if w not in warnings
+        )
+        completed += 1
+        if on_progress:
+            on_progress(
+                math.floor(completed / total_pieces * total_segments),
+                total_segments,
+                f"Rendered piece {completed}/{total_pieces} "
+                f"({workers} worker{'s' if workers > 1 else ''})",
+            )
+
+    profiler.start()
+    try:
+        # --------------------------------------------------------------
+        # 4. Encode the remaining pieces
+        # --------------------------------------------------------------
+        encode_started = time.perf_counter()
+        if workers == 1 or len(to_render) <= 1:
+            for job in to_render:
+                _piece_done(render_piece(job))
+        else:
+            executor = get_piece_pool(pool_workers)
+            pending = set()
+            try:
+                pending = {executor.submit(render_piece, job) for job in to_render}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _piece_done(future.result())
+            except BaseException as exc:
+                # Drop this render's queued pieces and let running ones
+                # finish; the pool stays usable for the next render.
+                for future in pending:
+                    future.cancel()
+                wait(pending)
+                if isinstance(exc, BrokenProcessPool):
+                    discard_piece_pool(executor)
+                raise
+        profiler.record_export(
+            sum(job["end"] - job["start"] for job in to_render),
+            time.perf_counter() - encode_started,
+            {
+                "total_frames": plan["total_frames"],
+                "pieces": total_pieces,
+                "pieces_encoded": len(to_render),
+                "workers": workers,
+            },
+        )
+
+        # --------------------------------------------------------------
+        # 5. Soundtrack + stitch (no video re-encode)
+        # --------------------------------------------------------------
+        if on_progress:
+            on_progress(85, 100, "Exporting MP4… mixing soundtrack")
+
+        with profiler.phase(PHASE_AUDIO_MIX):
+            audio_path = build_soundtrack(
+                specs,
+                plan["start_frames"],
+                fps,
+                plan["total_frames"],
+                os.path.join(temp_dir, "soundtrack.wav"),
+            )
+
+        if on_progress:
+            on_progress(92, 100, "Exporting MP4… joining segments")
+
+        with profiler.phase(PHASE_STITCH):
+            stitch_pieces(
+                [job["output_path"] for job in jobs],
+                audio_path,
+                output_path,
+                os.path.join(temp_dir, "pieces.txt"),
+            )
+
+        if on_progress:
+            on_progress(99, 100, "Verifying output file…")
+
+        if not os.path.exists(output_path):
+            raise RuntimeError(
+                f"Export completed but output file not found: {output_path}"
+            )
+    except Exception:
+        logger.exception("Parallel render failed for project %s", project_id)
+        try:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        if own_profiler:
+            profiler.stop()
+        render_utils.cleanup_temp_files(temp_dir)
+        cache.evict(keep={job["cache_key"] for job in jobs if job["cache_key"]})
+
+    total_duration = plan["total_frames"] / fps
+    expected_duration = (
+        sum(s["visual_duration"] for s in specs)
+        - (len(specs) - 1) * TRANSITION_DURATION
+    )
+    file_size = os.path.getsize(output_path)
+
+    logger.info(
+        "=== Parallel render complete: %.2fs, %.1f MB, %s ===",
+        total_duration, file_size / (1024 * 1024), output_path,
+    )
+
+    return {
+        "output_path": output_path,
+        "duration": total_duration,
+        "expected_duration": expected_duration,
+        "num_transitions": len(specs) - 1,
+        "file_size": file_size,
+        "warnings": warnings,
+        "render_mode": "parallel",
+        "workers": workers,
+        "cache": cache.report(),
+        "render_quality": render_settings["render_quality"],
+        "export_profile": render_settings.get("export_profile", EXPORT_PROFILE_CRF),
+        "peak_rss_mb": profiler.peak_mb,
+        "worker_peak_rss_mb": round(worker_peak_bytes / (1024 * 1024), 1),
+    }
@@ -0,0 +1,306 @@
+"""
+StoryFlow Segment Preview Renderer.
+
+Renders a single segment — Ken Burns pan, timed subtitles and logo
+watermark — into a short, low-resolution clip so an editor can check
+framing and caption placement without rendering the whole project.
+
+The preview goes through exactly the same per-segment assembly as a
+full render (:func:`core_engine.video_renderer.build_segment_clip`,
+which wraps ``build_ken_burns_engine`` and ``create_subtitle_overlay``,
+plus :func:`core_engine.video_renderer.build_logo_overlay`), using the
+``draft`` quality preset further clamped to :data:`PREVIEW_MAX_WIDTH`
+and :data:`PREVIEW_FPS`.
+
+Two output formats are supported:
+
+* ``mp4``  — H.264 with the segment's narration (default).
+* ``webp`` — silent animated WebP, handy for inline ``<img>`` previews.
+
+Previews are cached on disk under
+``MEDIA_ROOT/projects/<id>/previews/`` and named after a hash of every
+input that affects their pixels, so re-requesting an unchanged segment
+returns the existing file immediately.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+from core_engine import render_utils
+from core_engine.audio_utils import get_audio_duration
+from core_engine.render_cache import CACHE_VERSION, SegmentRenderCache
+from core_engine.render_quality import RENDER_QUALITY_DRAFT, scale_resolution
+from core_engine.video_renderer import (
+    build_logo_overlay,
+    build_segment_clip,
+    describe_segment,
+    load_render_settings,
+)
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Preview constants
+# ---------------------------------------------------------------------------
+
+PREVIEW_FORMAT_MP4 = "mp4"
+PREVIEW_FORMAT_WEBP = "webp"
+PREVIEW_FORMATS: tuple[str, ...] = (PREVIEW_FORMAT_MP4, PREVIEW_FORMAT_WEBP)
+DEFAULT_PREVIEW_FORMAT: str = PREVIEW_FORMAT_MP4
+
+# Upper bounds applied on top of the draft preset.
+PREVIEW_MAX_WIDTH: int = 480
+PREVIEW_FPS: int = 12
+
+# Lossy quality (0–100) for animated WebP frames.
+WEBP_QUALITY: int = 70
+
+
+# ---------------------------------------------------------------------------
+# Settings and cache key
+# ---------------------------------------------------------------------------
+
+def load_preview_settings(project) -> dict:
+    """Return render settings for a preview of *project*.
+
+    Starts from ``load_render_settings(project, "draft")`` and clamps the
+    resolution to :data:`PREVIEW_MAX_WIDTH` (scaling the subtitle font
+    size and logo margin with it) and the frame rate to
+    :data:`PREVIEW_FPS`.
+    """
+    render_settings = load_render_settings(
+        project, render_quality=RENDER_QUALITY_DRAFT,
+    )
+
+    width, height = render_settings["resolution"]
+    if width > PREVIEW_MAX_WIDTH:
+        scale = PREVIEW_MAX_WIDTH / width
+        render_settings["resolution"] = scale_resolution((width, height), scale)
+        if render_settings["subtitle_font_size"] is not None:
+            render_settings["subtitle_font_size"] = max(
+                int(round(render_settings["subtitle_font_size"] * scale)), 1,
+            )
+        if render_settings["logo"] is not None:
+            render_settings["logo"]["margin"] = int(
+                round(render_settings["logo"]["margin"] * scale)
+            )
+
+    render_settings["fps"] = min(render_settings["fps"], PREVIEW_FPS)
+    return render_settings
+
+
+def preview_key(spec: dict, render_settings: dict, fmt: str) -> str:
+    """Return the content hash identifying a segment preview.
+
+    Reuses :meth:`SegmentRenderCache.segment_fingerprint` so a preview
+    is invalidated by exactly the same edits as a cached render piece.
+    """
+    fingerprint = SegmentRenderCache(spec["project_id"], 0).segment_fingerprint(
+        spec, render_settings,
+    )
+    payload = {
+        "version": CACHE_VERSION,
+        "format": fmt,
+        "resolution": list(render_settings["resolution"]),
+        "fps": render_settings["fps"],
+        "zoom": render_settings["zoom_intensity"],
+        "resample": render_settings["resample"],
+        "easing": render_settings["ken_burns_easing"],
+        "subpixel": render_settings["subpixel"],
+        "x264_preset": render_settings["x264_preset"],
+        "crf": render_settings["crf"],
+        "segment": fingerprint,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _prepare_preview(segment, fmt: str) -> tuple[dict, dict, str]:
+    """Resolve the segment spec, preview settings and output path.
+
+    Raises:
+        ValueError: If *fmt* is unknown or the segment's audio is empty.
+    """
+    if fmt not in PREVIEW_FORMATS:
+        raise ValueError(
+            f"Unknown preview format '{fmt}'. "
+            f"Expected one of: {', '.join(PREVIEW_FORMATS)}."
+        )
+
+    project_id = str(segment.project_id)
+    render_settings = load_preview_settings(segment.project)
+
+    spec = describe_segment(segment, 1, 1)
+    spec["project_id"] = project_id
+    audio_duration = get_audio_duration(spec["audio_path"])
+    if audio_duration <= 0:
+        raise ValueError(
+            f"Segment {spec['id']} has an empty audio file; "
+            "cannot time the preview."
+        )
+    spec["audio_duration"] = audio_duration
+    spec["visual_duration"] = audio_duration
+
+    key = preview_key(spec, render_settings, fmt)
+    preview_dir = render_utils.get_preview_dir(project_id)
+    output_path = os.path.join(preview_dir, f"{spec['id']}_{key[:16]}.{fmt}")
+    return spec, render_settings, output_path
+
+
+def preview_url(project_id: str, output_path: str) -> str:
+    """Return the ``/media/...`` URL for a preview file."""
+    return (
+        f"/media/projects/{project_id}/previews/"
+        f"{os.path.basename(output_path)}"
+    )
+
+
+def get_cached_preview(segment, fmt: str = DEFAULT_PREVIEW_FORMAT) -> Optional[str]:
+    """Return the path of an up-to-date preview for *segment*, or ``None``."""
+    _spec, _settings, output_path = _prepare_preview(segment, fmt)
+    if os.path.isfile(output_path) and os.path.getsize(output_path) > 0:
+        return output_path
+    return None
+
+
+def _remove_stale_previews(preview_dir: str, segment_id: str, keep: str) -> None:
+    """Delete older previews of *segment_id* in every format."""
+    prefix = f"{segment_id}_"
+    for name in os.listdir(preview_dir):
+        if not name.startswith(prefix):
+            continue
+        path = os.path.join(preview_dir, name)
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError as exc:
+            logger.warning("Could not remove stale preview %s: %s", path, exc)
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def _write_webp(clip, output_path: str, fps: int) -> None:
+    """Encode *clip* as a looping, silent animated WebP."""
+    from PIL import Image as PILImage
+
+    frames = [
+        PILImage.fromarray(frame)
+        for frame in clip.iter_frames(fps=fps, dtype="uint8")
+    ]
+    if not frames:
+        raise RuntimeError("Preview clip produced no frames.")
+
+    frames[0].save(
+        output_path,
+        format="WEBP",
+        save_all=True,
+        append_images=frames[1:],
+        duration=int(round(1000 / fps)),
+        loop=0,
+        quality=WEBP_QUALITY,
+    )
+
+
+def _write_mp4(clip, spec: dict, render_settings: dict, output_path: str) -> None:
+    """Encode *clip* with the segment's narration as a small H.264 MP4."""
+    try:
+        from moviepy import AudioFileClip  # type: ignore[import-untyped]
+    except ImportError:
+        from moviepy.editor import AudioFileClip  # type: ignore[import-untyped]
+
+    audio_clip = AudioFileClip(spec["audio_path"])
+    try:
+        clip.with_audio(audio_clip).write_videofile(
+            output_path,
+            codec="libx264",
+            audio_codec="aac",
+            preset=render_settings["x264_preset"],
+            ffmpeg_params=["-crf", str(render_settings["crf"])],
+            fps=render_settings["fps"],
+            temp_audiofile=f"{output_path}.temp_audio.m4a",
+            logger=None,
+        )
+    finally:
+        audio_clip.close()
+
+
+def render_segment_preview(segment_id: str, fmt: str = DEFAULT_PREVIEW_FORMAT) -> dict:
+    """Render (or reuse) the low-resolution preview of one segment.
+
+    Args:
+        segment_id: Primary key of the ``Segment`` to preview.
+        fmt: ``"mp4"`` or ``"webp"``.
+
+    Returns:
+        dict with ``segment_id``, ``format``, ``path``, ``url``,
+        ``cached`` (``True`` when an existing file was reused),
+        ``resolution``, ``fps``, ``duration`` and ``warnings``.
+
+    Raises:
+        ValueError: For an unknown format or empty audio.
+        RuntimeError: If the Ken Burns clip or the encode fails.
+    """
+    from api.models import Segment  # noqa: E402 — deferred import
+
+    segment = Segment.objects.select_related("project").get(pk=segment_id)
+    spec, render_settings, output_path = _prepare_preview(segment, fmt)
+    project_id = spec["project_id"]
+
+    result = {
+        "segment_id": spec["id"],
+        "format": fmt,
+        "path": output_path,
+        "url": preview_url(project_id, output_path),
+        "cached": False,
+        "resolution": render_settings["resolution"],
+        "fps": render_settings["fps"],
+        "duration": spec["visual_duration"],
+        "warnings": [],
+    }
+
+    if os.path.isfile(output_path) and os.path.getsize(output_path) > 0:
+        result["cached"] = True
+        return result
+
+    logo_overlay = None
+    if render_settings["logo"] is not None:
+        try:
+            logo_overlay = build_logo_overlay(
+                render_settings["logo"], render_settings["resolution"],
+            )
+        except Exception as logo_err:
+            logger.warning("Preview logo could not be loaded: %s", logo_err)
+            result["warnings"].append(f"Logo watermark skipped: {logo_err}")
+
+    spec["label"] = f"Preview of segment {spec['id']}"
+    clip, warnings = build_segment_clip(spec, render_settings, logo_overlay)
+    result["warnings"].extend(warnings)
+
+    # Encode to a temporary name so a half-written file is never served.
+    partial_path = f"{output_path}.partial.{fmt}"
+    try:
+        if fmt == PREVIEW_FORMAT_WEBP:
+            _write_webp(clip, partial_path, render_settings["fps"])
+        else:
+            _write_mp4(clip, spec, render_settings, partial_path)
+        os.replace(partial_path, output_path)
+    finally:
+        clip.close()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    _remove_stale_previews(os.path.dirname(output_path), spec["id"], output_path)
+
+    logger.info(
+        "Preview rendered for segment %s: %s (%dx%d @ %d fps)",
+        spec["id"], os.path.basename(output_path),
+        render_settings["resolution"][0], render_settings["resolution"][1],
+        render_settings["fps"],
+    )
+    return result
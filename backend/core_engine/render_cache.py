@@ -0,0 +1,264 @@
+"""
+StoryFlow Segment Render Cache.
+
+Content-addressed store for encoded timeline pieces (see
+:mod:`core_engine.parallel_renderer`).  A piece's cache key hashes
+everything that influences its pixels:
+
+* the image and audio **bytes** of every segment it shows,
+* ``sequence_index`` (selects the Ken Burns pan direction),
+* the segment text and subtitle settings,
+* resolution, FPS, zoom intensity, inter-segment silence and the
+  quality preset's resampling filter,
+* the logo watermark settings (including the logo file bytes),
+* the piece's local frame range and the encoder parameters.
+
+Encoded pieces are stored as ``<key>.mp4`` under
+``MEDIA_ROOT/projects/<id>/cache/``.  When only one segment's text
+changes, every piece that does not show that segment keeps its key and
+is reused verbatim by the concat stitch — only the changed segment's
+body and its two crossfades are re-encoded.
+
+The cache is bounded by total size; the least recently used files
+(by modification time, refreshed on every hit) are evicted first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+from core_engine import render_utils
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every existing cache entry after a change to the
+# rendering pipeline that alters output pixels.
+CACHE_VERSION: int = 4
+
+_HASH_CHUNK: int = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SegmentRenderCache:
+    """Size-bounded, LRU-evicted cache of encoded pieces for one project.
+
+    Args:
+        project_id: Project whose cache directory is used.
+        max_bytes: Upper bound on the total size of cached files.
+            ``0`` disables the cache (every lookup misses, nothing is
+            stored).
+    """
+
+    def __init__(self, project_id: str, max_bytes: int):
+        self.project_id = str(project_id)
+        self.max_bytes = max(int(max_bytes), 0)
+        self.cache_dir = (
+            render_utils.get_cache_dir(self.project_id) if self.enabled else None
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._file_hashes: dict[str, str] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def _hash_cached(self, path: str) -> str:
+        """Hash a file once per render, even if several pieces use it."""
+        if path not in self._file_hashes:
+            self._file_hashes[path] = hash_file(path)
+        return self._file_hashes[path]
+
+    def segment_fingerprint(self, segment: dict, render_settings: dict) -> dict:
+        """Collect the inputs that determine a segment's rendered frames."""
+        logo = render_settings.get("logo")
+        logo_fp = None
+        if logo:
+            logo_fp = {
+                "file": self._hash_cached(logo["path"]),
+                "scale": logo["scale"],
+                "position": logo["position"],
+                "opacity": logo["opacity"],
+                "margin": logo["margin"],
+            }
+
+        subtitles_on = bool(render_settings["subtitles_enabled"])
+        return {
+            "image": self._hash_cached(segment["image_path"]),
+            "audio": self._hash_cached(segment["audio_path"]),
+            "sequence_index": segment["sequence_index"],
+            "visual_duration": round(segment["visual_duration"], 6),
+            "text": segment.get("text_content", "") if subtitles_on else "",
+            "subtitles": {
+                "enabled": subtitles_on,
+                "font": render_settings["subtitle_font"],
+                "color": render_settings["subtitle_color"],
+                "size": render_settings["subtitle_font_size"],
+                "position": render_settings["subtitle_position"],
+                "stroke_width": render_settings.get("subtitle_stroke_width"),
+            },
+            "logo": logo_fp,
+        }
+
+    def piece_key(
+        self,
+        piece: dict,
+        segments: list[dict],
+        render_settings: dict,
+        encoder: dict,
+    ) -> str:
+        """Return the content hash identifying an encoded piece."""
+        payload = {
+            "version": CACHE_VERSION,
+            "kind": piece["kind"],
+            "start": piece["start"],
+            "end": piece["end"],
+            "resolution": list(render_settings["resolution"]),
+            "fps": render_settings["fps"],
+            "zoom": render_settings["zoom_intensity"],
+            "resample": render_settings.get("resample"),
+            "easing": render_settings.get("ken_burns_easing"),
+            "subpixel": render_settings.get("subpixel"),
+            "encoder": encoder,
+            "segments": [
+                self.segment_fingerprint(seg, render_settings)
+                for seg in segments
+            ],
+        }
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mp4")
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the cached file for *key*, or ``None`` on a miss.
+
+        A hit refreshes the file's modification time so it becomes the
+        most recently used entry.
+        """
+        if not self.enabled:
+            self.misses += 1
+            return None
+
+        path = self._path_for(key)
+        if os.path.isfile(path) and os.path.getsize(path) > 0:
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+            self.hits += 1
+            return path
+
+        self.misses += 1
+        return None
+
+    def store(self, key: str, source_path: str) -> str:
+        """Move a freshly encoded piece into the cache.
+
+        Returns the path the piece should be read from afterwards — the
+        cache entry, or *source_path* unchanged when caching is off.
+        """
+        if not self.enabled:
+            return source_path
+
+        target = self._path_for(key)
+        try:
+            os.replace(source_path, target)
+        except OSError as exc:
+            logger.warning("Could not store piece in render cache: %s", exc)
+            return source_path
+        return target
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def evict(self, keep: Optional[set[str]] = None) -> int:
+        """Delete least recently used entries until under ``max_bytes``.
+
+        Args:
+            keep: Keys that must not be evicted (e.g. the pieces of the
+                render that just finished).
+
+        Returns:
+            Number of files removed.
+        """
+        if not self.enabled or not os.path.isdir(self.cache_dir):
+            return 0
+
+        keep = keep or set()
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".mp4"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total += stat.st_size
+            entries.append((stat.st_mtime, stat.st_size, name[:-4], path))
+
+        removed = 0
+        for _mtime, size, key, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key in keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError as exc:
+                logger.warning("Could not evict cache file %s: %s", path, exc)
+
+        if removed:
+            logger.info(
+                "Render cache for project %s: evicted %d file(s), %.1f MB kept.",
+                self.project_id, removed, total / (1024 * 1024),
+            )
+        self.evicted += removed
+        return removed
+
+    def size_bytes(self) -> int:
+        """Return the current total size of the cache directory."""
+        if not self.enabled or not os.path.isdir(self.cache_dir):
+            return 0
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            try:
+                total += os.path.getsize(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+        return total
+
+    def report(self) -> dict:
+        """Summarise this render's cache activity for the result dict."""
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+            "size_bytes": self.size_bytes(),
+        }
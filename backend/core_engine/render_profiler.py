@@ -0,0 +1,360 @@
+"""
+StoryFlow Render Profiler.
+
+Built-in instrumentation for a render.  The progress percentage only
+says *how far* a render is; the profiler records *where the time
+goes*:
+
+* **Phases** — wall time, CPU time, number of calls and peak resident
+  memory for each named phase (:data:`PHASE_SETUP`, image loading, Ken
+  Burns resampling, subtitle rasterisation, audio mixing, the export
+  itself, …).  Phases may nest and may run on several threads at once
+  (e.g. the next segment is prepared on a prefetch thread while the
+  current one is exported).
+* **Segments** — the same wall / CPU figures broken down per segment.
+* **Export** — frames written, frames per second, and how the frame
+  pipe spent its time: drawing frames (Ken Burns crop + compositing),
+  waiting for producers, and blocked on FFmpeg (x264).
+
+CPU time is process-wide (``os.times()``, including FFmpeg child
+processes once they have exited), so the CPU figures of phases that
+overlap in time overlap too.  Peak memory is sampled by a background
+thread (see :class:`core_engine.render_utils.PeakRSSSampler`).
+
+The report is a plain JSON-serialisable dict: it is returned in the
+render result as ``profile`` and written as :data:`RENDER_REPORT_NAME`
+next to ``final.mp4``.  While the render runs, ``/api/tasks/<id>/status/``
+shows the fixed-size :meth:`RenderProfiler.summary` instead (current
+phase, totals and the live export frame rate).
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Optional
+
+from core_engine.render_utils import PeakRSSSampler, current_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+# File name of the persisted report, next to the rendered MP4
+RENDER_REPORT_NAME: str = "render_report.json"
+
+# Phase names
+PHASE_SETUP = "setup"
+PHASE_AUDIO_PROBE = "audio_probe"
+PHASE_IMAGE_LOAD = "image_load"
+PHASE_KEN_BURNS = "ken_burns"
+PHASE_SUBTITLES = "subtitles"
+PHASE_AUDIO_MIX = "audio_mix"
+PHASE_EXPORT = "export"
+PHASE_PIECES = "piece_encode"
+PHASE_STITCH = "stitch"
+
+# Memory sampling interval of the profiler's sampler thread (seconds)
+SAMPLE_INTERVAL: float = 0.05
+
+_MB = 1024 * 1024
+
+
+def _cpu_seconds() -> float:
+    """CPU time of this process and its waited-for children."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _round(value: float) -> float:
+    return round(value, 3)
+
+
+def profile_phase(profiler: Optional["RenderProfiler"], name: str,
+                  segment: Optional[int] = None):
+    """``profiler.phase(name, segment)``, or a no-op without a profiler."""
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name, segment)
+
+
+class _PhaseSampler(PeakRSSSampler):
+    """RSS sampler that also raises the peak of every open phase."""
+
+    def __init__(self, profiler: "RenderProfiler", interval: float):
+        super().__init__(interval)
+        self._profiler = profiler
+
+    def sample(self) -> int:
+        rss = super().sample()
+        self._profiler._observe(rss)
+        return rss
+
+
+class RenderProfiler:
+    """
+    Collects per-phase and per-segment timings of one render.
+
+    Usage::
+
+        profiler = RenderProfiler().start()
+        with profiler.phase(PHASE_KEN_BURNS, segment=1):
+            ...
+        profiler.record_export(frames, seconds, stats)
+        report = profiler.stop()
+
+    All methods are thread-safe.  A profiler that was never started
+    still records timings, just without memory sampling.
+
+    Attributes:
+        output_path: The MP4 the report belongs to, set by the renderer
+            once known (used to place the report of a failed render).
+    """
+
+    def __init__(self, sample_interval: float = SAMPLE_INTERVAL):
+        self._lock = threading.Lock()
+        self._sampler = _PhaseSampler(self, sample_interval)
+        self._running = False
+        self._open: list[dict] = []
+        self._started_at = time.time()
+        self._t0 = time.perf_counter()
+        self._cpu0 = _cpu_seconds()
+        self._wall: Optional[float] = None
+        self._cpu: Optional[float] = None
+        self._frames_done = 0
+        self.output_path: Optional[str] = None
+
+        self.phases: dict[str, dict] = {}
+        self.segments: dict[int, dict] = {}
+        self.export: dict = {}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> "RenderProfiler":
+        """Start memory sampling (idempotent)."""
+        with self._lock:
+            if self._running:
+                return self
+            self._running = True
+        self._sampler.start()
+        return self
+
+    def stop(self) -> dict:
+        """Stop sampling, freeze the totals and return :meth:`report`."""
+        with self._lock:
+            running = self._running
+            self._running = False
+        if running:
+            self._sampler.stop()
+        if self._wall is None:
+            self._wall = time.perf_counter() - self._t0
+            self._cpu = _cpu_seconds() - self._cpu0
+        return self.report()
+
+    @property
+    def peak_mb(self) -> float:
+        """Peak resident memory seen so far, in MB."""
+        return self._sampler.peak_mb
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _observe(self, rss: int) -> None:
+        with self._lock:
+            for entry in self._open:
+                if rss > entry["peak"]:
+                    entry["peak"] = rss
+
+    def begin(self, name: str, segment: Optional[int] = None) -> dict:
+        """Open phase *name*; pass the returned token to :meth:`end`."""
+        token = {
+            "name": name,
+            "segment": segment,
+            "wall": time.perf_counter(),
+            "cpu": _cpu_seconds(),
+            "peak": current_rss_bytes(),
+        }
+        with self._lock:
+            self._open.append(token)
+        return token
+
+    def end(self, token: dict) -> None:
+        """Close a phase opened by :meth:`begin`."""
+        wall = time.perf_counter() - token["wall"]
+        cpu = _cpu_seconds() - token["cpu"]
+        self._observe(current_rss_bytes())
+        with self._lock:
+            if token in self._open:
+                self._open.remove(token)
+        self.add(token["name"], wall, cpu, token["peak"], token["segment"])
+
+    @contextmanager
+    def phase(self, name: str, segment: Optional[int] = None):
+        """Time the ``with`` block as one call of phase *name*."""
+        token = self.begin(name, segment)
+        try:
+            yield
+        finally:
+            self.end(token)
+
+    def add(
+        self,
+        name: str,
+        wall_seconds: float,
+        cpu_seconds: Optional[float] = None,
+        peak_bytes: int = 0,
+        segment: Optional[int] = None,
+    ) -> None:
+        """Record an externally measured call of phase *name*.
+
+        Used for work done in other processes (parallel piece workers),
+        whose CPU time and memory the parent cannot sample.
+        """
+        with self._lock:
+            stats = self.phases.setdefault(name, {
+                "calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0,
+                "peak_rss_bytes": 0,
+            })
+            stats["calls"] += 1
+            stats["wall_seconds"] += wall_seconds
+            stats["cpu_seconds"] += cpu_seconds or 0.0
+            stats["peak_rss_bytes"] = max(stats["peak_rss_bytes"], peak_bytes)
+
+            if segment is not None:
+                seg = self.segments.setdefault(segment, {"phases": {}})
+                seg_stats = seg["phases"].setdefault(name, {
+                    "wall_seconds": 0.0, "cpu_seconds": 0.0,
+                })
+                seg_stats["wall_seconds"] += wall_seconds
+                seg_stats["cpu_seconds"] += cpu_seconds or 0.0
+
+    def label_segment(self, segment: int, label: str, **info) -> None:
+        """Attach a label (and e.g. its duration) to a segment's entry."""
+        with self._lock:
+            seg = self.segments.setdefault(segment, {"phases": {}})
+            seg["label"] = label
+            seg.update(info)
+
+    def record_export(self, frames: int, seconds: float,
+                      pipe_stats: Optional[dict] = None) -> None:
+        """Record the export's frame count and speed.
+
+        Args:
+            frames: Frames in the output video.
+            seconds: Wall time of the export.
+            pipe_stats: Optional frame-pipe breakdown filled by
+                :func:`core_engine.frame_pipe.encode_frames`.
+        """
+        export = {
+            "frames": frames,
+            "seconds": _round(seconds),
+            "fps": round(frames / seconds, 2) if seconds > 0 else None,
+        }
+        for key, value in (pipe_stats or {}).items():
+            export[key] = _round(value) if isinstance(value, float) else value
+        with self._lock:
+            self.export = export
+
+    def note_frames(self, frames_done: int) -> None:
+        """Record export progress, for the live frame rate of :meth:`summary`."""
+        self._frames_done = frames_done
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def summary(self) -> dict:
+        """Return a small running snapshot for progress updates.
+
+        Unlike :meth:`report`, its size does not grow with the number
+        of phases or segments.  ``fps`` is the export's frame rate so
+        far (or its final rate once recorded), ``None`` before it.
+        """
+        wall = self._wall if self._wall is not None else time.perf_counter() - self._t0
+        cpu = self._cpu if self._cpu is not None else _cpu_seconds() - self._cpu0
+        with self._lock:
+            current = self._open[-1]["name"] if self._open else None
+            export_started = next(
+                (t["wall"] for t in self._open if t["name"] == PHASE_EXPORT), None,
+            )
+            fps = self.export.get("fps")
+        frames = self._frames_done
+        if fps is None and export_started is not None and frames:
+            elapsed = time.perf_counter() - export_started
+            fps = round(frames / elapsed, 2) if elapsed > 0 else None
+
+        return {
+            "started_at": self._started_at,
+            "running": self._wall is None,
+            "current_phase": current,
+            "wall_seconds": _round(wall),
+            "cpu_seconds": _round(cpu),
+            "peak_rss_mb": self.peak_mb,
+            "frames": frames,
+            "fps": fps,
+        }
+
+    def report(self) -> dict:
+        """Return the JSON-serialisable report (a snapshot while running)."""
+        wall = self._wall if self._wall is not None else time.perf_counter() - self._t0
+        cpu = self._cpu if self._cpu is not None else _cpu_seconds() - self._cpu0
+        with self._lock:
+            phases = [
+                {
+                    "name": name,
+                    "calls": stats["calls"],
+                    "wall_seconds": _round(stats["wall_seconds"]),
+                    "cpu_seconds": _round(stats["cpu_seconds"]),
+                    "peak_rss_mb": round(stats["peak_rss_bytes"] / _MB, 1),
+                }
+                for name, stats in self.phases.items()
+            ]
+            segments = []
+            for index in sorted(self.segments):
+                seg = self.segments[index]
+                entry = {k: v for k, v in seg.items() if k != "phases"}
+                entry["index"] = index
+                entry["phases"] = {
+                    name: {k: _round(v) for k, v in stats.items()}
+                    for name, stats in seg["phases"].items()
+                }
+                entry["wall_seconds"] = _round(
+                    sum(s["wall_seconds"] for s in seg["phases"].values())
+                )
+                segments.append(entry)
+            current = self._open[-1]["name"] if self._open else None
+            export = dict(self.export)
+
+        return {
+            "started_at": self._started_at,
+            "running": self._wall is None,
+            "current_phase": current,
+            "wall_seconds": _round(wall),
+            "cpu_seconds": _round(cpu),
+            "peak_rss_mb": self.peak_mb,
+            "phases": phases,
+            "segments": segments,
+            "export": export,
+        }
+
+    def write_report(self, output_path: str, **extra) -> Optional[str]:
+        """Write the report (plus *extra* keys) next to *output_path*.
+
+        Returns:
+            Path of the JSON file, or ``None`` if it could not be
+            written — a missing report never fails a render.
+        """
+        path = os.path.join(os.path.dirname(output_path), RENDER_REPORT_NAME)
+        report = self.report()
+        report.update(extra)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, default=str)
+        except OSError as exc:
+            logger.warning("Could not write render report %s: %s", path, exc)
+            return None
+        return path
@@ -0,0 +1,97 @@
+"""
+StoryFlow Render Quality Presets.
+
+A single ``render_quality`` name (``"draft"``, ``"standard"`` or
+``"final"``) selects every speed/quality trade-off of the pipeline
+together:
+
+* **resample** — Pillow filter used by the Ken Burns engine to resample
+  the source image (LANCZOS > BICUBIC > BILINEAR in quality and cost).
+* **x264_preset / crf** — encoder speed preset and constant rate factor
+  passed to libx264 (lower CRF = higher quality, larger file).
+* **resolution_scale** — multiplier applied to the configured output
+  resolution (draft renders at half size).
+* **subtitle_stroke_width** — outline width of subtitle text in output
+  pixels; the outline is the most expensive part of rasterising a
+  caption.
+* **subpixel** — whether the Ken Burns camera blends fractional pixel
+  offsets (smooth slow pans) or snaps to whole pixels (a plain slice
+  copy per frame).
+
+The preset is resolved once per render by
+:func:`core_engine.video_renderer.load_render_settings`.
+"""
+
+import logging
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+RENDER_QUALITY_DRAFT = "draft"
+RENDER_QUALITY_STANDARD = "standard"
+RENDER_QUALITY_FINAL = "final"
+
+DEFAULT_RENDER_QUALITY: str = RENDER_QUALITY_FINAL
+
+RENDER_QUALITY_PRESETS: dict[str, dict] = {
+    RENDER_QUALITY_DRAFT: {
+        "resample": Image.Resampling.BILINEAR,
+        "x264_preset": "ultrafast",
+        "crf": 28,
+        "resolution_scale": 0.5,
+        "subtitle_stroke_width": 1,
+        "subpixel": False,
+    },
+    RENDER_QUALITY_STANDARD: {
+        "resample": Image.Resampling.BICUBIC,
+        "x264_preset": "veryfast",
+        "crf": 23,
+        "resolution_scale": 1.0,
+        "subtitle_stroke_width": 2,
+        "subpixel": True,
+    },
+    RENDER_QUALITY_FINAL: {
+        "resample": Image.Resampling.LANCZOS,
+        "x264_preset": "medium",
+        "crf": 18,
+        "resolution_scale": 1.0,
+        "subtitle_stroke_width": 2,
+        "subpixel": True,
+    },
+}
+
+
+def get_quality_preset(name: str | None) -> dict:
+    """Return a copy of the preset called *name*.
+
+    Unknown or empty names fall back to :data:`DEFAULT_RENDER_QUALITY`
+    with a warning, so a bad stored value never blocks a render.
+
+    Returns:
+        dict with ``name`` plus every key of the preset.
+    """
+    key = (name or "").strip().lower()
+    if key not in RENDER_QUALITY_PRESETS:
+        if key:
+            logger.warning(
+                "Unknown render_quality '%s'. Falling back to '%s'.",
+                name, DEFAULT_RENDER_QUALITY,
+            )
+        key = DEFAULT_RENDER_QUALITY
+    preset = dict(RENDER_QUALITY_PRESETS[key])
+    preset["name"] = key
+    return preset
+
+
+def scale_resolution(resolution: tuple[int, int], scale: float) -> tuple[int, int]:
+    """Scale ``(width, height)`` keeping both dimensions even.
+
+    libx264 with ``yuv420p`` requires even frame dimensions.
+    """
+    width, height = resolution
+    if scale == 1.0:
+        return (width, height)
+    scaled_w = max(int(round(width * scale / 2)) * 2, 2)
+    scaled_h = max(int(round(height * scale / 2)) * 2, 2)
+    return (scaled_w, scaled_h)
@@ -3,9 +3,10 @@ StoryFlow Render Utilities Module.
 
 Provides utility functions for the video rendering pipeline including:
 - FFmpeg availability checking
-- Image resizing to target resolutions (cover mode)
+- Image resizing to target resolutions (cover mode, cached)
 - Output path management for rendered videos
 - Temporary file cleanup during rendering
+- Resident memory (RSS) measurement of the rendering process
 
 This module is the central hub for all rendering helper functions
 used throughout Phase 04 — The Vision.
@@ -18,12 +19,15 @@ import os
 import platform
 import shutil
 import subprocess
+import threading
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 from PIL import Image
 
+from core_engine.image_cache import get_image_cache, image_key
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -152,7 +156,9 @@ def resize_image_to_resolution(
 
     Cover mode scales the image so the shorter dimension matches the
     target, then centre-crops the longer dimension.  The returned
-    array always has shape ``(height, width, 3)`` in RGB.
+    array always has shape ``(height, width, 3)`` in RGB.  Results are
+    shared through the process-wide prepared-image cache
+    (:mod:`core_engine.image_cache`) and are therefore read-only.
 
     Args:
         image_path: Filesystem path to the source image.
@@ -177,6 +183,14 @@ def resize_image_to_resolution(
     if not img_path.exists():
         raise FileNotFoundError(f"Image not found: {image_path}")
 
+    return get_image_cache().get_or_prepare(
+        image_key(image_path, "cover", int(width), int(height)),
+        lambda: _cover_resize(image_path, width, height),
+    )
+
+
+def _cover_resize(image_path: str, width: int, height: int) -> np.ndarray:
+    """Uncached body of :func:`resize_image_to_resolution`."""
     logger.debug("Loading image for resize: %s → %dx%d", image_path, width, height)
 
     try:
@@ -270,6 +284,91 @@ def get_output_path(project_id: str) -> str:
     return str(output_path)
 
 
+def _get_project_media_dir(project_id: str, name: str) -> str:
+    """Return (and create) ``<MEDIA_ROOT>/projects/<project_id>/<name>/``.
+
+    Raises:
+        ValueError: If ``MEDIA_ROOT`` is not configured.
+    """
+    from django.conf import settings  # noqa: E402 — deferred import
+
+    media_root = getattr(settings, "MEDIA_ROOT", None)
+    if not media_root:
+        raise ValueError(
+            "MEDIA_ROOT is not configured in Django settings. "
+            f"This setting is required for render {name} path resolution."
+        )
+
+    path = Path(media_root) / "projects" / str(project_id) / name
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
+def get_temp_dir(project_id: str) -> str:
+    """
+    Return a scratch directory for intermediate render files.
+
+    The directory lives next to the project's output folder::
+
+        <MEDIA_ROOT>/projects/<project_id>/temp/
+
+    Callers are expected to remove it with :func:`cleanup_temp_files`
+    once the render finishes (successfully or not).
+
+    Args:
+        project_id: The unique identifier of the project.
+
+    Returns:
+        str: Absolute path to the (existing) temporary directory.
+
+    Raises:
+        ValueError: If ``MEDIA_ROOT`` is not configured.
+    """
+    return _get_project_media_dir(project_id, "temp")
+
+
+def get_cache_dir(project_id: str) -> str:
+    """
+    Return the persistent per-project render cache directory::
+
+        <MEDIA_ROOT>/projects/<project_id>/cache/
+
+    Unlike the temp directory this one survives between renders; its
+    size is bounded by :class:`core_engine.render_cache.SegmentRenderCache`.
+
+    Args:
+        project_id: The unique identifier of the project.
+
+    Returns:
+        str: Absolute path to the (existing) cache directory.
+
+    Raises:
+        ValueError: If ``MEDIA_ROOT`` is not configured.
+    """
+    return _get_project_media_dir(project_id, "cache")
+
+
+def get_preview_dir(project_id: str) -> str:
+    """
+    Return the per-project directory for segment preview clips::
+
+        <MEDIA_ROOT>/projects/<project_id>/previews/
+
+    Holds at most one preview per segment and format; stale previews
+    are replaced by :mod:`core_engine.preview_renderer`.
+
+    Args:
+        project_id: The unique identifier of the project.
+
+    Returns:
+        str: Absolute path to the (existing) preview directory.
+
+    Raises:
+        ValueError: If ``MEDIA_ROOT`` is not configured.
+    """
+    return _get_project_media_dir(project_id, "previews")
+
+
 # ---------------------------------------------------------------------------
 # Temporary file cleanup
 # ---------------------------------------------------------------------------
@@ -324,6 +423,103 @@ def cleanup_temp_files(temp_dir: str) -> None:
         logger.warning("Failed to clean up temp directory %s: %s", temp_dir, exc)
 
 
+# ---------------------------------------------------------------------------
+# Resident memory measurement
+# ---------------------------------------------------------------------------
+
+
+def current_rss_bytes() -> int:
+    """
+    Return the current resident set size of this process in bytes.
+
+    Reads ``/proc/self/statm`` where available (Linux).  Elsewhere the
+    lifetime peak from ``resource.getrusage`` is returned instead, and
+    ``0`` when neither source exists (e.g. Windows without psutil).
+    """
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    """
+    Return the lifetime peak RSS of this process in bytes (0 if unknown).
+
+    ``ru_maxrss`` is reported in kilobytes on Linux and bytes on macOS.
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak if platform.system() == "Darwin" else peak * 1024)
+
+
+class PeakRSSSampler:
+    """
+    Track the peak resident memory of a block of work.
+
+    The process-lifetime peak (``ru_maxrss``) is useless in a
+    long-running server, so a daemon thread samples
+    :func:`current_rss_bytes` every *interval* seconds between
+    :meth:`start` and :meth:`stop` (or inside a ``with`` block).
+
+    Attributes:
+        peak_bytes: Highest RSS observed so far.
+        start_bytes: RSS when sampling started.
+    """
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.start_bytes = 0
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> int:
+        """Take one sample now and return it."""
+        rss = current_rss_bytes()
+        if rss > self.peak_bytes:
+            self.peak_bytes = rss
+        return rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self) -> "PeakRSSSampler":
+        self.start_bytes = self.sample()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="rss-sampler", daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> int:
+        """Stop sampling and return the peak in bytes."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.sample()
+        return self.peak_bytes
+
+    @property
+    def peak_mb(self) -> float:
+        return round(self.peak_bytes / (1024 * 1024), 1)
+
+    def __enter__(self) -> "PeakRSSSampler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
 # ---------------------------------------------------------------------------
 # ImageMagick availability check
 # ---------------------------------------------------------------------------
@@ -11,6 +11,18 @@ orchestrates the full pipeline:
 
     chunk_text → calculate_subtitle_timing → generate_subtitle_clips
 
+The renderer uses the sprite path instead, via
+:func:`create_subtitle_overlay`:
+
+    chunk_text → calculate_subtitle_timing → generate_subtitle_sprites
+
+Each chunk is rasterised once with Pillow (text plus stroke) into a
+tight RGBA sprite, cached by its styling in :func:`rasterize_subtitle`,
+and a :class:`SubtitleOverlay` alpha-blends the sprite that is active
+at time *t* straight into the frame buffer.  Only the sprite's own
+pixels are touched, so compositing cost scales with the visible text
+rather than with a full-frame layer per chunk.
+
 Subsequent tasks populate the algorithm implementations:
 
 - **Task 05.01.02** — ``chunk_text``
@@ -20,11 +32,15 @@ Subsequent tasks populate the algorithm implementations:
 
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
 import re
 from typing import Optional
 
+import numpy as np
 from moviepy import TextClip
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 # ── Logger ──────────────────────────────────────────────────────────────────
 
@@ -56,6 +72,12 @@ DEFAULT_STROKE_COLOR: str = "#000000"
 DEFAULT_STROKE_WIDTH: int = 2
 """Stroke width in pixels."""
 
+MAX_SUBTITLE_HEIGHT_RATIO: float = 0.40
+"""Subtitles taller than this fraction of the frame are downscaled."""
+
+SPRITE_CACHE_SIZE: int = 512
+"""Number of rasterised subtitle sprites kept by :func:`rasterize_subtitle`."""
+
 
 # ── Function Stubs (populated by Tasks 05.01.02–04) ────────────────────────
 
@@ -225,6 +247,7 @@ def generate_subtitle_clips(
     color: str,
     font_size: int | None = None,
     position: str = "bottom",
+    stroke_width: int = DEFAULT_STROKE_WIDTH,
 ) -> list[TextClip]:
     """Create styled ``TextClip`` objects for each subtitle chunk.
 
@@ -250,6 +273,9 @@ def generate_subtitle_clips(
     position:
         Vertical anchor — ``"bottom"`` (default), ``"center"``, or
         ``"top"``.
+    stroke_width:
+        Outline width in pixels (``0`` disables the outline).  Selected
+        by the render quality preset.
 
     Returns
     -------
@@ -276,7 +302,7 @@ def generate_subtitle_clips(
     # BEFORE Pillow rasterises the text.  This prevents the stroke
     # outline on descenders (g, y, p, q, j) from being clipped by
     # the tight bounding box that ``method="caption"`` computes.
-    pad_px = max(DEFAULT_STROKE_WIDTH * 4, effective_font_size // 4, 12)
+    pad_px = max(stroke_width * 4, effective_font_size // 4, 12)
 
     for chunk, (start_time, duration) in zip(chunks, timings):
         try:
@@ -294,8 +320,8 @@ def generate_subtitle_clips(
                 font_size=effective_font_size,
                 font=font,
                 color=color,
-                stroke_color=DEFAULT_STROKE_COLOR,
-                stroke_width=DEFAULT_STROKE_WIDTH,
+                stroke_color=DEFAULT_STROKE_COLOR if stroke_width > 0 else None,
+                stroke_width=stroke_width,
                 method="caption",
                 size=(text_width, None),
                 text_align="center",
@@ -374,6 +400,7 @@ def create_subtitles_for_segment(
     color: str,
     font_size: int | None = None,
     position: str = "bottom",
+    stroke_width: int = DEFAULT_STROKE_WIDTH,
 ) -> list[TextClip]:
     """Generate subtitle clips for a single video segment.
 
@@ -401,6 +428,9 @@ def create_subtitles_for_segment(
         Explicit font size in pixels (``None`` → auto from resolution).
     position:
         Vertical position — ``"bottom"``, ``"center"``, or ``"top"``.
+    stroke_width:
+        Outline width in pixels, forwarded to
+        :func:`generate_subtitle_clips`.
 
     Returns
     -------
@@ -422,6 +452,7 @@ def create_subtitles_for_segment(
     clips = generate_subtitle_clips(
         chunks, timings, resolution, font, color,
         font_size=font_size, position=position,
+        stroke_width=stroke_width,
     )
 
     logger.info(
@@ -432,3 +463,326 @@ def create_subtitles_for_segment(
         position,
     )
     return clips
+
+
+# ── Sprite Rasterizer ──────────────────────────────────────────────────────
+
+
+def _subtitle_padding(font_size: int, stroke_width: int) -> int:
+    """Vertical padding (px per side) around a subtitle's text.
+
+    Matches the ``margin=`` the ``TextClip`` path allocates so both
+    paths place subtitles identically and descender strokes are never
+    clipped.
+    """
+    return max(stroke_width * 4, font_size // 4, 12)
+
+
+def _load_font(font: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load *font* at *font_size*, falling back to Pillow's default face."""
+    try:
+        return ImageFont.truetype(font, font_size)
+    except (OSError, TypeError, ValueError) as exc:
+        logger.warning(
+            "Could not load subtitle font %s (%s) — using Pillow default.",
+            font, exc,
+        )
+        return ImageFont.load_default(font_size)
+
+
+def _wrap_words(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    max_width: int,
+    stroke_width: int,
+) -> list[str]:
+    """Greedily wrap *text* into lines no wider than *max_width* px."""
+    lines: list[str] = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        width = font.getlength(candidate) + 2 * stroke_width
+        if current and width > max_width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+@functools.lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def rasterize_subtitle(
+    text: str,
+    font: str,
+    font_size: int,
+    color: str,
+    max_width: int,
+    stroke_width: int = DEFAULT_STROKE_WIDTH,
+    max_height: int | None = None,
+) -> np.ndarray:
+    """Render one subtitle chunk to a tight RGBA sprite.
+
+    Text is word-wrapped to *max_width*, centre-aligned, and drawn with
+    a :data:`DEFAULT_STROKE_COLOR` outline of *stroke_width* pixels.
+    The sprite is as wide as the widest line and padded vertically by
+    :func:`_subtitle_padding`.  Sprites taller than *max_height* are
+    downscaled (aspect preserved).
+
+    Results are memoised on every argument, so the same chunk in the
+    same style is rasterised once per process — across segments,
+    previews and re-renders.
+
+    Parameters
+    ----------
+    text:
+        The subtitle string.
+    font:
+        Path to a ``.ttf`` / ``.otf`` font file.
+    font_size:
+        Font size in pixels.
+    color:
+        Text colour (any Pillow colour string, e.g. ``"#FFFFFF"``).
+    max_width:
+        Wrap width in pixels.
+    stroke_width:
+        Outline width in pixels (``0`` disables the outline).
+    max_height:
+        Optional height limit in pixels.
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only ``(h, w, 4)`` uint8 RGBA array.
+    """
+    pil_font = _load_font(font, font_size)
+    lines = _wrap_words(text, pil_font, max_width, stroke_width) or [text]
+    body = "\n".join(lines)
+    stroke_fill = DEFAULT_STROKE_COLOR if stroke_width > 0 else None
+
+    # Measure on a scratch canvas, then draw onto an exact-size sprite.
+    scratch = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    left, top, right, bottom = scratch.multiline_textbbox(
+        (0, 0), body, font=pil_font, align="center",
+        stroke_width=stroke_width,
+    )
+    pad_y = _subtitle_padding(font_size, stroke_width)
+    pad_x = stroke_width + 1
+    sprite_w = max(int(right - left) + 2 * pad_x, 1)
+    sprite_h = max(int(bottom - top) + 2 * pad_y, 1)
+
+    sprite = Image.new("RGBA", (sprite_w, sprite_h), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).multiline_text(
+        (pad_x - left, pad_y - top),
+        body,
+        font=pil_font,
+        fill=ImageColor.getrgb(color),
+        align="center",
+        stroke_width=stroke_width,
+        stroke_fill=stroke_fill,
+    )
+
+    if max_height and sprite_h > max_height:
+        scale = max_height / sprite_h
+        sprite = sprite.resize(
+            (max(int(sprite_w * scale), 1), max_height),
+            Image.Resampling.LANCZOS,
+        )
+        logger.debug(
+            "  Subtitle sprite downscaled by %.2f (%dpx height)",
+            scale, max_height,
+        )
+
+    pixels = np.asarray(sprite).copy()
+    pixels.flags.writeable = False
+    return pixels
+
+
+class SubtitleSprite:
+    """One positioned, timed subtitle ready to blend into frames.
+
+    The RGBA sprite is split once into premultiplied colour and inverse
+    alpha planes, so blending is a single multiply-add over the
+    sprite's rectangle.
+
+    Parameters
+    ----------
+    rgba:
+        ``(h, w, 4)`` uint8 sprite from :func:`rasterize_subtitle`.
+    x, y:
+        Top-left position in the frame (may be partly off-frame).
+    start, duration:
+        Display window in seconds.
+    text:
+        The subtitle string (for logging and tests).
+    """
+
+    def __init__(
+        self,
+        rgba: np.ndarray,
+        x: int,
+        y: int,
+        start: float,
+        duration: float,
+        text: str = "",
+    ):
+        alpha = rgba[:, :, 3:4].astype(np.float32) / 255.0
+        self.premultiplied = rgba[:, :, :3].astype(np.float32) * alpha
+        self.inverse_alpha = 1.0 - alpha
+        self.x = int(x)
+        self.y = int(y)
+        self.start = float(start)
+        self.end = float(start) + float(duration)
+        self.text = text
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Sprite ``(width, height)`` in pixels."""
+        return self.premultiplied.shape[1], self.premultiplied.shape[0]
+
+    def blend_into(self, frame: np.ndarray) -> np.ndarray:
+        """Alpha-blend the sprite into *frame* (uint8 RGB) in place."""
+        frame_h, frame_w = frame.shape[:2]
+        sprite_w, sprite_h = self.size
+        x0, y0 = max(self.x, 0), max(self.y, 0)
+        x1 = min(self.x + sprite_w, frame_w)
+        y1 = min(self.y + sprite_h, frame_h)
+        if x0 >= x1 or y0 >= y1:
+            return frame
+
+        sx, sy = x0 - self.x, y0 - self.y
+        region = frame[y0:y1, x0:x1]
+        blended = region * self.inverse_alpha[sy:sy + y1 - y0, sx:sx + x1 - x0]
+        blended += self.premultiplied[sy:sy + y1 - y0, sx:sx + x1 - x0]
+        np.copyto(region, blended, casting="unsafe")
+        return frame
+
+
+class SubtitleOverlay:
+    """The timed subtitle sprites of one segment.
+
+    Sprites do not overlap in time (see
+    :func:`calculate_subtitle_timing`), so at most one is blended per
+    frame; it is found by bisecting the sorted start times.
+    """
+
+    def __init__(self, sprites: list[SubtitleSprite]):
+        self.sprites = sorted(sprites, key=lambda s: s.start)
+        self._starts = [s.start for s in self.sprites]
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def sprite_at(self, t: float) -> Optional[SubtitleSprite]:
+        """Return the sprite visible at time *t*, or ``None``."""
+        index = bisect.bisect_right(self._starts, t) - 1
+        if index < 0:
+            return None
+        sprite = self.sprites[index]
+        return sprite if t < sprite.end else None
+
+    def apply(self, frame: np.ndarray, t: float) -> np.ndarray:
+        """Blend the subtitle active at *t* into *frame* in place."""
+        sprite = self.sprite_at(t)
+        if sprite is not None:
+            sprite.blend_into(frame)
+        return frame
+
+
+def generate_subtitle_sprites(
+    chunks: list[str],
+    timings: list[tuple[float, float]],
+    resolution: tuple[int, int],
+    font: str,
+    color: str,
+    font_size: int | None = None,
+    position: str = "bottom",
+    stroke_width: int = DEFAULT_STROKE_WIDTH,
+) -> list[SubtitleSprite]:
+    """Sprite counterpart of :func:`generate_subtitle_clips`.
+
+    Uses the same font sizing, wrap width, height limit and
+    bottom/center/top anchoring, but returns :class:`SubtitleSprite`
+    objects instead of ``TextClip`` layers.  Chunks that fail to
+    rasterise are skipped with a warning.
+    """
+    if not chunks or not timings:
+        return []
+
+    width, height = resolution
+    effective_font_size = (
+        font_size if font_size and font_size > 0
+        else int(height / FONT_SIZE_DIVISOR)
+    )
+    text_width = int(width * TEXT_WIDTH_RATIO)
+    max_height = int(height * MAX_SUBTITLE_HEIGHT_RATIO)
+    vert_margin = int(height * SUBTITLE_VERT_MARGIN_RATIO)
+
+    sprites: list[SubtitleSprite] = []
+    for chunk, (start_time, duration) in zip(chunks, timings):
+        try:
+            rgba = rasterize_subtitle(
+                chunk, font, effective_font_size, color,
+                text_width, stroke_width, max_height,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to rasterise subtitle chunk '%.30s': %s",
+                chunk,
+                exc,
+            )
+            continue
+
+        sprite_h, sprite_w = rgba.shape[:2]
+        if position == "top":
+            y_pos = vert_margin
+        elif position == "center":
+            y_pos = int((height - sprite_h) / 2)
+        else:  # "bottom" (default)
+            y_pos = height - sprite_h - vert_margin
+        y_pos = max(0, min(y_pos, height - sprite_h))
+        x_pos = (width - sprite_w) // 2
+
+        sprites.append(
+            SubtitleSprite(rgba, x_pos, y_pos, start_time, duration, chunk)
+        )
+
+    return sprites
+
+
+def create_subtitle_overlay(
+    text_content: str,
+    audio_duration: float,
+    resolution: tuple[int, int],
+    font: str,
+    color: str,
+    font_size: int | None = None,
+    position: str = "bottom",
+    stroke_width: int = DEFAULT_STROKE_WIDTH,
+) -> SubtitleOverlay:
+    """Build the :class:`SubtitleOverlay` for a single video segment.
+
+    Sprite counterpart of :func:`create_subtitles_for_segment`, used by
+    the video renderer: chunk → time → rasterise.  Returns an empty
+    overlay for empty / whitespace-only text.
+    """
+    if not text_content or not text_content.strip():
+        return SubtitleOverlay([])
+
+    chunks = chunk_text(text_content)
+    timings = calculate_subtitle_timing(chunks, audio_duration)
+    overlay = SubtitleOverlay(generate_subtitle_sprites(
+        chunks, timings, resolution, font, color,
+        font_size=font_size, position=position,
+        stroke_width=stroke_width,
+    ))
+
+    logger.info(
+        "Created %d subtitle sprites (%.1f s total, font_size=%s, pos=%s).",
+        len(overlay),
+        audio_duration,
+        font_size or "auto",
+        position,
+    )
+    return overlay
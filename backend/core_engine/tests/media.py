@@ -0,0 +1,102 @@
+"""
+Synthetic media shared by the render tests.
+
+Silent WAVs are written with raw struct packing, so the tests have no
+dependency on soundfile or any third-party audio library.  Projects are
+kept small (320×180 at 12 fps) so a real render takes a few seconds.
+"""
+
+import os
+import shutil
+import struct
+
+from django.core.files.base import File
+
+from core_engine.render_utils import get_output_path
+
+SMALL_RESOLUTION = (320, 180)
+SMALL_FPS = 12
+
+
+def write_silent_wav(path: str, duration: float, sample_rate: int = 22050):
+    """Write a minimal 16-bit mono silent WAV file."""
+    num_samples = int(sample_rate * duration)
+    data_size = num_samples * 2  # 16-bit PCM → 2 bytes per sample
+    with open(path, "wb") as f:
+        f.write(b"RIFF")
+        f.write(struct.pack("<I", 36 + data_size))
+        f.write(b"WAVE")
+        f.write(b"fmt ")
+        f.write(struct.pack("<I", 16))
+        f.write(struct.pack("<HHIIHH", 1, 1, sample_rate,
+                            sample_rate * 2, 2, 16))
+        f.write(b"data")
+        f.write(struct.pack("<I", data_size))
+        f.write(b"\x00" * data_size)
+
+
+def create_small_project(title: str):
+    """Create a project at :data:`SMALL_RESOLUTION` / :data:`SMALL_FPS`."""
+    from api.models import Project  # noqa: E402
+
+    width, height = SMALL_RESOLUTION
+    return Project.objects.create(
+        title=title,
+        resolution_width=width,
+        resolution_height=height,
+        framerate=SMALL_FPS,
+    )
+
+
+def create_small_render_settings(**fields):
+    """Create GlobalSettings rendering at the small size, without subtitles."""
+    from api.models import GlobalSettings  # noqa: E402
+
+    width, height = SMALL_RESOLUTION
+    values = {
+        "render_width": width,
+        "render_height": height,
+        "render_fps": SMALL_FPS,
+        "subtitles_enabled": False,
+    }
+    values.update(fields)
+    return GlobalSettings.objects.create(**values)
+
+
+def create_media_segment(project, temp_dir: str, index: int, duration: float,
+                         image, text: str = "", prefix: str = "seg"):
+    """Create segment *index* of *project* with an image and silent audio.
+
+    Args:
+        image: PIL image saved as the segment's image file.
+        duration: Length of the silent narration, in seconds.
+        prefix: File name prefix of the media written to *temp_dir*.
+    """
+    from api.models import Segment  # noqa: E402
+
+    img_path = os.path.join(temp_dir, f"{prefix}_{index}.png")
+    image.save(img_path)
+    audio_path = os.path.join(temp_dir, f"{prefix}_{index}.wav")
+    write_silent_wav(audio_path, duration)
+
+    segment = Segment.objects.create(
+        project=project,
+        sequence_index=index,
+        text_content=text,
+        audio_duration=duration,
+    )
+    with open(img_path, "rb") as f:
+        segment.image_file.save(os.path.basename(img_path), File(f), save=False)
+    with open(audio_path, "rb") as f:
+        segment.audio_file.save(os.path.basename(audio_path), File(f), save=False)
+    segment.save()
+    return segment
+
+
+def remove_project_output(project):
+    """Delete everything a render of *project* wrote (best effort)."""
+    try:
+        output_dir = os.path.dirname(get_output_path(str(project.id)))
+        shutil.rmtree(os.path.dirname(output_dir), ignore_errors=True)
+    except Exception:
+        pass
@@ -1,5 +1,6 @@
 """
-Unit tests for audio_utils.py — normalization, duration, validation, and saving.
+Unit tests for audio_utils.py — normalization, duration, validation, saving,
+and soundtrack mixing.
 
 All tests are pure unit tests using synthetic NumPy arrays and temporary
 directories. No Kokoro model or Django media directory required.
@@ -15,6 +16,7 @@ from django.test import TestCase
 
 from core_engine.audio_utils import (
     get_audio_duration,
+    mix_soundtrack,
     normalize_audio,
     save_audio_wav,
     validate_audio_file,
@@ -229,3 +231,71 @@ class TestSaveAudioWav(TestCase):
         self.assertEqual(sr, 24000)
         self.assertEqual(len(data), 4, "Content should match second write")
         np.testing.assert_array_almost_equal(data, audio2, decimal=3)
+
+
+# ---------------------------------------------------------------------------
+# mix_soundtrack() tests
+# ---------------------------------------------------------------------------
+
+
+class TestMixSoundtrack(TestCase):
+    """Tests for mix_soundtrack()."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _wav(self, name, value, seconds, rate=1000, channels=1):
+        path = os.path.join(self.temp_dir, f"{name}.wav")
+        shape = (int(seconds * rate), channels) if channels > 1 else int(seconds * rate)
+        sf.write(path, np.full(shape, value, dtype=np.float32), rate)
+        return path
+
+    def test_offsets_gaps_and_overlap(self):
+        """Tracks land at their start times; gaps are silent; overlaps sum."""
+        a = self._wav("a", 0.25, 1.0)
+        b = self._wav("b", 0.5, 1.0)
+        out = os.path.join(self.temp_dir, "mix.wav")
+
+        # a: 0.0–1.0 s, b: 0.75–1.75 s, then 0.25 s of tail silence
+        mix_soundtrack([a, b], [0.0, 0.75], 2.0, out)
+
+        data, sr = sf.read(out, dtype="float32")
+        self.assertEqual(sr, 1000)
+        self.assertEqual(len(data), 2000)
+        self.assertAlmostEqual(float(data[500]), 0.25, places=3)
+        self.assertAlmostEqual(float(data[900]), 0.75, places=3)
+        self.assertAlmostEqual(float(data[1500]), 0.5, places=3)
+        self.assertAlmostEqual(float(data[1900]), 0.0, places=3)
+
+    def test_clips_and_truncates(self):
+        """Summed samples are clipped and audio past the end is dropped."""
+        a = self._wav("a", 0.8, 1.0)
+        b = self._wav("b", 0.8, 1.0)
+        out = os.path.join(self.temp_dir, "mix.wav")
+
+        mix_soundtrack([a, b], [0.0, 0.5], 1.2, out)
+
+        data, _ = sf.read(out, dtype="float32")
+        self.assertEqual(len(data), 1200)
+        self.assertLessEqual(float(np.max(data)), 1.0)
+        self.assertAlmostEqual(float(data[700]), 1.0, places=3)
+
+    def test_mixed_rates_and_channels(self):
+        """A mono track at another rate is resampled and spread to stereo."""
+        stereo = self._wav("stereo", 0.1, 1.0, rate=1000, channels=2)
+        mono = self._wav("mono", 0.3, 0.5, rate=500)
+        out = os.path.join(self.temp_dir, "mix.wav")
+
+        mix_soundtrack([stereo, mono], [0.0, 1.0], 1.5, out)
+
+        data, sr = sf.read(out, dtype="float32")
+        self.assertEqual(sr, 1000)
+        self.assertEqual(data.shape, (1500, 2))
+        np.testing.assert_array_almost_equal(data[1200], [0.3, 0.3], decimal=3)
+
+    def test_mismatched_lengths_rejected(self):
+        with self.assertRaises(ValueError):
+            mix_soundtrack([self._wav("a", 0.1, 0.1)], [], 1.0, "unused.wav")
@@ -0,0 +1,92 @@
+"""
+Tests for the core_engine benchmark suite.
+
+Covers the timing summary, result keys, baseline comparison, a quick
+run of the cheap benchmark groups, and the ``benchmark_core`` command's
+JSON output.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from core_engine.core_benchmark import (
+    compare_reports,
+    format_benchmark_report,
+    result_id,
+    run_benchmarks,
+    time_call,
+)
+
+
+def _report(**medians):
+    return {"results": [
+        {"id": key, "median_seconds": value} for key, value in medians.items()
+    ]}
+
+
+class BenchmarkHelperTests(SimpleTestCase):
+
+    def test_time_call_counts_calls(self):
+        calls = []
+        timing = time_call(lambda: calls.append(1), repeat=3, warmup=2)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(timing["repeat"], 3)
+        self.assertLessEqual(timing["min_seconds"], timing["median_seconds"])
+
+    def test_result_id_sorts_params(self):
+        self.assertEqual(result_id("api.gallery", {}), "api.gallery")
+        self.assertEqual(
+            result_id("subtitles.clips", {"resolution": "4k", "chunks": 4}),
+            "subtitles.clips[chunks=4,resolution=4k]",
+        )
+
+    def test_compare_reports(self):
+        rows = compare_reports(
+            _report(a=1.5, b=0.5, c=1.05, new=1.0),
+            _report(a=1.0, b=1.0, c=1.0, gone=1.0),
+        )
+        status = {row["id"]: row["status"] for row in rows}
+        self.assertEqual(status, {"a": "regression", "b": "improvement", "c": "same"})
+
+    def test_unknown_group_raises(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks(only=["nope"])
+
+
+class BenchmarkRunTests(TestCase):
+
+    def test_quick_run_of_cheap_groups(self):
+        report = run_benchmarks(only=["image", "audio"], quick=True)
+        ids = [r["id"] for r in report["results"]]
+        self.assertIn("image.load[resolution=720p]", ids)
+        self.assertIn("audio.normalize[seconds=60]", ids)
+        self.assertTrue(all("error" not in r for r in report["results"]))
+        self.assertIn("commit", report["environment"])
+        self.assertIn("image.load", format_benchmark_report(report))
+
+    def test_command_writes_json_and_compares(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        output = os.path.join(temp_dir, "bench.json")
+
+        call_command(
+            "benchmark_core", "--only", "audio", "--quick",
+            "--output", output, stdout=StringIO(),
+        )
+        with open(output) as f:
+            first = json.load(f)
+        self.assertEqual(first["settings"]["quick"], True)
+
+        out = StringIO()
+        call_command(
+            "benchmark_core", "--only", "audio", "--quick",
+            "--output", os.path.join(temp_dir, "second.json"),
+            "--compare", output, "--threshold", "100", stdout=out,
+        )
+        self.assertIn("vs baseline", out.getvalue())
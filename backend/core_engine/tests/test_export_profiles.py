@@ -0,0 +1,84 @@
+"""
+Tests for the export profiles.
+
+Covers profile resolution, two-pass bitrate sizing, the libx264
+arguments of each profile, the piece encoder dict, and reading the
+profile from GlobalSettings.
+"""
+
+from django.test import SimpleTestCase, TestCase
+
+from core_engine.export_profiles import (
+    AUDIO_BITRATE_KBPS,
+    MIN_VIDEO_BITRATE_KBPS,
+    encoder_args,
+    resolve_export_profile,
+    two_pass_bitrate_kbps,
+)
+from core_engine.parallel_renderer import piece_encoder
+from core_engine.video_renderer import load_render_settings
+
+_SETTINGS = {
+    "x264_preset": "veryfast",
+    "crf": 23,
+    "export_profile": "crf",
+    "export_bitrate_kbps": 3000,
+    "export_target_mb": 10,
+}
+
+
+class ExportProfileTests(SimpleTestCase):
+
+    def test_unknown_profile_falls_back(self):
+        self.assertEqual(resolve_export_profile("VBR"), "vbr")
+        self.assertEqual(resolve_export_profile("lossless"), "crf")
+        self.assertEqual(resolve_export_profile(None), "crf")
+
+    def test_two_pass_bitrate(self):
+        # 10 MB over 80 s = 1024 kbps in total, minus the audio share
+        self.assertEqual(two_pass_bitrate_kbps(10, 80.0), 1024 - AUDIO_BITRATE_KBPS)
+        self.assertEqual(two_pass_bitrate_kbps(1, 3600.0), MIN_VIDEO_BITRATE_KBPS)
+        self.assertEqual(two_pass_bitrate_kbps(10, 0.0), MIN_VIDEO_BITRATE_KBPS)
+
+    def test_crf_args(self):
+        args = encoder_args(dict(piece_encoder(_SETTINGS), threads=3))
+        self.assertEqual(args[args.index("-tune") + 1], "stillimage")
+        self.assertEqual(args[args.index("-crf") + 1], "23")
+        self.assertEqual(args[args.index("-threads") + 1], "3")
+        self.assertNotIn("-b:v", args)
+
+    def test_vbr_args(self):
+        encoder = piece_encoder(dict(_SETTINGS, export_profile="vbr"))
+        args = encoder_args(encoder)
+        self.assertEqual(args[args.index("-b:v") + 1], "3000k")
+        self.assertEqual(args[args.index("-maxrate") + 1], "4500k")
+        self.assertEqual(args[args.index("-bufsize") + 1], "6000k")
+        self.assertNotIn("-crf", args)
+
+    def test_two_pass_args(self):
+        encoder = piece_encoder(dict(_SETTINGS, export_profile="two_pass"), 80.0)
+        self.assertEqual(encoder["bitrate_kbps"], 1024 - AUDIO_BITRATE_KBPS)
+        args = encoder_args(encoder, 1, "/tmp/log")
+        self.assertEqual(args[args.index("-pass") + 1], "1")
+        self.assertEqual(args[args.index("-passlogfile") + 1], "/tmp/log")
+        self.assertNotIn("-maxrate", args)
+
+
+class LoadRenderSettingsExportTests(TestCase):
+
+    def setUp(self):
+        from api.models import GlobalSettings, Project
+
+        self.project = Project.objects.create(title="Export Test")
+        GlobalSettings.objects.update_or_create(pk=1, defaults={
+            "render_width": 640,
+            "render_height": 360,
+            "export_profile": "two_pass",
+            "export_target_mb": 25,
+        })
+
+    def test_profile_is_read(self):
+        settings = load_render_settings(self.project)
+        self.assertEqual(settings["export_profile"], "two_pass")
+        self.assertEqual(settings["export_target_mb"], 25)
+        self.assertEqual(settings["export_bitrate_kbps"], 4000)
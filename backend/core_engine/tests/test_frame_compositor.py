@@ -0,0 +1,176 @@
+"""
+Tests for the single-pass frame compositor.
+
+Covers in-place composition into the reused buffer, subtitle and logo
+blending order, the crossfade weighted blend, the crossfade
+timeline's segment offsets, and streaming lazily built segments.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from core_engine.frame_compositor import (
+    CrossfadeTimeline,
+    FrameCompositor,
+    LazySegmentFrameSource,
+    LogoOverlay,
+    SegmentFrameSource,
+)
+from core_engine.subtitle_engine import SubtitleOverlay, SubtitleSprite
+
+
+class _FlatEngine:
+    """Ken Burns engine stand-in that fills the frame with one value."""
+
+    def __init__(self, value, size=(8, 6)):
+        self.value = value
+        self.output_width, self.output_height = size
+        self.times = []
+
+    def frame_at(self, t, out=None):
+        self.times.append(t)
+        if out is None:
+            out = np.empty((self.output_height, self.output_width, 3), dtype=np.uint8)
+        out.fill(self.value)
+        return out
+
+
+class FrameCompositorTests(SimpleTestCase):
+
+    def test_compose_reuses_buffer(self):
+        compositor = FrameCompositor((8, 6))
+        source = SegmentFrameSource(_FlatEngine(40), 1.0)
+
+        first = compositor.compose(source, 0.0)
+        second = compositor.compose(source, 0.5)
+
+        self.assertIs(first, second)
+        self.assertIs(first, compositor.frame)
+        self.assertEqual(first.shape, (6, 8, 3))
+        self.assertTrue((first == 40).all())
+
+    def test_logo_is_blended_over_subtitle(self):
+        rgba = np.zeros((2, 2, 4), dtype=np.uint8)
+        rgba[:] = (200, 200, 200, 255)
+        subtitles = SubtitleOverlay([SubtitleSprite(rgba, 0, 0, 0.0, 1.0)])
+        logo = LogoOverlay(
+            np.full((1, 1, 3), 100, dtype=np.uint8),
+            np.full((1, 1), 0.5),
+            (1, 1),
+        )
+        source = SegmentFrameSource(_FlatEngine(0), 1.0, subtitles, logo)
+
+        frame = FrameCompositor((8, 6)).compose(source, 0.5)
+
+        self.assertEqual(frame[0, 0].tolist(), [200, 200, 200])
+        # 0.5 * 200 (subtitle underneath) + 0.5 * 100 (logo)
+        self.assertEqual(frame[1, 1].tolist(), [150, 150, 150])
+        self.assertEqual(frame[3, 3].tolist(), [0, 0, 0])
+
+    def test_subtitle_outside_window_not_drawn(self):
+        rgba = np.full((2, 2, 4), 255, dtype=np.uint8)
+        subtitles = SubtitleOverlay([SubtitleSprite(rgba, 0, 0, 1.0, 1.0)])
+        source = SegmentFrameSource(_FlatEngine(10), 3.0, subtitles)
+        frame = FrameCompositor((8, 6)).compose(source, 0.5)
+        self.assertTrue((frame == 10).all())
+
+    def test_crossfade_is_weighted_blend(self):
+        compositor = FrameCompositor((8, 6))
+        outgoing = SegmentFrameSource(_FlatEngine(100), 1.0)
+        incoming = SegmentFrameSource(_FlatEngine(200), 1.0)
+
+        self.assertTrue((compositor.crossfade(outgoing, 0.9, incoming, 0.0, 0.0) == 100).all())
+        self.assertTrue((compositor.crossfade(outgoing, 0.9, incoming, 0.0, 0.25) == 125).all())
+        self.assertTrue((compositor.crossfade(outgoing, 0.9, incoming, 0.0, 1.0) == 200).all())
+
+
+class CrossfadeTimelineTests(SimpleTestCase):
+
+    def test_offsets_and_duration(self):
+        sources = [SegmentFrameSource(_FlatEngine(v), 2.0) for v in (0, 100, 200)]
+        timeline = CrossfadeTimeline(sources, 0.5)
+        self.assertEqual(timeline.starts, [0.0, 1.5, 3.0])
+        self.assertAlmostEqual(timeline.duration, 5.0)
+
+    def test_frame_in_overlap_blends_neighbours(self):
+        a, b = _FlatEngine(0), _FlatEngine(200)
+        timeline = CrossfadeTimeline(
+            [SegmentFrameSource(a, 2.0), SegmentFrameSource(b, 2.0)], 0.5,
+        )
+
+        self.assertTrue((timeline.frame_at(1.0) == 0).all())
+        mid = timeline.frame_at(1.75)  # halfway through the overlap
+        self.assertTrue((mid == 100).all())
+        self.assertAlmostEqual(a.times[-1], 1.75)
+        self.assertAlmostEqual(b.times[-1], 0.25)
+        self.assertTrue((timeline.frame_at(2.5) == 200).all())
+
+    def test_single_segment_has_no_transition(self):
+        timeline = CrossfadeTimeline([SegmentFrameSource(_FlatEngine(7), 2.0)], 0.5)
+        self.assertEqual(timeline.transition, 0.0)
+        self.assertAlmostEqual(timeline.duration, 2.0)
+        self.assertTrue((timeline.frame_at(0.1) == 7).all())
+
+
+def _lazy(value, duration, warnings=None):
+    def loader():
+        return SegmentFrameSource(_FlatEngine(value), duration), [f"warn {value}"]
+    return LazySegmentFrameSource(loader, duration, (8, 6), warnings)
+
+
+class StreamingTimelineTests(SimpleTestCase):
+
+    def test_lazy_source_builds_on_first_render(self):
+        warnings = []
+        source = _lazy(9, 1.0, warnings)
+        self.assertFalse(source.loaded)
+
+        self.assertTrue((source.render(0.2) == 9).all())
+        source.release()
+        source.render(0.4)
+
+        self.assertEqual(source.loads, 2)
+        self.assertEqual(warnings, ["warn 9"])
+
+    def test_prefetch_after_release_is_discarded(self):
+        source = _lazy(3, 1.0)
+        with patch("core_engine.frame_compositor.threading.Thread") as thread_cls:
+            source.prefetch()
+            source.prefetch()  # one loader at a time
+        self.assertEqual(thread_cls.call_count, 1)
+        load = thread_cls.call_args.kwargs["target"]
+
+        source.release()
+        load()  # the loader runs only now, after the release
+
+        self.assertEqual(source.loads, 0)
+        self.assertFalse(source.loaded)
+        self.assertFalse(source._prefetching)
+
+    def test_finished_segments_are_released(self):
+        sources = [_lazy(v, 2.0) for v in (0, 100, 200, 250)]
+        timeline = CrossfadeTimeline(sources, 0.5)
+
+        timeline.frame_at(0.0)
+        self.assertTrue(sources[0].loaded)
+        timeline.frame_at(5.9)  # last segment, > RELEASE_LAG past the first
+
+        self.assertFalse(sources[0].loaded)
+        self.assertTrue(sources[3].loaded)
+
+        timeline.release_all()
+        self.assertFalse(any(s.loaded for s in sources))
+
+    def test_rewind_releases_again(self):
+        sources = [_lazy(v, 2.0) for v in (0, 100, 200, 250)]
+        timeline = CrossfadeTimeline(sources, 0.5)
+        for t in (0.0, 3.0, 5.9):
+            timeline.frame_at(t)
+
+        # Second pass of a two-pass export
+        for t in (0.0, 3.0, 5.9):
+            self.assertIsNotNone(timeline.frame_at(t))
+        self.assertFalse(sources[0].loaded)
+        self.assertEqual(sources[0].loads, 2)
@@ -0,0 +1,150 @@
+"""
+Tests for the raw-frame FFmpeg pipe.
+
+Covers frame counting, the FFmpeg command line, frame order with
+several producer threads, the pipe's time breakdown, audio muxing, two-pass encoding, and
+cancellation from the progress callback.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from core_engine.frame_compositor import CrossfadeTimeline, SegmentFrameSource
+from core_engine.frame_pipe import (
+    MAX_PRODUCER_THREADS,
+    build_rawvideo_command,
+    count_frames,
+    encode_timeline,
+    producer_thread_count,
+)
+from core_engine.render_utils import check_ffmpeg
+from core_engine.tests.test_frame_compositor import _FlatEngine
+
+_ENCODER = {
+    "codec": "libx264",
+    "preset": "ultrafast",
+    "crf": 18,
+    "pixel_format": "yuv420p",
+}
+
+
+class FramePipeHelperTests(SimpleTestCase):
+
+    def test_count_frames(self):
+        self.assertEqual(count_frames(1.0, 24), 24)
+        self.assertEqual(count_frames(1.01, 24), 25)
+        self.assertEqual(count_frames(0.0, 24), 1)
+
+    def test_producer_thread_count_is_clamped(self):
+        self.assertEqual(producer_thread_count(0), 1)
+        self.assertEqual(producer_thread_count(3), 3)
+        self.assertEqual(producer_thread_count(64), MAX_PRODUCER_THREADS)
+
+    def test_command_reads_rawvideo_from_stdin(self):
+        cmd = build_rawvideo_command(
+            "out.mp4", (64, 36), 24, "mix.wav", dict(_ENCODER, threads=2),
+        )
+        self.assertEqual(cmd[cmd.index("-f") + 1], "rawvideo")
+        self.assertEqual(cmd[cmd.index("-pix_fmt") + 1], "rgb24")
+        self.assertEqual(cmd[cmd.index("-s") + 1], "64x36")
+        self.assertEqual(cmd[cmd.index("-i") + 1], "-")
+        self.assertIn("mix.wav", cmd)
+        self.assertEqual(cmd[cmd.index("-threads") + 1], "2")
+        self.assertEqual(cmd[-1], "out.mp4")
+
+        video_only = build_rawvideo_command("out.mp4", (64, 36), 24, None, _ENCODER)
+        self.assertNotIn("-c:a", video_only)
+
+
+class EncodeTimelineTests(SimpleTestCase):
+
+    def setUp(self):
+        if not check_ffmpeg():
+            self.skipTest("FFmpeg not available")
+        self.temp_dir = tempfile.mkdtemp()
+        self.output = os.path.join(self.temp_dir, "out.mp4")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _timeline(self):
+        sources = [
+            SegmentFrameSource(_FlatEngine(v, size=(64, 36)), 1.0)
+            for v in (20, 230)
+        ]
+        return CrossfadeTimeline(sources, 0.5)
+
+    def test_frames_written_in_order(self):
+        from moviepy import VideoFileClip
+
+        progress = []
+        stats = {}
+        written = encode_timeline(
+            self._timeline(), 12, self.output, _ENCODER,
+            threads=3, ring_size=4,
+            on_frame=lambda done, total: progress.append((done, total)),
+            stats=stats,
+        )
+
+        self.assertEqual(written, 18)
+        self.assertGreater(stats["draw_seconds"], 0)
+        self.assertEqual(
+            set(stats),
+            {"draw_seconds", "wait_seconds", "write_seconds", "flush_seconds"},
+        )
+        self.assertEqual(progress[-1], (18, 18))
+        self.assertEqual([done for done, _ in progress], list(range(1, 19)))
+
+        clip = VideoFileClip(self.output)
+        try:
+            self.assertAlmostEqual(clip.duration, 1.5, delta=0.1)
+            self.assertLess(abs(float(np.mean(clip.get_frame(0.0))) - 20), 5)
+            self.assertLess(abs(float(np.mean(clip.get_frame(1.4))) - 230), 5)
+        finally:
+            clip.close()
+
+    def test_audio_is_muxed(self):
+        import soundfile as sf
+        from moviepy import VideoFileClip
+
+        wav = os.path.join(self.temp_dir, "mix.wav")
+        sf.write(wav, np.zeros(int(44100 * 1.5), dtype=np.float32), 44100)
+
+        encode_timeline(self._timeline(), 12, self.output, _ENCODER, audio_path=wav)
+
+        clip = VideoFileClip(self.output)
+        try:
+            self.assertIsNotNone(clip.audio)
+        finally:
+            clip.close()
+
+    def test_two_pass_draws_frames_twice(self):
+        from moviepy import VideoFileClip
+
+        progress = []
+        encoder = dict(_ENCODER, profile="two_pass", bitrate_kbps=200)
+        written = encode_timeline(
+            self._timeline(), 12, self.output, encoder,
+            on_frame=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual(written, 18)
+        self.assertEqual(progress[-1], (36, 36))
+        clip = VideoFileClip(self.output)
+        try:
+            self.assertAlmostEqual(clip.duration, 1.5, delta=0.1)
+        finally:
+            clip.close()
+
+    def test_callback_exception_stops_encoding(self):
+        def cancel(done, total):
+            if done == 3:
+                raise KeyboardInterrupt("cancelled")
+
+        with self.assertRaises(KeyboardInterrupt):
+            encode_timeline(self._timeline(), 12, self.output, _ENCODER, on_frame=cancel)
+        self.assertFalse(os.path.exists(self.output))
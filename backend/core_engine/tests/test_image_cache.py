@@ -0,0 +1,168 @@
+"""
+Tests for the prepared-image cache.
+
+Covers keying on file identity, byte-bounded LRU eviction, the ``.npy``
+memory-mapped disk tier, the loaders that share the process-wide
+instance, and sizing the cache from GlobalSettings.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+from PIL import Image as PILImage
+
+from core_engine.image_cache import (
+    PreparedImageCache,
+    get_image_cache,
+    image_key,
+)
+from core_engine.ken_burns import load_and_prepare_image
+from core_engine.render_utils import resize_image_to_resolution
+from core_engine.video_renderer import load_render_settings
+
+
+class _TempDirMixin:
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def _image(self, name="img.png", size=(64, 36), color=(10, 20, 30)):
+        path = os.path.join(self.temp_dir, name)
+        PILImage.new("RGB", size, color).save(path)
+        return path
+
+
+class PreparedImageCacheTests(_TempDirMixin, SimpleTestCase):
+
+    def test_key_tracks_file_identity(self):
+        path = self._image()
+        key = image_key(path, "cover", 32, 18)
+        self.assertEqual(key, image_key(path, "cover", 32, 18))
+        self.assertNotEqual(key, image_key(path, "cover", 64, 36))
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertNotEqual(key, image_key(path, "cover", 32, 18))
+        self.assertIsNone(image_key(os.path.join(self.temp_dir, "missing.png"), "cover"))
+
+    def test_hit_returns_shared_read_only_array(self):
+        cache = PreparedImageCache(max_bytes=1024 * 1024)
+        calls = []
+
+        def prepare():
+            calls.append(1)
+            return np.zeros((4, 4, 3), np.uint8)
+
+        first = cache.get_or_prepare(("a",), prepare)
+        second = cache.get_or_prepare(("a",), prepare)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(first.flags.writeable)
+        self.assertEqual(cache.report()["hits"], 1)
+
+    def test_lru_eviction_by_bytes(self):
+        entry = np.zeros((10, 10, 3), np.uint8)  # 300 bytes
+        cache = PreparedImageCache(max_bytes=700)
+        for key in ("a", "b"):
+            cache.get_or_prepare((key,), entry.copy)
+        cache.get_or_prepare(("a",), entry.copy)  # "b" is now least recent
+        cache.get_or_prepare(("c",), entry.copy)
+
+        report = cache.report()
+        self.assertEqual(report["entries"], 2)
+        self.assertEqual(report["evicted"], 1)
+        self.assertLessEqual(cache.bytes, 700)
+        cache.get_or_prepare(("a",), entry.copy)
+        self.assertEqual(cache.report()["misses"], 3)
+
+    def test_disabled_cache_always_prepares(self):
+        cache = PreparedImageCache(max_bytes=0)
+        calls = []
+        for _ in range(2):
+            cache.get_or_prepare(("a",), lambda: calls.append(1) or np.zeros(3))
+        self.assertEqual(len(calls), 2)
+
+    def test_spill_tier_is_memory_mapped_across_instances(self):
+        spill = os.path.join(self.temp_dir, "spill")
+        array = np.arange(300, dtype=np.uint8).reshape(10, 10, 3)
+        writer = PreparedImageCache(0, spill, 1024 * 1024)
+        writer.get_or_prepare(("a",), lambda: array)
+        self.assertEqual(len(os.listdir(spill)), 1)
+
+        reader = PreparedImageCache(1024 * 1024, spill, 1024 * 1024)
+        loaded = reader.get_or_prepare(("a",), lambda: self.fail("re-prepared"))
+        self.assertIsInstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, array)
+        self.assertEqual(reader.report()["spill_hits"], 1)
+
+    def test_spill_tier_is_bounded(self):
+        spill = os.path.join(self.temp_dir, "spill")
+        cache = PreparedImageCache(0, spill, 2500)
+        for key in ("a", "b", "c"):
+            cache.get_or_prepare((key,), lambda: np.zeros(1000, np.uint8))
+        self.assertEqual(len(os.listdir(spill)), 2)
+
+    def test_failed_spill_leaves_no_temp_file(self):
+        spill = os.path.join(self.temp_dir, "spill")
+        cache = PreparedImageCache(1024 * 1024, spill, 1024 * 1024)
+        with patch("core_engine.image_cache.np.save", side_effect=OSError(28, "No space left")):
+            array = cache.get_or_prepare(("a",), lambda: np.zeros(100, np.uint8))
+
+        self.assertEqual(array.shape, (100,))
+        self.assertEqual(os.listdir(spill), [])
+
+
+class SharedLoaderTests(_TempDirMixin, SimpleTestCase):
+
+    def test_prepared_image_is_reused(self):
+        path = self._image(size=(200, 120))
+        first = load_and_prepare_image(path, (64, 36), 1.3)
+        self.assertIs(first, load_and_prepare_image(path, (64, 36), 1.3))
+        self.assertIsNot(first, load_and_prepare_image(path, (64, 36), 1.5))
+        self.assertIsNot(first, load_and_prepare_image(path, (64, 36), 1.3, use_cache=False))
+
+    def test_replaced_image_is_reloaded(self):
+        path = self._image(size=(200, 120), color=(0, 0, 0))
+        before = resize_image_to_resolution(path, 64, 36)
+        os.remove(path)
+        self._image(size=(200, 121), color=(255, 255, 255))
+        after = resize_image_to_resolution(path, 64, 36)
+        self.assertEqual(int(before.max()), 0)
+        self.assertEqual(int(after.min()), 255)
+
+    def test_shared_instance(self):
+        self.assertIs(get_image_cache(), get_image_cache())
+
+
+class LoadRenderSettingsImageCacheTests(TestCase):
+
+    def setUp(self):
+        from api.models import GlobalSettings, Project
+
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.project = Project.objects.create(title="Image Cache Test")
+        GlobalSettings.objects.update_or_create(pk=1, defaults={
+            "image_cache_mb": 64,
+            "image_spill_mb": 128,
+        })
+
+    def tearDown(self):
+        get_image_cache().configure(256 * 1024 * 1024)
+
+    def test_budgets_are_applied(self):
+        with self.settings(MEDIA_ROOT=self.media_root):
+            settings = load_render_settings(self.project)
+
+        config = settings["image_cache"]
+        self.assertEqual(config["max_mb"], 64)
+        self.assertEqual(config["spill_mb"], 128)
+        self.assertEqual(config["spill_dir"], os.path.join(self.media_root, "image_cache"))
+        cache = get_image_cache()
+        self.assertEqual(cache.max_bytes, 64 * 1024 * 1024)
+        self.assertEqual(cache.spill_dir, config["spill_dir"])
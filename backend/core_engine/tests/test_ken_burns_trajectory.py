@@ -0,0 +1,122 @@
+"""
+Tests for the precomputed Ken Burns trajectory.
+
+Covers the easing curves, the shared progress table, frame-aligned
+lookups, sub-pixel blending between whole-pixel offsets, and reading
+the easing / sub-pixel settings through ``load_render_settings``.
+"""
+
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+
+from core_engine.ken_burns import (
+    KEN_BURNS_EASINGS,
+    KenBurnsFrameEngine,
+    KenBurnsTrajectory,
+    resolve_easing,
+    trajectory_progress,
+)
+from core_engine.video_renderer import load_render_settings
+
+
+def _gradient(width, height):
+    """Horizontal ramp image, so sub-pixel shifts change pixel values."""
+    ramp = np.linspace(0, 255, width, dtype=np.float64)
+    image = np.repeat(ramp[None, :, None], height, axis=0)
+    return np.repeat(image, 3, axis=2).round().astype(np.uint8)
+
+
+class TrajectoryTableTests(SimpleTestCase):
+
+    def test_easings_start_at_zero_and_end_at_one(self):
+        p = np.linspace(0.0, 1.0, 101)
+        for name, curve in KEN_BURNS_EASINGS.items():
+            eased = curve(p)
+            self.assertAlmostEqual(float(eased[0]), 0.0, msg=name)
+            self.assertAlmostEqual(float(eased[-1]), 1.0, msg=name)
+            self.assertTrue(np.all(np.diff(eased) >= 0), name)
+
+    def test_unknown_easing_falls_back(self):
+        with self.assertLogs("core_engine.ken_burns", level="WARNING"):
+            self.assertEqual(resolve_easing("bounce"), "linear")
+        self.assertEqual(resolve_easing(" Ease_Out "), "ease_out")
+        self.assertEqual(resolve_easing(None), "linear")
+
+    def test_progress_table_is_shared_and_read_only(self):
+        table = trajectory_progress(2.0, 30.0, "linear")
+        self.assertEqual(len(table), 61)
+        self.assertEqual(table[-1], 1.0)
+        self.assertIs(table, trajectory_progress(2.0, 30.0, "linear"))
+        with self.assertRaises(ValueError):
+            table[0] = 1.0
+
+    def test_frame_aligned_lookup_is_table_entry(self):
+        trajectory = KenBurnsTrajectory(
+            (0, 0), (90, 30), 3.0, fps=30, scale=(2.0, 1.0),
+            easing="ease_in_out",
+        )
+        self.assertEqual(len(trajectory), 90)
+        self.assertEqual(trajectory.position_at(0.0), (0.0, 0.0))
+        self.assertEqual(trajectory.position_at(3.0), (180.0, 30.0))
+        self.assertEqual(trajectory.position_at(99.0), (180.0, 30.0))
+        x, y = trajectory.position_at(45 / 30)
+        self.assertEqual((x, y), tuple(trajectory.positions[45]))
+        # Smoothstep is symmetric: half way in time is half way in space
+        self.assertAlmostEqual(x, 90.0)
+
+    def test_limits_clamp_positions(self):
+        trajectory = KenBurnsTrajectory((0, 0), (100, 100), 1.0, limits=(50, 80))
+        self.assertEqual(trajectory.position_at(1.0), (50.0, 80.0))
+
+
+class SubpixelEngineTests(SimpleTestCase):
+
+    def _engine(self, subpixel):
+        # 1:1 scale and a 4 px pan over 2 s: mostly fractional offsets.
+        return KenBurnsFrameEngine(
+            _gradient(68, 36), (64, 36), (64, 36), (0, 0), (4, 0), 2.0,
+            fps=10, subpixel=subpixel,
+        )
+
+    def test_fractional_offset_blends_neighbours(self):
+        engine = self._engine(True)
+        frame = engine.frame_at(0.25).astype(np.float64)  # x = 0.5
+        left = engine.plane[:, 0:64].astype(np.float64)
+        right = engine.plane[:, 1:65].astype(np.float64)
+        np.testing.assert_allclose(frame, (left + right) / 2, atol=1.0)
+
+    def test_whole_pixel_offset_is_exact_copy(self):
+        engine = self._engine(True)
+        np.testing.assert_array_equal(engine.frame_at(1.0), engine.plane[:, 2:66])
+
+    def test_rounding_without_subpixel(self):
+        engine = self._engine(False)
+        self.assertEqual(engine.offset_at(0.25), (0, 0))
+        np.testing.assert_array_equal(engine.frame_at(0.3), engine.plane[:, 1:65])
+
+    def test_motion_is_monotonic(self):
+        engine = self._engine(True)
+        means = [float(engine.frame_at(i / 10).mean()) for i in range(21)]
+        self.assertTrue(all(b >= a for a, b in zip(means, means[1:])))
+        self.assertGreater(len(set(round(m, 3) for m in means)), 5)
+
+
+class LoadRenderSettingsTrajectoryTests(TestCase):
+
+    def setUp(self):
+        from api.models import GlobalSettings, Project
+
+        self.project = Project.objects.create(title="Trajectory Test")
+        GlobalSettings.objects.update_or_create(pk=1, defaults={
+            "render_width": 640,
+            "render_height": 360,
+            "ken_burns_easing": "ease_in_out_sine",
+        })
+
+    def test_easing_and_subpixel_are_read(self):
+        settings = load_render_settings(self.project, render_quality="final")
+        self.assertEqual(settings["ken_burns_easing"], "ease_in_out_sine")
+        self.assertTrue(settings["subpixel"])
+
+        draft = load_render_settings(self.project, render_quality="draft")
+        self.assertFalse(draft["subpixel"])
@@ -11,9 +11,9 @@ test media (solid-colour images + silent audio) at a small 640×360
 resolution to keep execution time under 30 seconds per test.
 """
 
+import json
 import os
 import shutil
-import struct
 import tempfile
 import unittest
 
@@ -31,6 +31,7 @@ from core_engine.render_utils import (
     reset_imagemagick_cache,
     DEFAULT_FONT_PATH,
 )
+from core_engine.tests.media import write_silent_wav
 from core_engine.video_renderer import (
     TRANSITION_DURATION,
     calculate_total_duration_with_transitions,
@@ -38,31 +39,6 @@ from core_engine.video_renderer import (
 )
 
 
-# ---------------------------------------------------------------------------
-# Helper: write a minimal silent WAV without soundfile
-# ---------------------------------------------------------------------------
-
-def _write_silent_wav(path: str, duration: float, sample_rate: int = 22050):
-    """Write a minimal silent WAV file.
-
-    Uses raw struct packing so the test has zero dependency on soundfile
-    or any third-party audio library.
-    """
-    num_samples = int(sample_rate * duration)
-    data_size = num_samples * 2  # 16-bit PCM → 2 bytes per sample
-    with open(path, "wb") as f:
-        f.write(b"RIFF")
-        f.write(struct.pack("<I", 36 + data_size))
-        f.write(b"WAVE")
-        f.write(b"fmt ")
-        f.write(struct.pack("<I", 16))
-        f.write(struct.pack("<HHIIHH", 1, 1, sample_rate,
-                            sample_rate * 2, 2, 16))
-        f.write(b"data")
-        f.write(struct.pack("<I", data_size))
-        f.write(b"\x00" * data_size)
-
-
 # ===================================================================
 # MultiSegmentIntegrationTests
 # ===================================================================
@@ -197,7 +173,7 @@ class MultiSegmentIntegrationTests(TestCase):
 
             # Silent WAV at requested duration
             audio_path = os.path.join(self.temp_dir, f"int_seg_{i}.wav")
-            _write_silent_wav(audio_path, dur)
+            write_silent_wav(audio_path, dur)
 
             text = texts[i % len(texts)] if with_text else ""
 
@@ -295,6 +271,26 @@ class MultiSegmentIntegrationTests(TestCase):
             "Output MP4 file does not exist.",
         )
         self.assertGreater(result["file_size"], 0)
+        # Segments are streamed and the peak resident memory reported
+        self.assertTrue(result["streaming"])
+        self.assertGreater(result["peak_rss_mb"], 0)
+
+        # The render profile is returned and saved next to the MP4
+        profile = result["profile"]
+        phases = {p["name"] for p in profile["phases"]}
+        self.assertTrue({"setup", "ken_burns", "subtitles", "export"} <= phases)
+        self.assertEqual(len(profile["segments"]), 3)
+        self.assertGreater(profile["export"]["fps"], 0)
+        # One process; the frame pipe's producer threads reported apart
+        self.assertEqual(result["workers"], 1)
+        self.assertGreaterEqual(result["producer_threads"], 1)
+        self.assertEqual(profile["export"]["producer_threads"], result["producer_threads"])
+        self.assertEqual(
+            result["render_report"],
+            os.path.join(os.path.dirname(result["output_path"]), "render_report.json"),
+        )
+        with open(result["render_report"]) as f:
+            self.assertEqual(json.load(f)["status"], "completed")
 
     # ==================================================================
     # Step 9 — Crossfade WITHOUT subtitles test
@@ -0,0 +1,192 @@
+"""
+Tests for the parallel per-segment renderer.
+
+Covers the pure timeline planner (frame alignment, piece layout and the
+short-segment fallback), reuse of the worker pool, and an end-to-end render on a two-worker
+process pool using small synthetic media.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image as PILImage
+
+from django.test import TestCase
+
+from core_engine.parallel_renderer import (
+    discard_piece_pool,
+    get_piece_pool,
+    plan_segment_timeline,
+)
+from core_engine.render_utils import check_ffmpeg, reset_ffmpeg_cache
+from core_engine.tests.media import (
+    create_media_segment,
+    create_small_project,
+    create_small_render_settings,
+    remove_project_output,
+)
+from core_engine.video_renderer import render_project, resolve_render_workers
+
+
+# ===================================================================
+# Timeline planning
+# ===================================================================
+
+class PlanSegmentTimelineTests(unittest.TestCase):
+    """Pure-function tests for plan_segment_timeline."""
+
+    def test_single_segment_is_one_body(self):
+        plan = plan_segment_timeline([2.0], fps=24, transition_duration=0.5)
+        self.assertEqual(plan["segment_frames"], [48])
+        self.assertEqual(plan["transition_frames"], 0)
+        self.assertEqual(plan["total_frames"], 48)
+        self.assertEqual(len(plan["pieces"]), 1)
+        self.assertEqual(plan["pieces"][0]["kind"], "body")
+
+    def test_three_segments_alternate_body_and_transition(self):
+        plan = plan_segment_timeline(
+            [2.0, 3.0, 2.0], fps=24, transition_duration=0.5,
+        )
+        kinds = [p["kind"] for p in plan["pieces"]]
+        self.assertEqual(
+            kinds, ["body", "transition", "body", "transition", "body"],
+        )
+        self.assertEqual(plan["transition_frames"], 12)
+        self.assertEqual(plan["start_frames"], [0, 36, 96])
+        # 48 + 72 + 48 − 2 × 12
+        self.assertEqual(plan["total_frames"], 144)
+
+    def test_piece_frames_sum_to_total(self):
+        plan = plan_segment_timeline(
+            [1.3, 2.7, 1.1, 4.05], fps=30, transition_duration=0.5,
+        )
+        self.assertEqual(
+            sum(p["frames"] for p in plan["pieces"]), plan["total_frames"],
+        )
+
+    def test_body_excludes_transition_frames(self):
+        plan = plan_segment_timeline(
+            [2.0, 2.0], fps=10, transition_duration=0.5,
+        )
+        first_body, transition, second_body = plan["pieces"]
+        self.assertEqual((first_body["start"], first_body["end"]), (0, 15))
+        self.assertEqual((transition["start"], transition["end"]), (15, 20))
+        self.assertEqual(transition["segments"], [0, 1])
+        self.assertEqual((second_body["start"], second_body["end"]), (5, 20))
+
+    def test_segment_shorter_than_transitions_returns_none(self):
+        plan = plan_segment_timeline(
+            [2.0, 0.6, 2.0], fps=10, transition_duration=0.5,
+        )
+        self.assertIsNone(plan)
+
+    def test_invalid_fps_raises(self):
+        with self.assertRaises(ValueError):
+            plan_segment_timeline([1.0], fps=0)
+
+    def test_resolve_render_workers(self):
+        self.assertEqual(resolve_render_workers(1), 1)
+        self.assertEqual(resolve_render_workers(3), 3)
+        self.assertGreaterEqual(resolve_render_workers(0), 1)
+
+    def test_piece_pool_is_shared_between_renders(self):
+        self.addCleanup(discard_piece_pool)
+        pool = get_piece_pool(2)
+        self.assertIs(get_piece_pool(2), pool)
+
+        resized = get_piece_pool(3)
+        self.assertIsNot(resized, pool)
+        discard_piece_pool(pool)  # stale handle: no effect
+        self.assertIs(get_piece_pool(3), resized)
+
+
+# ===================================================================
+# End-to-end parallel render
+# ===================================================================
+
+@unittest.skipUnless(check_ffmpeg(), "FFmpeg not installed")
+class ParallelRenderIntegrationTests(TestCase):
+    """Render a small project with ``render_workers=2``."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.project = create_small_project("Parallel Render Test")
+        create_small_render_settings(render_workers=2)
+
+    def tearDown(self):
+        reset_ffmpeg_cache()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        remove_project_output(self.project)
+
+    def _create_segments(self, durations, project=None):
+        project = project or self.project
+        colours = [(220, 50, 50), (50, 180, 50), (50, 50, 220)]
+        for i, dur in enumerate(durations):
+            create_media_segment(
+                project, self.temp_dir, i, dur,
+                PILImage.new("RGB", (400, 300), color=colours[i % 3]),
+                prefix="par",
+            )
+
+    def test_parallel_render_produces_expected_duration(self):
+        self._create_segments([1.2, 1.2, 1.2])
+        progress = []
+        result = render_project(
+            str(self.project.id),
+            on_progress=lambda c, t, d: progress.append((c, t, d)),
+        )
+
+        self.assertEqual(result["render_mode"], "parallel")
+        self.assertEqual(result["workers"], 2)
+        self.assertGreater(result["peak_rss_mb"], 0)
+        self.assertGreater(result["worker_peak_rss_mb"], 0)
+        self.assertTrue(os.path.exists(result["output_path"]))
+        self.assertGreater(result["file_size"], 0)
+        # 3 × (1.2 + 0.3 silence) − 2 × 0.5 crossfade
+        self.assertAlmostEqual(result["duration"], 3.5, delta=0.05)
+        self.assertTrue(any(d.startswith("Exporting") for _, _, d in progress))
+
+        from moviepy import VideoFileClip  # noqa: E402
+
+        with VideoFileClip(result["output_path"]) as clip:
+            self.assertEqual(tuple(clip.size), (320, 180))
+            self.assertIsNotNone(clip.audio)
+            self.assertAlmostEqual(clip.duration, 3.5, delta=0.15)
+
+        temp_pieces = os.path.join(
+            os.path.dirname(os.path.dirname(result["output_path"])),
+            "temp", "pieces",
+        )
+        self.assertFalse(os.path.exists(temp_pieces))
+
+    def test_projects_of_any_size_share_the_pool(self):
+        from unittest.mock import patch
+
+        from api.models import GlobalSettings  # noqa: E402
+        from core_engine import parallel_renderer
+
+        self.addCleanup(discard_piece_pool)
+        # More workers than the small project has pieces
+        GlobalSettings.objects.update(render_workers=4)
+        self._create_segments([1.2, 1.2])  # 3 pieces
+        larger = create_small_project("Larger")
+        self.addCleanup(remove_project_output, larger)
+        self._create_segments([1.2, 1.2, 1.2], project=larger)  # 5 pieces
+
+        pools = []
+        original = parallel_renderer.get_piece_pool
+
+        def record_pool(workers):
+            pools.append(original(workers))
+            return pools[-1]
+
+        with patch("core_engine.parallel_renderer.get_piece_pool", side_effect=record_pool):
+            small_result = render_project(str(self.project.id))
+            large_result = render_project(str(larger.id))
+
+        self.assertEqual(len(pools), 2)
+        self.assertIs(pools[0], pools[1])
+        self.assertEqual(small_result["workers"], 3)
+        self.assertEqual(large_result["workers"], 4)
@@ -0,0 +1,105 @@
+"""
+Tests for the single-segment preview renderer.
+
+Covers the preview settings clamp, MP4 and animated WebP output, reuse
+of an up-to-date preview, and replacement of a stale preview after the
+segment's text changes.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from PIL import Image as PILImage
+
+from django.test import TestCase
+
+from core_engine.preview_renderer import (
+    PREVIEW_FPS,
+    PREVIEW_MAX_WIDTH,
+    get_cached_preview,
+    load_preview_settings,
+    render_segment_preview,
+)
+from core_engine.render_utils import check_ffmpeg, get_preview_dir
+from core_engine.tests.media import create_media_segment
+
+
+class SegmentPreviewTests(TestCase):
+    """Render previews of one segment from a small synthetic project."""
+
+    def setUp(self):
+        from api.models import GlobalSettings, Project  # noqa: E402
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.project = Project.objects.create(title="Preview Test")
+        GlobalSettings.objects.create(
+            render_width=1280,
+            render_height=720,
+            render_fps=30,
+            subtitles_enabled=False,
+        )
+
+        # Noise, so successive Ken Burns frames actually differ; index 1
+        # gets a diagonal pan (index 0 is static).
+        self.segment = create_media_segment(
+            self.project, self.temp_dir, 1, 0.5,
+            PILImage.effect_noise((400, 300), 64).convert("RGB"),
+            text="Preview me",
+            prefix="preview",
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        try:
+            preview_dir = get_preview_dir(str(self.project.id))
+            shutil.rmtree(os.path.dirname(preview_dir), ignore_errors=True)
+        except Exception:
+            pass
+
+    def test_settings_are_clamped(self):
+        settings = load_preview_settings(self.project)
+        width, height = settings["resolution"]
+        self.assertLessEqual(width, PREVIEW_MAX_WIDTH)
+        self.assertEqual((width % 2, height % 2), (0, 0))
+        self.assertEqual(settings["fps"], PREVIEW_FPS)
+        self.assertEqual(settings["render_quality"], "draft")
+
+    @unittest.skipUnless(check_ffmpeg(), "FFmpeg not available")
+    def test_mp4_preview_is_cached(self):
+        first = render_segment_preview(str(self.segment.id), "mp4")
+        self.assertFalse(first["cached"])
+        self.assertTrue(os.path.isfile(first["path"]))
+        self.assertTrue(first["url"].endswith(".mp4"))
+        self.assertEqual(get_cached_preview(self.segment, "mp4"), first["path"])
+
+        second = render_segment_preview(str(self.segment.id), "mp4")
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["path"], first["path"])
+
+    def test_webp_preview_is_animated(self):
+        result = render_segment_preview(str(self.segment.id), "webp")
+        with PILImage.open(result["path"]) as webp:
+            self.assertEqual(webp.format, "WEBP")
+            self.assertEqual(webp.size, tuple(result["resolution"]))
+            self.assertGreater(getattr(webp, "n_frames", 1), 1)
+
+    def test_text_change_replaces_stale_preview(self):
+        from api.models import GlobalSettings  # noqa: E402
+
+        GlobalSettings.objects.update(subtitles_enabled=True)
+        first = render_segment_preview(str(self.segment.id), "webp")
+
+        self.segment.text_content = "Edited caption"
+        self.segment.save()
+        self.assertIsNone(get_cached_preview(self.segment, "webp"))
+
+        second = render_segment_preview(str(self.segment.id), "webp")
+        self.assertNotEqual(first["path"], second["path"])
+        self.assertFalse(os.path.exists(first["path"]))
+        self.assertTrue(os.path.isfile(second["path"]))
+
+    def test_unknown_format_raises(self):
+        with self.assertRaises(ValueError):
+            render_segment_preview(str(self.segment.id), "gif")
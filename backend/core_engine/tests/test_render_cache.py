@@ -0,0 +1,215 @@
+"""
+Tests for the content-addressed segment render cache.
+
+Covers key stability and sensitivity, LRU/size eviction, and an
+incremental re-render where only the pieces of the changed segment are
+re-encoded.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from PIL import Image as PILImage
+
+from django.core.files.base import File
+from django.test import TestCase
+
+from core_engine.render_cache import SegmentRenderCache
+from core_engine.render_utils import check_ffmpeg
+from core_engine.tests.media import (
+    create_media_segment,
+    create_small_project,
+    create_small_render_settings,
+    remove_project_output,
+    write_silent_wav,
+)
+from core_engine.video_renderer import render_project
+
+
+_SETTINGS = {
+    "resolution": (320, 180),
+    "fps": 12,
+    "zoom_intensity": 1.3,
+    "subtitles_enabled": True,
+    "subtitle_font": "fonts/default.ttf",
+    "subtitle_color": "#FFFFFF",
+    "subtitle_font_size": None,
+    "subtitle_position": "bottom",
+    "inter_segment_silence": 0.3,
+    "logo": None,
+}
+_PIECE = {"kind": "body", "start": 0, "end": 18}
+_ENCODER = {"codec": "libx264"}
+
+
+# ===================================================================
+# Keys and eviction
+# ===================================================================
+
+class SegmentRenderCacheTests(unittest.TestCase):
+    """Unit tests for SegmentRenderCache (no rendering)."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        os.makedirs(self.cache_dir)
+        patcher = patch(
+            "core_engine.render_cache.render_utils.get_cache_dir",
+            return_value=self.cache_dir,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.image = os.path.join(self.temp_dir, "a.png")
+        PILImage.new("RGB", (40, 30), (200, 0, 0)).save(self.image)
+        self.audio = os.path.join(self.temp_dir, "a.wav")
+        write_silent_wav(self.audio, 0.5)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _segment(self, **overrides):
+        seg = {
+            "image_path": self.image,
+            "audio_path": self.audio,
+            "sequence_index": 0,
+            "visual_duration": 0.8,
+            "text_content": "Hello there.",
+        }
+        seg.update(overrides)
+        return seg
+
+    def _key(self, cache, segment=None, settings=None, piece=None):
+        return cache.piece_key(
+            piece or _PIECE,
+            [segment or self._segment()],
+            settings or _SETTINGS,
+            _ENCODER,
+        )
+
+    def test_disabled_cache_never_hits(self):
+        cache = SegmentRenderCache("p", 0)
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.lookup("abc"))
+        self.assertEqual(cache.report()["misses"], 1)
+
+    def test_key_is_stable(self):
+        cache = SegmentRenderCache("p", 1024)
+        self.assertEqual(self._key(cache), self._key(cache))
+
+    def test_key_changes_with_inputs(self):
+        cache = SegmentRenderCache("p", 1024)
+        base = self._key(cache)
+        self.assertNotEqual(base, self._key(cache, self._segment(sequence_index=1)))
+        self.assertNotEqual(base, self._key(cache, self._segment(text_content="Bye.")))
+        self.assertNotEqual(
+            base, self._key(cache, settings={**_SETTINGS, "fps": 24}),
+        )
+        self.assertNotEqual(
+            base, self._key(cache, piece={**_PIECE, "end": 17}),
+        )
+
+        # Same path, different bytes → different key (fresh instance so
+        # the per-render hash memo does not mask the change).
+        PILImage.new("RGB", (40, 30), (0, 200, 0)).save(self.image)
+        self.assertNotEqual(base, self._key(SegmentRenderCache("p", 1024)))
+
+    def test_text_ignored_when_subtitles_disabled(self):
+        cache = SegmentRenderCache("p", 1024)
+        off = {**_SETTINGS, "subtitles_enabled": False}
+        self.assertEqual(
+            self._key(cache, settings=off),
+            self._key(cache, self._segment(text_content="Other"), settings=off),
+        )
+
+    def test_store_then_lookup_hits(self):
+        cache = SegmentRenderCache("p", 1024 * 1024)
+        src = os.path.join(self.temp_dir, "piece.mp4")
+        with open(src, "wb") as fh:
+            fh.write(b"x" * 100)
+
+        stored = cache.store("k1", src)
+        self.assertEqual(os.path.dirname(stored), self.cache_dir)
+        self.assertFalse(os.path.exists(src))
+        self.assertEqual(cache.lookup("k1"), stored)
+        self.assertEqual(cache.report()["hits"], 1)
+
+    def test_evicts_least_recently_used_first(self):
+        cache = SegmentRenderCache("p", 250)
+        now = time.time()
+        for i, name in enumerate(["old", "mid", "new"]):
+            path = os.path.join(self.cache_dir, f"{name}.mp4")
+            with open(path, "wb") as fh:
+                fh.write(b"x" * 100)
+            os.utime(path, (now - 100 + i, now - 100 + i))
+
+        removed = cache.evict()
+
+        self.assertEqual(removed, 1)
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, "old.mp4")))
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, "new.mp4")))
+
+    def test_evict_respects_keep(self):
+        cache = SegmentRenderCache("p", 50)
+        for name in ("a", "b"):
+            with open(os.path.join(self.cache_dir, f"{name}.mp4"), "wb") as fh:
+                fh.write(b"x" * 100)
+
+        cache.evict(keep={"a", "b"})
+
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+
+# ===================================================================
+# Incremental re-render
+# ===================================================================
+
+@unittest.skipUnless(check_ffmpeg(), "FFmpeg not installed")
+class IncrementalRenderTests(TestCase):
+    """Re-rendering reuses every piece that does not show a changed segment."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.project = create_small_project("Render Cache Test")
+        create_small_render_settings(render_workers=1, render_cache_mb=64)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        remove_project_output(self.project)
+
+    def _create_segments(self, count):
+        return [
+            create_media_segment(
+                self.project, self.temp_dir, i, 1.2,
+                PILImage.new("RGB", (400, 300), (60 * i, 100, 200)),
+                prefix="cache",
+            )
+            for i in range(count)
+        ]
+
+    def test_second_render_only_encodes_changed_segment(self):
+        segments = self._create_segments(3)
+
+        first = render_project(str(self.project.id))
+        self.assertEqual(first["cache"]["hits"], 0)
+        self.assertEqual(first["cache"]["misses"], 5)
+
+        second = render_project(str(self.project.id))
+        self.assertEqual(second["cache"]["hits"], 5)
+        self.assertEqual(second["cache"]["misses"], 0)
+        self.assertAlmostEqual(second["duration"], first["duration"])
+
+        # Replace the middle image: its body and both crossfades change.
+        new_image = os.path.join(self.temp_dir, "replacement.png")
+        PILImage.new("RGB", (400, 300), (250, 250, 0)).save(new_image)
+        with open(new_image, "rb") as f:
+            segments[1].image_file.save("replacement.png", File(f), save=True)
+
+        third = render_project(str(self.project.id))
+        self.assertEqual(third["cache"]["hits"], 2)
+        self.assertEqual(third["cache"]["misses"], 3)
+        self.assertTrue(os.path.exists(third["output_path"]))
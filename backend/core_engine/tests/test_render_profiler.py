@@ -0,0 +1,107 @@
+"""
+Tests for the render profiler.
+
+Covers phase and per-segment accumulation, nested phases, the export
+frame rate, the live summary, externally measured (worker) phases, and
+writing the JSON report next to the output file.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from django.test import SimpleTestCase
+
+from core_engine.render_profiler import (
+    RENDER_REPORT_NAME,
+    RenderProfiler,
+    profile_phase,
+)
+
+
+class RenderProfilerTests(SimpleTestCase):
+
+    def test_phases_accumulate_per_segment(self):
+        profiler = RenderProfiler().start()
+        for segment in (1, 2):
+            with profiler.phase("ken_burns", segment):
+                time.sleep(0.01)
+        with profiler.phase("export"):
+            with profiler.phase("audio_mix"):
+                pass
+        report = profiler.stop()
+
+        phases = {p["name"]: p for p in report["phases"]}
+        self.assertEqual(phases["ken_burns"]["calls"], 2)
+        self.assertGreaterEqual(phases["ken_burns"]["wall_seconds"], 0.02)
+        self.assertGreater(phases["ken_burns"]["peak_rss_mb"], 0)
+        self.assertIn("audio_mix", phases)
+        self.assertEqual([s["index"] for s in report["segments"]], [1, 2])
+        self.assertIn("ken_burns", report["segments"][0]["phases"])
+        self.assertFalse(report["running"])
+        self.assertIsNone(report["current_phase"])
+
+    def test_snapshot_shows_current_phase(self):
+        profiler = RenderProfiler()
+        token = profiler.begin("export")
+        self.assertEqual(profiler.report()["current_phase"], "export")
+        self.assertTrue(profiler.report()["running"])
+        profiler.end(token)
+        self.assertIsNone(profiler.report()["current_phase"])
+
+    def test_export_fps_and_worker_phases(self):
+        profiler = RenderProfiler()
+        profiler.label_segment(1, "Segment 1/1", visual_duration=2.0)
+        profiler.add("piece_encode", 1.5, 1.2, 50 * 1024 * 1024, segment=1)
+        profiler.record_export(48, 2.0, {"draw_seconds": 0.51234})
+
+        report = profiler.report()
+        self.assertEqual(report["export"]["fps"], 24.0)
+        self.assertEqual(report["export"]["draw_seconds"], 0.512)
+        self.assertEqual(report["phases"][0]["peak_rss_mb"], 50.0)
+        self.assertEqual(report["segments"][0]["label"], "Segment 1/1")
+        self.assertEqual(report["segments"][0]["wall_seconds"], 1.5)
+
+    def test_summary_is_fixed_size_with_live_fps(self):
+        profiler = RenderProfiler()
+        for segment in range(20):
+            profiler.add("ken_burns", 0.1, segment=segment)
+        token = profiler.begin("export")
+        self.assertIsNone(profiler.summary()["fps"])
+        time.sleep(0.01)
+        profiler.note_frames(12)
+
+        summary = profiler.summary()
+        self.assertEqual(summary["current_phase"], "export")
+        self.assertEqual(summary["frames"], 12)
+        self.assertGreater(summary["fps"], 0)
+        self.assertNotIn("segments", summary)
+        self.assertNotIn("phases", summary)
+
+        profiler.end(token)
+        profiler.record_export(48, 2.0)
+        self.assertEqual(profiler.summary()["fps"], 24.0)
+
+    def test_profile_phase_without_profiler(self):
+        with profile_phase(None, "ken_burns", 1):
+            pass
+
+    def test_report_written_next_to_output(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        profiler = RenderProfiler()
+        with profiler.phase("setup"):
+            pass
+        profiler.stop()
+
+        path = profiler.write_report(
+            os.path.join(temp_dir, "final.mp4"), status="completed",
+        )
+
+        self.assertEqual(path, os.path.join(temp_dir, RENDER_REPORT_NAME))
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(data["status"], "completed")
+        self.assertEqual(data["phases"][0]["name"], "setup")
@@ -0,0 +1,98 @@
+"""
+Tests for the render quality presets.
+
+Covers preset lookup and fallback, even-dimension resolution scaling,
+and how ``load_render_settings`` applies a preset (from GlobalSettings
+or a per-render override) to the resolved render parameters.
+"""
+
+import unittest
+
+from PIL import Image as PILImage
+
+from django.test import TestCase
+
+from core_engine.render_quality import (
+    DEFAULT_RENDER_QUALITY,
+    RENDER_QUALITY_PRESETS,
+    get_quality_preset,
+    scale_resolution,
+)
+from core_engine.video_renderer import load_render_settings
+
+
+# ===================================================================
+# Preset helpers
+# ===================================================================
+
+class QualityPresetTests(unittest.TestCase):
+    """Pure-function tests for get_quality_preset and scale_resolution."""
+
+    def test_known_presets(self):
+        for name in ("draft", "standard", "final"):
+            preset = get_quality_preset(name)
+            self.assertEqual(preset["name"], name)
+            self.assertIn("x264_preset", preset)
+            self.assertIn("crf", preset)
+
+    def test_draft_is_cheaper_than_final(self):
+        draft = get_quality_preset("draft")
+        final = get_quality_preset("final")
+        self.assertGreater(draft["crf"], final["crf"])
+        self.assertLess(draft["resolution_scale"], final["resolution_scale"])
+        self.assertEqual(final["resample"], PILImage.Resampling.LANCZOS)
+
+    def test_unknown_name_falls_back_to_default(self):
+        with self.assertLogs("core_engine.render_quality", level="WARNING"):
+            preset = get_quality_preset("ultra")
+        self.assertEqual(preset["name"], DEFAULT_RENDER_QUALITY)
+
+    def test_none_and_case_insensitive(self):
+        self.assertEqual(get_quality_preset(None)["name"], DEFAULT_RENDER_QUALITY)
+        self.assertEqual(get_quality_preset(" Draft ")["name"], "draft")
+
+    def test_returns_copy(self):
+        preset = get_quality_preset("draft")
+        preset["crf"] = 0
+        self.assertNotEqual(RENDER_QUALITY_PRESETS["draft"]["crf"], 0)
+
+    def test_scale_resolution_keeps_even_dimensions(self):
+        self.assertEqual(scale_resolution((1920, 1080), 0.5), (960, 540))
+        self.assertEqual(scale_resolution((1280, 720), 1.0), (1280, 720))
+        width, height = scale_resolution((854, 482), 0.5)
+        self.assertEqual(width % 2, 0)
+        self.assertEqual(height % 2, 0)
+
+
+# ===================================================================
+# load_render_settings integration
+# ===================================================================
+
+class LoadRenderSettingsQualityTests(TestCase):
+    """The preset is resolved into the render settings dict."""
+
+    def setUp(self):
+        from api.models import GlobalSettings, Project
+
+        self.project = Project.objects.create(title="Quality Test")
+        GlobalSettings.objects.update_or_create(pk=1, defaults={
+            "render_width": 1280,
+            "render_height": 720,
+            "subtitle_font_size": 48,
+            "render_quality": "final",
+        })
+
+    def test_global_setting_is_used(self):
+        settings = load_render_settings(self.project)
+        self.assertEqual(settings["render_quality"], "final")
+        self.assertEqual(settings["resolution"], (1280, 720))
+        self.assertEqual(settings["subtitle_font_size"], 48)
+        self.assertEqual(settings["x264_preset"], "medium")
+
+    def test_override_scales_pixel_settings(self):
+        settings = load_render_settings(self.project, render_quality="draft")
+        self.assertEqual(settings["render_quality"], "draft")
+        self.assertEqual(settings["resolution"], (640, 360))
+        self.assertEqual(settings["subtitle_font_size"], 24)
+        self.assertEqual(settings["resample"], int(PILImage.Resampling.BILINEAR))
+        self.assertEqual(settings["crf"], 28)
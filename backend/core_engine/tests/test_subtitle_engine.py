@@ -28,8 +28,12 @@ from core_engine.subtitle_engine import (
     MIN_CHUNK_WORDS,
     MIN_DISPLAY_DURATION,
     calculate_subtitle_timing,
+    SubtitleOverlay,
+    SubtitleSprite,
     chunk_text,
+    create_subtitle_overlay,
     create_subtitles_for_segment,
+    rasterize_subtitle,
 )
 
 
@@ -381,6 +385,89 @@ class SubtitleTimingTests(TestCase):
 # ═══════════════════════════════════════════════════════════════════════
 
 
+class SubtitleSpriteTests(TestCase):
+    """Tests for the Pillow sprite rasterizer and frame overlay."""
+
+    def setUp(self):
+        from core_engine.render_utils import DEFAULT_FONT_PATH
+        self.font = DEFAULT_FONT_PATH
+
+    def test_sprite_is_cached_rgba(self):
+        first = rasterize_subtitle("Hello there", self.font, 32, "#FFFFFF", 600, 2)
+        hits = rasterize_subtitle.cache_info().hits
+        second = rasterize_subtitle("Hello there", self.font, 32, "#FFFFFF", 600, 2)
+
+        self.assertIs(first, second)
+        self.assertEqual(rasterize_subtitle.cache_info().hits, hits + 1)
+        self.assertEqual(first.shape[2], 4)
+        self.assertFalse(first.flags.writeable)
+        # White fill and black stroke are both present and opaque
+        opaque = first[first[:, :, 3] == 255][:, :3]
+        self.assertTrue((opaque == 255).all(axis=1).any())
+        self.assertTrue((opaque == 0).all(axis=1).any())
+
+    def test_long_text_wraps_within_width(self):
+        one_line = rasterize_subtitle("word " * 3, self.font, 24, "#FFFFFF", 1000, 2)
+        wrapped = rasterize_subtitle("word " * 12, self.font, 24, "#FFFFFF", 200, 2)
+        self.assertLessEqual(wrapped.shape[1], 200 + 6)
+        self.assertGreater(wrapped.shape[0], one_line.shape[0])
+
+    def test_height_limit_downscales(self):
+        sprite = rasterize_subtitle(
+            "word " * 40, self.font, 40, "#FFFFFF", 200, 2, max_height=100,
+        )
+        self.assertEqual(sprite.shape[0], 100)
+
+    def test_blend_only_touches_sprite_region(self):
+        rgba = np.zeros((10, 20, 4), dtype=np.uint8)
+        rgba[2:8, 5:15] = (255, 255, 255, 255)
+        sprite = SubtitleSprite(rgba, x=30, y=40, start=1.0, duration=2.0)
+        overlay = SubtitleOverlay([sprite])
+        frame = np.full((100, 100, 3), 50, dtype=np.uint8)
+
+        overlay.apply(frame, 0.5)  # before the window
+        self.assertTrue((frame == 50).all())
+
+        overlay.apply(frame, 1.5)
+        self.assertTrue((frame[42:48, 35:45] == 255).all())
+        changed = np.argwhere((frame != 50).any(axis=2))
+        self.assertEqual(changed.min(axis=0).tolist(), [42, 35])
+        self.assertEqual(changed.max(axis=0).tolist(), [47, 44])
+
+    def test_sprite_partly_off_frame_is_clipped(self):
+        rgba = np.full((10, 10, 4), 255, dtype=np.uint8)
+        frame = np.zeros((20, 20, 3), dtype=np.uint8)
+        SubtitleSprite(rgba, x=15, y=-5, start=0, duration=1).blend_into(frame)
+        self.assertTrue((frame[0:5, 15:20] == 255).all())
+        self.assertEqual(int(frame.sum()), 5 * 5 * 3 * 255)
+
+    def test_overlay_timing_and_position(self):
+        overlay = create_subtitle_overlay(
+            text_content=(
+                "The quick brown fox jumps over the lazy dog "
+                "near the river bank under the old oak tree"
+            ),
+            audio_duration=6.0,
+            resolution=(640, 360),
+            font=self.font,
+            color="#FFFFFF",
+        )
+        self.assertEqual(len(overlay), 3)
+        self.assertAlmostEqual(overlay.sprites[-1].end, 6.0, places=6)
+        self.assertIs(overlay.sprite_at(0.0), overlay.sprites[0])
+        self.assertIs(overlay.sprite_at(5.99), overlay.sprites[2])
+        self.assertIsNone(overlay.sprite_at(6.0))
+        for sprite in overlay.sprites:
+            width, height = sprite.size
+            self.assertGreaterEqual(sprite.y, 0)
+            self.assertLessEqual(sprite.y + height, 360)
+            self.assertEqual(sprite.x, (640 - width) // 2)
+
+    def test_empty_text_gives_empty_overlay(self):
+        overlay = create_subtitle_overlay("   ", 2.0, (640, 360), self.font, "#FFFFFF")
+        self.assertEqual(len(overlay), 0)
+
+
 class SubtitleIntegrationTests(TestCase):
     """Integration tests for the full subtitle pipeline.
 
@@ -17,15 +17,25 @@ import numpy as np
 import soundfile as sf
 from django.test import TestCase, override_settings
 
-from core_engine.model_loader import KokoroModelLoader
+from core_engine.model_loader import (
+    KokoroModelLoader,
+    build_session_options,
+    load_session_config,
+    record_optimized_model,
+)
+from core_engine.tts_benchmark import format_benchmark_report
 from core_engine.tts_wrapper import (
     DEFAULT_VOICE_ID,
     SPEED_MAX,
     SPEED_MIN,
+    STREAM_MIN_CHARS,
     VALID_VOICE_IDS,
     generate_audio,
+    generate_audio_batch,
     validate_voice_id,
+    _build_kokoro,
     _reset_kokoro_instance,
+    _stream_chunks,
 )
 
 
@@ -308,6 +318,375 @@ class TestGenerateAudio(TestCase):
                 self.fail(f"generate_audio raised {type(e).__name__}: {e}")
 
 
+# ---------------------------------------------------------------------------
+# ONNX Session Options Tests
+# ---------------------------------------------------------------------------
+
+
+class TestSessionOptions(TestCase):
+    """Tests for the configurable ONNX Runtime session options."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @override_settings(TTS_ONNX_SESSION={"intra_op_threads": 3, "bogus": 1})
+    def test_settings_and_overrides_merge(self):
+        config = load_session_config({"execution_mode": "parallel"})
+        self.assertEqual(config["intra_op_threads"], 3)
+        self.assertEqual(config["execution_mode"], "parallel")
+        self.assertNotIn("bogus", config)
+
+    def test_invalid_enums_fall_back(self):
+        config = load_session_config({
+            "execution_mode": "turbo", "graph_optimization_level": "max",
+        })
+        self.assertEqual(config["execution_mode"], "sequential")
+        self.assertEqual(config["graph_optimization_level"], "all")
+
+    def test_options_applied(self):
+        import onnxruntime as ort
+
+        config = load_session_config({
+            "intra_op_threads": 2,
+            "inter_op_threads": 1,
+            "allow_spinning": False,
+            "graph_optimization_level": "basic",
+            "enable_cpu_mem_arena": False,
+        })
+        options, path = build_session_options(config, "/models/kokoro.onnx")
+
+        self.assertEqual(path, "/models/kokoro.onnx")
+        self.assertEqual(options.intra_op_num_threads, 2)
+        self.assertEqual(options.inter_op_num_threads, 1)
+        self.assertFalse(options.enable_cpu_mem_arena)
+        self.assertEqual(
+            options.graph_optimization_level,
+            ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        )
+        self.assertEqual(
+            options.get_session_config_entry("session.intra_op.allow_spinning"), "0",
+        )
+
+    def test_optimized_model_saved_then_reused(self):
+        import onnxruntime as ort
+
+        model = os.path.join(self.temp_dir, "kokoro.onnx")
+        with open(model, "wb") as f:
+            f.write(b"model v1")
+        optimized = os.path.join(self.temp_dir, "kokoro.opt.onnx")
+        config = load_session_config({"optimized_model_path": optimized})
+
+        options, path = build_session_options(config, model)
+        self.assertEqual(path, model)
+        self.assertEqual(options.optimized_model_filepath, optimized)
+
+        # Saved by the session, then recorded against its source
+        open(optimized, "wb").close()
+        record_optimized_model(optimized, model, config["graph_optimization_level"])
+        options, path = build_session_options(config, model)
+        self.assertEqual(path, optimized)
+        self.assertEqual(
+            options.graph_optimization_level,
+            ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        )
+
+    def test_optimized_model_regenerated_when_source_changes(self):
+        model = os.path.join(self.temp_dir, "kokoro.onnx")
+        with open(model, "wb") as f:
+            f.write(b"model v1")
+        optimized = os.path.join(self.temp_dir, "kokoro.opt.onnx")
+        open(optimized, "wb").close()
+        config = load_session_config({"optimized_model_path": optimized})
+
+        # No record of the source model: not trusted
+        options, path = build_session_options(config, model)
+        self.assertEqual(path, model)
+
+        record_optimized_model(optimized, model, "all")
+        self.assertEqual(build_session_options(config, model)[1], optimized)
+
+        with open(model, "wb") as f:
+            f.write(b"replacement model")
+        options, path = build_session_options(config, model)
+        self.assertEqual(path, model)
+        self.assertEqual(options.optimized_model_filepath, optimized)
+
+        # A different optimization level needs a new graph too
+        record_optimized_model(optimized, model, "all")
+        basic = load_session_config({
+            "optimized_model_path": optimized, "graph_optimization_level": "basic",
+        })
+        self.assertEqual(build_session_options(basic, model)[1], model)
+
+    @patch("core_engine.model_loader.create_inference_session")
+    def test_kokoro_built_from_tuned_session(self, mock_create):
+        kokoro_cls = MagicMock()
+        _build_kokoro(kokoro_cls, "/m.onnx", "/v.bin")
+        kokoro_cls.from_session.assert_called_once_with(
+            mock_create.return_value, "/v.bin",
+        )
+
+    def test_benchmark_report_sorted_by_rtf(self):
+        report = format_benchmark_report([
+            {"name": "slow", "rtf": 0.9, "synth_seconds": 4.5,
+             "audio_seconds": 5.0, "load_seconds": 1.0},
+            {"name": "fast", "rtf": 0.2, "synth_seconds": 1.0,
+             "audio_seconds": 5.0, "load_seconds": 1.0},
+            {"name": "broken", "error": "boom"},
+        ])
+        lines = report.splitlines()
+        self.assertTrue(lines[2].startswith("fast"))
+        self.assertIn("broken", report)
+        self.assertIn("Fastest: fast", report)
+
+
+# ---------------------------------------------------------------------------
+# Batched Generation Tests
+# ---------------------------------------------------------------------------
+
+
+class _FakePhonemeKokoro:
+    """Minimal stand-in for a kokoro-onnx release with phoneme input."""
+
+    def __init__(self):
+        self.tokenizer = MagicMock()
+        self.tokenizer.phonemize.side_effect = lambda text, lang: f"/{text}/"
+        self.style_calls = 0
+        self.created = []
+
+    def get_voices(self):
+        return sorted(VALID_VOICE_IDS)
+
+    def get_voice_style(self, voice):
+        self.style_calls += 1
+        return np.zeros((512, 1, 256), dtype=np.float32)
+
+    def create(self, text, voice, speed=1.0, lang="en-us", is_phonemes=False):
+        if "fail" in text:
+            raise RuntimeError("inference exploded")
+        self.created.append((text, is_phonemes))
+        # Audio length proportional to the input, so results are distinguishable
+        return np.full(2400 * len(text), 0.1, dtype=np.float32), 24000
+
+
+class TestGenerateAudioBatch(TestCase):
+    """Tests for the generate_audio_batch() pipeline."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        _reset_kokoro_instance()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _reset_kokoro_instance()
+
+    def _items(self, texts):
+        return [
+            {
+                "key": f"seg-{i}",
+                "text": text,
+                "output_path": os.path.join(self.temp_dir, f"seg-{i}.wav"),
+            }
+            for i, text in enumerate(texts)
+        ]
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_results_in_order_with_callbacks(self, mock_get_kokoro):
+        kokoro = _FakePhonemeKokoro()
+        mock_get_kokoro.return_value = kokoro
+        starts, finished = [], []
+
+        results = generate_audio_batch(
+            self._items(["one", "three", "five5"]),
+            on_start=lambda i, total, key: starts.append((i, total, key)),
+            on_result=lambda key, result: finished.append(key),
+        )
+
+        self.assertEqual([r["success"] for r in results], [True, True, True])
+        self.assertEqual(starts[0], (0, 3, "seg-0"))
+        self.assertEqual(finished, ["seg-0", "seg-1", "seg-2"])
+        # Voice style resolved once; every segment synthesised from phonemes
+        self.assertEqual(kokoro.style_calls, 1)
+        self.assertEqual(kokoro.created[1], ("/three/", True))
+        data, sr = sf.read(results[1]["audio_path"])
+        self.assertEqual(sr, 24000)
+        self.assertAlmostEqual(results[1]["duration"], 0.7, places=2)
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_per_segment_errors_do_not_stop_batch(self, mock_get_kokoro):
+        mock_get_kokoro.return_value = _FakePhonemeKokoro()
+
+        results = generate_audio_batch(self._items(["ok", "   ", "fail", "fine"]))
+
+        self.assertEqual(
+            [r["success"] for r in results], [True, False, False, True],
+        )
+        self.assertIn("empty", results[1]["error"])
+        self.assertIn("inference exploded", results[2]["error"])
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_cancellation_stops_before_next_segment(self, mock_get_kokoro):
+        mock_get_kokoro.return_value = _FakePhonemeKokoro()
+        processed = []
+
+        results = generate_audio_batch(
+            self._items(["a", "b", "c", "d"]),
+            on_result=lambda key, result: processed.append(key),
+            should_cancel=lambda: len(processed) >= 2,
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(processed, ["seg-0", "seg-1"])
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_cache_lookup_error_falls_back_to_synthesis(self, mock_get_kokoro):
+        kokoro = _FakePhonemeKokoro()
+        mock_get_kokoro.return_value = kokoro
+        cache = MagicMock(enabled=True)
+        cache.key_for.side_effect = lambda text, voice, speed: text
+        cache.contains.side_effect = FileNotFoundError("evicted")
+
+        results = generate_audio_batch(self._items(["one", "two"]), cache=cache)
+
+        self.assertEqual([r["success"] for r in results], [True, True])
+        self.assertEqual(len(kokoro.created), 2)
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_dead_producer_does_not_hang_the_batch(self, mock_get_kokoro):
+        mock_get_kokoro.return_value = _FakePhonemeKokoro()
+        cache = MagicMock(enabled=True)
+        cache.key_for.side_effect = lambda text, voice, speed: text
+        # Not an Exception, so it escapes the per-item handling and ends the thread
+        cache.contains.side_effect = SystemExit
+
+        results = generate_audio_batch(self._items(["one", "two"]), cache=cache)
+
+        self.assertEqual([r["success"] for r in results], [False, False])
+        self.assertIn("phonemizer stopped", results[0]["error"])
+
+    @patch("core_engine.tts_wrapper.generate_audio")
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_falls_back_without_phoneme_support(self, mock_get_kokoro, mock_gen):
+        """A Kokoro without is_phonemes support uses generate_audio per item."""
+        mock_get_kokoro.return_value = MagicMock()
+        mock_gen.return_value = {"success": True, "duration": 1.0}
+
+        results = generate_audio_batch(self._items(["a", "b"]), voice_id="am_adam")
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(mock_gen.call_count, 2)
+        self.assertEqual(mock_gen.call_args.kwargs["voice_id"], "am_adam")
+
+
+# ---------------------------------------------------------------------------
+# Streaming Synthesis Tests
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingSynthesis(TestCase):
+    """Tests for chunked, streamed synthesis of long narration."""
+
+    SENTENCE = "The quick brown fox jumps over the lazy dog near the riverbank. "
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.long_text = (self.SENTENCE * 12).strip()
+        _reset_kokoro_instance()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _reset_kokoro_instance()
+
+    def _mock_kokoro(self):
+        kokoro = MagicMock(spec=["get_voices", "create"])
+        kokoro.get_voices.return_value = sorted(VALID_VOICE_IDS)
+        kokoro.create.side_effect = lambda text, **kw: (
+            np.full(240 * len(text), 0.1, dtype=np.float32), 24000,
+        )
+        return kokoro
+
+    def test_chunking_threshold(self):
+        self.assertGreater(len(self.long_text), STREAM_MIN_CHARS)
+        self.assertEqual(_stream_chunks("Short text."), ["Short text."])
+        self.assertEqual(_stream_chunks(self.long_text, stream=False), [self.long_text])
+        chunks = _stream_chunks(self.long_text)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(" ".join(chunks), self.long_text)
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_long_text_streams_chunks_to_one_wav(self, mock_get_kokoro):
+        kokoro = self._mock_kokoro()
+        mock_get_kokoro.return_value = kokoro
+        output_path = os.path.join(self.temp_dir, "long.wav")
+        progress = []
+
+        result = generate_audio(
+            self.long_text,
+            output_path=output_path,
+            on_chunk=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertTrue(result["success"])
+        chunks = kokoro.create.call_count
+        self.assertGreater(chunks, 1)
+        self.assertEqual(progress, [(i, chunks) for i in range(1, chunks + 1)])
+        data, sr = sf.read(output_path)
+        self.assertEqual(sr, 24000)
+        # The mock yields 240 samples per character of each chunk
+        expected = sum(240 * len(c) for c in _stream_chunks(self.long_text))
+        self.assertEqual(len(data), expected)
+        self.assertFalse(os.path.exists(output_path + ".partial"))
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_failed_chunk_keeps_previous_audio(self, mock_get_kokoro):
+        kokoro = self._mock_kokoro()
+        mock_get_kokoro.return_value = kokoro
+        output_path = os.path.join(self.temp_dir, "long.wav")
+        with open(output_path, "wb") as f:
+            f.write(b"previous")
+
+        calls = {"n": 0}
+        original = kokoro.create.side_effect
+
+        def flaky(text, **kw):
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise RuntimeError("chunk failed")
+            return original(text, **kw)
+
+        kokoro.create.side_effect = flaky
+        result = generate_audio(self.long_text, output_path=output_path)
+
+        self.assertFalse(result["success"])
+        self.assertIn("chunk failed", result["error"])
+        with open(output_path, "rb") as f:
+            self.assertEqual(f.read(), b"previous")
+        self.assertFalse(os.path.exists(output_path + ".partial"))
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_batch_streams_long_segments(self, mock_get_kokoro):
+        kokoro = _FakePhonemeKokoro()
+        mock_get_kokoro.return_value = kokoro
+        items = [
+            {"key": "short", "text": "Hi.", "output_path": os.path.join(self.temp_dir, "a.wav")},
+            {"key": "long", "text": self.long_text, "output_path": os.path.join(self.temp_dir, "b.wav")},
+        ]
+        progress = []
+
+        results = generate_audio_batch(
+            items, on_chunk=lambda key, done, total: progress.append((key, done, total)),
+        )
+
+        self.assertTrue(all(r["success"] for r in results))
+        chunks = len(_stream_chunks(self.long_text))
+        self.assertEqual(progress[0], ("short", 1, 1))
+        self.assertEqual(progress[1:], [("long", i, chunks) for i in range(1, chunks + 1)])
+        self.assertEqual(len(kokoro.created), 1 + chunks)
+
+
 # ---------------------------------------------------------------------------
 # Voice ID Validation Tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,144 @@
+"""
+Tests for the content-addressed TTS audio cache.
+
+Covers key normalization, cache hits that bypass the model, size-bounded
+LRU eviction, cached results in batched generation, and protection of
+hard-linked cache entries when a segment is regenerated.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from django.test import TestCase
+
+from core_engine.tts_cache import TTSAudioCache, normalize_tts_text, tts_input_hash
+from core_engine.tts_wrapper import (
+    VALID_VOICE_IDS,
+    _reset_kokoro_instance,
+    generate_audio,
+    generate_audio_batch,
+)
+
+
+def _mock_kokoro(value=0.25):
+    """Mock Kokoro returning one second of constant audio at 24 kHz."""
+    kokoro = MagicMock(spec=["get_voices", "create"])
+    kokoro.get_voices.return_value = sorted(VALID_VOICE_IDS)
+    kokoro.create.return_value = (np.full(24000, value, dtype=np.float32), 24000)
+    return kokoro
+
+
+class TTSAudioCacheTests(TestCase):
+    """Tests for TTSAudioCache and its use by generate_audio()."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.cache = TTSAudioCache(50 * 1024 * 1024, cache_dir=self.cache_dir)
+        _reset_kokoro_instance()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _reset_kokoro_instance()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir, "out", f"{name}.wav")
+
+    def test_key_normalizes_text_only(self):
+        base = self.cache.key_for("Hello  world\n", "af_bella", 1.0)
+        self.assertEqual(base, self.cache.key_for(" Hello world", "af_bella", 1.0))
+        # Decomposed "é" normalizes to the composed form
+        self.assertEqual(
+            self.cache.key_for("Cafe\u0301", "af_bella", 1.0),
+            self.cache.key_for("Caf\u00e9", "af_bella", 1.0),
+        )
+        self.assertNotEqual(base, self.cache.key_for("Hello world", "am_adam", 1.0))
+        self.assertNotEqual(base, self.cache.key_for("Hello world", "af_bella", 1.2))
+        self.assertEqual(normalize_tts_text("  a \t b  "), "a b")
+
+    def test_input_hash_ignores_formatting(self):
+        base = tts_input_hash("Hello  world", "af_bella", 1.0)
+        self.assertEqual(base, tts_input_hash(" Hello world\n", "af_bella", 1.001))
+        self.assertNotEqual(base, tts_input_hash("Hello world!", "af_bella", 1.0))
+        self.assertNotEqual(base, tts_input_hash("Hello world", "am_adam", 1.0))
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_hit_skips_model(self, mock_get_kokoro):
+        kokoro = _mock_kokoro()
+        mock_get_kokoro.return_value = kokoro
+
+        first = generate_audio("Same words", output_path=self._path("a"), cache=self.cache)
+        second = generate_audio("Same  words", output_path=self._path("b"), cache=self.cache)
+
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(kokoro.create.call_count, 1)
+        self.assertAlmostEqual(second["duration"], first["duration"], places=3)
+        with open(self._path("a"), "rb") as a, open(self._path("b"), "rb") as b:
+            self.assertEqual(a.read(), b.read())
+        self.assertEqual(self.cache.report()["hits"], 1)
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_disabled_cache_always_synthesises(self, mock_get_kokoro):
+        kokoro = _mock_kokoro()
+        mock_get_kokoro.return_value = kokoro
+        disabled = TTSAudioCache(0)
+
+        for name in ("a", "b"):
+            result = generate_audio("Same words", output_path=self._path(name), cache=disabled)
+            self.assertFalse(result["cached"])
+        self.assertEqual(kokoro.create.call_count, 2)
+        self.assertIsNone(disabled.cache_dir)
+
+    def test_eviction_removes_least_recently_used(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        small = TTSAudioCache(2500, cache_dir=self.cache_dir)
+        for i, key in enumerate(("old", "mid", "new")):
+            path = os.path.join(self.temp_dir, f"{key}.wav")
+            with open(path, "wb") as f:
+                f.write(b"\0" * 1000)
+            small.store(key, path)
+            stamp = 1_000_000 + i * 100
+            os.utime(os.path.join(self.cache_dir, f"{key}.wav"), (stamp, stamp))
+
+        # Storing the third entry pushed the cache over its bound
+        self.assertEqual(small.evicted, 1)
+        self.assertEqual(small.evict(), 0)
+        remaining = sorted(os.listdir(self.cache_dir))
+        self.assertEqual(remaining, ["mid.wav", "new.wav"])
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_regenerating_does_not_corrupt_cache_entry(self, mock_get_kokoro):
+        mock_get_kokoro.return_value = _mock_kokoro(0.25)
+        generate_audio("Original", output_path=self._path("a"), cache=self.cache)
+        generate_audio("Original", output_path=self._path("b"), cache=self.cache)
+        key = self.cache.key_for("Original", "af_bella", 1.0)
+        with open(os.path.join(self.cache_dir, f"{key}.wav"), "rb") as f:
+            cached_bytes = f.read()
+
+        # Segment "b" is edited: new audio is written over its hard link
+        mock_get_kokoro.return_value = _mock_kokoro(-0.5)
+        generate_audio("Edited", output_path=self._path("b"), cache=self.cache)
+
+        with open(os.path.join(self.cache_dir, f"{key}.wav"), "rb") as f:
+            self.assertEqual(f.read(), cached_bytes)
+        with open(self._path("b"), "rb") as f:
+            self.assertNotEqual(f.read(), cached_bytes)
+
+    @patch("core_engine.tts_wrapper._get_kokoro_instance")
+    def test_batch_reports_cached_segments(self, mock_get_kokoro):
+        kokoro = _mock_kokoro()
+        mock_get_kokoro.return_value = kokoro
+        generate_audio("Repeated line", output_path=self._path("seed"), cache=self.cache)
+
+        items = [
+            {"key": "s0", "text": "Repeated line", "output_path": self._path("s0")},
+            {"key": "s1", "text": "Brand new line", "output_path": self._path("s1")},
+        ]
+        results = generate_audio_batch(items, cache=self.cache)
+
+        self.assertEqual([r["cached"] for r in results], [True, False])
+        self.assertEqual(kokoro.create.call_count, 2)
@@ -0,0 +1,146 @@
+"""
+StoryFlow TTS Session Benchmark.
+
+Measures the real-time factor (RTF = synthesis time / audio duration) of
+Kokoro-82M under several ONNX Runtime session configurations, so the
+``TTS_ONNX_SESSION`` setting can be tuned for the CPU the backend runs
+on. An RTF below 1.0 means speech is generated faster than it plays.
+
+Used by ``python manage.py benchmark_tts`` and, when
+``TTS_STARTUP_BENCHMARK`` is enabled, once in the background at server
+startup (see ``api.apps.ApiConfig.ready``).
+"""
+
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_TEXT = (
+    "The old lighthouse keeper climbed the spiral stairs one last time, "
+    "counting each step as the storm gathered over the grey northern sea."
+)
+BENCHMARK_VOICE = "af_bella"
+
+
+def default_benchmark_configs():
+    """
+    Return the configurations compared when none are configured.
+
+    Sweeps intra-op thread counts (1, 2, 4, … up to the CPU count) in
+    sequential mode, plus the ONNX Runtime defaults as a baseline.
+    """
+    cpu_count = os.cpu_count() or 1
+    threads = sorted({n for n in (1, 2, 4, 8, cpu_count) if n <= cpu_count})
+    configs = [{"name": "ort-defaults"}]
+    for n in threads:
+        configs.append({
+            "name": f"intra={n}",
+            "intra_op_threads": n,
+            "inter_op_threads": 1,
+            "execution_mode": "sequential",
+            "graph_optimization_level": "all",
+        })
+    return configs
+
+
+def _benchmark_one(kokoro_cls, model_path, voices_path, config, text, voice_id, repeats):
+    """Create a session for *config*, warm it up, and time *repeats* runs."""
+    from core_engine.model_loader import load_session_config
+    from core_engine.tts_wrapper import _build_kokoro
+
+    overrides = {k: v for k, v in config.items() if k != "name"}
+    session_config = load_session_config(overrides)
+
+    start = time.perf_counter()
+    kokoro = _build_kokoro(kokoro_cls, model_path, voices_path, session_config)
+    load_seconds = time.perf_counter() - start
+
+    # Warm-up run: first inference pays for arena growth and lazy init.
+    kokoro.create(text, voice=voice_id, speed=1.0, lang="en-us")
+
+    synth_seconds = 0.0
+    audio_seconds = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        audio, sample_rate = kokoro.create(text, voice=voice_id, speed=1.0, lang="en-us")
+        synth_seconds += time.perf_counter() - start
+        audio_seconds += len(audio) / sample_rate
+
+    return {
+        "name": config.get("name", "custom"),
+        "config": session_config,
+        "load_seconds": round(load_seconds, 3),
+        "synth_seconds": round(synth_seconds / repeats, 3),
+        "audio_seconds": round(audio_seconds / repeats, 3),
+        "rtf": round(synth_seconds / audio_seconds, 4) if audio_seconds else None,
+    }
+
+
+def run_tts_benchmark(configs=None, text=BENCHMARK_TEXT, voice_id=BENCHMARK_VOICE, repeats=3):
+    """
+    Benchmark each configuration and return one result dict per config.
+
+    Args:
+        configs: List of override dicts (optionally with a ``name``);
+            defaults to the ``TTS_BENCHMARK_CONFIGS`` setting or
+            :func:`default_benchmark_configs`.
+        text: Sentence to synthesise.
+        voice_id: Kokoro voice to use.
+        repeats: Timed runs per configuration (after one warm-up).
+
+    Returns:
+        list[dict]: ``name``, ``config``, ``load_seconds``,
+        ``synth_seconds``, ``audio_seconds``, ``rtf`` — or ``name`` and
+        ``error`` for a configuration that failed.
+
+    Raises:
+        FileNotFoundError: If the model or voices file is missing.
+        ImportError: If kokoro-onnx is not installed.
+    """
+    from django.conf import settings
+    from kokoro_onnx import Kokoro
+
+    from core_engine.tts_wrapper import _resolve_model_path, _resolve_voices_path
+
+    model_path = _resolve_model_path()
+    voices_path = _resolve_voices_path()
+    for path in (model_path, voices_path):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"TTS benchmark needs {path}")
+
+    if configs is None:
+        configs = getattr(settings, "TTS_BENCHMARK_CONFIGS", None) or default_benchmark_configs()
+
+    results = []
+    for config in configs:
+        try:
+            results.append(_benchmark_one(
+                Kokoro, model_path, voices_path, config, text, voice_id, max(int(repeats), 1),
+            ))
+        except Exception as exc:
+            logger.warning("TTS benchmark config %s failed: %s", config.get("name"), exc)
+            results.append({"name": config.get("name", "custom"), "error": str(exc)})
+    return results
+
+
+def format_benchmark_report(results):
+    """Render benchmark results as a fixed-width text table (best RTF first)."""
+    ok = sorted((r for r in results if "error" not in r), key=lambda r: r["rtf"])
+    failed = [r for r in results if "error" in r]
+
+    lines = [
+        f"{'configuration':<16} {'RTF':>7} {'synth s':>8} {'audio s':>8} {'load s':>7}",
+        "-" * 50,
+    ]
+    for r in ok:
+        lines.append(
+            f"{r['name']:<16} {r['rtf']:>7.3f} {r['synth_seconds']:>8.3f} "
+            f"{r['audio_seconds']:>8.3f} {r['load_seconds']:>7.3f}"
+        )
+    for r in failed:
+        lines.append(f"{r['name']:<16} failed: {r['error']}")
+    if ok:
+        lines.append(f"Fastest: {ok[0]['name']} (RTF {ok[0]['rtf']:.3f})")
+    return "\n".join(lines)
@@ -0,0 +1,278 @@
+"""
+StoryFlow TTS Audio Cache.
+
+Content-addressed store for synthesised narration WAVs, shared by every
+project.  A cache key hashes everything that determines the audio:
+
+* the **normalized** text (Unicode NFC, whitespace collapsed, trimmed),
+* the voice ID and the clamped speed (rounded to 2 decimals),
+* the model version (model and voices file names and sizes),
+* :data:`TTS_CACHE_VERSION`.
+
+Entries live under ``MEDIA_ROOT/tts_cache/<key>.wav``.  On a hit the
+cached file is hard-linked (or copied, where links are unsupported) to
+the segment's ``construct_audio_path`` so identical text — duplicated
+projects, re-imports, ``force_regenerate`` — never reaches the model.
+
+The cache is bounded by total size; the least recently used entries
+(by modification time, refreshed on every hit) are evicted first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+from core_engine.audio_utils import get_audio_duration
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached WAV after a change to the TTS pipeline
+# that alters the generated audio.
+TTS_CACHE_VERSION: int = 1
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_tts_text(text: str) -> str:
+    """Return *text* in the canonical form used for cache keys."""
+    text = unicodedata.normalize("NFC", text or "")
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def tts_input_hash(text: str, voice_id: str, speed: float) -> str:
+    """Hash the inputs that decide a segment's narration.
+
+    Unlike :meth:`TTSAudioCache.key_for` it leaves out the model
+    version, so installing another model file does not mark every
+    generated segment as out of date.
+    """
+    payload = {
+        "text": normalize_tts_text(text),
+        "voice": voice_id,
+        "speed": round(float(speed), 2),
+    }
+    blob = json.dumps(payload, sort_keys=True)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def get_tts_cache_dir() -> str:
+    """Return (and create) ``<MEDIA_ROOT>/tts_cache/``.
+
+    Raises:
+        ValueError: If ``MEDIA_ROOT`` is not configured.
+    """
+    from django.conf import settings  # noqa: E402 — deferred import
+
+    media_root = getattr(settings, "MEDIA_ROOT", None)
+    if not media_root:
+        raise ValueError(
+            "MEDIA_ROOT is not configured in Django settings. "
+            "This setting is required for the TTS audio cache."
+        )
+    path = Path(media_root) / "tts_cache"
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
+def model_version() -> str:
+    """Identify the installed Kokoro model and voices by name and size."""
+    from core_engine.tts_wrapper import _resolve_model_path, _resolve_voices_path
+
+    parts = []
+    for path in (_resolve_model_path(), _resolve_voices_path()):
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        parts.append(f"{os.path.basename(path)}:{size}")
+    return "|".join(parts)
+
+
+class TTSAudioCache:
+    """Size-bounded, LRU-evicted cache of synthesised WAV files.
+
+    Args:
+        max_bytes: Upper bound on the total size of cached files.
+            ``0`` disables the cache (every lookup misses, nothing is
+            stored).
+        cache_dir: Override the cache directory (defaults to
+            :func:`get_tts_cache_dir`).
+    """
+
+    def __init__(self, max_bytes: int, cache_dir: Optional[str] = None):
+        self.max_bytes = max(int(max_bytes), 0)
+        self.cache_dir = None
+        if self.enabled:
+            self.cache_dir = cache_dir or get_tts_cache_dir()
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._model_version: Optional[str] = None
+
+    @classmethod
+    def from_settings(cls) -> "TTSAudioCache":
+        """Build a cache sized by ``GlobalSettings.tts_cache_mb``.
+
+        Any problem reading the settings disables the cache rather than
+        failing the TTS request.
+        """
+        try:
+            from api.models import GlobalSettings  # noqa: E402 — deferred import
+
+            cache_mb = GlobalSettings.load().tts_cache_mb
+            return cls(cache_mb * 1024 * 1024)
+        except Exception as exc:
+            logger.warning("TTS audio cache disabled: %s", exc)
+            return cls(0)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def key_for(self, text: str, voice_id: str, speed: float) -> str:
+        """Return the content hash for one synthesis request."""
+        if self._model_version is None:
+            self._model_version = model_version()
+        payload = {
+            "version": TTS_CACHE_VERSION,
+            "model": self._model_version,
+            "text": normalize_tts_text(text),
+            "voice": voice_id,
+            "speed": round(float(speed), 2),
+        }
+        blob = json.dumps(payload, sort_keys=True)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.wav")
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def contains(self, key: str) -> bool:
+        """Return True if a non-empty entry exists for *key* (no side effects)."""
+        if not self.enabled:
+            return False
+        cached = self._path_for(key)
+        return os.path.isfile(cached) and os.path.getsize(cached) > 0
+
+    def fetch(self, key: str, output_path: str) -> Optional[float]:
+        """Materialise the cached WAV for *key* at *output_path*.
+
+        Returns:
+            The audio duration in seconds on a hit, ``None`` on a miss.
+        """
+        if not self.enabled:
+            self.misses += 1
+            return None
+
+        cached = self._path_for(key)
+        if not (os.path.isfile(cached) and os.path.getsize(cached) > 0):
+            self.misses += 1
+            return None
+
+        try:
+            _link_or_copy(cached, output_path)
+            os.utime(cached, None)
+            duration = get_audio_duration(output_path)
+        except (OSError, ValueError) as exc:
+            logger.warning("TTS cache entry %s unusable: %s", key, exc)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return duration
+
+    def store(self, key: str, wav_path: str) -> None:
+        """Add a freshly generated WAV to the cache, then enforce the bound."""
+        if not self.enabled or not os.path.isfile(wav_path):
+            return
+        try:
+            _link_or_copy(wav_path, self._path_for(key))
+        except OSError as exc:
+            logger.warning("Could not store WAV in TTS cache: %s", exc)
+            return
+        self.evict(keep={key})
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def evict(self, keep: Optional[set[str]] = None) -> int:
+        """Delete least recently used entries until under ``max_bytes``.
+
+        Returns:
+            Number of files removed.
+        """
+        if not self.enabled or not os.path.isdir(self.cache_dir):
+            return 0
+
+        keep = keep or set()
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".wav"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total += stat.st_size
+            entries.append((stat.st_mtime, stat.st_size, name[:-4], path))
+
+        removed = 0
+        for _mtime, size, key, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key in keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError as exc:
+                logger.warning("Could not evict TTS cache file %s: %s", path, exc)
+
+        if removed:
+            logger.info(
+                "TTS cache: evicted %d file(s), %.1f MB kept.",
+                removed, total / (1024 * 1024),
+            )
+        self.evicted += removed
+        return removed
+
+    def report(self) -> dict:
+        """Summarise cache activity for logs and task results."""
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted": self.evicted,
+        }
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    """Hard-link *source* to *target*, copying where links are unsupported.
+
+    Any existing *target* is unlinked first so a shared inode is never
+    overwritten in place.
+    """
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    if os.path.lexists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
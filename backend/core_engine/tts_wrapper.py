@@ -8,10 +8,24 @@ pipeline, and returns a structured result dict.
 
 Never raises exceptions — always returns a dict with a ``success``
 key.
+
+``generate_audio_batch()`` is the bulk variant used by "Generate all
+audio": it resolves the voice once, phonemizes upcoming segments on a
+producer thread while the ONNX session synthesises the current one,
+and reports each segment's result through callbacks.
+
+Long narration is synthesised in streaming mode: the text is split at
+sentence boundaries (``split_text_into_chunks``), each chunk is
+synthesised on its own and appended to the WAV file as soon as it is
+ready (``_StreamingWavWriter``), and an ``on_chunk`` callback reports
+progress within the segment. Peak memory is bounded by one chunk rather
+than the whole narration.
 """
 
+import inspect
 import logging
 import os
+import queue
 import re
 import threading
 import wave
@@ -65,6 +79,18 @@ DEFAULT_VOICE_ID = "af_bella"
 SPEED_MIN = 0.5
 SPEED_MAX = 2.0
 
+TTS_LANG = "en-us"
+
+# How many segments the batch producer may phonemize ahead of inference.
+BATCH_PHONEMIZE_LOOKAHEAD = 8
+
+# Texts longer than this are synthesised chunk by chunk (streaming mode)
+# unless the caller forces a mode with ``stream=True/False``.
+STREAM_MIN_CHARS = 500
+
+# Target chunk length (characters) for streaming synthesis.
+STREAM_CHUNK_CHARS = 300
+
 # --------------------------------------------------------------------------
 # Audio File Path Construction (Task 03.01.07)
 # --------------------------------------------------------------------------
@@ -182,6 +208,27 @@ def _resolve_voices_path():
     return str(settings.BASE_DIR.parent / "models" / "voices.bin")
 
 
+def _build_kokoro(kokoro_cls, model_path, voices_path, session_config=None):
+    """
+    Construct a Kokoro instance on a tuned ONNX session.
+
+    kokoro-onnx >= 0.3 accepts a pre-built session via
+    ``Kokoro.from_session``; older releases only take a model path, in
+    which case the ``TTS_ONNX_SESSION`` options cannot be applied.
+    """
+    from core_engine.model_loader import create_inference_session
+
+    if hasattr(kokoro_cls, "from_session"):
+        session = create_inference_session(model_path, session_config)
+        return kokoro_cls.from_session(session, voices_path)
+
+    logger.warning(
+        "Installed kokoro-onnx does not support from_session(); "
+        "TTS_ONNX_SESSION options are not applied."
+    )
+    return kokoro_cls(model_path, voices_path)
+
+
 def _get_kokoro_instance():
     """
     Return a lazily-initialized Kokoro instance (thread-safe singleton).
@@ -212,7 +259,7 @@ def _get_kokoro_instance():
                     logger.error("Voices file not found at: %s", voices_path)
                     return None
 
-                _kokoro_instance = Kokoro(model_path, voices_path)
+                _kokoro_instance = _build_kokoro(Kokoro, model_path, voices_path)
                 logger.info(
                     "Kokoro-ONNX initialized: model=%s, voices=%s",
                     model_path,
@@ -239,7 +286,15 @@ def _reset_kokoro_instance():
 # --------------------------------------------------------------------------
 
 
-def generate_audio(text, voice_id="af_bella", speed=1.0, output_path=None):
+def generate_audio(
+    text,
+    voice_id="af_bella",
+    speed=1.0,
+    output_path=None,
+    cache=None,
+    stream=None,
+    on_chunk=None,
+):
     """
     Generate speech audio from text using the Kokoro-82M ONNX model.
 
@@ -255,13 +310,22 @@ def generate_audio(text, voice_id="af_bella", speed=1.0, output_path=None):
         speed (float): Speech speed multiplier (clamped to 0.5–2.0).
         output_path (str): Absolute path where the .wav file will be
             saved.
+        cache: Optional :class:`core_engine.tts_cache.TTSAudioCache`.
+            On a hit the cached WAV is linked to *output_path* without
+            loading the model; fresh audio is added to the cache.
+        stream (bool | None): Synthesise sentence chunks one at a time
+            and append each to the WAV as it is produced. ``None``
+            (default) streams texts longer than ``STREAM_MIN_CHARS``.
+        on_chunk: Optional ``callable(done, total)`` invoked after each
+            chunk is written (once with ``(1, 1)`` when not streaming).
 
     Returns:
         dict: On success: {
             "success": True,
             "audio_path": str,
             "duration": float (seconds),
-            "sample_rate": int
+            "sample_rate": int,
+            "cached": bool (True if served from the cache)
         }
         On failure: {
             "success": False,
@@ -289,6 +353,26 @@ def generate_audio(text, voice_id="af_bella", speed=1.0, output_path=None):
     # ------------------------------------------------------------------
     speed = max(SPEED_MIN, min(SPEED_MAX, float(speed)))
 
+    # ------------------------------------------------------------------
+    # Step 3b: Serve identical text/voice/speed from the audio cache
+    # ------------------------------------------------------------------
+    cache_key = None
+    if cache is not None and cache.enabled:
+        cache_key = cache.key_for(text, voice_id, speed)
+        cached_duration = cache.fetch(cache_key, output_path)
+        if cached_duration is not None:
+            logger.info(
+                "TTS cache hit: voice=%s, speed=%.1f, duration=%.2fs, path=%s",
+                voice_id, speed, cached_duration, output_path,
+            )
+            return {
+                "success": True,
+                "audio_path": output_path,
+                "duration": cached_duration,
+                "sample_rate": SAMPLE_RATE,
+                "cached": True,
+            }
+
     # ------------------------------------------------------------------
     # Step 4: Get Kokoro instance
     # ------------------------------------------------------------------
@@ -333,22 +417,44 @@ def generate_audio(text, voice_id="af_bella", speed=1.0, output_path=None):
     # Step 6: Generate audio via kokoro-onnx
     # ------------------------------------------------------------------
     try:
-        audio_array, sample_rate = kokoro.create(
-            text=text,
-            voice=voice_id,
-            speed=speed,
-            lang="en-us",
-        )
+        chunks = _stream_chunks(text, stream)
+        if len(chunks) > 1:
+            # --------------------------------------------------------------
+            # Step 6b / 7: Streaming — synthesise and append chunk by chunk
+            # --------------------------------------------------------------
+            with _StreamingWavWriter(output_path) as writer:
+                for done, chunk in enumerate(chunks, start=1):
+                    audio_array, sample_rate = kokoro.create(
+                        text=chunk,
+                        voice=voice_id,
+                        speed=speed,
+                        lang=TTS_LANG,
+                    )
+                    writer.write(audio_array, sample_rate)
+                    del audio_array
+                    if on_chunk is not None:
+                        on_chunk(done, len(chunks))
+        else:
+            audio_array, sample_rate = kokoro.create(
+                text=text,
+                voice=voice_id,
+                speed=speed,
+                lang=TTS_LANG,
+            )
 
-        # ------------------------------------------------------------------
-        # Step 7: Save WAV file
-        # ------------------------------------------------------------------
-        _save_wav(audio_array, output_path, sample_rate)
+            # --------------------------------------------------------------
+            # Step 7: Save WAV file
+            # --------------------------------------------------------------
+            _save_wav(audio_array, output_path, sample_rate)
+            if on_chunk is not None:
+                on_chunk(1, 1)
 
         # ------------------------------------------------------------------
         # Step 8: Calculate duration
         # ------------------------------------------------------------------
         duration = get_audio_duration(output_path)
+        if cache_key is not None:
+            cache.store(cache_key, output_path)
 
         # ------------------------------------------------------------------
         # Step 9: Return success dict
@@ -367,6 +473,7 @@ def generate_audio(text, voice_id="af_bella", speed=1.0, output_path=None):
             "audio_path": output_path,
             "duration": duration,
             "sample_rate": sample_rate,
+            "cached": False,
         }
 
     except FileNotFoundError as e:
@@ -378,11 +485,288 @@ def generate_audio(text, voice_id="af_bella", speed=1.0, output_path=None):
         return {"success": False, "error": f"TTS generation failed: {e}"}
 
 
+# --------------------------------------------------------------------------
+# Batched TTS Pipeline
+# --------------------------------------------------------------------------
+
+
+def _supports_phoneme_input(kokoro):
+    """Return True if *kokoro* can synthesise pre-phonemized text."""
+    try:
+        return (
+            hasattr(kokoro, "tokenizer")
+            and hasattr(kokoro, "get_voice_style")
+            and "is_phonemes" in inspect.signature(kokoro.create).parameters
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def generate_audio_batch(
+    items,
+    voice_id="af_bella",
+    speed=1.0,
+    on_start=None,
+    on_result=None,
+    should_cancel=None,
+    cache=None,
+    on_chunk=None,
+):
+    """
+    Generate speech for many segments with one voice and speed.
+
+    Per-call work that ``generate_audio()`` repeats for every segment —
+    voice validation, the ``voices.bin`` lookup, the style vector — is
+    done once.  Phonemization (espeak, CPU-bound) runs on a producer
+    thread up to ``BATCH_PHONEMIZE_LOOKAHEAD`` segments ahead, so it
+    overlaps the ONNX inference of the current segment instead of
+    preceding it.
+
+    With a *cache*, segments whose normalized text, voice and speed are
+    already cached are linked from the cache and skip phonemization and
+    inference entirely.
+
+    Long segments are phonemized per sentence chunk and streamed to
+    disk chunk by chunk, exactly as ``generate_audio()`` does.
+
+    Falls back to calling ``generate_audio()`` per segment when the
+    Kokoro instance is unavailable or does not accept phoneme input
+    (older kokoro-onnx releases), so callers see identical results
+    either way.
+
+    Like ``generate_audio()``, this function never raises for a
+    segment failure; each segment gets its own result dict.
+
+    Args:
+        items: Sequence of dicts with ``key``, ``text`` and
+            ``output_path``.
+        voice_id (str): Kokoro voice ID shared by every item.
+        speed (float): Speech speed multiplier (clamped to 0.5–2.0).
+        on_start: Optional ``callable(index, total, key)`` invoked
+            before each segment is synthesised.
+        on_result: Optional ``callable(key, result)`` invoked with each
+            segment's result dict as soon as it is available.
+        should_cancel: Optional ``callable() -> bool`` checked before
+            each segment; returning True stops the batch.
+        cache: Optional :class:`core_engine.tts_cache.TTSAudioCache`.
+        on_chunk: Optional ``callable(key, done, total)`` invoked after
+            each chunk of a segment is written.
+
+    Returns:
+        list[dict]: One result dict per processed item, in input order
+        (shorter than *items* if the batch was cancelled).
+    """
+    items = list(items)
+    total = len(items)
+    results = []
+
+    def _emit(item, result):
+        results.append(result)
+        if on_result is not None:
+            on_result(item["key"], result)
+
+    def _chunk_callback(item):
+        if on_chunk is None:
+            return None
+        return lambda done, chunks: on_chunk(item["key"], done, chunks)
+
+    # ------------------------------------------------------------------
+    # Step 1: Resolve the shared voice / speed / engine once
+    # ------------------------------------------------------------------
+    voice_id = validate_voice_id(voice_id)
+    speed = max(SPEED_MIN, min(SPEED_MAX, float(speed)))
+    use_cache = cache is not None and cache.enabled
+
+    def _cache_key(item):
+        if not use_cache or not isinstance(item["text"], str) or not item["text"].strip():
+            return None
+        return cache.key_for(item["text"].strip(), voice_id, speed)
+
+    try:
+        kokoro = _get_kokoro_instance()
+    except Exception as e:
+        logger.error("Failed to get Kokoro instance: %s", e)
+        kokoro = None
+
+    if kokoro is None or not _supports_phoneme_input(kokoro):
+        # Sequential fallback — identical to calling generate_audio()
+        for index, item in enumerate(items):
+            if should_cancel is not None and should_cancel():
+                break
+            if on_start is not None:
+                on_start(index, total, item["key"])
+            _emit(item, generate_audio(
+                text=item["text"],
+                voice_id=voice_id,
+                speed=speed,
+                output_path=item["output_path"],
+                cache=cache,
+                on_chunk=_chunk_callback(item),
+            ))
+        return results
+
+    try:
+        if voice_id not in kokoro.get_voices():
+            voice_id = DEFAULT_VOICE_ID
+        style = kokoro.get_voice_style(voice_id)
+    except Exception as e:
+        logger.error("Failed to load voice style '%s': %s", voice_id, e)
+        for index, item in enumerate(items):
+            if should_cancel is not None and should_cancel():
+                break
+            if on_start is not None:
+                on_start(index, total, item["key"])
+            _emit(item, {
+                "success": False,
+                "error": f"TTS generation failed: could not load voice '{voice_id}': {e}",
+            })
+        return results
+
+    # ------------------------------------------------------------------
+    # Step 2: Phonemize ahead of inference on a producer thread
+    # ------------------------------------------------------------------
+    phonemized = queue.Queue(maxsize=BATCH_PHONEMIZE_LOOKAHEAD)
+    stop = threading.Event()
+
+    def _phonemize(item):
+        """Return ``(phonemes per chunk, error)`` for one item."""
+        text = item["text"].strip() if isinstance(item["text"], str) else ""
+        if not text:
+            return None, "Text is empty or whitespace-only."
+        try:
+            return [
+                kokoro.tokenizer.phonemize(chunk, TTS_LANG)
+                for chunk in _stream_chunks(text)
+            ], None
+        except Exception as e:
+            return None, f"TTS generation failed: {e}"
+
+    def _prepare(item):
+        """Return the queue entry ``(key, phonemes, error)`` for one item."""
+        key = None
+        try:
+            key = _cache_key(item)
+            if key is not None and cache.contains(key):
+                return key, None, None  # cache hit — nothing to phonemize
+        except Exception as e:
+            # e.g. an entry evicted between the isfile and getsize checks
+            logger.warning("TTS cache lookup failed for %s: %s", item["key"], e)
+        return (key, *_phonemize(item))
+
+    def _producer():
+        for item in items:
+            if stop.is_set():
+                break
+            try:
+                entry = _prepare(item)
+            except Exception as e:
+                entry = (None, None, f"TTS generation failed: {e}")
+            while not stop.is_set():
+                try:
+                    phonemized.put(entry, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    producer = threading.Thread(target=_producer, name="tts-phonemize", daemon=True)
+    producer.start()
+
+    def _next_entry():
+        """Take the next producer entry without outliving the producer."""
+        while True:
+            try:
+                return phonemized.get(timeout=0.1)
+            except queue.Empty:
+                if producer.is_alive():
+                    continue
+            try:
+                return phonemized.get_nowait()  # put just before it exited
+            except queue.Empty:
+                return None, None, "TTS generation failed: the phonemizer stopped unexpectedly."
+
+    # ------------------------------------------------------------------
+    # Step 3: Synthesise and save each segment in order
+    # ------------------------------------------------------------------
+    try:
+        for index, item in enumerate(items):
+            if should_cancel is not None and should_cancel():
+                break
+            if on_start is not None:
+                on_start(index, total, item["key"])
+
+            key, phonemes, error = _next_entry()
+            if key is not None and phonemes is None and error is None:
+                cached_duration = cache.fetch(key, item["output_path"])
+                if cached_duration is not None:
+                    _emit(item, {
+                        "success": True,
+                        "audio_path": item["output_path"],
+                        "duration": cached_duration,
+                        "sample_rate": SAMPLE_RATE,
+                        "cached": True,
+                    })
+                    continue
+                # Entry vanished since the producer checked — synthesise it.
+                phonemes, error = _phonemize(item)
+
+            if error is not None:
+                _emit(item, {"success": False, "error": error})
+                continue
+            if not item.get("output_path"):
+                _emit(item, {"success": False, "error": "Output path is required."})
+                continue
+
+            try:
+                report_chunk = _chunk_callback(item)
+                with _StreamingWavWriter(item["output_path"]) as writer:
+                    for done, chunk_phonemes in enumerate(phonemes, start=1):
+                        audio_array, sample_rate = kokoro.create(
+                            chunk_phonemes, voice=style, speed=speed, is_phonemes=True,
+                        )
+                        writer.write(audio_array, sample_rate)
+                        del audio_array
+                        if report_chunk is not None:
+                            report_chunk(done, len(phonemes))
+                duration = get_audio_duration(item["output_path"])
+                if key is not None:
+                    cache.store(key, item["output_path"])
+                _emit(item, {
+                    "success": True,
+                    "audio_path": item["output_path"],
+                    "duration": duration,
+                    "sample_rate": sample_rate,
+                    "cached": False,
+                })
+            except Exception as e:
+                logger.error(
+                    "Batched TTS failed for %s: %s", item["key"], e, exc_info=True,
+                )
+                _emit(item, {
+                    "success": False,
+                    "error": f"TTS generation failed: {e}",
+                })
+    finally:
+        stop.set()
+        producer.join(timeout=5)
+
+    logger.info(
+        "Batched TTS finished: %d/%d segment(s), voice=%s, speed=%.1f",
+        sum(1 for r in results if r["success"]), total, voice_id, speed,
+    )
+    return results
+
+
 # --------------------------------------------------------------------------
 # Internal Helpers
 # --------------------------------------------------------------------------
 
 
+def _to_int16(audio_array):
+    """Clip a float32 [-1, 1] array and convert it to 16-bit PCM."""
+    clipped = np.clip(audio_array, -1.0, 1.0)
+    return (clipped * 32767).astype(np.int16)
+
+
 def _save_wav(audio_array, output_path, sample_rate=SAMPLE_RATE):
     """
     Save a float32 numpy audio array as a 16-bit WAV file.
@@ -394,9 +778,12 @@ def _save_wav(audio_array, output_path, sample_rate=SAMPLE_RATE):
     """
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    # Clip and convert float32 [-1,1] → int16
-    clipped = np.clip(audio_array, -1.0, 1.0)
-    audio_int16 = (clipped * 32767).astype(np.int16)
+    # Unlink first: the old file may be a hard link into the TTS audio
+    # cache, which must not be overwritten in place.
+    if os.path.lexists(output_path):
+        os.remove(output_path)
+
+    audio_int16 = _to_int16(audio_array)
 
     with wave.open(str(output_path), "wb") as wf:
         wf.setnchannels(1)
@@ -405,12 +792,79 @@ def _save_wav(audio_array, output_path, sample_rate=SAMPLE_RATE):
         wf.writeframes(audio_int16.tobytes())
 
 
+class _StreamingWavWriter:
+    """
+    Append float32 audio chunks to a 16-bit mono WAV file.
+
+    Frames go to ``<output_path>.partial`` as each chunk arrives; the
+    WAV header is finalised and the file moved over *output_path* only
+    when the ``with`` block exits cleanly, so a failed or interrupted
+    synthesis never leaves a truncated file behind. ``os.replace``
+    swaps the directory entry, so a previous output hard-linked into
+    the TTS audio cache is left intact.
+
+    The file is opened lazily on the first ``write()``, which fixes
+    the sample rate; later chunks must match it.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = str(output_path)
+        self.partial_path = f"{self.output_path}.partial"
+        self.sample_rate = None
+        self.frames = 0
+        self._wf = None
+
+    def __enter__(self):
+        return self
+
+    def write(self, audio_array, sample_rate=SAMPLE_RATE):
+        if self._wf is None:
+            os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
+            self._wf = wave.open(self.partial_path, "wb")
+            self._wf.setnchannels(1)
+            self._wf.setsampwidth(2)  # 16-bit
+            self._wf.setframerate(sample_rate)
+            self.sample_rate = sample_rate
+        elif sample_rate != self.sample_rate:
+            raise ValueError(
+                f"Chunk sample rate {sample_rate} differs from {self.sample_rate}."
+            )
+        audio_int16 = _to_int16(audio_array)
+        self._wf.writeframes(audio_int16.tobytes())
+        self.frames += len(audio_int16)
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._wf is not None:
+            self._wf.close()
+        if exc_type is None and self._wf is not None:
+            os.replace(self.partial_path, self.output_path)
+        elif os.path.exists(self.partial_path):
+            os.remove(self.partial_path)
+        if exc_type is None and self._wf is None:
+            raise ValueError("No audio was synthesised.")
+        return False
+
+
+def _stream_chunks(text, stream=None):
+    """
+    Return the text pieces to synthesise for *text*.
+
+    A single-element list means "synthesise in one call". With
+    ``stream=None`` only texts longer than ``STREAM_MIN_CHARS`` are
+    split; ``stream=True`` always splits at ``STREAM_CHUNK_CHARS``.
+    """
+    if stream is False or (stream is None and len(text) <= STREAM_MIN_CHARS):
+        return [text]
+    return split_text_into_chunks(text, max_length=STREAM_CHUNK_CHARS) or [text]
+
+
 def split_text_into_chunks(text, max_length=500):
     """
     Split text into chunks at sentence boundaries.
 
-    Note: kokoro-onnx handles chunking internally, but this utility
-    is kept for backward compatibility and potential use by callers.
+    Used by streaming synthesis (``_stream_chunks``) so long narration
+    is synthesised and written one chunk at a time. A single sentence
+    longer than *max_length* is kept whole.
 
     Args:
         text: Input text to split.
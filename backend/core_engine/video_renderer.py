@@ -11,6 +11,7 @@ status in the database.  Status management is handled by the API layer
 in SubPhase 04.03.
 """
 
+import functools
 import logging
 import os
 from pathlib import Path
@@ -19,8 +20,44 @@ from typing import Callable, Optional
 import proglog
 
 from core_engine import render_utils
-from core_engine.ken_burns import apply_ken_burns
-from core_engine.subtitle_engine import create_subtitles_for_segment
+from core_engine.audio_utils import get_audio_duration, mix_soundtrack
+from core_engine.export_profiles import (
+    DEFAULT_EXPORT_BITRATE_KBPS,
+    DEFAULT_EXPORT_TARGET_MB,
+    encoder_threads,
+    resolve_export_profile,
+)
+from core_engine.frame_compositor import (
+    LazySegmentFrameSource,
+    CrossfadeTimeline,
+    LogoOverlay,
+    SegmentFrameSource,
+)
+from core_engine.image_cache import (
+    DEFAULT_IMAGE_CACHE_MB,
+    configure_from_settings,
+    get_image_cache,
+    get_image_cache_dir,
+)
+from core_engine.ken_burns import (
+    DEFAULT_EASING,
+    build_ken_burns_engine,
+    resolve_easing,
+)
+from core_engine.render_profiler import (
+    PHASE_AUDIO_MIX,
+    PHASE_AUDIO_PROBE,
+    PHASE_EXPORT,
+    PHASE_SETUP,
+    PHASE_SUBTITLES,
+    RenderProfiler,
+    profile_phase,
+)
+from core_engine.render_quality import get_quality_preset, scale_resolution
+from core_engine.subtitle_engine import (
+    DEFAULT_STROKE_WIDTH,
+    create_subtitle_overlay,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,25 +68,15 @@ logger = logging.getLogger(__name__)
 try:
     # MoviePy 1.x — everything lives under moviepy.editor
     from moviepy.editor import (  # type: ignore[import-untyped]
-        AudioFileClip,
-        CompositeVideoClip,
-        ImageClip,
-        concatenate_videoclips,
+        VideoClip,
         vfx,
     )
-    from moviepy.audio.AudioClip import AudioClip as _AudioClipBase  # type: ignore[import-untyped]
 except ImportError:
     # MoviePy 2.x — direct imports from moviepy
     from moviepy import (  # type: ignore[import-untyped]
-        AudioFileClip,
-        CompositeVideoClip,
-        ImageClip,
-        concatenate_videoclips,
+        VideoClip,
         vfx,
     )
-    from moviepy.audio.AudioClip import AudioClip as _AudioClipBase  # type: ignore[import-untyped]
-
-import numpy as np
 
 # ---------------------------------------------------------------------------
 # Transition constants
@@ -60,8 +87,8 @@ import numpy as np
 # recommended by mainstream video-editing guides.
 TRANSITION_DURATION: float = 0.5
 
-# Brief silence gap appended to the end of each segment's audio before
-# concatenation.  This ensures narration from consecutive segments does
+# Brief silence gap appended to the end of each segment's audio on the
+# timeline.  This ensures narration from consecutive segments does
 # not run together without a natural pause.  The gap is in addition to
 # the crossfade overlap, giving the listener a moment of breathing room
 # between narration segments.
@@ -73,35 +100,19 @@ ProgressCallback = Optional[Callable[[int, int, str], None]]
 
 
 # ---------------------------------------------------------------------------
-# Silent audio utility
-# ---------------------------------------------------------------------------
-
-def _make_silent_audio(duration: float, fps: int = 44100) -> _AudioClipBase:
-    """Create a silent AudioClip of the given duration.
-
-    Used to pad silence to the end of each segment's audio so that
-    consecutive segments don't run together without a natural pause.
-    """
-    return _AudioClipBase(
-        frame_function=lambda t: np.zeros((1 if np.isscalar(t) else len(t), 2)),
-        duration=duration,
-        fps=fps,
-    )
-
-
-# ---------------------------------------------------------------------------
-# Export progress logger — reports frame-level progress during write_videofile
+# Export progress logger — reports frame-level progress during export
 # ---------------------------------------------------------------------------
 
 class _ExportProgressLogger(proglog.ProgressBarLogger):
-    """Custom proglog logger that funnels MoviePy export progress into the
+    """Custom proglog logger that funnels export progress into the
     render pipeline's progress callback.
 
     ``write_videofile`` iterates every frame through a ``proglog`` bar named
     ``"t"`` (time-based).  This logger intercepts bar updates and maps them
     to percentage values, invoking *on_progress* at a throttled rate (at most
     once per percentage-point change) so the TaskManager registry gets smooth,
-    fine-grained progress during the slowest phase of the render.
+    fine-grained progress during the slowest phase of the render.  The
+    raw-frame FFmpeg pipe reports through :meth:`report_frames` instead.
     """
 
     def __init__(
@@ -144,8 +155,21 @@ class _ExportProgressLogger(proglog.ProgressBarLogger):
         if bar not in self._seen_bars:
             self._seen_bars.append(bar)
 
-        bar_index = self._seen_bars.index(bar)
-        fraction = min(value / total, 1.0)
+        self.report_fraction(self._seen_bars.index(bar), value / total)
+
+    def report_frames(self, frames_done: int, total_frames: int) -> None:
+        """Frame callback for :func:`core_engine.frame_pipe.encode_timeline`.
+
+        The raw-frame pipe muxes the pre-mixed soundtrack while it
+        encodes video, so frame progress alone drives the video phase.
+        """
+        if self._on_progress is None or total_frames <= 0:
+            return
+        self.report_fraction(0, frames_done / total_frames)
+
+    def report_fraction(self, bar_index: int, fraction: float) -> None:
+        """Map the progress of the *bar_index*-th export phase to a percentage."""
+        fraction = min(fraction, 1.0)
 
         # Map fraction to percentage depending on phase
         if bar_index == 0:
@@ -193,8 +217,9 @@ def apply_crossfade_transitions(
     * **Last clip** — ``CrossFadeIn`` only (video ends at full opacity).
 
     This function only *prepares* the clips with crossfade effects — it does
-    **not** concatenate them.  Concatenation with negative padding is handled
-    separately in Task 05.02.02.
+    **not** concatenate them.  It is kept for callers composing MoviePy
+    clips directly; :func:`render_project` blends crossfades in
+    :class:`core_engine.frame_compositor.CrossfadeTimeline` instead.
 
     Args:
         clips: Ordered list of MoviePy video clips.
@@ -316,35 +341,46 @@ def calculate_total_duration_with_transitions(
     return total
 
 
-def render_project(
-    project_id: str,
-    on_progress: ProgressCallback = None,
-) -> dict:
-    """
-    Render a project's segments into a single MP4 video file.
+# ---------------------------------------------------------------------------
+# Render settings
+# ---------------------------------------------------------------------------
+
+_DEFAULT_ZOOM: float = 1.3
+_DEFAULT_RESAMPLE: int = int(get_quality_preset(None)["resample"])
 
-    Each segment must have both an ``image_file`` and an ``audio_file``.
-    The image is resized to the project's resolution using cover mode,
-    displayed for the duration of its audio clip, and then all segment
-    clips are concatenated in ``sequence_index`` order.
+
+def load_render_settings(project, render_quality: Optional[str] = None) -> dict:
+    """Resolve every render parameter for *project* into a plain dict.
+
+    Reads the project's own resolution/framerate, then applies the
+    GlobalSettings overrides (resolution, FPS, zoom, subtitles, silence,
+    logo watermark) and finally the render quality preset (see
+    :mod:`core_engine.render_quality`), which may scale the resolution
+    and every pixel-sized setting with it.  The result contains only
+    plain Python values so it can be handed to worker processes or
+    hashed for cache keys without touching the ORM again.
+
+    Any problem reading GlobalSettings is logged and the corresponding
+    defaults are used — this function never raises for bad settings.
 
     Args:
-        project_id: UUID string of the project to render.
-        on_progress: Optional callback ``(current, total, description)``
-            invoked after each segment and before export.
+        project: The ``Project`` model instance being rendered.
+        render_quality: Optional preset name overriding
+            ``GlobalSettings.render_quality`` for this render.
 
     Returns:
-        dict: ``{"output_path": str, "duration": float, "file_size": int}``
-
-    Raises:
-        RuntimeError: If FFmpeg is not installed.
-        ValueError: If any segment is missing an image or audio file.
-        Exception: Re-raises any MoviePy or I/O error after cleanup.
+        dict with the keys ``resolution``, ``fps``, ``zoom_intensity``,
+        ``ken_burns_easing``,
+        ``subtitles_enabled``, ``subtitle_font``, ``subtitle_color``,
+        ``subtitle_font_size``, ``subtitle_position``,
+        ``subtitle_stroke_width``, ``inter_segment_silence``, ``logo``
+        (``None`` or a dict of logo parameters), ``render_workers``,
+        ``render_cache_mb``, ``render_quality``, ``resample``,
+        ``subpixel``, ``x264_preset``, ``crf``, ``export_profile``,
+        ``export_bitrate_kbps``, ``export_target_mb`` and
+        ``image_cache`` (budgets of :mod:`core_engine.image_cache`,
+        which is also resized to them).
     """
-    # Import Django models lazily to keep this module importable
-    # outside a Django context during early development.
-    from api.models import Project, Segment  # noqa: E402
-
     # GlobalSettings may not exist yet; import separately to handle
     # gracefully if the model or table is missing.
     try:
@@ -352,20 +388,6 @@ def render_project(
     except ImportError:
         GlobalSettings = None  # type: ignore[assignment,misc]
 
-    logger.info("=== Render started for project %s ===", project_id)
-
-    # ------------------------------------------------------------------
-    # A. FFmpeg availability check
-    # ------------------------------------------------------------------
-    if not render_utils.check_ffmpeg():
-        raise RuntimeError(render_utils.get_ffmpeg_error_message())
-
-    # ------------------------------------------------------------------
-    # B. Load project from database
-    # ------------------------------------------------------------------
-    project = Project.objects.get(id=project_id)
-    logger.info("Project loaded: '%s'", project.title)
-
     # ------------------------------------------------------------------
     # C. Read resolution and framerate settings
     # ------------------------------------------------------------------
@@ -376,8 +398,10 @@ def render_project(
     # ------------------------------------------------------------------
     # C2. Read zoom intensity and overrides from GlobalSettings
     # ------------------------------------------------------------------
-    _DEFAULT_ZOOM = 1.3
     zoom_intensity = _DEFAULT_ZOOM
+    ken_burns_easing = None
+    render_workers = 1
+    render_cache_mb = 0
 
     if GlobalSettings is not None:
         try:
@@ -403,6 +427,19 @@ def render_project(
                         "FPS overridden by GlobalSettings: %d", fps,
                     )
 
+                # ── Parallel segment workers (1 = single stream) ──
+                gs_workers = getattr(gs, "render_workers", None)
+                if gs_workers is not None and int(gs_workers) >= 0:
+                    render_workers = int(gs_workers)
+
+                # ── Encoded-segment cache budget (0 = disabled) ──
+                gs_cache = getattr(gs, "render_cache_mb", None)
+                if gs_cache is not None and int(gs_cache) > 0:
+                    render_cache_mb = int(gs_cache)
+
+                # ── Camera easing curve of the Ken Burns pan ──
+                ken_burns_easing = getattr(gs, "ken_burns_easing", None)
+
                 val = getattr(gs, "zoom_intensity", None)
 
                 if val is None:
@@ -505,8 +542,7 @@ def render_project(
     # ------------------------------------------------------------------
     # C4. Read logo watermark settings from GlobalSettings
     # ------------------------------------------------------------------
-    logo_enabled = False
-    logo_clip = None  # Will be set if logo is enabled and valid
+    logo = None  # Will be set if logo is enabled and valid
 
     if GlobalSettings is not None:
         try:
@@ -516,55 +552,13 @@ def render_project(
                 if active_logo is not None and active_logo.file:
                     logo_file_path = active_logo.file.path
                     if os.path.isfile(logo_file_path):
-                        logo_enabled = True
-                        logo_scale = float(getattr(gs_logo, "logo_scale", 0.15))
-                        logo_position_str = getattr(gs_logo, "logo_position", "bottom-right")
-                        logo_opacity = float(getattr(gs_logo, "logo_opacity", 1.0))
-                        logo_margin_px = int(getattr(gs_logo, "logo_margin", 20))
-
-                        # Compute logo size based on resolution and scale
-                        logo_target_w = int(res_width * logo_scale)
-
-                        from PIL import Image as PILImage
-                        pil_logo = PILImage.open(logo_file_path).convert("RGBA")
-                        logo_aspect = pil_logo.width / pil_logo.height
-                        logo_target_h = int(logo_target_w / logo_aspect)
-                        pil_logo = pil_logo.resize(
-                            (logo_target_w, logo_target_h),
-                            PILImage.LANCZOS,
-                        )
-
-                        # Compute position
-                        if logo_position_str == "top-left":
-                            logo_pos = (logo_margin_px, logo_margin_px)
-                        elif logo_position_str == "top-right":
-                            logo_pos = (res_width - logo_target_w - logo_margin_px, logo_margin_px)
-                        elif logo_position_str == "bottom-left":
-                            logo_pos = (logo_margin_px, res_height - logo_target_h - logo_margin_px)
-                        else:  # bottom-right
-                            logo_pos = (res_width - logo_target_w - logo_margin_px, res_height - logo_target_h - logo_margin_px)
-
-                        import numpy as np  # noqa: F811 — already imported at module level
-                        logo_arr = np.array(pil_logo)
-                        # Separate RGB and alpha
-                        logo_rgb = logo_arr[:, :, :3]
-                        logo_alpha = logo_arr[:, :, 3].astype(float) / 255.0
-                        if logo_opacity < 1.0:
-                            logo_alpha = logo_alpha * logo_opacity
-
-                        logo_clip = (
-                            ImageClip(logo_rgb)
-                            .with_mask(ImageClip(logo_alpha, is_mask=True))
-                            .with_position(logo_pos)
-                        )
-
-                        logger.info(
-                            "Logo watermark enabled: %s, size: %dx%d, "
-                            "position: %s (%s), opacity: %.2f",
-                            os.path.basename(logo_file_path),
-                            logo_target_w, logo_target_h,
-                            logo_position_str, logo_pos, logo_opacity,
-                        )
+                        logo = {
+                            "path": logo_file_path,
+                            "scale": float(getattr(gs_logo, "logo_scale", 0.15)),
+                            "position": getattr(gs_logo, "logo_position", "bottom-right"),
+                            "opacity": float(getattr(gs_logo, "logo_opacity", 1.0)),
+                            "margin": int(getattr(gs_logo, "logo_margin", 20)),
+                        }
                     else:
                         logger.warning(
                             "Logo file not found: %s", logo_file_path,
@@ -574,6 +568,459 @@ def render_project(
                 "Could not read logo settings: %s. Logo disabled.", logo_err,
             )
 
+    # ------------------------------------------------------------------
+    # C5. Apply the render quality preset
+    # ------------------------------------------------------------------
+    if render_quality is None and GlobalSettings is not None:
+        try:
+            gs_quality = GlobalSettings.objects.first()
+            if gs_quality is not None:
+                render_quality = getattr(gs_quality, "render_quality", None)
+        except Exception as quality_err:
+            logger.warning(
+                "Could not read render_quality: %s. Using default.",
+                quality_err,
+            )
+
+    preset = get_quality_preset(render_quality)
+    scale = preset["resolution_scale"]
+    if scale != 1.0:
+        res_width, res_height = scale_resolution((res_width, res_height), scale)
+        if subtitle_font_size is not None:
+            subtitle_font_size = max(int(round(subtitle_font_size * scale)), 1)
+        if logo is not None:
+            logo["margin"] = int(round(logo["margin"] * scale))
+
+    logger.info(
+        "Render quality '%s': %dx%d, resample=%s, sub-pixel=%s, "
+        "x264 preset=%s, crf=%d",
+        preset["name"], res_width, res_height, preset["resample"].name,
+        preset["subpixel"], preset["x264_preset"], preset["crf"],
+    )
+
+    # ------------------------------------------------------------------
+    # C6. Read the export profile (rate control of the final encode)
+    # ------------------------------------------------------------------
+    export_profile = None
+    export_bitrate_kbps = DEFAULT_EXPORT_BITRATE_KBPS
+    export_target_mb = DEFAULT_EXPORT_TARGET_MB
+    if GlobalSettings is not None:
+        try:
+            gs_export = GlobalSettings.objects.first()
+            if gs_export is not None:
+                export_profile = getattr(gs_export, "export_profile", None)
+                gs_bitrate = getattr(gs_export, "export_bitrate_kbps", None)
+                if gs_bitrate is not None and int(gs_bitrate) > 0:
+                    export_bitrate_kbps = int(gs_bitrate)
+                gs_target = getattr(gs_export, "export_target_mb", None)
+                if gs_target is not None and int(gs_target) > 0:
+                    export_target_mb = int(gs_target)
+        except Exception as export_err:
+            logger.warning(
+                "Could not read export profile: %s. Using default.",
+                export_err,
+            )
+    export_profile = resolve_export_profile(export_profile)
+    logger.info(
+        "Export profile '%s' (VBR %d kbps, two-pass target %d MB)",
+        export_profile, export_bitrate_kbps, export_target_mb,
+    )
+
+    # ------------------------------------------------------------------
+    # C7. Size the process-wide prepared-image cache
+    # ------------------------------------------------------------------
+    image_cache = {
+        "max_mb": DEFAULT_IMAGE_CACHE_MB,
+        "spill_mb": 0,
+        "spill_dir": None,
+    }
+    if GlobalSettings is not None:
+        try:
+            gs_images = GlobalSettings.objects.first()
+            if gs_images is not None:
+                gs_image_mb = getattr(gs_images, "image_cache_mb", None)
+                if gs_image_mb is not None and int(gs_image_mb) >= 0:
+                    image_cache["max_mb"] = int(gs_image_mb)
+                gs_spill_mb = getattr(gs_images, "image_spill_mb", None)
+                if gs_spill_mb is not None and int(gs_spill_mb) > 0:
+                    image_cache["spill_dir"] = get_image_cache_dir()
+                    image_cache["spill_mb"] = int(gs_spill_mb)
+        except Exception as image_err:
+            logger.warning(
+                "Could not read image cache settings: %s. Using defaults.",
+                image_err,
+            )
+    configure_from_settings({"image_cache": image_cache})
+
+    return {
+        "resolution": (res_width, res_height),
+        "fps": fps,
+        "zoom_intensity": zoom_intensity,
+        "subtitles_enabled": bool(subtitles_enabled),
+        "subtitle_font": resolved_font,
+        "subtitle_color": subtitle_color,
+        "subtitle_font_size": subtitle_font_size,
+        "subtitle_position": subtitle_position,
+        "subtitle_stroke_width": preset["subtitle_stroke_width"],
+        "inter_segment_silence": inter_segment_silence,
+        "logo": logo,
+        "render_workers": render_workers,
+        "render_cache_mb": render_cache_mb,
+        "render_quality": preset["name"],
+        "resample": int(preset["resample"]),
+        "subpixel": bool(preset["subpixel"]),
+        "ken_burns_easing": resolve_easing(ken_burns_easing),
+        "x264_preset": preset["x264_preset"],
+        "crf": preset["crf"],
+        "export_profile": export_profile,
+        "export_bitrate_kbps": export_bitrate_kbps,
+        "export_target_mb": export_target_mb,
+        "image_cache": image_cache,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Logo watermark
+# ---------------------------------------------------------------------------
+
+def build_logo_overlay(logo: dict, resolution: tuple[int, int]) -> LogoOverlay:
+    """Create the positioned, semi-transparent logo watermark.
+
+    The logo is scaled to ``logo["scale"]`` of the frame width (aspect
+    preserved), anchored to one of the four corners with
+    ``logo["margin"]`` pixels of padding, and its alpha channel is
+    multiplied by ``logo["opacity"]``.
+
+    Args:
+        logo: Logo parameters as returned in ``load_render_settings()["logo"]``.
+        resolution: Output ``(width, height)``.
+
+    Returns:
+        A premultiplied :class:`LogoOverlay` blended into every frame
+        by the frame compositor.
+    """
+    return LogoOverlay.from_settings(logo, resolution)
+
+
+# ---------------------------------------------------------------------------
+# Per-segment visual assembly
+# ---------------------------------------------------------------------------
+
+def build_segment_source(
+    segment: dict,
+    render_settings: dict,
+    logo: Optional[LogoOverlay] = None,
+    profiler: Optional[RenderProfiler] = None,
+) -> tuple:
+    """Prepare the single-pass frame source for one segment.
+
+    Builds the segment's Ken Burns engine (one resample of the image),
+    rasterises its timed subtitle sprites (when enabled and the segment
+    has text) and attaches the logo watermark.  Nothing is composited
+    yet — :class:`core_engine.frame_compositor.SegmentFrameSource`
+    draws each frame in one pass when asked.
+
+    Args:
+        segment: Plain description of the segment with the keys
+            ``label``, ``id``, ``image_path``, ``sequence_index``,
+            ``text_content``, ``audio_duration`` and ``visual_duration``.
+        render_settings: Dict returned by :func:`load_render_settings`.
+        logo: Optional pre-built overlay from :func:`build_logo_overlay`.
+        profiler: Optional :class:`RenderProfiler`; image loading, the
+            Ken Burns resample and subtitle rasterisation are recorded
+            under the segment's ``position``.
+
+    Returns:
+        ``(source, warnings)`` — the ``SegmentFrameSource`` and a list of
+        non-fatal warning messages (e.g. subtitle failures).
+
+    Raises:
+        RuntimeError: If the Ken Burns engine cannot be created.
+    """
+    res_width, res_height = render_settings["resolution"]
+    seg_label = segment["label"]
+    image_path = segment["image_path"]
+    audio_duration = segment["audio_duration"]
+    visual_duration = segment["visual_duration"]
+    warnings: list[str] = []
+
+    # Step 3a: Prepare the Ken Burns engine with error handling
+    try:
+        engine = build_ken_burns_engine(
+            image_path,
+            visual_duration,
+            (res_width, res_height),
+            zoom_intensity=render_settings["zoom_intensity"],
+            segment_index=segment["sequence_index"],
+            resample=render_settings.get("resample", _DEFAULT_RESAMPLE),
+            profiler=profiler,
+            profile_segment=segment.get("position"),
+            fps=render_settings["fps"],
+            easing=render_settings.get("ken_burns_easing", DEFAULT_EASING),
+            subpixel=render_settings.get("subpixel", True),
+        )
+    except Exception as exc:
+        logger.error(
+            "Failed to create Ken Burns clip for %s (ID %s): %s",
+            seg_label, segment["id"], exc,
+        )
+        raise RuntimeError(
+            f"Ken Burns effect failed for {seg_label} "
+            f"(segment ID {segment['id']}): {image_path}"
+        ) from exc
+
+    logger.debug(
+        "  Ken Burns engine ready: %s (direction index %d, "
+        "visual_duration=%.2fs)",
+        image_path, segment["sequence_index"], visual_duration,
+    )
+
+    # Step 3b: Pre-rasterise the subtitle sprites
+    overlay = None
+    text_content = segment.get("text_content") or ""
+    subtitles_enabled = render_settings["subtitles_enabled"]
+    if subtitles_enabled and text_content.strip():
+        try:
+            with profile_phase(profiler, PHASE_SUBTITLES, segment.get("position")):
+                overlay = create_subtitle_overlay(
+                    text_content=text_content,
+                    audio_duration=audio_duration,
+                    resolution=(res_width, res_height),
+                    font=render_settings["subtitle_font"],
+                    color=render_settings["subtitle_color"],
+                    font_size=render_settings["subtitle_font_size"],
+                    position=render_settings["subtitle_position"],
+                    stroke_width=render_settings.get(
+                        "subtitle_stroke_width", DEFAULT_STROKE_WIDTH,
+                    ),
+                )
+            logger.debug(
+                "  Subtitles prepared: %d sprite(s) for %s "
+                "(visual_duration=%.2fs)",
+                len(overlay), seg_label, visual_duration,
+            )
+        except Exception as sub_exc:
+            warn_msg = (
+                f"Subtitle generation failed for {seg_label} "
+                f"(segment ID {segment['id']}): {sub_exc}"
+            )
+            logger.warning(warn_msg)
+            warnings.append(warn_msg)
+            # Continue rendering without subtitles for this segment
+    elif not subtitles_enabled:
+        logger.debug(
+            "  Subtitles disabled — skipping for %s.",
+            seg_label,
+        )
+    elif not text_content.strip():
+        logger.debug(
+            "  No text_content for %s — skipping subtitles.",
+            seg_label,
+        )
+
+    # Step 3c: Logo watermark is blended last, over the subtitles
+    source = SegmentFrameSource(engine, visual_duration, overlay, logo)
+    return source, warnings
+
+
+def build_segment_clip(
+    segment: dict,
+    render_settings: dict,
+    logo: Optional[LogoOverlay] = None,
+) -> tuple:
+    """Build the silent visual clip for one segment.
+
+    Wraps :func:`build_segment_source` in a MoviePy ``VideoClip`` whose
+    frames are drawn in a single pass (Ken Burns, subtitles, logo).
+    Every call to ``get_frame`` returns a fresh array, so the clip is
+    safe for consumers that keep earlier frames (e.g. the WebP preview).
+    Audio is *not* attached.
+
+    Returns:
+        ``(clip, warnings)``.
+
+    Raises:
+        RuntimeError: If the Ken Burns engine cannot be created.
+    """
+    source, warnings = build_segment_source(segment, render_settings, logo)
+    clip = VideoClip(source.render, duration=source.duration)
+    return clip.with_fps(render_settings["fps"]), warnings
+
+
+def describe_segment(segment, position: int, total: int) -> dict:
+    """Flatten a ``Segment`` row into the plain dict used by the renderers.
+
+    Only picklable values are kept so the description can be sent to
+    worker processes.  ``audio_duration`` / ``visual_duration`` are
+    filled in by the caller once the audio file has been measured.
+
+    Args:
+        segment: ``Segment`` model instance with image and audio files.
+        position: 1-based position of the segment within the render.
+        total: Total number of segments being rendered.
+
+    Returns:
+        dict describing the segment.
+    """
+    return {
+        "id": str(segment.id),
+        "label": (
+            f"Segment {position}/{total} "
+            f"(index {segment.sequence_index})"
+        ),
+        "sequence_index": segment.sequence_index,
+        "position": position,
+        "image_path": segment.image_file.path,
+        "audio_path": segment.audio_file.path,
+        "text_content": getattr(segment, "text_content", None) or "",
+        "db_audio_duration": segment.audio_duration,
+        "audio_duration": None,
+        "visual_duration": None,
+    }
+
+
+def resolve_render_workers(configured: int) -> int:
+    """Translate the ``render_workers`` setting into a process count.
+
+    ``0`` means "auto" (one worker per CPU core); any other value is
+    used as-is, with a floor of one.
+    """
+    if configured == 0:
+        return max(os.cpu_count() or 1, 1)
+    return max(int(configured), 1)
+
+
+def render_project(
+    project_id: str,
+    on_progress: ProgressCallback = None,
+    render_quality: Optional[str] = None,
+    profiler: Optional[RenderProfiler] = None,
+) -> dict:
+    """
+    Render a project's segments into a single MP4 video file.
+
+    Each segment must have both an ``image_file`` and an ``audio_file``.
+    The image is resized to the project's resolution using cover mode,
+    displayed for the duration of its audio clip, and then all segment
+    clips are concatenated in ``sequence_index`` order.
+
+    When ``GlobalSettings.render_workers`` is greater than one (or ``0``
+    for auto), multi-segment projects are encoded in parallel by
+    :mod:`core_engine.parallel_renderer` — one process per segment
+    piece — and stitched without re-encoding.  The same piece path is
+    used whenever ``render_cache_mb`` is set, so unchanged segments are
+    reused from the per-project render cache.  Otherwise the timeline
+    is exported in a single stream through
+    :func:`core_engine.frame_pipe.encode_timeline`, which overlaps frame
+    production with FFmpeg encoding.
+
+    The single-stream export is memory bounded: each segment's Ken
+    Burns plane is built when its window begins (the next one is
+    prefetched) and released shortly after it ends, so peak memory
+    depends on the resolution, not on the number of segments.  The
+    sampled peak resident set size is reported as ``peak_rss_mb``.
+    Prepared images and the resized logo come from the process-wide
+    :mod:`core_engine.image_cache`, so re-renders and previews of the
+    same images skip decoding and resizing; its counters are reported
+    as ``image_cache``.
+
+    Every render is profiled (:mod:`core_engine.render_profiler`): wall
+    time, CPU time and peak memory per phase and per segment, plus the
+    export frame rate.  The report is returned as ``profile`` and
+    written to ``render_report.json`` next to the MP4 — also when the
+    render fails, as far as it got.
+
+    Args:
+        project_id: UUID string of the project to render.
+        on_progress: Optional callback ``(current, total, description)``
+            invoked after each segment and before export.
+        render_quality: Optional ``"draft"`` / ``"standard"`` /
+            ``"final"`` preset overriding ``GlobalSettings.render_quality``.
+        profiler: Optional :class:`RenderProfiler` to record into (the
+            task runner passes one to show live timings); a new one is
+            used when ``None``.
+
+    Returns:
+        dict: ``{"output_path": str, "duration": float, "file_size": int,
+        "render_mode": str, "workers": int, "render_quality": str,
+        "producer_threads": int (single stream only), "peak_rss_mb": float, "profile": dict, "render_report": str,
+        ...}``
+
+    Raises:
+        RuntimeError: If FFmpeg is not installed.
+        ValueError: If any segment is missing an image or audio file.
+        Exception: Re-raises any MoviePy or I/O error after cleanup.
+    """
+    profiler = (profiler or RenderProfiler()).start()
+    try:
+        result = _render_project(project_id, on_progress, render_quality, profiler)
+    except Exception as exc:
+        profiler.stop()
+        if profiler.output_path:
+            profiler.write_report(
+                profiler.output_path,
+                project_id=str(project_id),
+                status="failed",
+                error=f"{type(exc).__name__}: {exc}",
+            )
+        raise
+
+    result["profile"] = profiler.stop()
+    result["peak_rss_mb"] = profiler.peak_mb
+    result["image_cache"] = get_image_cache().report()
+    result["render_report"] = profiler.write_report(
+        result["output_path"], project_id=str(project_id), status="completed",
+    )
+    return result
+
+
+def _render_project(
+    project_id: str,
+    on_progress: ProgressCallback,
+    render_quality: Optional[str],
+    profiler: RenderProfiler,
+) -> dict:
+    """Body of :func:`render_project`, recording into *profiler*."""
+    # Import Django models lazily to keep this module importable
+    # outside a Django context during early development.
+    from api.models import Project, Segment  # noqa: E402
+
+    logger.info("=== Render started for project %s ===", project_id)
+    setup = profiler.begin(PHASE_SETUP)
+
+    # ------------------------------------------------------------------
+    # A. FFmpeg availability check
+    # ------------------------------------------------------------------
+    if not render_utils.check_ffmpeg():
+        raise RuntimeError(render_utils.get_ffmpeg_error_message())
+
+    # ------------------------------------------------------------------
+    # B. Load project from database
+    # ------------------------------------------------------------------
+    project = Project.objects.get(id=project_id)
+    logger.info("Project loaded: '%s'", project.title)
+
+    # ------------------------------------------------------------------
+    # C. Resolve render settings (resolution, zoom, subtitles, logo)
+    # ------------------------------------------------------------------
+    render_settings = load_render_settings(project, render_quality)
+    res_width, res_height = render_settings["resolution"]
+    fps = render_settings["fps"]
+    subtitles_enabled = render_settings["subtitles_enabled"]
+    inter_segment_silence = render_settings["inter_segment_silence"]
+
+    logo_overlay = None
+    if render_settings["logo"] is not None:
+        try:
+            logo_overlay = build_logo_overlay(
+                render_settings["logo"], (res_width, res_height),
+            )
+        except Exception as logo_err:
+            logger.warning(
+                "Could not load logo: %s. Logo disabled.", logo_err,
+            )
+            render_settings["logo"] = None
+
     # Warnings accumulator for the result dict
     warnings: list[str] = []
 
@@ -618,14 +1065,46 @@ def render_project(
     # F. Determine output path
     # ------------------------------------------------------------------
     output_path = render_utils.get_output_path(str(project_id))
+    profiler.output_path = output_path
     logger.info("Output path: %s", output_path)
+    profiler.end(setup)
+
+    # ------------------------------------------------------------------
+    # F2. Piece-based encoding (parallel workers and/or render cache)
+    # ------------------------------------------------------------------
+    workers = resolve_render_workers(render_settings["render_workers"])
+    use_cache = render_settings["render_cache_mb"] > 0
+    if use_cache or (workers > 1 and total_segments > 1):
+        from core_engine import parallel_renderer  # noqa: E402
+
+        segment_specs = [
+            describe_segment(seg, idx, total_segments)
+            for idx, seg in enumerate(segments, start=1)
+        ]
+        result = parallel_renderer.render_segments_parallel(
+            project_id=str(project_id),
+            segment_specs=segment_specs,
+            render_settings=render_settings,
+            output_path=output_path,
+            workers=workers,
+            on_progress=on_progress,
+            warnings=warnings,
+            profiler=profiler,
+        )
+        if result is not None:
+            return result
+        logger.info(
+            "Falling back to single-stream render for project %s.",
+            project_id,
+        )
 
     # ------------------------------------------------------------------
     # Rendering pipeline (with proper cleanup)
     # ------------------------------------------------------------------
-    clips: list = []
-    audio_clips: list = []
-    composite_clip = None
+    sources: list = []
+    placed_audio: list = []
+    temp_dir = None
+    timeline = None
 
     try:
         # --------------------------------------------------------------
@@ -653,9 +1132,11 @@ def render_project(
                     f"(segment ID {segment.id}): {image_path}"
                 )
 
-            # Step 2: Load audio clip with error handling
+            # Step 2: Read the audio header with error handling (the
+            #         samples themselves are read once, by the mixer)
             try:
-                audio_clip = AudioFileClip(audio_path)
+                with profiler.phase(PHASE_AUDIO_PROBE, idx):
+                    audio_duration = get_audio_duration(audio_path)
             except Exception as exc:
                 logger.error(
                     "Failed to load audio for %s (ID %s): %s",
@@ -666,14 +1147,12 @@ def render_project(
                     f"(segment ID {segment.id}): {audio_path}"
                 ) from exc
 
-            audio_clips.append(audio_clip)
-            audio_duration = audio_clip.duration
             logger.debug(
                 "  Audio loaded: %s (%.2fs)", audio_path, audio_duration
             )
 
             # Duration synchronization checks
-            # Use audio_clip.duration as the authoritative source (not DB)
+            # Use the file's duration as the authoritative source (not DB)
             if audio_duration is None or audio_duration <= 0:
                 logger.warning(
                     "Skipping %s (ID %s): audio duration is zero or negative "
@@ -707,125 +1186,35 @@ def render_project(
             if inter_segment_silence > 0:
                 visual_duration = audio_duration + inter_segment_silence
 
-            # Step 3a: Create Ken Burns animated clip with error handling
-            try:
-                ken_burns_clip = apply_ken_burns(
-                    image_path=image_path,
-                    duration=visual_duration,
-                    resolution=(res_width, res_height),
-                    zoom_intensity=zoom_intensity,
-                    fps=fps,
-                    segment_index=segment.sequence_index,
-                )
-            except Exception as exc:
-                logger.error(
-                    "Failed to create Ken Burns clip for %s (ID %s): %s",
-                    seg_label, segment.id, exc,
-                )
-                raise RuntimeError(
-                    f"Ken Burns effect failed for {seg_label} "
-                    f"(segment ID {segment.id}): {image_path}"
-                ) from exc
-
-            logger.debug(
-                "  Ken Burns clip created: %s (direction index %d, "
-                "visual_duration=%.2fs)",
-                image_path, segment.sequence_index, visual_duration,
+            # Step 3a–3c: Ken Burns + subtitles + logo watermark.  The
+            # source is built lazily when the segment's window begins
+            # and released when it ends (streaming render), so only the
+            # current and next segment's planes are held in memory.
+            spec = describe_segment(segment, idx, total_segments)
+            spec["audio_duration"] = audio_duration
+            spec["visual_duration"] = visual_duration
+            profiler.label_segment(
+                idx, seg_label,
+                audio_duration=round(audio_duration, 3),
+                visual_duration=round(visual_duration, 3),
             )
+            source = LazySegmentFrameSource(
+                functools.partial(
+                    build_segment_source, spec, render_settings, logo_overlay,
+                    profiler,
+                ),
+                visual_duration,
+                (res_width, res_height),
+                warnings,
+            )
+            text_content = spec["text_content"]
 
-            # Step 3b: Composite subtitles onto Ken Burns clip
-            text_content = getattr(segment, "text_content", None) or ""
-            if subtitles_enabled and text_content.strip():
-                try:
-                    subtitle_clips = create_subtitles_for_segment(
-                        text_content=text_content,
-                        audio_duration=audio_duration,
-                        resolution=(res_width, res_height),
-                        font=resolved_font,
-                        color=subtitle_color,
-                        font_size=subtitle_font_size,
-                        position=subtitle_position,
-                    )
-                    if subtitle_clips:
-                        ken_burns_clip = CompositeVideoClip(
-                            [ken_burns_clip] + subtitle_clips,
-                            size=(res_width, res_height),
-                        ).with_duration(visual_duration)
-                        logger.debug(
-                            "  Subtitles composited: %d clip(s) for %s "
-                            "(visual_duration=%.2fs)",
-                            len(subtitle_clips), seg_label, visual_duration,
-                        )
-                    else:
-                        logger.debug(
-                            "  No subtitle clips generated for %s",
-                            seg_label,
-                        )
-                except Exception as sub_exc:
-                    warn_msg = (
-                        f"Subtitle generation failed for {seg_label} "
-                        f"(segment ID {segment.id}): {sub_exc}"
-                    )
-                    logger.warning(warn_msg)
-                    warnings.append(warn_msg)
-                    # Continue rendering without subtitles for this segment
-            elif not subtitles_enabled:
-                logger.debug(
-                    "  Subtitles disabled — skipping for %s.",
-                    seg_label,
-                )
-            elif not text_content.strip():
-                logger.debug(
-                    "  No text_content for %s — skipping subtitles.",
-                    seg_label,
-                )
-
-            # Step 3c: Composite logo watermark if enabled
-            if logo_enabled and logo_clip is not None:
-                try:
-                    seg_logo = logo_clip.with_duration(visual_duration)
-                    ken_burns_clip = CompositeVideoClip(
-                        [ken_burns_clip, seg_logo],
-                        size=(res_width, res_height),
-                    ).with_duration(visual_duration)
-                    logger.debug(
-                        "  Logo watermark composited for %s", seg_label,
-                    )
-                except Exception as logo_exc:
-                    logger.warning(
-                        "  Logo compositing failed for %s: %s",
-                        seg_label, logo_exc,
-                    )
-
-            # Step 4: Pair Ken Burns clip with audio
-            # The Ken Burns clip was already created with visual_duration
-            # (audio + silence), so the image stays on screen during the
-            # silence gap — no black frame.
-            if inter_segment_silence > 0:
-                try:
-                    from moviepy import concatenate_audioclips  # type: ignore[import-untyped]
-                except ImportError:
-                    from moviepy.editor import concatenate_audioclips  # type: ignore[import-untyped]
-
-                silence = _make_silent_audio(
-                    inter_segment_silence,
-                    fps=getattr(audio_clip, "fps", 44100) or 44100,
-                )
-                padded_audio = concatenate_audioclips([audio_clip, silence])
-                ken_burns_clip = ken_burns_clip.with_audio(padded_audio)
-
-                logger.debug(
-                    "  Audio padded: %.2fs + %.2fs silence = %.2fs",
-                    audio_duration, inter_segment_silence, visual_duration,
-                )
-            else:
-                ken_burns_clip = ken_burns_clip.with_audio(audio_clip)
-                logger.debug(
-                    "  Audio set: %.2fs (no silence gap)", audio_duration,
-                )
-
-            # Step 5: Append and continue
-            clips.append(ken_burns_clip)
+            # Step 4: Keep the narration for the timeline mix.  The
+            # frame source already lasts visual_duration (audio +
+            # silence), so the image stays on screen during the silence
+            # gap; the gap itself is simply unfilled in the mix.
+            sources.append(source)
+            placed_audio.append(audio_path)
 
             # Progress callback
             if on_progress:
@@ -839,121 +1228,59 @@ def render_project(
                 )
 
         # --------------------------------------------------------------
-        # H. Concatenate all clips (transition-aware)
+        # H. Assemble the timeline (transition-aware)
         # --------------------------------------------------------------
-        # Validate clips list is not empty (all segments may have been
+        # Validate sources list is not empty (all segments may have been
         # skipped due to zero-duration audio)
-        if not clips:
+        if not sources:
             raise ValueError(
                 "No clips available for rendering. All segments may have "
                 "been skipped due to zero-duration audio or missing files. "
                 "This should have been caught by pre-render validation."
             )
 
-        # Preserve original durations for logging before crossfade.
-        original_durations = [c.duration for c in clips]
-
-        if len(clips) > 1:
-            # --- Multi-clip: apply crossfade transitions, then
-            # concatenate with negative padding for overlap. ---
-            #
-            # AUDIO CROSSFADE BEHAVIOUR (Task 05.02.04)
-            # ------------------------------------------
-            # MoviePy's CrossFadeIn / CrossFadeOut effects modify BOTH
-            # the video opacity AND the audio volume simultaneously:
-            #
-            #   • CrossFadeOut(d) ramps audio volume 1.0 → 0.0 over the
-            #     last *d* seconds of the outgoing clip.
-            #   • CrossFadeIn(d) ramps audio volume 0.0 → 1.0 over the
-            #     first *d* seconds of the incoming clip.
-            #
-            # During the 0.5 s overlap created by negative padding, both
-            # audio streams play at the same time.  The outgoing audio
-            # fades out while the incoming audio fades in, producing a
-            # smooth cross-mix whose total level stays approximately
-            # constant (the two linear ramps sum to ~1.0 at every point).
-            #
-            # No manual AudioClip manipulation is required — this
-            # automatic behaviour produces a natural-sounding transition
-            # for TTS narration, where segment boundaries usually fall in
-            # natural speech pauses.
-            #
-            # ALTERNATIVES NOT IMPLEMENTED (v1.0 design decision):
-            #
-            #   A) Independent audio fading (audio_fadein / audio_fadeout
-            #      with different curves or durations).  Adds complexity
-            #      without clear benefit for narration content.
-            #
-            #   B) Full-volume audio during visual crossfade (strip audio
-            #      before crossfade, reattach after).  Would produce a
-            #      harsh, abrupt audio cut rather than a smooth cross-mix.
-            #
-            # SUBTITLE–TRANSITION INTERACTION (Task 05.02.06)
-            # -----------------------------------------------
-            # Subtitles are composited INTO each clip (via
-            # CompositeVideoClip) in SubPhase 05.01 *before* crossfade
-            # effects are applied here.  The crossfade opacity therefore
-            # affects the ENTIRE composite — Ken Burns visuals and
-            # subtitle text fade together as a single unit.
-            #
-            # During the 0.5 s overlap, both the outgoing clip's subtitle
-            # and the incoming clip's subtitle are partially visible at
-            # reduced opacity.  This brief blended state is standard
-            # video-editing behaviour and is visually acceptable for v1.0
-            # because:
-            #   • The overlap is only 0.5 s — too short for viewers to
-            #     focus on the blended text.
-            #   • Both subtitles occupy the same screen position, so the
-            #     blend appears as one subtitle morphing into another.
-            #   • Content boundaries (end-of-sentence → start-of-sentence)
-            #     make the transition feel coherent.
-            #
-            # Subtitle timing (start / duration of each TextClip) is
-            # unaffected by crossfade — only opacity is modified.
-            #
-            # POTENTIAL FUTURE IMPROVEMENTS (not implemented in v1.0):
-            #   A) Truncate outgoing subtitles 0.5 s before clip end.
-            #   B) Delay incoming subtitles 0.5 s after clip start.
-            #   C) Add semi-transparent background behind subtitle text
-            #      for readability during partial-opacity blending.
-            # All deferred due to added complexity with minimal benefit.
-
-            # Progress: transition phase
-            if on_progress:
-                on_progress(
-                    total_segments,
-                    total_segments,
-                    "Applying crossfade transitions…",
-                )
-
-            clips = apply_crossfade_transitions(clips, TRANSITION_DURATION)
+        # Preserve original durations for logging.
+        original_durations = [src.duration for src in sources]
 
-            logger.info(
-                "Concatenating %d clip(s) with crossfade "
-                "(padding=%.2fs)...",
-                len(clips),
-                -TRANSITION_DURATION,
-            )
-            composite_clip = concatenate_videoclips(
-                clips,
-                method="compose",
-                padding=-TRANSITION_DURATION,
-            )
-        else:
-            # --- Single-clip: no transitions, no concatenation. ---
-            # A single segment renders as-is — no crossfadein/crossfadeout,
-            # no fadein/fadeout, no concatenation overhead.  All previously
-            # applied effects (Ken Burns, subtitle overlay, audio) are
-            # preserved exactly as they were baked into the clip.
-            logger.info(
-                "Project has a single segment — skipping crossfade "
-                "transitions and concatenation.  The clip will be "
-                "exported directly with all existing effects intact."
+        if len(sources) > 1 and on_progress:
+            on_progress(
+                total_segments,
+                total_segments,
+                "Applying crossfade transitions…",
             )
-            composite_clip = clips[0]
 
-        # Validate concatenation / single-clip result
-        if composite_clip.duration is None or composite_clip.duration <= 0:
+        # SINGLE-PASS COMPOSITING
+        # -----------------------
+        # Every output frame is drawn once into a reused buffer by
+        # CrossfadeTimeline / FrameCompositor: Ken Burns crop, then the
+        # visible subtitle sprite, then the premultiplied logo.  During
+        # the TRANSITION_DURATION overlap between consecutive segments
+        # the frame is a weighted blend of the two fully composed
+        # frames (outgoing * (1 - w) + incoming * w), so Ken Burns
+        # visuals, subtitle text and logo fade together as one unit.
+        # Subtitle timing is unaffected — only the blend weight changes.
+        #
+        # AUDIO
+        # -----
+        # Each segment's narration starts with its visual segment.
+        # During an overlap the outgoing segment's trailing silence
+        # (inter_segment_silence) meets the incoming narration; any
+        # remaining overlap is summed.  The whole track is pre-mixed
+        # by mix_soundtrack() in one vectorized pass at export time,
+        # using the timeline's own start offsets so audio and video
+        # cannot drift apart.
+        timeline = CrossfadeTimeline(sources, TRANSITION_DURATION)
+
+        logger.info(
+            "Timeline assembled: %d segment(s), %d crossfade(s) "
+            "(%.2fs each).",
+            len(sources),
+            len(sources) - 1,
+            timeline.transition,
+        )
+
+        # Validate timeline result
+        if timeline.duration is None or timeline.duration <= 0:
             raise ValueError(
                 "Concatenation produced a clip with zero or negative duration."
             )
@@ -973,7 +1300,7 @@ def render_project(
             TRANSITION_DURATION if num_overlaps else 0.0,
             naive_sum,
             expected_duration,
-            composite_clip.duration,
+            timeline.duration,
         )
 
         # --------------------------------------------------------------
@@ -996,32 +1323,57 @@ def render_project(
 
         # Build a fine-grained export progress logger so the frontend
         # sees smooth advancement during the most time-consuming phase.
-        export_logger: object = None
-        if on_progress:
-            export_logger = _ExportProgressLogger(
-                on_progress=on_progress,
-                total_segments=total_segments,
-                base_percentage=80,
-            )
+        export_logger = _ExportProgressLogger(
+            on_progress=on_progress,
+            total_segments=total_segments,
+            base_percentage=80,
+        )
 
+        # RAW-FRAME PIPE
+        # --------------
+        # The soundtrack is mixed once into a WAV; producer threads
+        # then draw frames into a ring of preallocated buffers while
+        # this thread streams them as raw RGB into FFmpeg, which
+        # encodes the video and muxes the WAV in the same pass.
+        from core_engine.frame_pipe import (  # noqa: E402
+            encode_timeline,
+            producer_thread_count,
+        )
+        from core_engine.parallel_renderer import piece_encoder  # noqa: E402
+
+        temp_dir = render_utils.get_temp_dir(str(project_id))
+        soundtrack_path = os.path.join(temp_dir, "soundtrack.wav")
+        pipe_stats: dict = {}
+        producer_threads = producer_thread_count(workers)
         try:
-            composite_clip.write_videofile(
+            with profiler.phase(PHASE_AUDIO_MIX):
+                mix_soundtrack(
+                    placed_audio, timeline.starts, timeline.duration,
+                    soundtrack_path,
+                )
+
+            def on_frame(done, total):
+                profiler.note_frames(done)
+                export_logger.report_frames(done, total)
+
+            export = profiler.begin(PHASE_EXPORT)
+            frames = encode_timeline(
+                timeline,
+                fps,
                 output_path,
-                codec="libx264",
-                audio_codec="aac",
-                bitrate="8000k",
-                fps=fps,
-                logger=export_logger,  # Fine-grained frame-by-frame progress
+                dict(
+                    piece_encoder(render_settings, timeline.duration),
+                    threads=encoder_threads(1),
+                ),
+                audio_path=soundtrack_path,
+                threads=producer_threads,
+                on_frame=on_frame,
+                stats=pipe_stats,
             )
-        except PermissionError as perm_err:
-            # On Windows MoviePy sometimes fails to delete the temp
-            # audio file (``finalTEMP_MPY_wvf_snd.mp4``) because another
-            # process still holds a lock.  The actual video export has
-            # already completed successfully if we reach this point, so
-            # we log a warning and continue.
-            logger.warning(
-                "Temp-file cleanup failed (non-fatal, Windows lock): %s",
-                perm_err,
+            profiler.end(export)
+            profiler.record_export(
+                frames, profiler.phases[PHASE_EXPORT]["wall_seconds"],
+                dict(pipe_stats, producer_threads=producer_threads),
             )
         except (IOError, RuntimeError) as export_err:
             logger.error("Export failed: %s", export_err)
@@ -1047,7 +1399,7 @@ def render_project(
                 f"Export completed but output file not found: {output_path}"
             )
 
-        total_duration = composite_clip.duration
+        total_duration = timeline.duration
 
         # Duration validation: compare actual vs expected.
         duration_diff = abs(total_duration - expected_duration)
@@ -1084,6 +1436,12 @@ def render_project(
             "num_transitions": num_overlaps,
             "file_size": file_size,
             "warnings": warnings,
+            "render_mode": "sequential",
+            "workers": 1,
+            "producer_threads": producer_threads,
+            "render_quality": render_settings["render_quality"],
+            "export_profile": render_settings["export_profile"],
+            "streaming": True,
         }
 
         if warnings:
@@ -1110,30 +1468,10 @@ def render_project(
 
     finally:
         # --------------------------------------------------------------
-        # L. Close all clips to free memory and file handles
+        # L. Release segment planes, remove the pre-mixed soundtrack and
+        #    other scratch files
         # --------------------------------------------------------------
-        if composite_clip is not None:
-            try:
-                composite_clip.close()
-            except Exception:
-                pass
-
-        for clip in clips:
-            try:
-                # Close audio sub-clip if attached
-                if hasattr(clip, "audio") and clip.audio is not None:
-                    clip.audio.close()
-            except Exception:
-                pass
-            try:
-                clip.close()
-            except Exception:
-                pass
-
-        for ac in audio_clips:
-            try:
-                ac.close()
-            except Exception:
-                pass
-
-        logger.debug("All clips closed.")
+        if timeline is not None:
+            timeline.release_all()
+        if temp_dir is not None:
+            render_utils.cleanup_temp_files(temp_dir)
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -150,3 +151,48 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 50,
 }
+
+# ---------------------
+# Background task lanes
+# ---------------------
+# Worker threads per TaskManager lane (see api/tasks.py). TTS stays at one
+# worker to avoid concurrent Kokoro inference; renders use their own
+# process pool for per-segment parallelism.
+TASK_LANE_WORKERS = {
+    'tts': 1,
+    'render': 1,
+    'preview': 1,
+}
+
+# Persist the task registry to the TaskRecord table (see api/task_store.py)
+# so task status and stuck PROCESSING projects survive a restart. Changes
+# are batched into one write per TASK_STORE_FLUSH_INTERVAL seconds.
+# Opt-in: set STORYFLOW_TASK_STORE=1 in the environment of the server
+# process. Enabling it switches a SQLite database to the WAL journal.
+TASK_STORE_ENABLED = os.environ.get('STORYFLOW_TASK_STORE', '').lower() in ('1', 'true', 'yes')
+TASK_STORE_FLUSH_INTERVAL = 2.0
+# Resubmit interrupted "generate all audio" batches on startup
+TASK_STORE_RESUME_TTS = False
+
+# ---------------------
+# TTS (ONNX Runtime)
+# ---------------------
+# SessionOptions for every Kokoro session (see core_engine/model_loader.py).
+# Run `python manage.py benchmark_tts` to find the fastest values for this CPU.
+TTS_ONNX_SESSION = {
+    'intra_op_threads': 0,               # 0 = ONNX Runtime default
+    'inter_op_threads': 0,
+    'intra_op_thread_affinities': None,  # e.g. '1;2;3'
+    'allow_spinning': True,
+    'execution_mode': 'sequential',      # 'sequential' | 'parallel'
+    'graph_optimization_level': 'all',   # 'disable' | 'basic' | 'extended' | 'all'
+    'optimized_model_path': None,        # e.g. BASE_DIR.parent / 'models' / 'kokoro-v0_19.opt.onnx'
+    'enable_cpu_mem_arena': True,
+    'enable_mem_pattern': True,
+    'enable_mem_reuse': True,
+}
+
+# Log a real-time-factor benchmark of TTS_BENCHMARK_CONFIGS (or a default
+# intra-op thread sweep) in the background when the server starts.
+TTS_STARTUP_BENCHMARK = False
+TTS_BENCHMARK_CONFIGS = None
@@ -93,14 +93,20 @@ class GlobalSettingsAPITests(APITestCase):
         data = response.json()
 
         expected_fields = {
-            'default_voice_id', 'tts_speed',
+            'default_voice_id', 'tts_speed', 'tts_cache_mb',
             'subtitle_font_family', 'subtitle_font_size',
             'subtitle_font_color', 'subtitle_position',
             'subtitle_font', 'subtitle_color',
             'render_width', 'render_height', 'render_fps',
-            'ken_burns_zoom', 'transition_duration', 'zoom_intensity',
+            'render_workers', 'render_cache_mb', 'image_cache_mb',
+            'image_spill_mb', 'render_quality',
+            'export_profile', 'export_bitrate_kbps', 'export_target_mb',
+            'ken_burns_zoom', 'ken_burns_easing', 'transition_duration',
+            'zoom_intensity',
             'custom_font_file',
             'inter_segment_silence', 'subtitles_enabled',
+            'logo_enabled', 'active_logo', 'logo_scale',
+            'logo_position', 'logo_opacity', 'logo_margin',
             'created_at', 'updated_at',
         }
         self.assertEqual(set(data.keys()), expected_fields)
@@ -19,6 +19,7 @@ const baseSegment: Segment = {
   image_file: null,
   audio_file: null,
   audio_duration: null,
+  audio_stale: false,
   is_locked: false,
 };
 
@@ -142,6 +143,18 @@ describe('SegmentCard — Audio Integration', () => {
     expect(screen.getByText('Regenerate')).toBeInTheDocument();
   });
 
+  it('shows stale warning when the server flags the audio as stale', () => {
+    setupStoreMock();
+
+    renderWithTooltip(
+      <SegmentCard segment={{ ...segmentWithAudio, audio_stale: true }} {...commonProps} />,
+    );
+
+    expect(
+      screen.getByText('Text changed — audio may be out of sync.'),
+    ).toBeInTheDocument();
+  });
+
   it('does NOT show stale warning when segment is not stale', () => {
     setupStoreMock({
       staleAudioSegments: new Set<string>(),
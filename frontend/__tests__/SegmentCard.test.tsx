@@ -19,6 +19,7 @@ const mockSegment: Segment = {
   image_file: null,
   audio_file: null,
   audio_duration: null,
+  audio_stale: false,
   is_locked: false,
 };
 
@@ -13,6 +13,7 @@ function createMockSegment(overrides: Partial<Segment> = {}): Segment {
     image_file: null,
     audio_file: null,
     audio_duration: null,
+    audio_stale: false,
     is_locked: false,
     ...overrides,
   };
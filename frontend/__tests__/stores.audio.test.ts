@@ -15,6 +15,7 @@ const mockSegments: Segment[] = [
     image_file: null,
     audio_file: null,
     audio_duration: null,
+    audio_stale: false,
     is_locked: false,
   },
   {
@@ -26,6 +27,7 @@ const mockSegments: Segment[] = [
     image_file: null,
     audio_file: '/media/audio/seg-2.wav',
     audio_duration: 3.5,
+    audio_stale: false,
     is_locked: false,
   },
 ];
@@ -29,6 +29,7 @@ const mockSegments: Segment[] = [
     image_file: null,
     audio_file: null,
     audio_duration: null,
+    audio_stale: false,
     is_locked: false,
   },
   {
@@ -40,6 +41,7 @@ const mockSegments: Segment[] = [
     image_file: null,
     audio_file: null,
     audio_duration: null,
+    audio_stale: false,
     is_locked: false,
   },
 ];
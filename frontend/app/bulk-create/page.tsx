@@ -5,11 +5,12 @@ import Link from 'next/link';
 import {
   getProjects,
   getProject,
-  startRender,
-  getRenderStatus,
-  cancelRender,
+  createRenderBatch,
+  getRenderBatches,
+  cancelRenderBatch,
+  watchRenderBatch,
 } from '@/lib/api';
-import { Project, ProjectDetail, Segment, RenderStatusResponse } from '@/lib/types';
+import { Project, ProjectDetail, Segment, RenderBatch, RenderBatchItem } from '@/lib/types';
 import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
 import { Card, CardContent, CardHeader } from '@/components/ui/card';
@@ -87,10 +88,15 @@ interface QueueItem {
   error: string | null;
 }
 
+/** Aggregate figures of the running batch, shown in the queue header. */
+interface BatchStats {
+  etaSeconds: number | null;
+  segmentsPerMinute: number;
+}
+
 // ── Constants ──
 
 const RENDERABLE_STATUSES: Project['status'][] = ['DRAFT', 'COMPLETED', 'FAILED'];
-const POLL_INTERVAL = 3000;
 
 // ── Helper functions ──
 
@@ -139,6 +145,26 @@ function getQueueStatusBadge(status: QueueItemStatus) {
   }
 }
 
+function toQueueItem(item: RenderBatchItem): QueueItem {
+  return {
+    projectId: item.project_id,
+    title: item.title,
+    status: item.status,
+    progress: item.percentage,
+    currentPhase: item.current_phase,
+    currentSegment: item.current_segment,
+    totalSegments: item.segments,
+    error: item.error,
+  };
+}
+
+function formatEta(seconds: number): string {
+  if (seconds < 60) return `${seconds}s`;
+  const minutes = Math.floor(seconds / 60);
+  if (minutes < 60) return `${minutes}m ${seconds % 60}s`;
+  return `${Math.floor(minutes / 60)}h ${minutes % 60}m`;
+}
+
 function getIssueTooltip(item: ProjectReadiness): string {
   const issues: string[] = [];
   if (item.emptySegments) issues.push('No segments');
@@ -159,9 +185,11 @@ export default function BulkCreatePage() {
   const [queue, setQueue] = useState<QueueItem[]>([]);
   const [isRunning, setIsRunning] = useState(false);
   const [isCancelling, setIsCancelling] = useState(false);
+  const [batchStats, setBatchStats] = useState<BatchStats | null>(null);
 
-  const pollTimersRef = useRef<Map<string, ReturnType<typeof setInterval>>>(new Map());
-  const cancelledRef = useRef(false);
+  // The server-side batch being shown, and the stop function of its watch
+  const batchIdRef = useRef<string | null>(null);
+  const stopWatchRef = useRef<(() => void) | null>(null);
 
   // ── Derived state ──
   const readyProjects = useMemo(
@@ -184,13 +212,46 @@ export default function BulkCreatePage() {
     [queue]
   );
 
-  // ── Cleanup poll timers on unmount ──
+  // ── Follow a server-side batch ──
+  const applyBatch = useCallback((batch: RenderBatch) => {
+    const active = batch.status === 'PENDING' || batch.status === 'PROCESSING';
+    setQueue(batch.items.map(toQueueItem));
+    setBatchStats({
+      etaSeconds: active ? batch.eta_seconds : null,
+      segmentsPerMinute: batch.throughput.segments_per_minute,
+    });
+    setIsRunning(active);
+    setIsCancelling(active && batch.cancel_requested);
+  }, []);
+
+  const followBatch = useCallback(
+    (batchId: string) => {
+      stopWatchRef.current?.();
+      batchIdRef.current = batchId;
+      stopWatchRef.current = watchRenderBatch(batchId, applyBatch);
+    },
+    [applyBatch]
+  );
+
+  // ── Re-attach to a running batch; stop watching on unmount ──
   useEffect(() => {
+    getRenderBatches()
+      .then((batches) => {
+        const running = batches.find(
+          (b) => b.status === 'PENDING' || b.status === 'PROCESSING'
+        );
+        if (running && !batchIdRef.current) {
+          applyBatch(running);
+          followBatch(running.batch_id);
+        }
+      })
+      .catch(() => { /* no batch to resume */ });
+
     return () => {
-      pollTimersRef.current.forEach((timer) => clearInterval(timer));
-      pollTimersRef.current.clear();
+      stopWatchRef.current?.();
+      stopWatchRef.current = null;
     };
-  }, []);
+  }, [applyBatch, followBatch]);
 
   // ── Fetch & validate projects ──
   const fetchAndValidate = useCallback(async () => {
@@ -292,251 +353,54 @@ export default function BulkCreatePage() {
     }
   }, [allReadySelected, readyProjects]);
 
-  // ── Poll render status for a single project ──
-  const pollProjectRender = useCallback(
-    (projectId: string) => {
-      // Clear any existing timer
-      const existing = pollTimersRef.current.get(projectId);
-      if (existing) clearInterval(existing);
-
-      const timer = setInterval(async () => {
-        if (cancelledRef.current) {
-          clearInterval(timer);
-          pollTimersRef.current.delete(projectId);
-          return;
-        }
-
-        try {
-          const status: RenderStatusResponse = await getRenderStatus(projectId);
-
-          setQueue((prev) =>
-            prev.map((item) => {
-              if (item.projectId !== projectId) return item;
-
-              if (status.status === 'COMPLETED') {
-                clearInterval(timer);
-                pollTimersRef.current.delete(projectId);
-                return {
-                  ...item,
-                  status: 'completed' as const,
-                  progress: 100,
-                  currentPhase: 'Done',
-                };
-              }
-
-              if (status.status === 'FAILED') {
-                clearInterval(timer);
-                pollTimersRef.current.delete(projectId);
-                return {
-                  ...item,
-                  status: 'failed' as const,
-                  progress: 0,
-                  error: 'Render failed on the server',
-                };
-              }
-
-              // Still processing — update progress
-              return {
-                ...item,
-                status: 'rendering' as const,
-                progress: status.progress?.percentage ?? item.progress,
-                currentPhase: status.progress?.current_phase ?? item.currentPhase,
-                currentSegment: status.progress?.current_segment ?? item.currentSegment,
-                totalSegments: status.progress?.total_segments ?? item.totalSegments,
-              };
-            })
-          );
-        } catch {
-          // Transient error — keep polling
-        }
-      }, POLL_INTERVAL);
-
-      pollTimersRef.current.set(projectId, timer);
-    },
-    []
-  );
-
   // ── Start bulk render ──
   const startBulkRender = useCallback(async () => {
     const selected = readyProjects.filter((p) => selectedIds.has(p.project.id));
     if (selected.length === 0) return;
 
-    cancelledRef.current = false;
     setIsCancelling(false);
     setIsRunning(true);
 
-    // Initialize queue
-    const initialQueue: QueueItem[] = selected.map((p) => ({
-      projectId: p.project.id,
-      title: p.project.title,
-      status: 'queued' as const,
-      progress: 0,
-      currentPhase: 'Waiting',
-      currentSegment: 0,
-      totalSegments: p.project.segment_count,
-      error: null,
-    }));
-
-    setQueue(initialQueue);
-    setSelectedIds(new Set()); // Clear selection
-
-    // Process sequentially
-    for (let i = 0; i < initialQueue.length; i++) {
-      const queueItem = initialQueue[i];
-
-      // Check if cancelled
-      if (cancelledRef.current) {
-        // Mark remaining as cancelled
-        setQueue((prev) =>
-          prev.map((item, idx) =>
-            idx >= i && item.status === 'queued'
-              ? { ...item, status: 'cancelled' as const, currentPhase: 'Cancelled' }
-              : item
-          )
-        );
-        break;
-      }
-
-      // Mark current as rendering
-      setQueue((prev) =>
-        prev.map((item) =>
-          item.projectId === queueItem.projectId
-            ? { ...item, status: 'rendering' as const, currentPhase: 'Starting…' }
-            : item
-        )
-      );
-
-      try {
-        const result = await startRender(queueItem.projectId);
-
-        // Update with task info
-        setQueue((prev) =>
-          prev.map((item) =>
-            item.projectId === queueItem.projectId
-              ? {
-                  ...item,
-                  status: 'rendering' as const,
-                  totalSegments: result.total_segments,
-                  currentPhase: 'Rendering',
-                }
-              : item
-          )
-        );
-
-        // Poll and wait for completion
-        await new Promise<void>((resolve) => {
-          const timer = setInterval(async () => {
-            if (cancelledRef.current) {
-              clearInterval(timer);
-              pollTimersRef.current.delete(queueItem.projectId);
-              // Try to cancel on the backend
-              try {
-                await cancelRender(queueItem.projectId);
-              } catch { /* best effort */ }
-              setQueue((prev) =>
-                prev.map((item) =>
-                  item.projectId === queueItem.projectId && item.status === 'rendering'
-                    ? { ...item, status: 'cancelled' as const, currentPhase: 'Cancelled' }
-                    : item
-                )
-              );
-              resolve();
-              return;
-            }
-
-            try {
-              const status = await getRenderStatus(queueItem.projectId);
-
-              if (status.status === 'COMPLETED') {
-                clearInterval(timer);
-                pollTimersRef.current.delete(queueItem.projectId);
-                setQueue((prev) =>
-                  prev.map((item) =>
-                    item.projectId === queueItem.projectId
-                      ? { ...item, status: 'completed' as const, progress: 100, currentPhase: 'Done' }
-                      : item
-                  )
-                );
-                resolve();
-                return;
-              }
-
-              if (status.status === 'FAILED') {
-                clearInterval(timer);
-                pollTimersRef.current.delete(queueItem.projectId);
-                setQueue((prev) =>
-                  prev.map((item) =>
-                    item.projectId === queueItem.projectId
-                      ? { ...item, status: 'failed' as const, progress: 0, error: 'Render failed' }
-                      : item
-                  )
-                );
-                resolve();
-                return;
-              }
-
-              // Update progress
-              setQueue((prev) =>
-                prev.map((item) =>
-                  item.projectId === queueItem.projectId
-                    ? {
-                        ...item,
-                        progress: status.progress?.percentage ?? item.progress,
-                        currentPhase: status.progress?.current_phase ?? item.currentPhase,
-                        currentSegment: status.progress?.current_segment ?? item.currentSegment,
-                        totalSegments: status.progress?.total_segments ?? item.totalSegments,
-                      }
-                    : item
-                )
-              );
-            } catch {
-              // Transient error — keep polling
-            }
-          }, POLL_INTERVAL);
-
-          pollTimersRef.current.set(queueItem.projectId, timer);
-        });
-      } catch (err: unknown) {
-        const axiosErr = err as { response?: { status?: number; data?: Record<string, unknown> } };
-        const status = axiosErr?.response?.status;
-
-        let errorMsg = 'Failed to start render';
-        if (status === 400) {
-          const data = axiosErr?.response?.data;
-          errorMsg = String(data?.message || data?.error || 'Validation failed on server');
-        } else if (status === 409) {
-          errorMsg = 'Project is already being rendered';
-        }
-
-        setQueue((prev) =>
-          prev.map((item) =>
-            item.projectId === queueItem.projectId
-              ? { ...item, status: 'failed' as const, error: errorMsg, currentPhase: 'Failed' }
-              : item
-          )
-        );
-      }
+    try {
+      // The server renders them in list order (equal priorities)
+      const batch = await createRenderBatch(selected.map((p) => p.project.id));
+      setSelectedIds(new Set()); // Clear selection
+      applyBatch(batch);
+      followBatch(batch.batch_id);
+    } catch (err: unknown) {
+      const axiosErr = err as { response?: { status?: number; data?: Record<string, unknown> } };
+      const data = axiosErr?.response?.data;
+      const problems = data?.projects as Record<string, string> | undefined;
+      const message = problems
+        ? `${Object.keys(problems).length} project(s) cannot be rendered: ${Object.values(problems)[0]}`
+        : String(data?.error || 'Failed to start bulk render');
+      toast.error(message);
+      setIsRunning(false);
     }
-
-    setIsRunning(false);
-  }, [readyProjects, selectedIds]);
+  }, [readyProjects, selectedIds, applyBatch, followBatch]);
 
   // ── Cancel bulk render ──
-  const handleCancelBulk = useCallback(() => {
-    cancelledRef.current = true;
+  const handleCancelBulk = useCallback(async () => {
+    const batchId = batchIdRef.current;
+    if (!batchId) return;
     setIsCancelling(true);
     toast.info('Cancelling bulk render…');
+    try {
+      await cancelRenderBatch(batchId);
+    } catch {
+      // Already finished — the watch delivers the final state
+    }
   }, []);
 
   // ── Clear queue ──
   const clearQueue = useCallback(() => {
-    // Clean up any remaining timers
-    pollTimersRef.current.forEach((timer) => clearInterval(timer));
-    pollTimersRef.current.clear();
+    stopWatchRef.current?.();
+    stopWatchRef.current = null;
+    batchIdRef.current = null;
     setQueue([]);
+    setBatchStats(null);
     setIsRunning(false);
     setIsCancelling(false);
-    cancelledRef.current = false;
   }, []);
 
   // ── Queue summary ──
@@ -772,6 +636,12 @@ export default function BulkCreatePage() {
                   {queueSummary.failed > 0 && `, ${queueSummary.failed} failed`}
                   {queueSummary.cancelled > 0 && `, ${queueSummary.cancelled} cancelled`})
                 </span>
+                {isRunning && batchStats && batchStats.segmentsPerMinute > 0 && (
+                  <span className="text-muted-foreground text-sm">
+                    · {batchStats.segmentsPerMinute} segments/min
+                    {batchStats.etaSeconds !== null && ` · ETA ${formatEta(batchStats.etaSeconds)}`}
+                  </span>
+                )}
               </div>
               <div className="flex items-center gap-2">
                 {isRunning && !isCancelling && (
@@ -786,7 +656,7 @@ export default function BulkCreatePage() {
                       <AlertDialogHeader>
                         <AlertDialogTitle>Cancel Bulk Render</AlertDialogTitle>
                         <AlertDialogDescription>
-                          This will cancel the currently rendering project and skip all remaining queued projects.
+                          This will cancel the projects rendering now and skip all remaining queued projects.
                           Projects that already completed will keep their rendered output.
                         </AlertDialogDescription>
                       </AlertDialogHeader>
@@ -15,7 +15,7 @@ import { Progress } from '@/components/ui/progress';
 import { Tooltip, TooltipProvider, TooltipContent, TooltipTrigger } from '@/components/ui/tooltip';
 import {
   ArrowLeft, Volume2, Film, Loader2, X, Plus, FileUp, Download, CheckCircle, AlertCircle,
-  LayoutDashboard, Settings, Calendar, Layers, ChevronLeft, ChevronRight,
+  LayoutDashboard, Settings, Calendar, Layers, ChevronLeft, ChevronRight, RotateCcw, RefreshCw,
 } from 'lucide-react';
 import { cn } from '@/lib/utils';
 
@@ -42,6 +42,7 @@ export default function TimelineEditorPage() {
     fetchProject, addSegment, importSegmentsToProject, updateSegment, deleteSegment,
     uploadImage, removeImage, reset,
     bulkGenerationProgress, generateAllAudio, cancelGeneration,
+    resumableAudioTaskId, resumeAllAudio,
     // Render pipeline
     renderStatus, renderProgress, outputUrl,
     startRender, resetRenderState, cancelRender, downloadVideo,
@@ -51,6 +52,8 @@ export default function TimelineEditorPage() {
     bulkGenerationProgress.status !== 'COMPLETED' &&
     bulkGenerationProgress.status !== 'FAILED';
 
+  const staleSegmentCount = segments.filter((s) => s.audio_stale).length;
+
   const bulkPercentage = bulkGenerationProgress
     ? Math.round((bulkGenerationProgress.completed / Math.max(bulkGenerationProgress.total, 1)) * 100)
     : 0;
@@ -403,7 +406,7 @@ export default function TimelineEditorPage() {
             <div className="flex flex-wrap items-center gap-2 sm:gap-3">
               <Button
                 size="sm"
-                onClick={generateAllAudio}
+                onClick={() => generateAllAudio()}
                 disabled={!!bulkGenerationProgress}
               >
                 {isGenerating ? (
@@ -413,6 +416,28 @@ export default function TimelineEditorPage() {
                 )}
                 {isGenerating ? 'Generating...' : 'Generate All Audio'}
               </Button>
+              {staleSegmentCount > 0 && !bulkGenerationProgress && (
+                <Button
+                  variant="outline"
+                  size="sm"
+                  onClick={() => generateAllAudio({ stale_only: true })}
+                  title="Regenerate audio only where the text, voice or speed changed"
+                >
+                  <RefreshCw className="h-4 w-4 mr-1" />
+                  Regenerate Changed ({staleSegmentCount})
+                </Button>
+              )}
+              {resumableAudioTaskId && !bulkGenerationProgress && (
+                <Button
+                  variant="outline"
+                  size="sm"
+                  onClick={resumeAllAudio}
+                  title="Generate only the segments the last run did not finish or whose text changed"
+                >
+                  <RotateCcw className="h-4 w-4 mr-1" />
+                  Resume
+                </Button>
+              )}
               {isGenerating && (
                 <Button
                   variant="outline"
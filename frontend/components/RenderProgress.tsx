@@ -1,9 +1,9 @@
 "use client";
 
-import { useEffect, useRef } from "react";
+import { useEffect } from "react";
 import { Progress } from "@/components/ui/progress";
 import { useProjectStore } from "@/lib/stores";
-import { getRenderStatus } from "@/lib/api";
+import { watchRenderStatus } from "@/lib/api";
 
 /**
  * RenderProgress — Multi-phase progress display during video rendering.
@@ -12,8 +12,9 @@ import { getRenderStatus } from "@/lib/api";
  *   1. **Segment processing** (0–80 % overall) — Ken Burns + subtitle compositing
  *   2. **Export / encoding** (80–100 % overall) — video frames → audio → finalize
  *
- * Polls GET /api/projects/{id}/status/ every 3 seconds while the
- * project is in the PROCESSING state.
+ * Follows the render over the task event stream (GET /api/tasks/events/)
+ * while the project is in the PROCESSING state, falling back to polling
+ * GET /api/projects/{id}/status/ where EventSource is unavailable.
  */
 export default function RenderProgress() {
   const {
@@ -22,51 +23,27 @@ export default function RenderProgress() {
     renderProgress,
   } = useProjectStore();
 
-  const intervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
-
-  // ── Polling effect ──
+  // ── Progress watch (pushed over the task event stream) ──
   useEffect(() => {
     if (renderStatus !== "rendering" || !project) return;
 
-    const poll = async () => {
-      try {
-        const status = await getRenderStatus(project.id);
-        useProjectStore.setState({ renderProgress: status.progress });
-
-        if (status.status === "COMPLETED") {
-          useProjectStore.setState({
-            renderStatus: "completed",
-            renderProgress: status.progress,
-            outputUrl: status.output_url,
-          });
-          if (intervalRef.current) {
-            clearInterval(intervalRef.current);
-            intervalRef.current = null;
-          }
-        } else if (status.status === "FAILED") {
-          useProjectStore.setState({
-            renderStatus: "failed",
-            renderProgress: status.progress,
-            outputUrl: null,
-          });
-          if (intervalRef.current) {
-            clearInterval(intervalRef.current);
-            intervalRef.current = null;
-          }
-        }
-      } catch {
-        // Transient error — continue polling
-      }
-    };
-
-    intervalRef.current = setInterval(poll, 3000);
-
-    return () => {
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
-        intervalRef.current = null;
+    return watchRenderStatus(project.id, (status) => {
+      useProjectStore.setState({ renderProgress: status.progress });
+
+      if (status.status === "COMPLETED") {
+        useProjectStore.setState({
+          renderStatus: "completed",
+          renderProgress: status.progress,
+          outputUrl: status.output_url,
+        });
+      } else if (status.status === "FAILED") {
+        useProjectStore.setState({
+          renderStatus: "failed",
+          renderProgress: status.progress,
+          outputUrl: null,
+        });
       }
-    };
+    });
   }, [renderStatus, project]);
 
   if (renderStatus !== "rendering") return null;
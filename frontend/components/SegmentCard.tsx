@@ -48,9 +48,10 @@ function SegmentCardComponent({
   );
   const generateAudio = useProjectStore((state) => state.generateAudio);
   const removeAudio = useProjectStore((state) => state.removeAudio);
-  const isStale = useProjectStore(
+  const isEditedSinceAudio = useProjectStore(
     (state) => state.staleAudioSegments.has(segment.id),
   );
+  const isStale = segment.audio_stale || isEditedSinceAudio;
 
   const isGenerating = generationStatus.status === 'generating';
   const isFailed = generationStatus.status === 'failed';
@@ -9,11 +9,19 @@ import {
   PaginatedResponse,
   TaskResponse,
   BulkTaskResponse,
+  ResumeAudioResponse,
   GenerateAllAudioOptions,
   TaskStatusResponse,
+  TaskEvent,
+  RenderStatusResponse,
+  RenderBatch,
+  RenderBatchProject,
   GlobalSettings,
   GalleryItem,
   Logo,
+  RenderQuality,
+  PreviewFormat,
+  SegmentPreviewResponse,
 } from './types';
 import { Voice } from './constants';
 
@@ -138,6 +146,7 @@ export async function generateAllAudio(
   const body = {
     skip_locked: options.skip_locked ?? true,
     force_regenerate: options.force_regenerate ?? false,
+    stale_only: options.stale_only ?? false,
   };
   const response = await api.post<BulkTaskResponse>(
     `/api/projects/${projectId}/generate-all-audio/`,
@@ -146,6 +155,22 @@ export async function generateAllAudio(
   return response.data;
 }
 
+/**
+ * Resume an interrupted bulk generation: only segments the batch never
+ * finished, or whose text changed since, are synthesised. Defaults to the
+ * project's most recent batch.
+ */
+export async function resumeAllAudio(
+  projectId: string,
+  taskId?: string
+): Promise<ResumeAudioResponse> {
+  const response = await api.post<ResumeAudioResponse>(
+    `/api/projects/${projectId}/resume-audio/`,
+    taskId ? { task_id: taskId } : {}
+  );
+  return response.data;
+}
+
 export async function getTaskStatus(
   taskId: string
 ): Promise<TaskStatusResponse> {
@@ -188,22 +213,174 @@ export async function pollTaskStatus(
   });
 }
 
+// ── Segment Preview ──
+
+export async function previewSegment(
+  segmentId: string,
+  format: PreviewFormat = 'mp4'
+): Promise<SegmentPreviewResponse> {
+  const response = await api.post<SegmentPreviewResponse>(
+    `/api/segments/${segmentId}/preview/`,
+    { format }
+  );
+  return response.data;
+}
+
 // ── Render Pipeline ──
 
 export async function startRender(
-  projectId: string
-): Promise<{ task_id: string; project_id: string; status: string; total_segments: number; message: string }> {
-  const { data } = await api.post(`/api/projects/${projectId}/render/`);
+  projectId: string,
+  renderQuality?: RenderQuality
+): Promise<{ task_id: string; project_id: string; status: string; total_segments: number; render_quality: RenderQuality | null; message: string }> {
+  const { data } = await api.post(
+    `/api/projects/${projectId}/render/`,
+    renderQuality ? { render_quality: renderQuality } : undefined
+  );
   return data;
 }
 
 export async function getRenderStatus(
   projectId: string
-): Promise<import('./types').RenderStatusResponse> {
+): Promise<RenderStatusResponse> {
   const { data } = await api.get(`/api/projects/${projectId}/status/`);
   return data;
 }
 
+// ── Task Events (server-sent events) ──
+
+type TaskEventHandler = (event: TaskEvent) => void;
+
+let taskEventSource: EventSource | null = null;
+const taskEventHandlers = new Map<string, Set<TaskEventHandler>>();
+
+function openTaskEventSource(): EventSource {
+  const base = api.defaults.baseURL || 'http://localhost:8000';
+  const source = new EventSource(`${base}/api/tasks/events/`);
+  source.addEventListener('task', (message) => {
+    const event: TaskEvent = JSON.parse((message as MessageEvent).data);
+    taskEventHandlers.get(event.task_id)?.forEach((handler) => handler(event));
+  });
+  return source;
+}
+
+/**
+ * Subscribe to pushed updates of one task.
+ *
+ * All subscribers share a single EventSource connection. The browser
+ * reconnects it by itself (resuming after the last event id), and it is
+ * closed when the last subscriber leaves. Returns an unsubscribe function.
+ */
+export function subscribeTaskEvents(
+  taskId: string,
+  handler: TaskEventHandler
+): () => void {
+  let handlers = taskEventHandlers.get(taskId);
+  if (!handlers) {
+    handlers = new Set();
+    taskEventHandlers.set(taskId, handlers);
+  }
+  handlers.add(handler);
+  if (!taskEventSource) {
+    taskEventSource = openTaskEventSource();
+  }
+
+  return () => {
+    handlers.delete(handler);
+    if (handlers.size === 0) {
+      taskEventHandlers.delete(taskId);
+    }
+    if (taskEventHandlers.size === 0 && taskEventSource) {
+      taskEventSource.close();
+      taskEventSource = null;
+    }
+  };
+}
+
+/**
+ * Follow a task's pushed state until `isDone` says it finished.
+ *
+ * `pick` extracts the value from each task event; `load` reads it once
+ * for the initial state, and every `intervalMs` where EventSource is
+ * unavailable. Returns a function that stops watching.
+ */
+function watchTask<T>(
+  taskId: string,
+  load: () => Promise<T>,
+  pick: (event: TaskEvent) => T | undefined,
+  isDone: (value: T) => boolean,
+  onUpdate: (value: T) => void,
+  intervalMs: number
+): () => void {
+  let stopped = false;
+  let pushed = false;
+  let timer: ReturnType<typeof setTimeout> | null = null;
+  let unsubscribe: (() => void) | null = null;
+
+  const stop = () => {
+    stopped = true;
+    if (timer) {
+      clearTimeout(timer);
+      timer = null;
+    }
+    unsubscribe?.();
+    unsubscribe = null;
+  };
+
+  const deliver = (value: T) => {
+    if (stopped) return;
+    onUpdate(value);
+    if (isDone(value)) stop();
+  };
+
+  const poll = async () => {
+    try {
+      const value = await load();
+      // A pushed event is newer than a response that was in flight
+      if (!pushed) deliver(value);
+    } catch {
+      // Transient error — the next poll (or push) catches up
+    }
+    if (!stopped && !unsubscribe) {
+      timer = setTimeout(poll, intervalMs);
+    }
+  };
+
+  if (typeof EventSource !== 'undefined') {
+    unsubscribe = subscribeTaskEvents(taskId, (event) => {
+      const value = pick(event);
+      if (value === undefined) return;
+      pushed = true;
+      deliver(value);
+    });
+  }
+  void poll();
+
+  return stop;
+}
+
+/**
+ * Follow a project's render until it completes or fails.
+ *
+ * Progress is pushed over the task event stream; the render status is
+ * fetched once for the initial state. Where EventSource is unavailable
+ * the status endpoint is polled every `intervalMs` instead.
+ * Returns a function that stops watching.
+ */
+export function watchRenderStatus(
+  projectId: string,
+  onStatus: (status: RenderStatusResponse) => void,
+  intervalMs: number = 3000
+): () => void {
+  return watchTask(
+    `render_${projectId}`,
+    () => getRenderStatus(projectId),
+    (event) => event.render,
+    (status) => status.status === 'COMPLETED' || status.status === 'FAILED',
+    onStatus,
+    intervalMs
+  );
+}
+
 export async function cancelRender(
   projectId: string
 ): Promise<{ project_id: string; status: string; message: string }> {
@@ -211,6 +388,56 @@ export async function cancelRender(
   return data;
 }
 
+// ── Render Batches ──
+
+export async function createRenderBatch(
+  projects: (string | RenderBatchProject)[],
+  renderQuality?: RenderQuality
+): Promise<RenderBatch> {
+  const { data } = await api.post<RenderBatch>('/api/render-batches/', {
+    projects,
+    ...(renderQuality ? { render_quality: renderQuality } : {}),
+  });
+  return data;
+}
+
+export async function getRenderBatches(): Promise<RenderBatch[]> {
+  const { data } = await api.get<RenderBatch[]>('/api/render-batches/');
+  return data;
+}
+
+export async function getRenderBatch(batchId: string): Promise<RenderBatch> {
+  const { data } = await api.get<RenderBatch>(`/api/render-batches/${batchId}/`);
+  return data;
+}
+
+export async function cancelRenderBatch(
+  batchId: string
+): Promise<{ batch_id: string; status: string; message: string }> {
+  const { data } = await api.post(`/api/render-batches/${batchId}/cancel/`);
+  return data;
+}
+
+/**
+ * Follow a render batch until it finishes (pushed over the task event
+ * stream, polled where EventSource is unavailable).
+ * Returns a function that stops watching.
+ */
+export function watchRenderBatch(
+  batchId: string,
+  onBatch: (batch: RenderBatch) => void,
+  intervalMs: number = 3000
+): () => void {
+  return watchTask(
+    batchId,
+    () => getRenderBatch(batchId),
+    (event) => event.batch,
+    (batch) => batch.status !== 'PENDING' && batch.status !== 'PROCESSING',
+    onBatch,
+    intervalMs
+  );
+}
+
 // ── Global Settings ──
 
 export async function getSettings(): Promise<GlobalSettings> {
@@ -13,10 +13,11 @@ import {
   reorderSegments as apiReorderSegments,
   generateSegmentAudio,
   generateAllAudio as apiGenerateAllAudio,
+  resumeAllAudio as apiResumeAllAudio,
   getTaskStatus,
   pollTaskStatus,
   startRender as apiStartRender,
-  getRenderStatus as apiGetRenderStatus,
+  watchRenderStatus as apiWatchRenderStatus,
   cancelRender as apiCancelRender,
   getSettings as apiGetSettings,
   updateSettings as apiUpdateSettings,
@@ -32,6 +33,7 @@ import type {
   UpdateSegmentPayload,
   AudioGenerationState,
   BulkGenerationProgress,
+  GenerateAllAudioOptions,
   RenderStatus,
   RenderProgress,
   GlobalSettings,
@@ -55,7 +57,13 @@ interface ProjectStore {
   /** Bulk generation progress (null when idle). */
   bulkGenerationProgress: BulkGenerationProgress | null;
 
-  /** Session-only Set of segment IDs whose text was edited after audio generation. */
+  /** Last bulk task that failed, had errors or lost the server (can be resumed). */
+  resumableAudioTaskId: string | null;
+
+  /**
+   * Session-only Set of segment IDs whose text was edited after audio generation
+   * (immediate feedback; saved segments also carry the server's `audio_stale`).
+   */
   staleAudioSegments: Set<string>;
 
   // ── Render Pipeline State ──
@@ -87,7 +95,13 @@ interface ProjectStore {
   generateAudio: (segmentId: string) => Promise<void>;
 
   /** Trigger audio generation for all unlocked segments. */
-  generateAllAudio: () => Promise<void>;
+  generateAllAudio: (options?: GenerateAllAudioOptions) => Promise<void>;
+
+  /** Resume the last interrupted bulk generation (only unfinished or edited segments). */
+  resumeAllAudio: () => Promise<void>;
+
+  /** Poll a bulk generation task until it finishes, updating progress. */
+  followBulkGeneration: (taskId: string, total: number) => Promise<void>;
 
   /** Cancel bulk audio generation polling (client-side only). */
   cancelGeneration: () => void;
@@ -130,8 +144,8 @@ interface ProjectStore {
 // Module-level variable for cancellable bulk polling
 let bulkPollingTimer: ReturnType<typeof setInterval> | null = null;
 
-// Module-level variable for cancellable render polling
-let renderPollingTimer: ReturnType<typeof setTimeout> | null = null;
+// Module-level stop function of the render progress watch
+let stopRenderWatch: (() => void) | null = null;
 
 export const useProjectStore = create<ProjectStore>()((set, get) => ({
   project: null,
@@ -141,6 +155,7 @@ export const useProjectStore = create<ProjectStore>()((set, get) => ({
   audioTaskId: null,
   audioGenerationStatus: {} as Record<string, AudioGenerationState>,
   bulkGenerationProgress: null,
+  resumableAudioTaskId: null,
   staleAudioSegments: new Set<string>(),
   renderTaskId: null,
   renderStatus: 'idle' as RenderStatus,
@@ -283,7 +298,7 @@ export const useProjectStore = create<ProjectStore>()((set, get) => ({
       await removeSegmentAudio(segmentId);
       set((state) => ({
         segments: state.segments.map((s) =>
-          s.id === segmentId ? { ...s, audio_file: null, audio_duration: null } : s
+          s.id === segmentId ? { ...s, audio_file: null, audio_duration: null, audio_stale: false } : s
         ),
         // Clear any audio generation status for this segment
         audioGenerationStatus: {
@@ -340,50 +355,40 @@ export const useProjectStore = create<ProjectStore>()((set, get) => ({
     const { project } = get();
     if (!project) return;
 
-    const poll = async () => {
-      const { renderStatus } = get();
-      if (renderStatus !== 'rendering') return;
-
-      try {
-        const status = await apiGetRenderStatus(project.id);
-
-        if (status.status === 'COMPLETED') {
-          set({
-            renderStatus: 'completed' as RenderStatus,
-            renderProgress: status.progress,
-            outputUrl: status.output_url,
-          });
-          renderPollingTimer = null;
-          return;
-        }
+    stopRenderWatch?.();
+    // Pushed over the task event stream (polling where unsupported)
+    stopRenderWatch = apiWatchRenderStatus(project.id, (status) => {
+      if (get().renderStatus !== 'rendering') return;
 
-        if (status.status === 'FAILED') {
-          set({
-            renderStatus: 'failed' as RenderStatus,
-            renderProgress: status.progress,
-            outputUrl: null,
-          });
-          renderPollingTimer = null;
-          return;
-        }
+      if (status.status === 'COMPLETED') {
+        set({
+          renderStatus: 'completed' as RenderStatus,
+          renderProgress: status.progress,
+          outputUrl: status.output_url,
+        });
+        stopRenderWatch = null;
+        return;
+      }
 
-        // Still processing — update progress and poll again
-        set({ renderProgress: status.progress });
-        renderPollingTimer = setTimeout(poll, 3000);
-      } catch {
-        // Transient error — try again
-        renderPollingTimer = setTimeout(poll, 3000);
+      if (status.status === 'FAILED') {
+        set({
+          renderStatus: 'failed' as RenderStatus,
+          renderProgress: status.progress,
+          outputUrl: null,
+        });
+        stopRenderWatch = null;
+        return;
       }
-    };
 
-    // Start polling after a short delay to let the backend begin
-    renderPollingTimer = setTimeout(poll, 1000);
+      // Still processing — update progress
+      set({ renderProgress: status.progress });
+    });
   },
 
   resetRenderState: () => {
-    if (renderPollingTimer) {
-      clearTimeout(renderPollingTimer);
-      renderPollingTimer = null;
+    if (stopRenderWatch) {
+      stopRenderWatch();
+      stopRenderWatch = null;
     }
     set({
       renderTaskId: null,
@@ -405,9 +410,9 @@ export const useProjectStore = create<ProjectStore>()((set, get) => ({
     }
 
     // Stop polling and reset
-    if (renderPollingTimer) {
-      clearTimeout(renderPollingTimer);
-      renderPollingTimer = null;
+    if (stopRenderWatch) {
+      stopRenderWatch();
+      stopRenderWatch = null;
     }
     set({
       renderTaskId: null,
@@ -447,15 +452,16 @@ export const useProjectStore = create<ProjectStore>()((set, get) => ({
       clearInterval(bulkPollingTimer);
       bulkPollingTimer = null;
     }
-    if (renderPollingTimer) {
-      clearTimeout(renderPollingTimer);
-      renderPollingTimer = null;
+    if (stopRenderWatch) {
+      stopRenderWatch();
+      stopRenderWatch = null;
     }
     set({
       project: null, segments: [], isLoading: false, error: null,
       audioTaskId: null,
       audioGenerationStatus: {},
       bulkGenerationProgress: null,
+      resumableAudioTaskId: null,
       staleAudioSegments: new Set<string>(),
       renderTaskId: null,
       renderStatus: 'idle' as RenderStatus,
@@ -498,99 +504,123 @@ export const useProjectStore = create<ProjectStore>()((set, get) => ({
     }
   },
 
-  generateAllAudio: async () => {
-    const { project, setSegmentAudioStatus, refreshSegmentAudio } = get();
+  generateAllAudio: async (options) => {
+    const { project, followBulkGeneration } = get();
     if (!project) return;
 
     try {
-      const bulkResponse = await apiGenerateAllAudio(project.id);
-      // Seed initial progress state
-      set({
-        audioTaskId: bulkResponse.task_id,
-        bulkGenerationProgress: {
-          task_id: bulkResponse.task_id,
-          status: bulkResponse.status,
-          total: bulkResponse.segments_to_process,
-          completed: 0,
-          failed: 0,
-          completed_segments: [],
-          errors: [],
-        },
-      });
+      const bulkResponse = await apiGenerateAllAudio(project.id, options);
+      await followBulkGeneration(bulkResponse.task_id, bulkResponse.segments_to_process);
+    } catch (err) {
+      const message = err instanceof Error ? err.message : 'Bulk audio generation failed';
+      set({ error: message, bulkGenerationProgress: null, audioTaskId: null });
+    }
+  },
+
+  resumeAllAudio: async () => {
+    const { project, resumableAudioTaskId, followBulkGeneration } = get();
+    if (!project) return;
+
+    try {
+      const response = await apiResumeAllAudio(project.id, resumableAudioTaskId ?? undefined);
+      set({ resumableAudioTaskId: null });
+      if (!response.task_id) return; // Nothing left to do
+      await followBulkGeneration(response.task_id, response.segments_to_process);
+    } catch (err) {
+      const message = err instanceof Error ? err.message : 'Resuming audio generation failed';
+      set({ error: message, bulkGenerationProgress: null, audioTaskId: null });
+    }
+  },
 
-      // Track which segments have already been processed to avoid duplicates
-      const handledSegments = new Set<string>();
-      let consecutiveFailures = 0;
-
-      // Start cancellable polling loop
-      await new Promise<void>((resolve, reject) => {
-        bulkPollingTimer = setInterval(async () => {
-          try {
-            const taskStatus = await getTaskStatus(bulkResponse.task_id);
-            consecutiveFailures = 0; // Reset on successful poll
-
-            // Process newly completed segments
-            for (const seg of taskStatus.completed_segments) {
-              if (!handledSegments.has(seg.segment_id)) {
-                handledSegments.add(seg.segment_id);
-                setSegmentAudioStatus(seg.segment_id, { status: 'completed' as const });
-                refreshSegmentAudio(seg.segment_id);
-              }
+  followBulkGeneration: async (taskId, total) => {
+    const { setSegmentAudioStatus, refreshSegmentAudio } = get();
+
+    // Seed initial progress state
+    set({
+      audioTaskId: taskId,
+      resumableAudioTaskId: null,
+      bulkGenerationProgress: {
+        task_id: taskId,
+        status: 'PENDING',
+        total,
+        completed: 0,
+        failed: 0,
+        completed_segments: [],
+        errors: [],
+      },
+    });
+
+    // Track which segments have already been processed to avoid duplicates
+    const handledSegments = new Set<string>();
+    let consecutiveFailures = 0;
+
+    // Start cancellable polling loop
+    await new Promise<void>((resolve, reject) => {
+      bulkPollingTimer = setInterval(async () => {
+        try {
+          const taskStatus = await getTaskStatus(taskId);
+          consecutiveFailures = 0; // Reset on successful poll
+
+          // Process newly completed segments
+          for (const seg of taskStatus.completed_segments) {
+            if (!handledSegments.has(seg.segment_id)) {
+              handledSegments.add(seg.segment_id);
+              setSegmentAudioStatus(seg.segment_id, { status: 'completed' as const });
+              refreshSegmentAudio(seg.segment_id);
             }
+          }
 
-            // Process newly failed segments
-            for (const err of taskStatus.errors) {
-              if (!handledSegments.has(err.segment_id)) {
-                handledSegments.add(err.segment_id);
-                setSegmentAudioStatus(err.segment_id, { status: 'failed' as const, error: err.error });
-              }
+          // Process newly failed segments
+          for (const err of taskStatus.errors) {
+            if (!handledSegments.has(err.segment_id)) {
+              handledSegments.add(err.segment_id);
+              setSegmentAudioStatus(err.segment_id, { status: 'failed' as const, error: err.error });
             }
+          }
 
-            // Update bulk progress incrementally
-            set({
-              bulkGenerationProgress: {
-                task_id: taskStatus.task_id,
-                status: taskStatus.status,
-                total: taskStatus.progress.total,
-                completed: taskStatus.completed_segments.length,
-                failed: taskStatus.errors.length,
-                completed_segments: taskStatus.completed_segments,
-                errors: taskStatus.errors,
-              },
-            });
-
-            if (taskStatus.status === 'COMPLETED' || taskStatus.status === 'FAILED') {
-              if (bulkPollingTimer) {
-                clearInterval(bulkPollingTimer);
-                bulkPollingTimer = null;
-              }
-              set({ audioTaskId: null });
-
-              if (taskStatus.status === 'FAILED' && taskStatus.errors.length > 0) {
-                set({ error: `Bulk audio generation completed with ${taskStatus.errors.length} error(s)` });
-              }
-              // Clear progress after a brief delay for UI feedback
-              setTimeout(() => set({ bulkGenerationProgress: null }), 3000);
-              resolve();
+          // Update bulk progress incrementally
+          set({
+            bulkGenerationProgress: {
+              task_id: taskStatus.task_id,
+              status: taskStatus.status,
+              total: taskStatus.progress.total,
+              completed: taskStatus.completed_segments.length,
+              failed: taskStatus.errors.length,
+              completed_segments: taskStatus.completed_segments,
+              errors: taskStatus.errors,
+            },
+          });
+
+          if (taskStatus.status === 'COMPLETED' || taskStatus.status === 'FAILED') {
+            if (bulkPollingTimer) {
+              clearInterval(bulkPollingTimer);
+              bulkPollingTimer = null;
             }
-          } catch {
-            consecutiveFailures++;
-            if (consecutiveFailures >= 3) {
-              if (bulkPollingTimer) {
-                clearInterval(bulkPollingTimer);
-                bulkPollingTimer = null;
-              }
-              set({ audioTaskId: null });
-              reject(new Error('Lost connection to server'));
+            const interrupted = taskStatus.status === 'FAILED' || taskStatus.errors.length > 0;
+            set({ audioTaskId: null, resumableAudioTaskId: interrupted ? taskId : null });
+
+            if (taskStatus.status === 'FAILED' && taskStatus.errors.length > 0) {
+              set({ error: `Bulk audio generation completed with ${taskStatus.errors.length} error(s)` });
             }
-            // Otherwise continue polling (transient failure)
+            // Clear progress after a brief delay for UI feedback
+            setTimeout(() => set({ bulkGenerationProgress: null }), 3000);
+            resolve();
           }
-        }, 2000);
-      });
-    } catch (err) {
-      const message = err instanceof Error ? err.message : 'Bulk audio generation failed';
-      set({ error: message, bulkGenerationProgress: null, audioTaskId: null });
-    }
+        } catch {
+          consecutiveFailures++;
+          if (consecutiveFailures >= 3) {
+            if (bulkPollingTimer) {
+              clearInterval(bulkPollingTimer);
+              bulkPollingTimer = null;
+            }
+            // The server may have restarted mid-batch — offer to resume it
+            set({ audioTaskId: null, resumableAudioTaskId: taskId });
+            reject(new Error('Lost connection to server'));
+          }
+          // Otherwise continue polling (transient failure)
+        }
+      }, 2000);
+    });
   },
 
   cancelGeneration: () => {
@@ -624,7 +654,8 @@ export const useProjectStore = create<ProjectStore>()((set, get) => ({
         if (
           !existing ||
           (existing.audio_file === updated.audio_file &&
-           existing.audio_duration === updated.audio_duration)
+           existing.audio_duration === updated.audio_duration &&
+           existing.audio_stale === updated.audio_stale)
         ) {
           return {};
         }
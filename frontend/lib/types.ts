@@ -19,13 +19,28 @@ export interface Segment {
   image_file: string | null;
   audio_file: string | null;
   audio_duration: number | null;
+  /** Audio was generated from other text, voice or speed than the current ones. */
+  audio_stale: boolean;
   is_locked: boolean;
 }
 
+export type RenderQuality = 'draft' | 'standard' | 'final';
+
+export type ExportProfile = 'crf' | 'vbr' | 'two_pass';
+
+export type KenBurnsEasing =
+  | 'linear'
+  | 'ease_in'
+  | 'ease_out'
+  | 'ease_in_out'
+  | 'ease_in_out_sine';
+
 export interface GlobalSettings {
   default_voice_id: string;
   tts_speed: number;
+  tts_cache_mb: number;  // 0 = TTS audio cache disabled
   zoom_intensity: number;
+  ken_burns_easing: KenBurnsEasing;
   subtitle_font: string;
   subtitle_color: string;
   subtitle_font_size: number;
@@ -35,6 +50,14 @@ export interface GlobalSettings {
   render_width: number;
   render_height: number;
   render_fps: number;
+  render_workers: number;  // 0 = auto (one per CPU core), 1 = single stream
+  render_cache_mb: number;  // 0 = render cache disabled
+  image_cache_mb: number;  // prepared-image memory cache, 0 = disabled
+  image_spill_mb: number;  // on-disk .npy image store, 0 = disabled
+  render_quality: RenderQuality;
+  export_profile: ExportProfile;
+  export_bitrate_kbps: number;  // constrained VBR average bitrate
+  export_target_mb: number;  // two-pass target file size
   logo_enabled: boolean;
   active_logo: string | null;  // Logo UUID or null
   logo_scale: number;
@@ -105,6 +128,8 @@ export interface TaskResponse {
 export interface GenerateAllAudioOptions {
   skip_locked?: boolean;
   force_regenerate?: boolean;
+  /** Regenerate existing audio only where it is stale (overrides force_regenerate). */
+  stale_only?: boolean;
 }
 
 export interface BulkTaskResponse {
@@ -113,6 +138,20 @@ export interface BulkTaskResponse {
   status: TaskStatus;
   total_segments: number;
   segments_to_process: number;
+  stale_segments?: number;
+  message: string;
+}
+
+export interface ResumeAudioResponse {
+  /** New task ID; absent when nothing was left to resume. */
+  task_id?: string;
+  project_id: string;
+  status?: TaskStatus;
+  resumed_from: string;
+  segments_to_process: number;
+  skipped_completed: number;  // Already completed with unchanged text
+  stale_segments: number;     // Completed, but the text changed since
+  missing_segments: number;   // Deleted since the batch ran
   message: string;
 }
 
@@ -121,12 +160,19 @@ export interface TaskProgress {
   total: number;
   percentage: number;
   current_segment_id?: string;
+  segment_chunk?: number;   // Chunks of the current segment written so far
+  segment_chunks?: number;  // Total chunks of the current segment (streamed TTS)
+  preview_url?: string;  // Set by segment preview tasks
 }
 
 export interface CompletedSegmentAudio {
   segment_id: string;
   audio_url: string;
   duration: number;
+  /** True when the audio was served from the shared TTS audio cache. */
+  cached?: boolean;
+  /** Hash of the text, voice and speed the audio was generated from (bulk tasks). */
+  text_hash?: string;
 }
 
 export interface TaskError {
@@ -134,12 +180,83 @@ export interface TaskError {
   error: string;
 }
 
+export type TaskLane = 'tts' | 'render' | 'preview' | 'batch';
+
+export interface TaskLaneMetrics {
+  workers: number;
+  queue_depth: number;
+  running: number;
+  completed: number;
+  avg_wait_seconds: number;
+  max_wait_seconds: number;
+  oldest_pending_seconds: number;
+}
+
+export interface RenderPhaseProfile {
+  name: string;
+  calls: number;
+  wall_seconds: number;
+  cpu_seconds: number;
+  peak_rss_mb: number;
+}
+
+export interface RenderSegmentProfile {
+  index: number;
+  label?: string;
+  audio_duration?: number;
+  visual_duration?: number;
+  wall_seconds: number;
+  phases: Record<string, { wall_seconds: number; cpu_seconds: number }>;
+}
+
+/**
+ * Render profiler report — also saved as render_report.json next to final.mp4.
+ *
+ * While the render runs only a summary is sent: `phases`, `segments` and
+ * `export` are absent and `frames` / `fps` give the export's progress.
+ */
+export interface RenderProfile {
+  started_at: number;
+  running: boolean;
+  current_phase: string | null;
+  wall_seconds: number;
+  cpu_seconds: number;
+  peak_rss_mb: number;
+  frames?: number;
+  fps?: number | null;
+  phases?: RenderPhaseProfile[];
+  segments?: RenderSegmentProfile[];
+  export?: {
+    frames?: number;
+    seconds?: number;
+    fps?: number | null;
+    draw_seconds?: number;
+    wait_seconds?: number;
+    write_seconds?: number;
+    flush_seconds?: number;
+  };
+}
+
 export interface TaskStatusResponse {
   task_id: string;
   status: TaskStatus;
   progress: TaskProgress;
   completed_segments: CompletedSegmentAudio[];
   errors: TaskError[];
+  lane: TaskLane;
+  wait_seconds: number;
+  lanes: Record<TaskLane, TaskLaneMetrics>;
+  /** Render tasks only: live / final render profile. */
+  profile?: RenderProfile | null;
+}
+
+/** One `event: task` frame of the `/api/tasks/events/` stream. */
+export interface TaskEvent
+  extends Omit<TaskStatusResponse, 'wait_seconds' | 'lanes'> {
+  /** Render tasks only: the same shape as `GET /api/projects/{id}/status/`. */
+  render?: RenderStatusResponse;
+  /** Render batches only: the same shape as `GET /api/render-batches/{id}/`. */
+  batch?: RenderBatch;
 }
 
 export interface BulkGenerationProgress {
@@ -152,6 +269,21 @@ export interface BulkGenerationProgress {
   errors: TaskError[];
 }
 
+// ── Segment Preview ──
+
+export type PreviewFormat = 'mp4' | 'webp';
+
+/** Response from POST /api/segments/{id}/preview/ (200 cached or 202 queued). */
+export interface SegmentPreviewResponse {
+  segment_id: string;
+  status: TaskStatus;
+  format: PreviewFormat;
+  task_id?: string;
+  cached?: boolean;
+  preview_url?: string;
+  message?: string;
+}
+
 // ── Render Pipeline ──
 
 /** Render pipeline status for the project. */
@@ -173,6 +305,68 @@ export interface RenderStatusResponse {
   output_url: string | null;
 }
 
+// ── Render Batches ──
+
+export type RenderBatchItemStatus =
+  | 'queued'
+  | 'rendering'
+  | 'completed'
+  | 'failed'
+  | 'cancelled';
+
+/** One project of a render batch. */
+export interface RenderBatchItem {
+  project_id: string;
+  title: string;
+  priority: number;
+  position: number;
+  segments: number;
+  status: RenderBatchItemStatus;
+  task_id: string | null;
+  percentage: number;
+  current_segment: number;
+  current_phase: string;
+  started_at: number | null;
+  finished_at: number | null;
+  /** Rendered video length in seconds (completed items). */
+  duration: number;
+  output_url: string | null;
+  error: string | null;
+}
+
+/** Entry of `projects` in `POST /api/render-batches/`. */
+export interface RenderBatchProject {
+  project_id: string;
+  /** Higher renders first; ties keep list order. */
+  priority?: number;
+}
+
+export interface RenderBatch {
+  batch_id: string;
+  status: TaskStatus | 'CANCELLED';
+  cancel_requested: boolean;
+  created_at: number;
+  started_at: number | null;
+  completed_at: number | null;
+  render_quality: RenderQuality | null;
+  total: number;
+  queued: number;
+  rendering: number;
+  completed: number;
+  failed: number;
+  cancelled: number;
+  elapsed_seconds: number;
+  throughput: {
+    projects_per_hour: number;
+    segments_per_minute: number;
+    video_seconds_per_minute: number;
+  };
+  /** Estimated seconds until the batch finishes (null until measurable). */
+  eta_seconds: number | null;
+  /** In render order. */
+  items: RenderBatchItem[];
+}
+
 // ── Gallery ──
 
 /** A rendered video item returned by the Gallery API. */